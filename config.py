@@ -12,14 +12,26 @@ load_dotenv()
 NAVER_CLIENT_ID = os.getenv("NAVER_CLIENT_ID")
 NAVER_CLIENT_SECRET = os.getenv("NAVER_CLIENT_SECRET")
 
+# 여러 애플리케이션 키 (선택): NAVER_CREDENTIALS="id1:secret1,id2:secret2"
+# DataLab 일일 한도는 키마다 적용 → naver_api.KeyPool로 키를 번갈아 사용
+NAVER_CREDENTIALS = [
+    tuple(part.strip() for part in pair.split(":", 1))
+    for pair in os.getenv("NAVER_CREDENTIALS", "").split(",") if ":" in pair
+]
+if NAVER_CLIENT_ID and NAVER_CLIENT_SECRET and (NAVER_CLIENT_ID, NAVER_CLIENT_SECRET) not in NAVER_CREDENTIALS:
+    NAVER_CREDENTIALS.insert(0, (NAVER_CLIENT_ID, NAVER_CLIENT_SECRET))
+
 # API 키 확인
-if not NAVER_CLIENT_ID or not NAVER_CLIENT_SECRET:
+if not NAVER_CREDENTIALS:
     raise ValueError(
         "⚠️ API 키가 설정되지 않았습니다!\n"
         ".env 파일을 생성하고 NAVER_CLIENT_ID와 NAVER_CLIENT_SECRET을 입력하세요.\n"
         ".env.example 파일을 참고하세요."
     )
 
+# 단일 키 설정 (NAVER_CREDENTIALS만 있으면 첫 번째 키)
+NAVER_CLIENT_ID, NAVER_CLIENT_SECRET = NAVER_CREDENTIALS[0]
+
 # 프로젝트 설정
 PROJECT_NAME = os.getenv("PROJECT_NAME", "soda-project")
 START_DATE = os.getenv("START_DATE", "2025-11-15")
@@ -0,0 +1,156 @@
+"""
+SODA 프로젝트 - API 응답 디코딩 벤치마크
+======================================
+
+표준 json(response.json()) 디코딩과 api_codec(msgspec / orjson) 컬럼 디코딩을
+세그먼트 그리드 / 블로그 수집 규모에서 비교
+
+실행:
+    python scripts/bench_codec.py
+    python scripts/bench_codec.py --responses 500 --days 1826
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# ============================================
+# 경로 설정
+# ============================================
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent
+src_dir = project_root / 'src'
+
+if str(src_dir) not in sys.path:
+    sys.path.insert(0, str(src_dir))
+
+import api_codec
+from api_codec import BLOG_FIELDS, decode_items, decode_trend, trend_series
+
+
+def print_section(title):
+    """섹션 제목 출력"""
+    print("\n" + "="*70)
+    print(f"  {title}")
+    print("="*70)
+
+
+def timed(func, *args, **kwargs):
+    """(결과, 소요 시간[초]) 반환"""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+# ============================================
+# 가상 응답
+# ============================================
+def make_trend_payloads(n_responses, n_days, n_keywords=5, seed=0):
+    """DataLab 일별 응답 본문 (bytes) 목록"""
+    rng = np.random.default_rng(seed)
+    periods = pd.date_range("2020-01-01", periods=n_days, freq="D").strftime("%Y-%m-%d").tolist()
+
+    payloads = []
+    for _ in range(n_responses):
+        results = []
+        for k in range(n_keywords):
+            ratios = np.round(rng.uniform(0, 100, n_days), 5).tolist()
+            results.append({
+                "title": f"키워드{k}",
+                "keywords": [f"키워드{k}"],
+                "data": [{"period": p, "ratio": r} for p, r in zip(periods, ratios)],
+            })
+        body = {"startDate": periods[0], "endDate": periods[-1], "timeUnit": "date", "results": results}
+        payloads.append(json.dumps(body, ensure_ascii=False).encode("utf-8"))
+    return payloads
+
+
+def make_blog_payloads(n_pages, seed=0):
+    """블로그 검색 응답 본문 (페이지당 100건)"""
+    rng = np.random.default_rng(seed)
+    payloads = []
+    for page in range(n_pages):
+        items = [{
+            "title": f"<b>선크림</b> 스키장 후기 {page}-{i}",
+            "link": f"https://blog.naver.com/user{i}/{rng.integers(1e9)}",
+            "description": "겨울 스키장에서도 <b>선크림</b>은 필수! " * 3,
+            "bloggername": f"블로거{i}",
+            "bloggerlink": f"blog.naver.com/user{i}",
+            "postdate": "20240115",
+        } for i in range(100)]
+        body = {"total": n_pages * 100, "start": page * 100 + 1, "display": 100, "items": items}
+        payloads.append(json.dumps(body, ensure_ascii=False).encode("utf-8"))
+    return payloads
+
+
+# ============================================
+# 기존 방식 (response.json())
+# ============================================
+def stdlib_trend(payloads):
+    return [trend_series(json.loads(payload)) for payload in payloads]
+
+
+def legacy_blog(payloads):
+    items = []
+    for payload in payloads:
+        items.extend(json.loads(payload)['items'])
+    return pd.DataFrame(items)
+
+
+# ============================================
+# api_codec
+# ============================================
+def codec_trend(payloads):
+    return [decode_trend(payload) for payload in payloads]
+
+
+def codec_blog(payloads):
+    columns = {field: [] for field in BLOG_FIELDS}
+    for payload in payloads:
+        _, items = decode_items(payload, BLOG_FIELDS)
+        for field in BLOG_FIELDS:
+            columns[field].extend(items[field])
+    return pd.DataFrame(columns)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API 응답 디코딩 벤치마크")
+    parser.add_argument("--responses", type=int, default=100, help="DataLab 응답 수")
+    parser.add_argument("--days", type=int, default=1826, help="응답당 일수 (기본 5년)")
+    parser.add_argument("--blog-pages", type=int, default=200, help="블로그 페이지 수 (페이지당 100건)")
+    args = parser.parse_args()
+
+    print_section("⏱️  API 응답 디코딩 벤치마크")
+    print(f"코덱: {api_codec.BACKEND}")
+
+    print_section("1. DataLab 응답 디코딩")
+    payloads = make_trend_payloads(args.responses, args.days)
+    size = sum(len(p) for p in payloads) / 1e6
+    print(f"응답: {args.responses:,}개 × 키워드 5개 × {args.days:,}일 ({size:,.1f} MB)")
+
+    _, t_old = timed(stdlib_trend, payloads)
+    series, t_new = timed(codec_trend, payloads)
+    print(f"  json    → 컬럼 구조: {t_old:8.3f}s")
+    print(f"  {api_codec.BACKEND:<7} → 컬럼 구조: {t_new:8.3f}s  (x{t_old / t_new:,.1f})")
+
+    same = series[0] == trend_series(json.loads(payloads[0]))
+    print(f"  결과 일치: {'✅' if same else '❌'}")
+
+    print_section("2. 블로그 검색 응답 → DataFrame")
+    payloads = make_blog_payloads(args.blog_pages)
+    print(f"페이지: {args.blog_pages:,}개 ({args.blog_pages * 100:,}건)")
+
+    old, t_old = timed(legacy_blog, payloads)
+    new, t_new = timed(codec_blog, payloads)
+    print(f"  json    → dict 목록: {t_old:8.3f}s")
+    print(f"  {api_codec.BACKEND:<7} → 컬럼 구조: {t_new:8.3f}s  (x{t_old / t_new:,.1f})")
+    print(f"  결과 일치: {'✅' if old[list(BLOG_FIELDS)].equals(new) else '❌'}")
+
+
+if __name__ == "__main__":
+    main()
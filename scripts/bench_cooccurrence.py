@@ -0,0 +1,127 @@
+"""
+SODA 프로젝트 - 블로그 동시 언급 색인 벤치마크
+===========================================
+
+월별로 스키 / 선크림 언급 확률이 다른 합성 블로그 글 토큰으로
+analysis.cooccurrence.CooccurrenceIndex의 색인 생성 / 질의 / 월별 동시 언급률 계산 / 저장을 측정
+
+실행:
+    python scripts/bench_cooccurrence.py
+    python scripts/bench_cooccurrence.py --posts 500000 --vocabulary 50000
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# ============================================
+# 경로 설정
+# ============================================
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent
+src_dir = project_root / 'src'
+
+if str(src_dir) not in sys.path:
+    sys.path.insert(0, str(src_dir))
+
+from analysis.cooccurrence import CooccurrenceIndex
+from analysis.segmentation import SPORT_KEYWORDS
+
+SPORT_TERMS = ["스키장", "스키", "스노우보드", "스키복", "스키장비"]
+SUNSCREEN_TERMS = ["선크림", "톤업선크림", "자외선차단제", "썬크림"]
+
+
+def print_section(title):
+    """섹션 제목 출력"""
+    print("\n" + "="*70)
+    print(f"  {title}")
+    print("="*70)
+
+
+def timed(func, *args, **kwargs):
+    """(결과, 소요 시간[초]) 반환"""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def make_posts(n_posts, n_vocabulary, seed=0):
+    """
+    글별 토큰 목록 + 게시일 (YYYYMMDD)
+
+    스키 단어는 겨울(12~2월)에, 선크림 단어는 여름에 더 자주 나오고
+    스키 글의 선크림 동시 언급은 3월(봄 스키)에 가장 높도록 생성
+    """
+    rng = np.random.default_rng(seed)
+    days = pd.date_range("2023-01-01", "2025-10-31", freq="D")
+    dates = days[rng.integers(0, len(days), n_posts)]
+    month = dates.month.to_numpy()
+    winter = np.isin(month, [12, 1, 2, 3])
+    p_sport = np.where(winter, 0.3, 0.03)
+    p_sun = np.where(np.isin(month, [6, 7, 8]), 0.3, 0.05) + np.where(month == 3, 0.15, 0)
+
+    vocabulary = [f"단어{i}" for i in range(n_vocabulary)]
+    common = rng.zipf(1.3, (n_posts, 20)) % n_vocabulary
+    sport = rng.random(n_posts) < p_sport
+    sun = rng.random(n_posts) < p_sun
+    sport_pick = rng.integers(0, len(SPORT_TERMS), n_posts)
+    sun_pick = rng.integers(0, len(SUNSCREEN_TERMS), n_posts)
+
+    tokens = []
+    for i in range(n_posts):
+        post = [vocabulary[w] for w in common[i]]
+        if sport[i]:
+            post.append(SPORT_TERMS[sport_pick[i]])
+        if sun[i]:
+            post.append(SUNSCREEN_TERMS[sun_pick[i]])
+        tokens.append(post)
+    return tokens, dates.strftime("%Y%m%d")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="블로그 동시 언급 색인 벤치마크")
+    parser.add_argument("--posts", type=int, default=100_000, help="글 수")
+    parser.add_argument("--vocabulary", type=int, default=20_000, help="일반 단어 수")
+    parser.add_argument("--repeat", type=int, default=100, help="질의 반복 횟수")
+    args = parser.parse_args()
+
+    print_section("⏱️  블로그 동시 언급 색인 벤치마크")
+    tokens, dates = make_posts(args.posts, args.vocabulary)
+    index, t_build = timed(CooccurrenceIndex.from_tokens, tokens, dates)
+    print(f"입력: {index}")
+
+    sport_keywords = list(SPORT_KEYWORDS)
+    index.query(sport_keywords, ["선크림", "자외선차단제"])   # 키워드 → 단어 확장 결과 캐시
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        index.query(sport_keywords, ["선크림", "자외선차단제"])
+    t_query = (time.perf_counter() - start) / args.repeat
+    table, t_table = timed(index.cooccurrence, sport_keywords)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "index.npz"
+        _, t_save = timed(index.save, path)
+        loaded, t_load = timed(CooccurrenceIndex.load, path)
+        size = path.stat().st_size
+    assert np.array_equal(loaded.postings, index.postings)
+
+    print_section("처리 시간")
+    print(f"  색인 생성                  {t_build:8.2f}s")
+    print(f"  질의 (스포츠 AND 선크림, 월별) {t_query * 1000:8.2f}ms")
+    print(f"  키워드별 월별 동시 언급률     {t_table * 1000:8.2f}ms")
+    print(f"  저장 / 불러오기             {t_save:8.2f}s / {t_load:.2f}s "
+          f"({size / 1e6:.1f}MB, posting {len(index.postings):,}개)")
+
+    print_section("스포츠 글의 선크림 동시 언급률 (월평균)")
+    total = table[table["keyword"] == "전체"].copy()
+    total["calendar_month"] = total["month"].str[5:].astype(int)
+    print(total.groupby("calendar_month")[["posts", "both", "rate"]].mean().round(3).to_string())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+SODA 프로젝트 - 상관 / 시차 분석 벤치마크
+=======================================
+
+기존 방식(키워드마다 pandas Series.corr / shift / rolling 반복)과
+analysis.correlation 일괄 계산을 키워드 수백 개 규모에서 비교
+
+실행:
+    python scripts/bench_correlation.py
+    python scripts/bench_correlation.py --series 2000 --months 240
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# ============================================
+# 경로 설정
+# ============================================
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent
+src_dir = project_root / 'src'
+
+if str(src_dir) not in sys.path:
+    sys.path.insert(0, str(src_dir))
+
+from analysis.correlation import DEFAULT_LAGS, correlation_scan, rolling_correlation
+
+
+def print_section(title):
+    """섹션 제목 출력"""
+    print("\n" + "="*70)
+    print(f"  {title}")
+    print("="*70)
+
+
+def timed(func, *args, **kwargs):
+    """(결과, 소요 시간[초]) 반환"""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def make_frame(n_series, n_months, seed=0):
+    """UV-B 지수 + 키워드별 검색량 (일부는 UV-B에 시차를 두고 반응, 일부 결측)"""
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range("2010-01-01", periods=n_months, freq="MS")
+    uv = 3.5 + 2 * np.sin((dates.month.to_numpy() - 3) / 12 * 2 * np.pi) + rng.normal(0, 0.3, n_months)
+
+    lags = rng.integers(0, 4, size=n_series)
+    strength = rng.uniform(0, 10, size=n_series)
+    values = rng.normal(50, 10, size=(n_months, n_series))
+    for j in range(n_series):
+        values[lags[j]:, j] += strength[j] * uv[:n_months - lags[j]]
+    values[rng.random(values.shape) < 0.01] = np.nan
+
+    df = pd.DataFrame(values, columns=[f"키워드{i:04d}" for i in range(n_series)])
+    df.insert(0, "UVB평균", uv)
+    df.insert(0, "date", dates)
+    return df
+
+
+# ============================================
+# 기존 방식 (키워드별 pandas)
+# ============================================
+def legacy_scan(df, keywords, lags):
+    rows = {}
+    uv = df['UVB평균']
+    for keyword in keywords:
+        series = df[keyword]
+        lagged = {lag: series.shift(-lag).corr(uv) for lag in lags}
+        best = max(lagged, key=lambda lag: lagged[lag])
+        rows[keyword] = (series.corr(uv), series.corr(uv, method='spearman'), best, lagged[best])
+    return pd.DataFrame.from_dict(rows, orient='index',
+                                  columns=['pearson', 'spearman', 'best_lag', 'best_lag_r'])
+
+
+def legacy_rolling(df, keywords, window):
+    return pd.DataFrame({keyword: df[keyword].rolling(window).corr(df['UVB평균'])
+                         for keyword in keywords})
+
+
+def main():
+    parser = argparse.ArgumentParser(description="상관 / 시차 분석 벤치마크")
+    parser.add_argument("--series", type=int, default=500, help="키워드(시계열) 수")
+    parser.add_argument("--months", type=int, default=120, help="기간 (개월)")
+    parser.add_argument("--window", type=int, default=12, help="이동 상관 구간 (개월)")
+    args = parser.parse_args()
+
+    print_section("⏱️  상관 / 시차 분석 벤치마크")
+    print(f"키워드: {args.series:,}개 / 기간: {args.months}개월 / 시차: {list(DEFAULT_LAGS)}")
+
+    df = make_frame(args.series, args.months)
+    keywords = [col for col in df.columns if col not in ('date', 'UVB평균')]
+
+    print_section("1. Pearson / Spearman / 시차 상관")
+    new, t_new = timed(correlation_scan, df, 'UVB평균', keywords)
+    old, t_old = timed(legacy_scan, df, keywords, DEFAULT_LAGS)
+    print(f"  벡터 구현: {t_new:8.3f}s")
+    print(f"  기존 구현: {t_old:8.3f}s  (x{t_old / t_new:,.1f})")
+
+    cols = ['pearson', 'spearman', 'best_lag', 'best_lag_r']
+    same = np.allclose(old[cols].to_numpy(float), new.loc[old.index, cols].to_numpy(float))
+    print(f"  결과 일치: {'✅' if same else '❌'}")
+
+    print_section(f"2. 이동 구간 상관 ({args.window}개월)")
+    new, t_new = timed(rolling_correlation, df, 'UVB평균', keywords, args.window)
+    old, t_old = timed(legacy_rolling, df, keywords, args.window)
+    print(f"  벡터 구현: {t_new:8.3f}s")
+    print(f"  기존 구현: {t_old:8.3f}s  (x{t_old / t_new:,.1f})")
+
+    same = np.allclose(old.to_numpy(), new.to_numpy(), equal_nan=True)
+    print(f"  결과 일치: {'✅' if same else '❌'}")
+
+
+if __name__ == "__main__":
+    main()
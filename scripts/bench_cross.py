@@ -0,0 +1,107 @@
+"""
+SODA 프로젝트 - 교차 이용률 추정 벤치마크
+=======================================
+
+노트북 방식(지역 × 연도마다 DataFrame 필터 + 셀별 계산)과
+analysis.cross_estimate 브로드캐스팅 추정을 17개 시도 × 4개 조사 연도 규모에서 비교
+(실제 데이터는 전국만 있으므로 전국 값에 잡음을 더해 시도 데이터를 만듦)
+
+실행:
+    python scripts/bench_cross.py
+    python scripts/bench_cross.py --regions 17
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# ============================================
+# 경로 설정
+# ============================================
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent
+src_dir = project_root / 'src'
+
+if str(src_dir) not in sys.path:
+    sys.path.insert(0, str(src_dir))
+
+from analysis.cross_estimate import estimate_cross
+from kosis import load_kosis
+
+AGES = ['20∼29세', '30∼39세', '40∼49세']
+INCOMES = ['300∼400만원 미만', '400∼500만원 미만', '500∼600만원 미만', '600만원 이상']
+
+
+def print_section(title):
+    """섹션 제목 출력"""
+    print("\n" + "="*70)
+    print(f"  {title}")
+    print("="*70)
+
+
+def timed(func, *args, **kwargs):
+    """(결과, 소요 시간[초]) 반환"""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def make_regions(long, n_regions, seed=0):
+    """전국 long format → 시도별 long format (이용률에 ±20% 잡음)"""
+    rng = np.random.default_rng(seed)
+    national = long[long['metric'] == '원데이터'].drop(columns='metric')
+    pieces = []
+    for r in range(n_regions):
+        piece = national.copy()
+        piece['region'] = f'시도{r:02d}'
+        piece['value'] = piece['value'].to_numpy() * rng.uniform(0.8, 1.2, len(piece))
+        pieces.append(piece)
+    return pd.concat(pieces, ignore_index=True)
+
+
+def legacy_cross(long):
+    """노트북 방식: 지역 × 연도 × 셀마다 필터 후 계산"""
+    results = {}
+    for region in pd.unique(long['region']):
+        for year in sorted(pd.unique(long['year'])):
+            sub = long[(long['region'] == region) & (long['year'] == year)]
+            avg_rate = sub[sub['characteristic'] == '전체']['value'].values[0]
+            table = pd.DataFrame(index=AGES, columns=INCOMES, dtype=float)
+            for age in AGES:
+                for income in INCOMES:
+                    age_rate = sub[sub['detail'] == age]['value'].values[0]
+                    income_rate = sub[sub['detail'] == income]['value'].values[0]
+                    table.loc[age, income] = avg_rate * (age_rate / avg_rate) * (income_rate / avg_rate)
+            results[(region, year)] = table
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="교차 이용률 추정 벤치마크")
+    parser.add_argument("--regions", type=int, default=17, help="시도 수")
+    args = parser.parse_args()
+
+    print_section("⏱️  교차 이용률 추정 벤치마크")
+    national = load_kosis(project_root / 'data' / '02_통계청_지난1년간_스키장_이용_횟수.csv')
+    long = make_regions(national, args.regions)
+    print(f"입력: {len(long):,}행 ({args.regions}개 시도 × {long['year'].nunique()}개 연도)")
+
+    old, t_old = timed(legacy_cross, long)
+    new, t_new = timed(estimate_cross, long, '연령', '가구소득', AGES, INCOMES)
+    ipf, t_ipf = timed(estimate_cross, long, '연령', '가구소득', AGES, INCOMES, method='ipf')
+
+    same = all(np.allclose(table.to_numpy(), new.frame(region, year).to_numpy())
+               for (region, year), table in old.items())
+
+    print_section("셀별 계산 vs 브로드캐스팅")
+    print(f"  셀별 계산       {t_old * 1000:9.1f}ms")
+    print(f"  브로드캐스팅    {t_new * 1000:9.1f}ms (x{t_old / t_new:,.0f}) {'✅' if same else '❌'}")
+    print(f"  IPF ({ipf.iterations}회 반복) {t_ipf * 1000:9.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+SODA 프로젝트 - 집계 큐브 벤치마크
+=================================
+
+일별 세그먼트 × 키워드 long format 원본을 매번 groupby하는 방식과
+analysis.cube 집계 큐브 조회를 전체 그리드 규모에서 비교
+
+실행:
+    python scripts/bench_cube.py
+    python scripts/bench_cube.py --segments 66 --keywords 200 --days 1826
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# ============================================
+# 경로 설정
+# ============================================
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent
+src_dir = project_root / 'src'
+
+if str(src_dir) not in sys.path:
+    sys.path.insert(0, str(src_dir))
+
+from analysis.cube import AggregateCube
+from analysis.seasons import add_calendar_features
+
+
+def print_section(title):
+    """섹션 제목 출력"""
+    print("\n" + "="*70)
+    print(f"  {title}")
+    print("="*70)
+
+
+def timed(func, *args, **kwargs):
+    """(결과, 소요 시간[초]) 반환"""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def make_long(n_segments, n_keywords, n_days, seed=0):
+    """일별 세그먼트 × 키워드 long format (collect_dataset_4 결과 형태)"""
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range("2021-01-01", periods=n_days, freq="D")
+    n_series = n_segments * n_keywords
+
+    return pd.DataFrame({
+        "date": np.tile(dates, n_series),
+        "keyword": np.repeat(np.tile([f"키워드{k:03d}" for k in range(n_keywords)], n_segments), n_days),
+        "segment": np.repeat([f"세그먼트{s:02d}" for s in range(n_segments)], n_keywords * n_days),
+        "search_volume": rng.uniform(0, 100, n_series * n_days),
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description="집계 큐브 벤치마크")
+    parser.add_argument("--segments", type=int, default=66, help="세그먼트 수 (성별 × 연령 × 기기)")
+    parser.add_argument("--keywords", type=int, default=100)
+    parser.add_argument("--days", type=int, default=1826, help="기간 (일, 기본 5년)")
+    args = parser.parse_args()
+
+    print_section("⏱️  집계 큐브 벤치마크")
+    df = make_long(args.segments, args.keywords, args.days)
+    add_calendar_features(df)
+    print(f"원본: {len(df):,}행 ({df.memory_usage(deep=True).sum() / 1e6:,.0f} MB)")
+
+    cube, t_build = timed(AggregateCube.from_frame, df)
+    path = Path(tempfile.gettempdir()) / "bench_cube.npz"
+    cube.save(path)
+    print(f"큐브 생성: {t_build:.2f}s / 저장 크기: {path.stat().st_size / 1e6:,.1f} MB  {cube}")
+
+    queries = [
+        ("세그먼트 × 키워드 평균",
+         lambda: df.groupby(["segment", "keyword"])["search_volume"].mean(),
+         lambda: cube.query("mean")),
+        ("겨울 세그먼트 × 키워드 평균",
+         lambda: df[df["season"] == "겨울"].groupby(["segment", "keyword"])["search_volume"].mean(),
+         lambda: cube.query("mean", where={"season": "겨울"})),
+        ("키워드 × 연도 최대",
+         lambda: df.groupby(["keyword", "year"])["search_volume"].max(),
+         lambda: cube.query("max", by=("keyword", "year"))),
+        ("세그먼트 × 월 표준편차 (2024년)",
+         lambda: df[df["year"] == 2024].groupby(["segment", "month"])["search_volume"].std(),
+         lambda: cube.query("std", by=("segment", "month"), where={"year": 2024})),
+        ("키워드 × 계절 평균",
+         lambda: df.groupby(["keyword", "season"])["search_volume"].mean(),
+         lambda: cube.query("mean", by=("keyword", "season"))),
+    ]
+
+    print_section("groupby (원본) vs 큐브 조회")
+    for name, legacy, fast in queries:
+        old, t_old = timed(legacy)
+        new, t_new = timed(fast)
+        same = np.allclose(old.to_numpy(), new.loc[old.index].to_numpy())
+        print(f"  {name:<28} groupby {t_old * 1000:8.1f}ms | 큐브 {t_new * 1000:7.2f}ms "
+              f"(x{t_old / t_new:,.0f}) {'✅' if same else '❌'}")
+
+
+if __name__ == "__main__":
+    main()
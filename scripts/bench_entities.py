@@ -0,0 +1,148 @@
+"""
+SODA 프로젝트 - 상품 동일성 판별 벤치마크
+=======================================
+
+여러 쇼핑몰이 같은 상품을 서로 다른 상품명으로 올린 쇼핑 검색 결과를 합성해
+analysis.entities.resolve_entities의 처리 시간과 정확도(정답 상품 대비 쌍 단위 정밀도 / 재현율)를 측정
+
+실행:
+    python scripts/bench_entities.py
+    python scripts/bench_entities.py --listings 300000 --products 20000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# ============================================
+# 경로 설정
+# ============================================
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent
+src_dir = project_root / 'src'
+
+if str(src_dir) not in sys.path:
+    sys.path.insert(0, str(src_dir))
+
+from analysis.entities import canonical_products, resolve_entities
+
+BRANDS = ["라운드랩", "토리든", "닥터지", "아넷사", "비오레", "라로슈포제", "이니스프리", "구달"]
+LINES = ["자작나무", "다이브인", "그린", "마일드", "퍼펙트", "아쿠아", "수분", "톤업", "무기자차", "비건",
+         "시카", "어성초", "히알루론", "세라마이드", "카밍", "워터", "에센스", "젤", "로션", "밀크"]
+TYPES = ["선크림", "선스틱", "선쿠션", "선세럼", "선밀크"]
+MALLS = ["네이버", "쿠팡", "11번가", "G마켓", "올리브영", "SSG닷컴", "롯데ON", "위메프"]
+VOLUMES = ["50", "60", "40", "100", "25", "70"]
+PACKS = ["", " x 2", " 1+1", " 3개입"]
+PROMOS = ["[무료배송]", "(정품)", "[특가]", "당일발송", "[공식]", "NEW", "【증정】", "사은품"]
+
+
+def print_section(title):
+    """섹션 제목 출력"""
+    print("\n" + "="*70)
+    print(f"  {title}")
+    print("="*70)
+
+
+def timed(func, *args, **kwargs):
+    """(결과, 소요 시간[초]) 반환"""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def make_catalog(n_products, rng):
+    """정답 상품 (브랜드, 라인 토큰 2~3개, 종류, SPF, 용량, 수량)"""
+    catalog = []
+    for _ in range(n_products):
+        line = list(rng.choice(LINES, rng.integers(2, 4), replace=False))
+        catalog.append({
+            "brand": str(rng.choice(BRANDS)),
+            "tokens": line + [str(rng.choice(TYPES)), f"SPF{rng.choice(['50+', '50', '35'])}",
+                              f"M{rng.integers(100, 1000)}"],
+            "volume": str(rng.choice(VOLUMES)),
+            "pack": str(rng.choice(PACKS)),
+            "price": int(rng.integers(8, 40)) * 1000,
+        })
+    return catalog
+
+
+def make_listings(n_listings, n_products, seed=0):
+    """
+    쇼핑몰별 상품명 변형 (홍보 문구, 토큰 순서, 단위 표기, 모델 번호 / 토큰 하나 누락, 브랜드 빈 값)
+
+    Returns:
+        (NaverShopping.to_dataframe 형태 DataFrame, 정답 상품 번호 배열)
+    """
+    rng = np.random.default_rng(seed)
+    catalog = make_catalog(n_products, rng)
+    truth = rng.integers(0, n_products, n_listings)
+    rows = []
+    for product_index in truth:
+        product = catalog[product_index]
+        tokens = list(product["tokens"])
+        if rng.random() < 0.4:
+            tokens.pop()                                            # 모델 번호 없음
+        if rng.random() < 0.3:
+            tokens.pop(int(rng.integers(0, len(tokens) - 2)))       # 라인 토큰 하나 누락
+        if rng.random() < 0.5:
+            rng.shuffle(tokens)
+        unit = rng.choice(["ml", "mL", " ml", "㎖"])
+        parts = [f"[{product['brand']}]" if rng.random() < 0.3 else product["brand"], *tokens,
+                 f"{product['volume']}{unit}{product['pack']}"]
+        if rng.random() < 0.6:
+            parts.insert(int(rng.integers(0, len(parts) + 1)), str(rng.choice(PROMOS)))
+        rows.append({
+            "title": " ".join(parts),
+            "lprice": product["price"] + int(rng.integers(-20, 20)) * 100,
+            "hprice": 0,
+            "mallName": str(rng.choice(MALLS)),
+            "productId": str(rng.integers(10**9, 10**10)),
+            "brand": product["brand"] if rng.random() < 0.7 else "",
+            "maker": "",
+        })
+    return pd.DataFrame(rows), truth
+
+
+def pair_scores(truth, predicted):
+    """쌍 단위 정밀도 / 재현율 (같은 상품으로 묶인 listing 쌍 기준)"""
+    def pairs(counts):
+        counts = np.asarray(counts, dtype=np.int64)
+        return int((counts * (counts - 1) // 2).sum())
+
+    both = pairs(pd.crosstab(truth, predicted).to_numpy().ravel())
+    predicted_pairs = pairs(np.bincount(predicted))
+    true_pairs = pairs(np.bincount(truth))
+    return both / max(predicted_pairs, 1), both / max(true_pairs, 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="상품 동일성 판별 벤치마크")
+    parser.add_argument("--listings", type=int, default=100_000, help="전체 listing 수")
+    parser.add_argument("--products", type=int, default=10_000, help="정답 상품 수")
+    args = parser.parse_args()
+
+    print_section("⏱️  상품 동일성 판별 벤치마크")
+    df, truth = make_listings(args.listings, args.products)
+    print(f"입력: {len(df):,}개 listing (정답 상품 {len(np.unique(truth)):,}개, "
+          f"고유 상품명 {df['title'].nunique():,}개)")
+
+    entity_ids, t_resolve = timed(resolve_entities, df, BRANDS)
+    products, t_summary = timed(canonical_products, df, entity_ids)
+    precision, recall = pair_scores(truth, entity_ids.to_numpy())
+
+    print_section("결과")
+    print(f"  동일성 판별       {t_resolve:8.2f}s → 대표 상품 {entity_ids.nunique():,}개")
+    print(f"  대표 상품 표      {t_summary:8.2f}s")
+    print(f"  쌍 단위 정밀도    {precision:8.1%}")
+    print(f"  쌍 단위 재현율    {recall:8.1%}")
+
+    print_section("listing이 많은 대표 상품")
+    print(products.head(10).to_string())
+
+
+if __name__ == "__main__":
+    main()
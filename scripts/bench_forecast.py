@@ -0,0 +1,113 @@
+"""
+SODA 프로젝트 - 트렌드 시계열 일괄 예측 벤치마크
+=============================================
+
+Dataset 4 형태(세그먼트 × 키워드, 월별 검색 비율) 합성 시계열로
+analysis.forecast의 Holt-Winters 일괄 예측 시간(단일 프로세스 / 프로세스 풀)과
+마지막 12개월 홀드아웃 정확도(계절 나이브 대비 MAPE, 95% 예측 구간 포함률)를 측정
+
+실행:
+    python scripts/bench_forecast.py
+    python scripts/bench_forecast.py --series 2000 --months 72 --workers 8
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# ============================================
+# 경로 설정
+# ============================================
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent
+src_dir = project_root / 'src'
+
+if str(src_dir) not in sys.path:
+    sys.path.insert(0, str(src_dir))
+
+from analysis.forecast import DEFAULT_HORIZON, forecast_series
+
+
+def print_section(title):
+    """섹션 제목 출력"""
+    print("\n" + "="*70)
+    print(f"  {title}")
+    print("="*70)
+
+
+def timed(func, *args, **kwargs):
+    """(결과, 소요 시간[초]) 반환"""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def make_series(n_series, n_months, seed=0):
+    """
+    long format 합성 검색 비율 (date, segment, keyword, search_volume)
+
+    여름 / 겨울 정점 시계열이 섞인 승법 계절성 + 완만한 추세 + 잡음
+    """
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range("2020-01-01", periods=n_months, freq="MS")
+    months = dates.month.to_numpy()
+
+    peak = rng.choice([6, 1], n_series, p=[0.7, 0.3])                       # 선크림형 / 스키형
+    amplitude = rng.uniform(0.3, 0.9, n_series)
+    base = rng.uniform(5, 60, n_series)
+    growth = rng.normal(0.003, 0.004, n_series)
+    phase = np.cos(2 * np.pi * (months[None, :] - peak[:, None]) / 12)
+    level = base[:, None] * np.exp(growth[:, None] * np.arange(n_months))
+    values = level * np.exp(amplitude[:, None] * phase) * rng.lognormal(0, 0.08, (n_series, n_months))
+    values = values / values.max(axis=1, keepdims=True) * 100                 # DataLab처럼 최댓값 100
+
+    return pd.DataFrame({
+        "date": np.tile(dates, n_series),
+        "segment": np.repeat([f"세그먼트{i // 10:03d}" for i in range(n_series)], n_months),
+        "keyword": np.repeat([f"키워드{i % 10}" for i in range(n_series)], n_months),
+        "search_volume": values.ravel(),
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description="트렌드 시계열 일괄 예측 벤치마크")
+    parser.add_argument("--series", type=int, default=800, help="시계열 수")
+    parser.add_argument("--months", type=int, default=60, help="시계열 길이 (월, 홀드아웃 12개월 포함)")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: CPU 수)")
+    args = parser.parse_args()
+
+    print_section("⏱️  트렌드 시계열 일괄 예측 벤치마크")
+    df = make_series(args.series, args.months)
+    cutoff = df["date"].sort_values().unique()[-DEFAULT_HORIZON]
+    train, test = df[df["date"] < cutoff], df[df["date"] >= cutoff]
+    print(f"입력: {args.series:,}개 시계열 × {args.months}개월 (마지막 {DEFAULT_HORIZON}개월 홀드아웃)")
+
+    key = ["segment", "keyword"]
+    _, t_single = timed(forecast_series, train, key=key, workers=1)
+    forecast, t_pool = timed(forecast_series, train, key=key, workers=args.workers)
+
+    print_section("처리 시간")
+    print(f"  단일 프로세스                {t_single:8.2f}s ({t_single / args.series * 1000:.2f} ms/시계열)")
+    print(f"  프로세스 풀                  {t_pool:8.2f}s ({t_pool / args.series * 1000:.2f} ms/시계열)")
+
+    # 정확도: 계절 나이브 (1년 전 같은 달) 대비
+    merged = forecast.merge(test, on=key + ["date"])
+    last_year = train.assign(date=train["date"] + pd.DateOffset(years=1))
+    merged = merged.merge(last_year.rename(columns={"search_volume": "naive"}), on=key + ["date"])
+    actual = merged["search_volume"]
+    mape = (merged["forecast"] - actual).abs().div(actual).mean() * 100
+    naive_mape = (merged["naive"] - actual).abs().div(actual).mean() * 100
+    coverage = ((actual >= merged["lower"]) & (actual <= merged["upper"])).mean() * 100
+
+    print_section(f"홀드아웃 정확도 ({DEFAULT_HORIZON}개월)")
+    print(f"  Holt-Winters MAPE            {mape:8.2f}%")
+    print(f"  계절 나이브 MAPE             {naive_mape:8.2f}%")
+    print(f"  95% 예측 구간 포함률         {coverage:8.2f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""
+SODA 프로젝트 - 트렌드 이상 감지 벤치마크
+=======================================
+
+세그먼트 × 키워드 일별 검색 비율 형태 합성 시계열(급등 / 수준 변화 주입)로
+monitor.TrendMonitor의 처리 시간(전체 이력 첫 실행 / 하루치 추가 실행)과
+주입한 이상의 탐지율, 정상 구간 오탐 수, 상태 파일 크기를 측정
+
+실행:
+    python scripts/bench_monitor.py
+    python scripts/bench_monitor.py --series 20000 --days 365
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# ============================================
+# 경로 설정
+# ============================================
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent
+src_dir = project_root / 'src'
+
+if str(src_dir) not in sys.path:
+    sys.path.insert(0, str(src_dir))
+
+from monitor import KEY_SEPARATOR, TrendMonitor
+
+
+def print_section(title):
+    """섹션 제목 출력"""
+    print("\n" + "="*70)
+    print(f"  {title}")
+    print("="*70)
+
+
+def timed(func, *args, **kwargs):
+    """(결과, 소요 시간[초]) 반환"""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def make_feed(n_series, n_days, spike_share=0.2, shift_share=0.1, seed=0):
+    """
+    long format 합성 일별 검색 비율 + 주입한 이상 목록
+
+    Returns:
+        (DataFrame: date, segment, keyword, search_volume,
+         DataFrame: series, date, kind)
+    """
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range("2024-01-01", periods=n_days, freq="D")
+    base = rng.uniform(10, 60, n_series)
+    weekly = 1 + 0.08 * np.sin(2 * np.pi * np.arange(n_days) / 7)
+    yearly = 1 + 0.3 * np.cos(2 * np.pi * (np.arange(n_days) - 170) / 365)
+    values = base[:, None] * weekly * yearly * rng.lognormal(0, 0.06, (n_series, n_days))
+
+    injected = []
+    window = np.arange(n_days // 3, n_days - 5)
+    for i in np.flatnonzero(rng.random(n_series) < spike_share):
+        day = rng.choice(window)
+        values[i, day] *= rng.uniform(1.8, 3.0)
+        injected.append((i, day, 'spike'))
+    for i in np.flatnonzero(rng.random(n_series) < shift_share):
+        day = rng.choice(window)
+        values[i, day:] *= rng.uniform(1.4, 1.8)
+        injected.append((i, day, 'shift'))
+
+    segments = np.array([f"세그먼트{i // 10:04d}" for i in range(n_series)])
+    keywords = np.array([f"키워드{i % 10}" for i in range(n_series)])
+    feed = pd.DataFrame({
+        "date": np.tile(dates, n_series),
+        "segment": np.repeat(segments, n_days),
+        "keyword": np.repeat(keywords, n_days),
+        "search_volume": values.ravel(),
+    })
+    truth = pd.DataFrame([(segments[i] + KEY_SEPARATOR + keywords[i], dates[day], kind)
+                          for i, day, kind in injected], columns=["series", "date", "kind"])
+    return feed, truth
+
+
+def main():
+    parser = argparse.ArgumentParser(description="트렌드 이상 감지 벤치마크")
+    parser.add_argument("--series", type=int, default=5000, help="시계열 수")
+    parser.add_argument("--days", type=int, default=180, help="일 수 (마지막 하루는 추가 실행으로 처리)")
+    args = parser.parse_args()
+
+    print_section("⏱️  트렌드 이상 감지 벤치마크")
+    feed, truth = make_feed(args.series, args.days)
+    last_day = feed["date"].max()
+    history = feed[feed["date"] < last_day]
+    print(f"입력: {args.series:,}개 시계열 × {args.days}일 ({len(feed):,}행), "
+          f"주입한 이상 {len(truth):,}개 (급등 {(truth['kind'] == 'spike').sum():,} / "
+          f"수준 변화 {(truth['kind'] == 'shift').sum():,})")
+
+    key = ["segment", "keyword"]
+    with tempfile.TemporaryDirectory() as tmp:
+        state_path = Path(tmp) / "state.npz"
+        monitor = TrendMonitor()
+        first, t_first = timed(monitor.process, history, key=key)
+        _, t_save = timed(monitor.save, state_path)
+        size = state_path.stat().st_size
+
+        monitor, t_load = timed(TrendMonitor.load, state_path)
+        last, t_daily = timed(monitor.process, feed, key=key)          # 전체 이력을 넘겨도 새 날짜만
+        _, t_rerun = timed(monitor.process, feed, key=key)              # 같은 수집 결과 재실행 → 처리 없음
+    alerts = pd.concat([first, last], ignore_index=True)
+
+    print_section("처리 시간")
+    print(f"  첫 실행 ({args.days - 1}일 이력)         {t_first:8.2f}s "
+          f"({t_first / (args.days - 1) * 1000:.1f} ms/일)")
+    print(f"  하루치 추가 (전체 이력 입력)  {t_daily:8.3f}s")
+    print(f"  같은 입력 재실행             {t_rerun:8.3f}s")
+    print(f"  상태 저장 / 불러오기         {t_save:8.3f}s / {t_load:.3f}s ({size / 1024:,.0f} KB, "
+          f"시계열당 {size / args.series:.0f} B)")
+
+    # 탐지: 주입 날짜부터 7일 안에 같은 시계열 알림
+    joined = truth.merge(alerts[["series", "date", "kind"]], on="series", how="left",
+                         suffixes=("", "_alert"))
+    delay = (joined["date_alert"] - joined["date"]).dt.days
+    joined["hit"] = delay.between(0, 7)
+    recall = joined.groupby(["series", "date", "kind"])["hit"].any().groupby("kind").mean() * 100
+
+    matched = alerts.merge(truth, on="series", how="left", suffixes=("", "_true"))
+    matched["near"] = (matched["date"] - matched["date_true"]).dt.days.between(0, 7)
+    explained = matched.groupby(["series", "date", "kind"])["near"].any()
+    false_alerts = int((~explained).sum())
+
+    print_section("탐지")
+    for kind, rate in recall.items():
+        print(f"  {kind:<6} 탐지율 (7일 이내)      {rate:8.1f}%")
+    print(f"  전체 알림                    {len(alerts):8,}개")
+    print(f"  주입하지 않은 곳 알림        {false_alerts:8,}개 "
+          f"({false_alerts / (args.series * args.days) * 1e4:.2f} / 만 관측)")
+
+
+if __name__ == "__main__":
+    main()
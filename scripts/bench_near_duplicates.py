@@ -0,0 +1,123 @@
+"""
+SODA 프로젝트 - 블로그 유사 중복 탐지 벤치마크
+===========================================
+
+협찬 원고를 조금씩 바꾼 글(단어 삽입 / 삭제 / 교체)이 섞인 합성 블로그 글로
+analysis.near_duplicates의 MinHash 서명 / LSH 묶음 처리 시간과 정확도(쌍 단위 정밀도 / 재현율)를 측정
+
+실행:
+    python scripts/bench_near_duplicates.py
+    python scripts/bench_near_duplicates.py --posts 500000 --duplicate-share 0.3
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# ============================================
+# 경로 설정
+# ============================================
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent
+src_dir = project_root / 'src'
+
+if str(src_dir) not in sys.path:
+    sys.path.insert(0, str(src_dir))
+
+from analysis.near_duplicates import lsh_clusters, minhash_signatures
+from analysis.text import blog_documents
+
+WORDS = ["스키장", "보드", "리프트", "슬로프", "시즌권", "렌탈", "선크림", "자외선", "톤업", "피부", "후기",
+         "추천", "가격", "주말", "여행", "강습", "곤돌라", "눈썰매", "야간", "숙소", "맛집", "주차", "할인",
+         "예약", "초보", "상급", "장비", "고글", "헬멧", "장갑", "따뜻", "추위", "바람", "눈", "날씨", "사진"]
+
+
+def print_section(title):
+    """섹션 제목 출력"""
+    print("\n" + "="*70)
+    print(f"  {title}")
+    print("="*70)
+
+
+def timed(func, *args, **kwargs):
+    """(결과, 소요 시간[초]) 반환"""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def make_posts(n_posts, duplicate_share, n_templates, seed=0):
+    """
+    NaverBlog.to_dataframe 형태 합성 글 + 정답 묶음 번호
+
+    duplicate_share 비율은 n_templates개 원고 중 하나를 단어 1~3개 바꿔 쓴 글, 나머지는 모두 다른 글
+    """
+    rng = np.random.default_rng(seed)
+    templates = [list(rng.choice(WORDS, 40)) for _ in range(n_templates)]
+    is_copy = rng.random(n_posts) < duplicate_share
+    template_of = rng.integers(0, n_templates, n_posts)
+
+    titles, descriptions, truth = [], [], np.empty(n_posts, dtype=np.int64)
+    for i in range(n_posts):
+        if is_copy[i]:
+            words = list(templates[template_of[i]])
+            for _ in range(rng.integers(1, 4)):
+                position = int(rng.integers(0, len(words)))
+                edit = rng.integers(0, 3)
+                if edit == 0:
+                    words[position] = str(rng.choice(WORDS))
+                elif edit == 1:
+                    words.insert(position, str(rng.choice(WORDS)))
+                else:
+                    del words[position]
+            truth[i] = template_of[i]
+        else:
+            words = list(rng.choice(WORDS, 40))
+            truth[i] = n_templates + i
+        titles.append(" ".join(words[:6]))
+        descriptions.append(" ".join(words[6:]))
+    df = pd.DataFrame({"title": titles, "description": descriptions})
+    return df, truth
+
+
+def pair_scores(truth, predicted):
+    """쌍 단위 정밀도 / 재현율 (같은 묶음으로 분류된 글 쌍 기준)"""
+    def pairs(counts):
+        counts = np.asarray(counts, dtype=np.int64)
+        return int((counts * (counts - 1) // 2).sum())
+
+    joint = pd.Series(1, index=pd.MultiIndex.from_arrays([truth, predicted])).groupby(level=[0, 1]).size()
+    both = pairs(joint.to_numpy())
+    return both / max(pairs(np.bincount(predicted)), 1), both / max(pairs(np.unique(truth, return_counts=True)[1]), 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="블로그 유사 중복 탐지 벤치마크")
+    parser.add_argument("--posts", type=int, default=200_000, help="글 수")
+    parser.add_argument("--duplicate-share", type=float, default=0.2, help="협찬 원고 복제 글 비율")
+    parser.add_argument("--templates", type=int, default=2_000, help="원고 수")
+    args = parser.parse_args()
+
+    print_section("⏱️  블로그 유사 중복 탐지 벤치마크")
+    df, truth = make_posts(args.posts, args.duplicate_share, args.templates)
+    texts = blog_documents(df)
+    print(f"입력: {len(df):,}개 글 (정답 묶음 {len(np.unique(truth)):,}개)")
+
+    signatures, t_sign = timed(minhash_signatures, texts)
+    clusters, t_lsh = timed(lsh_clusters, signatures)
+    precision, recall = pair_scores(truth, clusters)
+
+    print_section("결과")
+    print(f"  MinHash 서명         {t_sign:8.2f}s ({signatures.shape[1]}개 해시)")
+    print(f"  LSH 묶음             {t_lsh:8.2f}s → 묶음 {clusters.max() + 1:,}개 "
+          f"(대표 글만 남기면 {len(df) - clusters.max() - 1:,}개 제거)")
+    print(f"  쌍 단위 정밀도        {precision:8.1%}")
+    print(f"  쌍 단위 재현율        {recall:8.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+SODA 프로젝트 - 쇼핑 가격 분석 벤치마크
+=====================================
+
+여러 검색어의 쇼핑 검색 결과(get_all_products, columnar=True 형태)를 합성해
+analysis.prices의 listing 결합 / 용량 추출 / 그룹별 요약과 분위수 스케치를 측정
+(스케치 분위수는 정확한 분위수와의 최대 상대 오차도 출력)
+
+실행:
+    python scripts/bench_prices.py
+    python scripts/bench_prices.py --listings 500000 --queries 200
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# ============================================
+# 경로 설정
+# ============================================
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent
+src_dir = project_root / 'src'
+
+if str(src_dir) not in sys.path:
+    sys.path.insert(0, str(src_dir))
+
+from analysis.prices import (
+    DEFAULT_QUANTILES, PriceSketches, brand_names, listings_frame, price_summary,
+)
+
+BRAND_KEYWORDS = ["라운드랩 선크림", "토리든 선크림", "닥터지 선크림", "아넷사 선크림", "비오레 선크림"]
+MALLS = ["네이버", "쿠팡", "11번가", "G마켓", "올리브영", "SSG닷컴", "롯데ON", "위메프"]
+CATEGORIES = ["선크림", "선스틱", "선쿠션", "선스프레이", "선밤"]
+VOLUMES = ["50ml", "60mL", "40ml", "100ml", "1.5L", "25ml", ""]
+PACKS = ["", " x 2", " 1+1", " 3개입", " 2개", ""]
+
+
+def print_section(title):
+    """섹션 제목 출력"""
+    print("\n" + "="*70)
+    print(f"  {title}")
+    print("="*70)
+
+
+def timed(func, *args, **kwargs):
+    """(결과, 소요 시간[초]) 반환"""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def make_results(n_listings, n_queries, duplicate_share=0.3, seed=0):
+    """
+    검색어별 columnar 쇼핑 검색 결과 (brand는 30%가 빈 값 → 상품명에서 추출)
+
+    상품명은 duplicate_share 비율만큼 다른 검색어와 겹침 (나머지는 모델 번호로 모두 다름)
+    """
+    rng = np.random.default_rng(seed)
+    brands = brand_names(BRAND_KEYWORDS)
+    per_query = n_listings // n_queries
+    results = {}
+    for q in range(n_queries):
+        brand = rng.choice(brands, per_query)
+        model = np.where(rng.random(per_query) < duplicate_share,
+                         rng.integers(0, 1000, per_query), rng.integers(10**6, 10**8, per_query))
+        title = [f"<b>{b}</b> 선크림 SPF50+ M{m} {v}{p}" for b, m, v, p in
+                 zip(brand, model, rng.choice(VOLUMES, per_query), rng.choice(PACKS, per_query))]
+        lprice = np.round(rng.lognormal(9.8, 0.5, per_query), -1).astype(int)
+        hprice = np.where(rng.random(per_query) < 0.4, lprice + rng.integers(0, 20000, per_query), 0)
+        results[f"선크림 {q:03d}"] = {
+            'title': title,
+            'lprice': lprice.astype(str).tolist(),
+            'hprice': hprice.astype(str).tolist(),
+            'mallName': rng.choice(MALLS, per_query).tolist(),
+            'brand': np.where(rng.random(per_query) < 0.3, '', brand).tolist(),
+            'maker': [''] * per_query,
+            'category1': ['화장품/미용'] * per_query,
+            'category2': ['선케어'] * per_query,
+            'category3': rng.choice(CATEGORIES, per_query).tolist(),
+            'category4': [''] * per_query,
+            'productId': rng.integers(10**9, 10**10, per_query).astype(str).tolist(),
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="쇼핑 가격 분석 벤치마크")
+    parser.add_argument("--listings", type=int, default=300_000, help="전체 상품 수")
+    parser.add_argument("--queries", type=int, default=100, help="검색어 수")
+    parser.add_argument("--batches", type=int, default=10, help="스케치 누적 배치 수")
+    args = parser.parse_args()
+
+    print_section("⏱️  쇼핑 가격 분석 벤치마크")
+    results = make_results(args.listings, args.queries)
+
+    df, t_load = timed(listings_frame, results, brand_names(BRAND_KEYWORDS))
+    print(f"입력: {len(df):,}개 상품 ({args.queries}개 검색어)")
+
+    by_brand, t_brand = timed(price_summary, df, ("brand",))
+    by_mall, t_mall = timed(price_summary, df, ("brand", "mallName"))
+    _, t_category = timed(price_summary, df, ("category3",))
+
+    # 배치별 스케치 누적 (수집할 때마다 갱신하는 상황)
+    def sketch_batches():
+        sketches = PriceSketches(("brand",))
+        for batch in np.array_split(np.arange(len(df)), args.batches):
+            sketches.update(df.iloc[batch])
+        return sketches
+
+    sketches, t_sketch = timed(sketch_batches)
+    approx = sketches.summary()
+    exact = df.groupby("brand", observed=True)["lprice"].quantile(list(DEFAULT_QUANTILES),
+                                                                  interpolation="lower").unstack()
+    error = np.abs(approx[[f"q{round(q * 100):02d}" for q in DEFAULT_QUANTILES]].to_numpy()
+                   / exact.loc[approx.index].to_numpy() - 1).max()
+
+    print_section("처리 시간")
+    print(f"  listing 결합 + 용량 추출  {t_load * 1000:9.1f}ms "
+          f"(용량 인식 {df['total_ml'].notna().mean():.0%})")
+    print(f"  브랜드별 요약            {t_brand * 1000:9.1f}ms")
+    print(f"  브랜드 × 쇼핑몰 요약      {t_mall * 1000:9.1f}ms ({len(by_mall)}개 그룹)")
+    print(f"  카테고리별 요약           {t_category * 1000:9.1f}ms")
+    print(f"  스케치 누적 ({args.batches}배치)     {t_sketch * 1000:9.1f}ms "
+          f"(정확한 분위수 대비 최대 오차 {error:.2%})")
+
+    print_section("브랜드별 가격 요약")
+    print(by_brand.round(1).to_string())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+SODA 프로젝트 - 계절 통계 벤치마크
+=================================
+
+기존 구현(키워드마다 apply로 계절 라벨 → groupby → ttest_ind 반복)과
+analysis.seasonal_stats 일괄 계산을 키워드 수백 개 규모에서 비교
+
+실행:
+    python scripts/bench_seasonal.py
+    python scripts/bench_seasonal.py --series 2000 --months 120
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+# ============================================
+# 경로 설정
+# ============================================
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent
+src_dir = project_root / 'src'
+
+if str(src_dir) not in sys.path:
+    sys.path.insert(0, str(src_dir))
+
+from analysis.seasons import add_calendar_features
+from analysis.seasonal_stats import season_means, season_ttest, yoy_growth
+
+
+def print_section(title):
+    """섹션 제목 출력"""
+    print("\n" + "="*70)
+    print(f"  {title}")
+    print("="*70)
+
+
+def timed(func, *args, **kwargs):
+    """(결과, 소요 시간[초]) 반환"""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def make_wide(n_series, n_months, seed=0):
+    """월별 검색량 wide format (date + 키워드 컬럼)"""
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range("2015-01-01", periods=n_months, freq="MS")
+    seasonal = 50 + 30 * np.sin((dates.month.to_numpy() - 3) / 12 * 2 * np.pi)
+    values = seasonal[:, None] + rng.normal(0, 10, size=(n_months, n_series))
+
+    df = pd.DataFrame(values, columns=[f"키워드{i:04d}" for i in range(n_series)])
+    df.insert(0, "date", dates)
+    return df
+
+
+# ============================================
+# 기존 구현 (collect_dataset_1 / Q1 노트북)
+# ============================================
+def legacy_summary(df, keywords):
+    df = df.copy()
+    df['year'] = df['date'].dt.year
+    df['month'] = df['date'].dt.month
+    df['season'] = df['month'].apply(
+        lambda x: '겨울' if x in [12, 1, 2] else ('여름' if x in [6, 7, 8] else '기타')
+    )
+
+    rows = {}
+    for keyword in keywords:
+        seasonal_avg = df.groupby('season')[keyword].mean()
+        summer = df[df['season'] == '여름'][keyword]
+        winter = df[df['season'] == '겨울'][keyword]
+        t_stat, p_value = stats.ttest_ind(summer, winter)
+        yearly_winter = df[df['season'] == '겨울'].groupby('year')[keyword].mean()
+        growth = yearly_winter.pct_change() * 100
+        rows[keyword] = (seasonal_avg['겨울'], seasonal_avg['여름'], t_stat, p_value, growth.mean())
+    return pd.DataFrame.from_dict(rows, orient='index',
+                                  columns=['winter', 'summer', 't_stat', 'p_value', 'growth'])
+
+
+# ============================================
+# 벡터 구현 (analysis.seasonal_stats)
+# ============================================
+def vectorized_summary(df):
+    add_calendar_features(df)
+    means = season_means(df)
+    test = season_ttest(df, '여름', '겨울')
+    growth = yoy_growth(df, '겨울')
+    return pd.DataFrame({
+        'winter': means.loc['겨울'],
+        'summer': means.loc['여름'],
+        't_stat': test['t_stat'],
+        'p_value': test['p_value'],
+        'growth': growth.mean(axis=0),
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description="계절 통계 벤치마크")
+    parser.add_argument("--series", type=int, default=500, help="키워드(시계열) 수")
+    parser.add_argument("--months", type=int, default=120, help="기간 (개월)")
+    args = parser.parse_args()
+
+    print_section("⏱️  계절 통계 벤치마크")
+    print(f"키워드: {args.series:,}개 / 기간: {args.months}개월")
+
+    df = make_wide(args.series, args.months)
+    keywords = [col for col in df.columns if col != 'date']
+
+    new, t_new = timed(vectorized_summary, df.copy())
+    old, t_old = timed(legacy_summary, df, keywords)
+
+    print(f"  벡터 구현: {t_new:8.3f}s")
+    print(f"  기존 구현: {t_old:8.3f}s  (x{t_old / t_new:,.1f})")
+
+    same = np.allclose(old.to_numpy(), new.loc[old.index].to_numpy(), equal_nan=True)
+    print(f"  결과 일치: {'✅' if same else '❌'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+"""
+SODA 프로젝트 - 세그먼트 분석 벤치마크
+=====================================
+
+기존 구현(collect_dataset_4의 중첩 루프 / Q4 노트북의 행 단위 apply)과
+analysis.segmentation 벡터 구현을 세그먼트 × 키워드 그리드 규모에서 비교
+
+실행:
+    python scripts/bench_segmentation.py
+    python scripts/bench_segmentation.py --grid-segments 5000 --grid-keywords 1000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# ============================================
+# 경로 설정
+# ============================================
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent
+src_dir = project_root / 'src'
+
+if str(src_dir) not in sys.path:
+    sys.path.insert(0, str(src_dir))
+
+from analysis.segmentation import (
+    QUADRANT_LABELS,
+    stack_segments,
+    segment_matrix,
+    quadrant_table,
+    assign_quadrants,
+)
+
+
+def print_section(title):
+    """섹션 제목 출력"""
+    print("\n" + "="*70)
+    print(f"  {title}")
+    print("="*70)
+
+
+def timed(func, *args, **kwargs):
+    """(결과, 소요 시간[초]) 반환"""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+# ============================================
+# 가상 그리드 데이터
+# ============================================
+def make_responses(n_segments, n_keywords, n_months, seed=0):
+    """세그먼트 × 키워드별 API 응답을 흉내낸 DataFrame 목록"""
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range("2023-01-01", periods=n_months, freq="MS")
+    keywords = ["선크림"] + [f"스포츠{i:03d}" for i in range(n_keywords - 1)]
+    segments = [f"세그먼트{i:04d}" for i in range(n_segments)]
+
+    responses = []
+    for keyword in keywords:
+        values = rng.uniform(0, 100, size=(n_segments, n_months))
+        for seg_idx, seg_name in enumerate(segments):
+            df = pd.DataFrame({"date": dates, keyword: values[seg_idx]})
+            responses.append((keyword, seg_name, df))
+    return keywords, segments, responses
+
+
+# ============================================
+# 기존 구현 (collect_dataset_4 / Q4 노트북)
+# ============================================
+def legacy_long_format(responses):
+    all_data_list = []
+    stats_summary = {}
+    for keyword, seg_name, df in responses:
+        df = df.copy()
+        df['year'] = df['date'].dt.year
+        df['month'] = df['date'].dt.month
+        stats_summary.setdefault(keyword, {})[seg_name] = df[keyword].mean()
+        for _, row in df.iterrows():
+            all_data_list.append({
+                'date': row['date'],
+                'keyword': keyword,
+                'segment': seg_name,
+                'search_volume': row[keyword],
+                'year': row['year'],
+                'month': row['month']
+            })
+    return pd.DataFrame(all_data_list), stats_summary
+
+
+def legacy_quadrants(stats_summary, segment_order, sport_keywords):
+    suncream_stats = stats_summary["선크림"]
+    suncream_avg = sum(suncream_stats.values()) / len(suncream_stats)
+    result = {}
+    for sport_name in sport_keywords:
+        sport_stats = stats_summary[sport_name]
+        sport_avg = sum(sport_stats.values()) / len(sport_stats)
+        for seg_name in segment_order:
+            sc_val = suncream_stats[seg_name]
+            sport_val = sport_stats[seg_name]
+            if sc_val >= suncream_avg and sport_val >= sport_avg:
+                quad = QUADRANT_LABELS["A"]
+            elif sc_val < suncream_avg and sport_val >= sport_avg:
+                quad = QUADRANT_LABELS["B"]
+            elif sc_val >= suncream_avg and sport_val < sport_avg:
+                quad = QUADRANT_LABELS["C"]
+            else:
+                quad = QUADRANT_LABELS["D"]
+            result[(seg_name, sport_name)] = quad
+    return result
+
+
+def legacy_apply(df_stats):
+    suncream_avg = df_stats['선크림'].mean()
+    sport_avg = df_stats['겨울스포츠'].mean()
+
+    def classify_quadrant(row):
+        sc = row['선크림']
+        ws = row['겨울스포츠']
+        if sc >= suncream_avg and ws >= sport_avg:
+            return QUADRANT_LABELS["A"]
+        elif sc < suncream_avg and ws >= sport_avg:
+            return QUADRANT_LABELS["B"]
+        elif sc >= suncream_avg and ws < sport_avg:
+            return QUADRANT_LABELS["C"]
+        else:
+            return QUADRANT_LABELS["D"]
+
+    return df_stats.apply(classify_quadrant, axis=1)
+
+
+# ============================================
+# 벡터 구현 (analysis.segmentation)
+# ============================================
+def vectorized_long_format(responses):
+    pieces = [
+        ({'keyword': keyword, 'segment': seg_name}, df['date'].to_numpy(), df[keyword].to_numpy())
+        for keyword, seg_name, df in responses
+    ]
+    return stack_segments(pieces)
+
+
+def make_stats(n_segments, n_keywords, seed=0):
+    """세그먼트 × 키워드 평균 매트릭스 (pivot)와 기존 stats_summary 딕셔너리"""
+    rng = np.random.default_rng(seed)
+    keywords = ["선크림"] + [f"스포츠{i:04d}" for i in range(n_keywords - 1)]
+    segments = [f"세그먼트{i:05d}" for i in range(n_segments)]
+    pivot = pd.DataFrame(rng.uniform(0, 100, size=(n_segments, n_keywords)),
+                         index=segments, columns=keywords)
+    stats_summary = {kw: dict(zip(segments, pivot[kw].tolist())) for kw in keywords}
+    return pivot, stats_summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="세그먼트 분석 벤치마크")
+    parser.add_argument("--segments", type=int, default=300,
+                        help="long format 변환 단계의 세그먼트 수")
+    parser.add_argument("--keywords", type=int, default=20,
+                        help="long format 변환 단계의 키워드 수")
+    parser.add_argument("--months", type=int, default=35)
+    parser.add_argument("--grid-segments", type=int, default=3000,
+                        help="4사분면 분류 단계의 세그먼트 수")
+    parser.add_argument("--grid-keywords", type=int, default=500,
+                        help="4사분면 분류 단계의 키워드 수")
+    parser.add_argument("--skip-legacy-long", action="store_true",
+                        help="iterrows 기반 long format 변환(가장 느림) 생략")
+    args = parser.parse_args()
+
+    print_section("⏱️  세그먼트 분석 벤치마크")
+
+    # 1. long format 변환
+    print_section("1. long format 변환 (iterrows vs 배열 결합)")
+    print(f"세그먼트: {args.segments:,}개 / 키워드: {args.keywords:,}개 / 기간: {args.months}개월"
+          f" → {args.segments * args.keywords * args.months:,}행")
+
+    keywords, segments, responses = make_responses(args.segments, args.keywords, args.months)
+
+    df_long, t_new = timed(vectorized_long_format, responses)
+    print(f"  벡터 구현: {t_new:8.3f}s")
+    if not args.skip_legacy_long:
+        (df_legacy, _), t_old = timed(legacy_long_format, responses)
+        print(f"  기존 구현: {t_old:8.3f}s  (x{t_old / t_new:,.1f})")
+        same = np.allclose(df_legacy['search_volume'].to_numpy(), df_long['search_volume'].to_numpy())
+        print(f"  결과 일치: {'✅' if same else '❌'}")
+
+    pivot, t_pivot = timed(segment_matrix, df_long, segment_order=segments)
+    print(f"  피벗(groupby/unstack): {t_pivot:8.3f}s")
+
+    # 2. 스포츠 키워드별 4사분면
+    print_section("2. 세그먼트 × 키워드 4사분면 (중첩 루프 vs np.select)")
+    print(f"세그먼트: {args.grid_segments:,}개 / 키워드: {args.grid_keywords:,}개"
+          f" → {args.grid_segments * (args.grid_keywords - 1):,}개 조합")
+
+    pivot, stats_summary = make_stats(args.grid_segments, args.grid_keywords)
+    sport_keywords = list(pivot.columns[1:])
+
+    quadrants, t_new = timed(quadrant_table, pivot, sport_keywords=sport_keywords)
+    legacy, t_old = timed(legacy_quadrants, stats_summary, list(pivot.index), sport_keywords)
+    print(f"  벡터 구현: {t_new:8.3f}s")
+    print(f"  기존 구현: {t_old:8.3f}s  (x{t_old / t_new:,.1f})")
+
+    expected = pd.Series(legacy)
+    actual = quadrants.set_index(["segment", "sport"])["quadrant"]
+    mismatches = (actual.reindex(expected.index) != expected).sum()
+    print(f"  결과 일치: {'✅' if mismatches == 0 else f'❌ {mismatches}개 불일치'}")
+
+    # 3. 통합 지수 4사분면 (노트북 apply)
+    print_section("3. 통합 지수 4사분면 (df.apply vs assign_quadrants)")
+    df_stats = pd.DataFrame({
+        '선크림': pivot['선크림'],
+        '겨울스포츠': pivot[sport_keywords].mean(axis=1)
+    })
+
+    new_quads, t_new = timed(assign_quadrants, df_stats, '선크림', '겨울스포츠')
+    old_quads, t_old = timed(legacy_apply, df_stats)
+    print(f"  벡터 구현: {t_new:8.4f}s")
+    print(f"  기존 구현: {t_old:8.4f}s  (x{t_old / t_new:,.1f})")
+    print(f"  결과 일치: {'✅' if (new_quads == old_quads).all() else '❌'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+SODA 프로젝트 - 블로그 텍스트 처리 벤치마크
+=========================================
+
+스키장 / 선크림 블로그 검색 결과(제목 + 요약) 형태의 합성 글로
+analysis.text의 형태소 분석(프로세스 풀, 캐시 없음 / 캐시 적중)과 문서-단어 행렬 생성을 측정
+(konlpy가 없으면 regex 분석기로 측정)
+
+실행:
+    python scripts/bench_text.py
+    python scripts/bench_text.py --docs 50000 --analyzer okt --workers 8
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# ============================================
+# 경로 설정
+# ============================================
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent
+src_dir = project_root / 'src'
+
+if str(src_dir) not in sys.path:
+    sys.path.insert(0, str(src_dir))
+
+from analysis.text import (
+    ANALYZERS, DEFAULT_ANALYZER, TokenCache, blog_documents, document_term_matrix,
+    tokenize_texts, top_terms,
+)
+
+TOPICS = {
+    "스키장": ["스키장", "보드", "리프트", "슬로프", "시즌권", "렌탈", "곤돌라", "눈썰매", "강습", "야간"],
+    "선크림": ["선크림", "자외선", "차단", "톤업", "무기자차", "유기자차", "끈적임", "백탁", "SPF50", "피부"],
+}
+COMMON = ["후기", "추천", "오늘", "정말", "다녀왔어요", "좋아요", "가격", "비교", "주말", "여행", "내돈내산"]
+JOSA = ["", "", "은", "는", "이", "가", "을", "를", "에서", "으로", "도"]
+
+
+def print_section(title):
+    """섹션 제목 출력"""
+    print("\n" + "="*70)
+    print(f"  {title}")
+    print("="*70)
+
+
+def timed(func, *args, **kwargs):
+    """(결과, 소요 시간[초]) 반환"""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def make_blogs(n_docs, duplicate_share=0.1, seed=0):
+    """NaverBlog.to_dataframe 형태 합성 글 (duplicate_share 비율은 다른 글과 본문이 같음)"""
+    rng = np.random.default_rng(seed)
+    topics = rng.choice(list(TOPICS), n_docs)
+    rows = []
+    for i, topic in enumerate(topics):
+        words = TOPICS[topic] + COMMON
+        title = " ".join(w + rng.choice(JOSA) for w in rng.choice(words, 5))
+        description = " ".join(w + rng.choice(JOSA) for w in rng.choice(words, 25))
+        rows.append({
+            "title": f"<b>{title}</b> #{i}",
+            "description": f"{description} &amp; {rng.integers(1, 10**6)}",
+            "topic": topic,
+        })
+    df = pd.DataFrame(rows)
+    copies = rng.random(n_docs) < duplicate_share
+    df.loc[copies, ["title", "description"]] = df.loc[0, ["title", "description"]].to_numpy()
+    return df
+
+
+def main():
+    parser = argparse.ArgumentParser(description="블로그 텍스트 처리 벤치마크")
+    parser.add_argument("--docs", type=int, default=30_000, help="글 수")
+    parser.add_argument("--analyzer", choices=list(ANALYZERS), default=DEFAULT_ANALYZER, help="형태소 분석기")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: CPU 수)")
+    args = parser.parse_args()
+
+    print_section("⏱️  블로그 텍스트 처리 벤치마크")
+    df = make_blogs(args.docs)
+    docs = blog_documents(df)
+    print(f"입력: {len(docs):,}개 글 (고유 본문 {len(set(docs)):,}개), 분석기: {args.analyzer}")
+
+    with tempfile.TemporaryDirectory() as tmp, TokenCache(Path(tmp) / "tokens.sqlite") as cache:
+        _, t_single = timed(tokenize_texts, docs[:2000], args.analyzer, workers=1)
+        tokens, t_cold = timed(tokenize_texts, docs, args.analyzer, args.workers, cache)
+        _, t_warm = timed(tokenize_texts, docs, args.analyzer, args.workers, cache)
+    (matrix, vocabulary), t_dtm = timed(document_term_matrix, tokens, min_df=2)
+
+    print_section("처리 시간")
+    print(f"  단일 프로세스 (2,000개)       {t_single:8.2f}s → 전체 환산 {t_single * len(docs) / 2000:8.2f}s")
+    print(f"  프로세스 풀 (캐시 없음)       {t_cold:8.2f}s")
+    print(f"  캐시 적중                    {t_warm:8.2f}s")
+    print(f"  문서-단어 행렬               {t_dtm:8.2f}s → {matrix.shape[0]:,} × {matrix.shape[1]:,} "
+          f"(0이 아닌 값 {matrix.nnz:,}개)")
+
+    print_section("주제별 상위 단어")
+    print(top_terms(matrix, vocabulary, n=5, groups=df["topic"]).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -41,6 +41,7 @@ try:
     
     NAVER_CLIENT_ID = config.NAVER_CLIENT_ID
     NAVER_CLIENT_SECRET = config.NAVER_CLIENT_SECRET
+    NAVER_CREDENTIALS = config.NAVER_CREDENTIALS
     
 except ImportError as e:
     raise ImportError(
@@ -80,6 +81,7 @@ __version__ = '1.0.0'
 __all__ = [
     'NAVER_CLIENT_ID',
     'NAVER_CLIENT_SECRET',
+    'NAVER_CREDENTIALS',
     'PROJECT_ROOT',
     'get_data_dir',
     'get_output_dir',
@@ -0,0 +1,156 @@
+# src/analysis/__init__.py
+"""
+수집 스크립트(collect_dataset_*)와 노트북이 공통으로 사용하는 분석 로직
+
+- API 키(config) 없이 임포트 가능 (CSV만으로 분석 가능하도록)
+"""
+
+from .segmentation import (
+    BASE_KEYWORD,
+    SPORT_KEYWORDS,
+    QUADRANT_LABELS,
+    stack_segments,
+    segment_matrix,
+    composite_index,
+    classify_quadrants,
+    assign_quadrants,
+    quadrant_table,
+    blue_ocean_candidates,
+    blue_ocean_summary,
+)
+from .seasons import (
+    SEASON_SCHEMES,
+    DEFAULT_SCHEME,
+    season_lookup,
+    season_codes,
+    season_labels,
+    add_calendar_features,
+)
+from .seasonal_stats import (
+    long_to_wide,
+    season_means,
+    season_ratio,
+    yearly_season_means,
+    yoy_growth,
+    season_ttest,
+    seasonal_summary,
+)
+from .correlation import (
+    DEFAULT_LAGS,
+    correlate,
+    lagged_correlation,
+    best_lag,
+    rolling_correlation,
+    correlation_scan,
+)
+from .cube import AggregateCube
+from .cross_estimate import (
+    cross_margins,
+    independence_estimate,
+    ipf_estimate,
+    scale_to_population,
+    CrossEstimate,
+    estimate_cross,
+)
+from .prices import (
+    DEFAULT_QUANTILES,
+    listings_frame,
+    brand_names,
+    assign_brands,
+    parse_volume,
+    price_summary,
+    PriceSketch,
+    PriceSketches,
+)
+from .entities import (
+    normalize_titles,
+    blocking_keys,
+    resolve_entities,
+    canonical_products,
+)
+from .text import (
+    clean_text,
+    blog_documents,
+    TokenCache,
+    tokenize_texts,
+    document_term_matrix,
+    top_terms,
+)
+from .cooccurrence import SUNSCREEN_KEYWORDS, CooccurrenceIndex
+from .near_duplicates import (
+    minhash_signatures,
+    lsh_clusters,
+    near_duplicate_clusters,
+    drop_near_duplicates,
+)
+from .mentions import posts_frame, mention_counts
+from .forecast import fit_holt_winters, predict_holt_winters, forecast_series
+
+__all__ = [
+    'BASE_KEYWORD',
+    'SPORT_KEYWORDS',
+    'QUADRANT_LABELS',
+    'stack_segments',
+    'segment_matrix',
+    'composite_index',
+    'classify_quadrants',
+    'assign_quadrants',
+    'quadrant_table',
+    'blue_ocean_candidates',
+    'blue_ocean_summary',
+    'SEASON_SCHEMES',
+    'DEFAULT_SCHEME',
+    'season_lookup',
+    'season_codes',
+    'season_labels',
+    'add_calendar_features',
+    'long_to_wide',
+    'season_means',
+    'season_ratio',
+    'yearly_season_means',
+    'yoy_growth',
+    'season_ttest',
+    'seasonal_summary',
+    'DEFAULT_LAGS',
+    'correlate',
+    'lagged_correlation',
+    'best_lag',
+    'rolling_correlation',
+    'correlation_scan',
+    'AggregateCube',
+    'cross_margins',
+    'independence_estimate',
+    'ipf_estimate',
+    'scale_to_population',
+    'CrossEstimate',
+    'estimate_cross',
+    'DEFAULT_QUANTILES',
+    'listings_frame',
+    'brand_names',
+    'assign_brands',
+    'parse_volume',
+    'price_summary',
+    'PriceSketch',
+    'PriceSketches',
+    'normalize_titles',
+    'blocking_keys',
+    'resolve_entities',
+    'canonical_products',
+    'clean_text',
+    'blog_documents',
+    'TokenCache',
+    'tokenize_texts',
+    'document_term_matrix',
+    'top_terms',
+    'SUNSCREEN_KEYWORDS',
+    'CooccurrenceIndex',
+    'minhash_signatures',
+    'lsh_clusters',
+    'near_duplicate_clusters',
+    'drop_near_duplicates',
+    'posts_frame',
+    'mention_counts',
+    'fit_holt_winters',
+    'predict_holt_winters',
+    'forecast_series',
+]
@@ -0,0 +1,248 @@
+"""
+상관 / 시차 분석
+- 기준 시계열(예: UV-B 지수) 하나와 여러 검색량 시계열의 상관을 한 번에 계산
+- Pearson / Spearman 상관, 시차(lag)별 교차상관, 이동 구간(rolling) 상관
+- 결측(NaN)은 시계열별로 쌍 단위 제외 (pandas Series.corr와 동일)
+"""
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from .seasonal_stats import CALENDAR_COLUMNS, _series_matrix
+
+
+DEFAULT_LAGS = range(0, 7)   # 0~6개월
+
+
+# ============================================
+# 입력 정리
+# ============================================
+def _xy_matrix(frame, x, columns, date_col):
+    """(DatetimeIndex, (T,) 기준 배열, (T, N) 시계열 배열, 컬럼 목록)"""
+    if columns is None:
+        data = frame.drop(columns=date_col) if date_col in frame.columns else frame
+        columns = [
+            col for col in data.select_dtypes(include="number").columns
+            if col not in CALENDAR_COLUMNS and col != x
+        ]
+
+    dates, values, columns = _series_matrix(frame, columns, date_col)
+
+    if isinstance(x, str):
+        base = frame[x].to_numpy(dtype=float)
+    else:
+        base = np.asarray(x, dtype=float)
+    if base.shape != (len(dates),):
+        raise ValueError(f"기준 시계열 길이({base.shape})가 데이터 길이({len(dates)})와 다릅니다")
+
+    return dates, base, values, columns
+
+
+def _pearson(x, y):
+    """
+    열 단위 Pearson 상관 (쌍 단위 결측 제외)
+
+    Args:
+        x: (T,) 또는 (T, N)
+        y: (T, N)
+
+    Returns:
+        tuple: r, n — 각각 (N,)
+    """
+    if x.ndim == 1:
+        x = x[:, None]
+    valid = ~np.isnan(x) & ~np.isnan(y)
+    n = valid.sum(axis=0)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mx = np.where(valid, x, 0.0).sum(axis=0) / n
+        my = np.where(valid, y, 0.0).sum(axis=0) / n
+        dx = np.where(valid, x - mx, 0.0)
+        dy = np.where(valid, y - my, 0.0)
+        r = (dx * dy).sum(axis=0) / np.sqrt((dx ** 2).sum(axis=0) * (dy ** 2).sum(axis=0))
+
+    return np.clip(r, -1.0, 1.0), n
+
+
+def _spearman(x, y):
+    """
+    열 단위 Spearman 상관 (순위 변환 후 Pearson)
+
+    결측은 +inf로 바꿔 순위를 매기면 항상 뒤쪽 순위가 되므로,
+    유효한 값들의 순위는 열마다 결측을 제외하고 매긴 순위와 같습니다.
+    """
+    valid = ~np.isnan(x)[:, None] & ~np.isnan(y)
+
+    rx = stats.rankdata(np.where(valid, x[:, None], np.inf), axis=0)
+    ry = stats.rankdata(np.where(valid, y, np.inf), axis=0)
+
+    r, n = _pearson(np.where(valid, rx, np.nan), np.where(valid, ry, np.nan))
+    return r, n
+
+
+def _p_value(r, n):
+    """상관계수 유의확률 (양측, t 분포 근사 — scipy.stats.pearsonr/spearmanr와 동일)"""
+    dof = n - 2
+    with np.errstate(invalid="ignore", divide="ignore"):
+        t_stat = r * np.sqrt(dof / ((1 - r) * (1 + r)))
+    return 2 * stats.t.sf(np.abs(t_stat), dof)
+
+
+def _shift_pair(x, y, lag):
+    """lag > 0: x(t) vs y(t + lag) — 검색량이 기준 시계열보다 lag만큼 늦게 반응"""
+    if lag > 0:
+        return x[:-lag], y[lag:]
+    if lag < 0:
+        return x[-lag:], y[:lag]
+    return x, y
+
+
+# ============================================
+# 상관 분석
+# ============================================
+def correlate(frame, x, columns=None, method="pearson", date_col="date"):
+    """
+    기준 시계열 x와 각 시계열의 상관
+
+    Args:
+        frame: wide format (date 컬럼 또는 DatetimeIndex + 시계열별 컬럼)
+        x: 기준 컬럼 이름 (예: 'UVB평균') 또는 같은 길이의 배열
+        columns: 비교할 컬럼 (None이면 x와 year/month를 제외한 숫자 컬럼)
+        method: 'pearson' 또는 'spearman'
+
+    Returns:
+        DataFrame: index=시계열, columns=[r, p_value, n]
+    """
+    _, base, values, columns = _xy_matrix(frame, x, columns, date_col)
+
+    if method == "pearson":
+        r, n = _pearson(base, values)
+    elif method == "spearman":
+        r, n = _spearman(base, values)
+    else:
+        raise ValueError(f"지원하지 않는 상관 방식: {method} (pearson / spearman)")
+
+    return pd.DataFrame({
+        "r": r,
+        "p_value": _p_value(r, n),
+        "n": n,
+    }, index=pd.Index(columns, name="series"))
+
+
+def lagged_correlation(frame, x, columns=None, lags=DEFAULT_LAGS, date_col="date"):
+    """
+    시차별 교차상관 (Pearson)
+
+    lag = k 는 x(t)와 시계열(t + k)의 상관 — 예: UV-B가 오르고 k개월 뒤 검색이 반응
+
+    Returns:
+        DataFrame: index=시계열, columns=lag
+    """
+    _, base, values, columns = _xy_matrix(frame, x, columns, date_col)
+    lags = list(lags)
+
+    result = np.full((len(columns), len(lags)), np.nan)
+    for i, lag in enumerate(lags):
+        if abs(lag) >= len(base) - 1:
+            continue
+        xs, ys = _shift_pair(base, values, lag)
+        result[:, i], _ = _pearson(xs, ys)
+
+    return pd.DataFrame(result, index=pd.Index(columns, name="series"),
+                        columns=pd.Index(lags, name="lag"))
+
+
+def best_lag(lagged):
+    """
+    시계열별 상관이 가장 높은 시차
+
+    Args:
+        lagged: lagged_correlation 결과
+
+    Returns:
+        DataFrame: index=시계열, columns=[best_lag, best_lag_r]
+    """
+    values = lagged.to_numpy()
+    has_value = ~np.isnan(values).all(axis=1)
+
+    position = np.zeros(len(values), dtype=int)
+    position[has_value] = np.nanargmax(values[has_value], axis=1)
+
+    lag = lagged.columns.to_numpy()[position].astype(float)
+    lag[~has_value] = np.nan
+
+    return pd.DataFrame({
+        "best_lag": lag,
+        "best_lag_r": np.where(has_value, values[np.arange(len(values)), position], np.nan),
+    }, index=lagged.index)
+
+
+def rolling_correlation(frame, x, columns=None, window=12, min_periods=None, date_col="date"):
+    """
+    이동 구간 상관 (Pearson) — 누적합으로 모든 구간·시계열을 한 번에 계산
+
+    pandas의 Series.rolling(window).corr(other)와 같은 결과 (구간 끝 날짜 기준)
+
+    Args:
+        window: 구간 길이 (행 수, 월별 데이터면 개월)
+        min_periods: 구간 내 최소 유효 쌍 수 (None이면 window)
+
+    Returns:
+        DataFrame: index=date, columns=시계열
+    """
+    dates, base, values, columns = _xy_matrix(frame, x, columns, date_col)
+    min_periods = window if min_periods is None else min_periods
+
+    valid = ~np.isnan(base)[:, None] & ~np.isnan(values)
+
+    # 수치 안정성을 위해 전체 평균을 빼고 누적
+    with np.errstate(invalid="ignore"):
+        xc = np.where(valid, base[:, None] - np.nanmean(base), 0.0)
+        yc = np.where(valid, values - np.nanmean(values, axis=0), 0.0)
+
+    def window_sum(a):
+        cumulative = np.cumsum(np.vstack([np.zeros((1, a.shape[1])), a]), axis=0)
+        start = np.maximum(np.arange(1, len(a) + 1) - window, 0)
+        return cumulative[1:] - cumulative[start]
+
+    n = window_sum(valid.astype(float))
+    sx, sy = window_sum(xc), window_sum(yc)
+    sxx, syy, sxy = window_sum(xc * xc), window_sum(yc * yc), window_sum(xc * yc)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cov = sxy - sx * sy / n
+        var_x = sxx - sx * sx / n
+        var_y = syy - sy * sy / n
+        r = cov / np.sqrt(var_x * var_y)
+
+    r[(n < max(min_periods, 2)) | (var_x <= 0) | (var_y <= 0)] = np.nan
+
+    return pd.DataFrame(np.clip(r, -1.0, 1.0), index=pd.Index(dates, name="date"),
+                        columns=columns)
+
+
+# ============================================
+# 요약
+# ============================================
+def correlation_scan(frame, x, columns=None, lags=DEFAULT_LAGS, date_col="date"):
+    """
+    키워드별 기준 시계열 반응도 요약 (수백 개 키워드 일괄 스캔용)
+
+    Returns:
+        DataFrame: index=시계열
+            n, pearson, pearson_p, spearman, spearman_p, best_lag, best_lag_r
+    """
+    pearson = correlate(frame, x, columns, "pearson", date_col)
+    spearman = correlate(frame, x, columns, "spearman", date_col)
+    lagged = best_lag(lagged_correlation(frame, x, columns, lags, date_col))
+
+    return pd.DataFrame({
+        "n": pearson["n"],
+        "pearson": pearson["r"],
+        "pearson_p": pearson["p_value"],
+        "spearman": spearman["r"],
+        "spearman_p": spearman["p_value"],
+        "best_lag": lagged["best_lag"],
+        "best_lag_r": lagged["best_lag_r"],
+    }, index=pearson.index)
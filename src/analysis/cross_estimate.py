@@ -0,0 +1,251 @@
+"""
+특성 교차 이용률 추정 (예: 연령 × 가구소득)
+- KOSIS는 특성별 한계(marginal) 이용률만 제공 → 교차 셀은 모형으로 추정
+- 지역 × 연도 전체를 (지역, 연도, 행, 열) 배열 하나로 브로드캐스팅 계산
+- 'independence': 셀 = 전체 × (행 이용률 / 전체) × (열 이용률 / 전체)
+- 'ipf': 곱셈 모형을 시작값으로 반복 비례 조정(IPF) → 셀의 행별/열별 가중 평균이
+  한계 이용률과 일치
+"""
+
+import numpy as np
+import pandas as pd
+
+
+METHODS = ("independence", "ipf")
+TOTAL = ("전체", "계")
+
+
+# ============================================
+# tidy long → 한계 이용률 배열
+# ============================================
+def _rate_array(rates, regions, years, labels):
+    """(region, year, detail) Series → (지역, 연도, 라벨) 배열 (없는 조합은 NaN)"""
+    index = pd.MultiIndex.from_product([regions, years, labels])
+    values = rates.reindex(index).to_numpy(dtype=float)
+    return values.reshape(len(regions), len(years), len(labels))
+
+
+def cross_margins(long, row_category, col_category, row_labels=None, col_labels=None,
+                  metric="원데이터", total=TOTAL):
+    """
+    tidy long format에서 전체 / 행 / 열 한계 이용률 배열 추출
+
+    Args:
+        long: kosis.load_kosis 결과 (region, characteristic, detail, year, value 컬럼,
+            metric 컬럼이 있으면 metric 값만 사용)
+        row_category / col_category: 행 / 열 특성 대분류 (예: '연령', '가구소득')
+        row_labels / col_labels: 사용할 특성 세부 (None이면 해당 대분류 전체, 등장 순서)
+        metric: 사용할 데이터 종류
+        total: 전체 평균 행의 (대분류, 세부)
+
+    Returns:
+        dict: regions, years, rows, cols (라벨 목록),
+              total (지역, 연도), row_rates (지역, 연도, 행), col_rates (지역, 연도, 열)
+    """
+    frame = long
+    if "metric" in frame.columns:
+        frame = frame[frame["metric"] == metric]
+
+    category = frame["characteristic"].astype(str).to_numpy()
+    detail = frame["detail"].astype(str).to_numpy()
+    rates = pd.Series(
+        frame["value"].to_numpy(dtype=float),
+        index=pd.MultiIndex.from_arrays(
+            [frame["region"].astype(str).to_numpy(), frame["year"].to_numpy(), detail]
+        ),
+    )
+
+    def labels_of(name, labels):
+        if labels is None:
+            labels = pd.unique(detail[category == name])
+        if len(labels) == 0:
+            raise KeyError(f"특성 대분류가 없습니다: {name}")
+        return list(labels)
+
+    rows = labels_of(row_category, row_labels)
+    cols = labels_of(col_category, col_labels)
+    regions = list(pd.unique(frame["region"].astype(str).to_numpy()))
+    years = sorted(pd.unique(frame["year"]).tolist())
+
+    return {
+        "regions": regions,
+        "years": years,
+        "rows": rows,
+        "cols": cols,
+        "total": _rate_array(rates[category == total[0]], regions, years, [total[1]])[..., 0],
+        "row_rates": _rate_array(rates[category == row_category], regions, years, rows),
+        "col_rates": _rate_array(rates[category == col_category], regions, years, cols),
+    }
+
+
+# ============================================
+# 추정 (앞쪽 축은 지역 × 연도 등 임의 차원, 마지막 축이 행 / 열)
+# ============================================
+def _fill_missing(rates, total):
+    """없는 한계 이용률은 전체 평균으로 대체 (효과 = 1)"""
+    return np.where(np.isnan(rates), total[..., None], rates)
+
+
+def independence_estimate(total, row_rates, col_rates):
+    """
+    곱셈(독립) 모형 교차 이용률
+
+    Args:
+        total: 전체 평균 이용률 (...)
+        row_rates: 행 한계 이용률 (..., 행)
+        col_rates: 열 한계 이용률 (..., 열)
+
+    Returns:
+        ndarray (..., 행, 열)
+    """
+    total = np.asarray(total, dtype=float)
+    rows = _fill_missing(np.asarray(row_rates, dtype=float), total)
+    cols = _fill_missing(np.asarray(col_rates, dtype=float), total)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return rows[..., :, None] * cols[..., None, :] / total[..., None, None]
+
+
+def _weighted_mean(values, weights, axis):
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return (values * weights).sum(axis=axis) / weights.sum(axis=axis)
+
+
+def ipf_estimate(total, row_rates, col_rates, weights=None, max_iter=100, tol=1e-6):
+    """
+    반복 비례 조정(IPF) 교차 이용률
+
+    곱셈 모형을 시작값으로 행 / 열 방향 비례 조정을 번갈아 반복해
+    셀의 행별 가중 평균 = 행 이용률, 열별 가중 평균 = 열 이용률이 되도록 맞춤.
+    선택한 행 / 열이 전체 모집단의 일부이면(예: 20~40대 × 300만원 이상) 두 한계의
+    평균이 달라 동시에 맞출 수 없으므로, 열 이용률을 행 이용률 평균에 맞춰
+    비례 조정(상대 효과 유지)한 뒤 적용합니다.
+
+    Args:
+        total / row_rates / col_rates: independence_estimate와 동일
+        weights: 셀 인구 비중 (..., 행, 열)으로 브로드캐스팅 가능한 배열 (None이면 균등)
+        max_iter: 최대 반복 횟수
+        tol: 한계 오차 허용치 (%p)
+
+    Returns:
+        (ndarray (..., 행, 열), 반복 횟수)
+    """
+    total = np.asarray(total, dtype=float)
+    rows = _fill_missing(np.asarray(row_rates, dtype=float), total)
+    cols = _fill_missing(np.asarray(col_rates, dtype=float), total)
+    estimate = independence_estimate(total, rows, cols)
+
+    shape = estimate.shape
+    weights = np.broadcast_to(np.ones(shape) if weights is None else np.asarray(weights, dtype=float),
+                              shape)
+    row_weight = weights.sum(axis=-1)
+    col_weight = weights.sum(axis=-2)
+
+    # 두 한계의 가중 평균을 일치시킴 (열 한계를 비례 조정)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        row_mean = (rows * row_weight).sum(axis=-1) / row_weight.sum(axis=-1)
+        col_mean = (cols * col_weight).sum(axis=-1) / col_weight.sum(axis=-1)
+        cols = cols * (row_mean / col_mean)[..., None]
+
+    iterations = 0
+    for iterations in range(1, max_iter + 1):
+        with np.errstate(invalid="ignore", divide="ignore"):
+            estimate *= (rows / _weighted_mean(estimate, weights, -1))[..., :, None]
+            estimate *= (cols / _weighted_mean(estimate, weights, -2))[..., None, :]
+        error = np.abs(_weighted_mean(estimate, weights, -1) - rows)
+        if not np.any(error > tol):  # NaN(데이터 없는 지역/연도)은 수렴 판정에서 제외
+            break
+    return estimate, iterations
+
+
+def scale_to_population(rates, population):
+    """
+    이용률(%) → 추정 이용자 수
+
+    Args:
+        rates: 이용률 배열 (지역, 연도, ...)
+        population: 인구 (스칼라 또는 (지역, 연도) 배열, 단위는 결과와 동일)
+    """
+    rates = np.asarray(rates, dtype=float)
+    population = np.asarray(population, dtype=float)
+    population = population.reshape(population.shape + (1,) * (rates.ndim - population.ndim))
+    return rates * population / 100
+
+
+# ============================================
+# 결과
+# ============================================
+class CrossEstimate:
+    """
+    지역 × 연도 × 행 × 열 교차 이용률 추정 결과
+
+    values[r, y, i, j] = regions[r], years[y]의 rows[i] × cols[j] 추정 이용률
+    """
+
+    def __init__(self, regions, years, rows, cols, values, method="independence", iterations=0):
+        self.regions = list(regions)
+        self.years = list(years)
+        self.rows = list(rows)
+        self.cols = list(cols)
+        self.values = values
+        self.method = method
+        self.iterations = iterations
+
+    def frame(self, region="전국", year=None, row_names=None, col_names=None):
+        """
+        히트맵용 행 × 열 DataFrame
+
+        Args:
+            region: 지역
+            year: 연도 (None이면 최신 연도)
+            row_names / col_names: 표시 라벨 매핑 {특성 세부: 라벨}
+        """
+        year = self.years[-1] if year is None else year
+        matrix = self.values[self.regions.index(region), self.years.index(year)]
+        return pd.DataFrame(
+            matrix,
+            index=[(row_names or {}).get(r, r) for r in self.rows],
+            columns=[(col_names or {}).get(c, c) for c in self.cols],
+        )
+
+    def to_frame(self, value_name="rate"):
+        """전체 결과 → long format (region, year, row, col, value_name)"""
+        index = pd.MultiIndex.from_product([self.regions, self.years, self.rows, self.cols],
+                                           names=["region", "year", "row", "col"])
+        return pd.DataFrame({value_name: self.values.ravel()}, index=index).reset_index()
+
+    def __repr__(self):
+        return (f"CrossEstimate(method={self.method!r}, regions={len(self.regions)}, "
+                f"years={self.years}, shape={self.values.shape})")
+
+
+def estimate_cross(long, row_category, col_category, row_labels=None, col_labels=None,
+                   method="independence", weights=None, metric="원데이터",
+                   max_iter=100, tol=1e-6):
+    """
+    tidy KOSIS 데이터 → 모든 지역 × 연도의 교차 이용률 추정
+
+    Args:
+        long: kosis.load_kosis 결과 (tidy long format)
+        row_category / col_category: 행 / 열 특성 대분류 (예: '연령', '가구소득')
+        row_labels / col_labels: 사용할 특성 세부 (None이면 전체)
+        method: 'independence' (곱셈 모형) 또는 'ipf' (반복 비례 조정)
+        weights: IPF 셀 인구 비중 (ipf_estimate 참고)
+        metric: 사용할 데이터 종류
+        max_iter / tol: IPF 반복 설정
+
+    Returns:
+        CrossEstimate
+    """
+    if method not in METHODS:
+        raise ValueError(f"지원하지 않는 추정 방법: {method} (사용 가능: {METHODS})")
+
+    margins = cross_margins(long, row_category, col_category, row_labels, col_labels, metric)
+    if method == "ipf":
+        values, iterations = ipf_estimate(margins["total"], margins["row_rates"],
+                                          margins["col_rates"], weights, max_iter, tol)
+    else:
+        values = independence_estimate(margins["total"], margins["row_rates"], margins["col_rates"])
+        iterations = 0
+
+    return CrossEstimate(margins["regions"], margins["years"], margins["rows"], margins["cols"],
+                         values, method, iterations)
@@ -0,0 +1,276 @@
+"""
+세그먼트 × 키워드 × 연도 × 월 집계 큐브
+- 수집 후 한 번 만들어 두고(.npz), 연도별 / 월별 / 계절별 등 임의의 집계를 원본 행 없이 계산
+- 셀마다 sum, count, sumsq, min, max 저장 → mean, var, std, min, max, sum, count 조회 가능
+- 중앙값(median) 등 분위수는 원본 값이 필요해 큐브로 계산할 수 없음
+"""
+
+import numpy as np
+import pandas as pd
+
+from .seasons import DEFAULT_SCHEME, season_lookup
+
+
+DEFAULT_DIMS = ("segment", "keyword", "year", "month")
+STATS = ("sum", "count", "mean", "var", "std", "min", "max")
+
+# 통계별로 집계해야 하는 셀 (count는 dropna에 항상 필요)
+STAT_CELLS = {
+    "sum": ("sum", "count"),
+    "count": ("count",),
+    "mean": ("sum", "count"),
+    "var": ("sum", "count", "sumsq"),
+    "std": ("sum", "count", "sumsq"),
+    "min": ("min", "count"),
+    "max": ("max", "count"),
+}
+
+
+def _reduce(array, axes, kind):
+    """여러 축을 한 번에 집계 (min/max는 빈 셀 NaN 무시, 선택된 셀이 없으면 NaN)"""
+    if not axes:
+        return array
+    if kind == "min":
+        return np.fmin.reduce(array, axis=axes, initial=np.nan)
+    if kind == "max":
+        return np.fmax.reduce(array, axis=axes, initial=np.nan)
+    return array.sum(axis=axes)
+
+
+class AggregateCube:
+    """
+    집계 큐브
+
+    Attributes:
+        dims: 차원 이름 (예: ('segment', 'keyword', 'year', 'month'))
+        labels: {차원: 라벨 배열}
+        cells: {'sum', 'count', 'sumsq', 'min', 'max'} → 차원 순서의 배열
+        value: 원본 값 컬럼 이름
+    """
+
+    CELL_STATS = ("sum", "count", "sumsq", "min", "max")
+
+    def __init__(self, dims, labels, cells, value="search_volume"):
+        self.dims = tuple(dims)
+        # 문자열 라벨은 object 대신 고정 길이 유니코드 배열 (.npz 저장 시 pickle 불필요)
+        self.labels = {
+            dim: np.asarray(labels[dim], dtype=str) if np.asarray(labels[dim]).dtype == object
+            else np.asarray(labels[dim])
+            for dim in self.dims
+        }
+        self.cells = cells
+        self.value = value
+
+    # ============================================
+    # 생성 / 저장
+    # ============================================
+    @classmethod
+    def from_frame(cls, df, dims=DEFAULT_DIMS, value="search_volume", date_col="date"):
+        """
+        long format DataFrame으로 큐브 생성
+
+        Args:
+            df: 차원 컬럼과 value 컬럼이 있는 DataFrame
+                (year/month 컬럼이 없으면 date_col에서 생성)
+            dims: 큐브 차원
+            value: 집계할 값 컬럼
+        """
+        dims = tuple(dims)
+        columns = {}
+        for dim in dims:
+            if dim in df.columns:
+                columns[dim] = df[dim]
+            elif dim in ("year", "month") and date_col in df.columns:
+                dates = pd.DatetimeIndex(df[date_col])
+                columns[dim] = pd.Series(getattr(dates, dim), index=df.index)
+            else:
+                raise KeyError(f"차원 컬럼이 없습니다: {dim}")
+
+        values = df[value].to_numpy(dtype=float)
+        valid = ~np.isnan(values)
+
+        codes, labels = [], {}
+        for dim in dims:
+            dim_codes, uniques = pd.factorize(columns[dim], sort=True)
+            codes.append(dim_codes[valid])
+            labels[dim] = np.asarray(uniques)
+
+        shape = tuple(len(labels[dim]) for dim in dims)
+        flat = np.ravel_multi_index(codes, shape)
+        values = values[valid]
+        size = int(np.prod(shape))
+
+        cells = {
+            "sum": np.bincount(flat, weights=values, minlength=size),
+            "count": np.bincount(flat, minlength=size).astype(np.uint32),
+            "sumsq": np.bincount(flat, weights=values * values, minlength=size),
+        }
+
+        # min / max: 셀 순서로 정렬 후 구간별 reduceat
+        order = np.argsort(flat, kind="stable")
+        sorted_flat, sorted_values = flat[order], values[order]
+        starts = np.flatnonzero(np.r_[True, sorted_flat[1:] != sorted_flat[:-1]]) if len(flat) else []
+        for kind, ufunc in (("min", np.minimum), ("max", np.maximum)):
+            cell = np.full(size, np.nan)
+            if len(flat):
+                cell[sorted_flat[starts]] = ufunc.reduceat(sorted_values, starts)
+            cells[kind] = cell
+
+        cells = {name: array.reshape(shape) for name, array in cells.items()}
+        return cls(dims, labels, cells, value)
+
+    def save(self, path):
+        """압축 .npz로 저장 (sum/sumsq: float64, min/max: float32, count: uint32)"""
+        arrays = {
+            "sum": self.cells["sum"],
+            "count": self.cells["count"],
+            "sumsq": self.cells["sumsq"],
+            "min": self.cells["min"].astype(np.float32),
+            "max": self.cells["max"].astype(np.float32),
+            "dims": np.array(self.dims),
+            "value": np.array(self.value),
+        }
+        for dim in self.dims:
+            arrays[f"labels_{dim}"] = self.labels[dim]
+        np.savez_compressed(path, **arrays)
+
+    @classmethod
+    def load(cls, path):
+        """save로 저장한 큐브 불러오기"""
+        with np.load(path, allow_pickle=False) as data:
+            dims = tuple(data["dims"].tolist())
+            labels = {dim: data[f"labels_{dim}"] for dim in dims}
+            cells = {name: data[name].astype(np.float64) if name in ("min", "max") else data[name]
+                     for name in cls.CELL_STATS}
+            value = str(data["value"])
+        return cls(dims, labels, cells, value)
+
+    # ============================================
+    # 조회
+    # ============================================
+    def _month_groups(self, scheme):
+        """월 라벨 → 계절 (라벨 목록, 월 축 위치별 계절 코드)"""
+        if "month" not in self.dims:
+            raise KeyError("season 조회에는 month 차원이 필요합니다")
+        season_labels, lookup = season_lookup(scheme)
+        return season_labels, lookup[self.labels["month"].astype(int)]
+
+    def _select(self, where, scheme, names=CELL_STATS):
+        """where 조건으로 각 축을 잘라낸 (cells, labels) — cells는 names 셀만"""
+        where = dict(where or {})
+        masks = {dim: np.ones(len(self.labels[dim]), dtype=bool) for dim in self.dims}
+
+        if "season" in where:
+            wanted = where.pop("season")
+            wanted = [wanted] if isinstance(wanted, str) else list(wanted)
+            season_labels, month_codes = self._month_groups(scheme)
+            unknown = set(wanted) - set(season_labels)
+            if unknown:
+                raise ValueError(f"알 수 없는 계절: {sorted(unknown)} (사용 가능: {list(season_labels)})")
+            masks["month"] &= np.isin(month_codes, [season_labels.index(s) for s in wanted])
+
+        for dim, wanted in where.items():
+            if dim not in masks:
+                raise KeyError(f"큐브에 없는 차원: {dim} (차원: {self.dims})")
+            if np.isscalar(wanted):
+                wanted = [wanted]
+            masks[dim] &= np.isin(self.labels[dim], list(wanted))
+
+        index = np.ix_(*(masks[dim] for dim in self.dims))
+        cells = {name: self.cells[name][index] for name in names}
+        labels = {dim: self.labels[dim][masks[dim]] for dim in self.dims}
+        return cells, labels
+
+    def query(self, stat="mean", by=("segment", "keyword"), where=None,
+              scheme=DEFAULT_SCHEME, dropna=True):
+        """
+        임의 집계 조회 (원본 행 없이 큐브에서 계산)
+
+        Args:
+            stat: 'sum', 'count', 'mean', 'var', 'std', 'min', 'max'
+            by: 남길 차원 (큐브 차원 또는 'season')
+            where: {차원: 값 또는 값 목록} 필터 (예: {'year': 2024, 'season': '겨울'})
+            scheme: 'season' 사용 시 계절 구분 방식
+            dropna: 값이 하나도 없는 조합 제외 (groupby와 동일)
+
+        Returns:
+            Series: index=by 차원 (2개 이상이면 MultiIndex), name=stat
+        """
+        if stat == "median":
+            raise ValueError("median은 원본 값이 필요해 큐브로 계산할 수 없습니다 "
+                             "(long format 원본에서 groupby로 계산하세요)")
+        if stat not in STATS:
+            raise ValueError(f"지원하지 않는 통계: {stat} (사용 가능: {STATS})")
+
+        by = (by,) if isinstance(by, str) else tuple(by)
+        cells, labels = self._select(where, scheme, STAT_CELLS[stat])
+
+        # season은 month 축을 계절별로 묶어 새 축으로 교체
+        dims = list(self.dims)
+        if "season" in by:
+            season_labels, month_codes = self._month_groups(scheme)
+            month_codes = month_codes[np.isin(self.labels["month"], labels["month"])]
+            axis = dims.index("month")
+            groups = [g for g in range(len(season_labels)) if (month_codes == g).any()]
+            cells = {
+                name: np.stack([
+                    _reduce(np.compress(month_codes == g, array, axis=axis), (axis,), name)
+                    for g in groups
+                ], axis=axis)
+                for name, array in cells.items()
+            }
+            dims[axis] = "season"
+            labels["season"] = np.array([season_labels[g] for g in groups])
+
+        missing = [dim for dim in by if dim not in dims]
+        if missing:
+            raise KeyError(f"큐브에 없는 차원: {missing} (차원: {tuple(dims)})")
+
+        axes = tuple(i for i, dim in enumerate(dims) if dim not in by)
+        reduced = {name: _reduce(array, axes, name) for name, array in cells.items()}
+        kept = [dim for dim in dims if dim in by]
+        order = [kept.index(dim) for dim in by]
+        reduced = {name: np.transpose(array, order) for name, array in reduced.items()}
+
+        count = reduced["count"].astype(float)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            if stat in ("sum", "min", "max"):
+                result = reduced[stat]
+            elif stat == "count":
+                result = reduced["count"].astype(np.int64)
+            elif stat == "mean":
+                result = reduced["sum"] / count
+            else:
+                var = (reduced["sumsq"] - reduced["sum"] ** 2 / count) / (count - 1)
+                var = np.maximum(var, 0)
+                result = np.sqrt(var) if stat == "std" else var
+
+        if not by:
+            return result.item() if np.ndim(result) == 0 else result
+
+        index = pd.MultiIndex.from_product([labels[dim] for dim in by], names=list(by))
+        series = pd.Series(np.ravel(result), index=index, name=stat)
+        if dropna:
+            series = series[np.ravel(count) > 0]
+        if len(by) == 1:
+            series.index = series.index.get_level_values(0)
+        return series
+
+    def matrix(self, stat="mean", rows="segment", columns="keyword", where=None,
+               scheme=DEFAULT_SCHEME):
+        """
+        2차원 집계 매트릭스 (예: 세그먼트 × 키워드 평균 — 04 매트릭스 CSV와 같은 형태)
+
+        Returns:
+            DataFrame: index=rows, columns=columns
+        """
+        series = self.query(stat, (rows, columns), where, scheme)
+        # unstack은 라벨을 정렬하므로 큐브 라벨 순서(예: 계절 구분 순서)로 복원
+        return series.unstack(columns).reindex(
+            index=pd.unique(series.index.get_level_values(rows)),
+            columns=pd.unique(series.index.get_level_values(columns)),
+        )
+
+    def __repr__(self):
+        shape = " × ".join(f"{dim}({len(self.labels[dim])})" for dim in self.dims)
+        return f"AggregateCube({shape}, value={self.value!r})"
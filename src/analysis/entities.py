@@ -0,0 +1,260 @@
+"""
+쇼핑 검색 결과 상품 동일성 판별 (여러 쇼핑몰의 같은 상품 → 하나의 대표 상품)
+- 같은 선크림이 쇼핑몰마다 다른 상품명으로 올라와 상품 수(시장 규모)가 부풀려지는 문제 보정
+- 상품명 정규화: 태그 / 괄호 / 홍보 문구 제거, 용량 단위 통일, 토큰화
+- 블로킹: (브랜드, 용량, 수량)이 같은 상품끼리만 비교하고, 그 안에서도 드문 토큰(서명)을
+  하나 이상 공유하는 쌍만 토큰 Jaccard 유사도 계산 → 전체 쌍 비교(O(n²)) 없이 후보 쌍만
+- 유사도가 기준 이상인 쌍 / 같은 productId를 union-find로 묶어 대표 상품 번호 부여
+  (모델 번호가 서로 다른 묶음은 유사도가 높아도 합치지 않음)
+"""
+
+import re
+from collections import Counter, defaultdict
+
+import numpy as np
+import pandas as pd
+
+from .prices import HTML_TAG, assign_brands, parse_volume
+
+
+DEFAULT_THRESHOLD = 0.7     # 토큰 Jaccard 유사도 기준
+DEFAULT_SIGNATURE = 3       # 상품명마다 서명으로 쓸 드문 토큰 수
+DEFAULT_MAX_BUCKET = 200    # 이보다 많은 상품명이 공유하는 토큰은 서명 버킷에서 제외
+
+# 상품 구분과 무관한 홍보 / 배송 문구
+PROMO_WORDS = frozenset((
+    "무료배송", "당일발송", "당일배송", "빠른배송", "정품", "정품보장", "본사정품", "공식", "공식몰",
+    "특가", "초특가", "할인", "세일", "sale", "행사", "사은품", "증정", "최신상", "신상", "new",
+    "단독", "한정", "한정판", "best", "베스트", "인기", "추천", "택1", "선택",
+))
+BRACKETS = re.compile(r"[\[\]\(\)\{\}【】〔〕<>「」『』]")
+UNITS = re.compile(r"(\d+(?:\.\d+)?)\s*(ml|㎖|l|ℓ|g|매|개입|개|입|팩|ea)\b")
+NON_WORD = re.compile(r"[^\w+.%]+")
+# 모델 번호 (영문 + 숫자, SPF / PA 표기 제외): 서로 다른 모델 번호를 가진 묶음은 합치지 않음
+MODEL_TOKEN = re.compile(r"^(?!spf|pa\+)(?=[a-z]*\d)(?=\d*[a-z])[a-z\d]{3,}$")
+# 용량 / 수량 토큰 (블로킹 키에 이미 들어가므로 유사도 계산에서 제외)
+QUANTITY_TOKEN = re.compile(r"^(?:[x×*]?\d+(?:\.\d+)?(?:ml|l|g|매|개입|개|입|팩|ea)?|\d\+\d|[x×*+])$")
+
+
+# ============================================
+# 상품명 정규화
+# ============================================
+def _normalize(title):
+    title = HTML_TAG.sub(" ", title).lower()
+    title = BRACKETS.sub(" ", title).replace("㎖", "ml").replace("ℓ", "l")
+    title = UNITS.sub(r" \1\2 ", title)
+    return NON_WORD.sub(" ", title).strip()
+
+
+def normalize_titles(titles):
+    """
+    상품명 정규화 (같은 상품명은 한 번만 처리)
+
+    Args:
+        titles: 상품명 Series / 목록
+
+    Returns:
+        Series: 소문자, 태그 / 괄호 / 특수문자 제거, 용량 단위 붙여 쓰기 ('50 mL' → '50ml')
+    """
+    titles = pd.Series(titles, dtype=object).fillna("").astype(str)
+    codes, unique = pd.factorize(titles)
+    normalized = np.array([_normalize(t) for t in unique], dtype=object)
+    return pd.Series(normalized[codes], index=titles.index, dtype=object)
+
+
+def _first_word(normalized):
+    """홍보 문구를 건너뛴 첫 단어 (브랜드 정보가 없을 때 블로킹 키)"""
+    return next((token for token in normalized.split() if token not in PROMO_WORDS), "")
+
+
+def title_tokens(normalized, brand=""):
+    """정규화한 상품명 → 비교용 토큰 집합 (홍보 문구 / 용량·수량 / 브랜드 토큰 제외)"""
+    brand = brand.lower()
+    return frozenset(
+        token for token in normalized.split()
+        if token not in PROMO_WORDS and token != brand and not QUANTITY_TOKEN.match(token)
+    )
+
+
+# ============================================
+# union-find
+# ============================================
+class _DisjointSet:
+    """union-find + 묶음별 모델 번호 (모델 번호가 서로 다른 묶음은 합치지 않음)"""
+
+    def __init__(self, n, models=None):
+        self.parent = list(range(n))
+        self.models = models if models is not None else [frozenset()] * n
+
+    def find(self, i):
+        parent = self.parent
+        root = i
+        while parent[root] != root:
+            root = parent[root]
+        while parent[i] != root:        # 경로 압축
+            parent[i], i = root, parent[i]
+        return root
+
+    def union(self, i, j, force=False):
+        """
+        두 묶음 합치기 (합쳤거나 이미 같은 묶음이면 True)
+
+        force=False면 양쪽 모두 모델 번호가 있고 겹치지 않을 때 합치지 않음
+        (모델 번호 없는 상품명을 통해 다른 모델끼리 연쇄적으로 묶이는 것 방지)
+        """
+        i, j = self.find(i), self.find(j)
+        if i == j:
+            return True
+        a, b = self.models[i], self.models[j]
+        if not force and a and b and a.isdisjoint(b):
+            return False
+        root, child = min(i, j), max(i, j)
+        self.parent[child] = root
+        self.models[root] = a | b
+        return True
+
+
+# ============================================
+# 동일 상품 판별
+# ============================================
+def blocking_keys(df, brands=None):
+    """
+    블로킹 키 컬럼 (brand_key, volume_ml, pack)
+
+    Args:
+        df: NaverShopping.to_dataframe (또는 analysis.listings_frame) 결과
+        brands: 브랜드 목록 (지정하면 brand가 빈 상품은 상품명 / 제조사에서 추출)
+
+    Returns:
+        DataFrame: brand_key (소문자, 없으면 정규화한 상품명 첫 단어), volume_ml (없으면 -1), pack
+    """
+    normalized = normalize_titles(df["title"])
+    if brands:
+        brand = assign_brands(df, brands)
+    elif "brand" in df.columns:
+        brand = df["brand"].astype(object).fillna("").astype(str)
+    else:
+        brand = pd.Series("", index=df.index)
+    first_word = normalized.map(_first_word)
+    brand = brand.str.lower().str.replace(r"\(.*?\)|\s+", "", regex=True)
+    brand = brand.where(brand != "", first_word)
+
+    if {"volume_ml", "pack"}.issubset(df.columns):
+        volume = df[["volume_ml", "pack"]]
+    else:
+        volume = parse_volume(df["title"])
+    return pd.DataFrame({
+        "brand_key": brand,
+        "volume_ml": volume["volume_ml"].fillna(-1).round(1),
+        "pack": volume["pack"].astype(np.int64),
+        "normalized": normalized,
+    }, index=df.index)
+
+
+def resolve_entities(df, brands=None, threshold=DEFAULT_THRESHOLD, n_signature=DEFAULT_SIGNATURE,
+                     max_bucket=DEFAULT_MAX_BUCKET):
+    """
+    같은 상품(여러 쇼핑몰 / 다른 상품명)을 하나의 대표 상품 번호로 묶기
+
+    Args:
+        df: NaverShopping.to_dataframe (또는 analysis.listings_frame) 결과
+            (title 필수, brand / maker / productId 있으면 사용)
+        brands: 브랜드 목록 (brand가 빈 상품 보정)
+        threshold: 토큰 Jaccard 유사도 기준 (이상이면 같은 상품)
+        n_signature: 상품명마다 서명으로 쓸 드문 토큰 수 (많을수록 재현율↑, 비교 쌍↑)
+        max_bucket: 이보다 많은 상품명이 공유하는 토큰은 서명 버킷에서 제외
+
+    Returns:
+        Series: entity_id (0부터, 처음 나온 순서), df와 같은 인덱스
+    """
+    keys = blocking_keys(df, brands)
+    # 노드 = 고유 (브랜드, 용량, 수량, 정규화 상품명) → 완전히 같은 상품명은 비교 없이 하나로
+    node_codes, nodes = pd.factorize(pd.MultiIndex.from_frame(
+        keys[["brand_key", "volume_ml", "pack", "normalized"]]))
+    n = len(nodes)
+    block_codes, _ = pd.factorize(pd.MultiIndex.from_arrays([
+        nodes.get_level_values(0), nodes.get_level_values(1), nodes.get_level_values(2)]))
+    tokens = [title_tokens(title, brand) for brand, _, _, title in nodes]
+    sets = _DisjointSet(n, [frozenset(t for t in node_tokens if MODEL_TOKEN.match(t))
+                            for node_tokens in tokens])
+
+    # 같은 productId (네이버 가격비교 묶음 상품)는 상품명이 달라도 같은 상품
+    if "productId" in df.columns:
+        product_ids = df["productId"].astype(object).fillna("").astype(str).to_numpy()
+        first_node = {}
+        for product_id, node in zip(product_ids, node_codes):
+            if product_id:
+                sets.union(first_node.setdefault(product_id, node), node, force=True)
+
+    # 서명: 상품명마다 가장 드문 토큰 n_signature개 (전체 상품명 기준 문서 빈도) → (블록, 토큰) 버킷
+    frequency = Counter(token for node_tokens in tokens for token in node_tokens)
+    buckets = defaultdict(list)
+    for node, node_tokens in enumerate(tokens):
+        signature = sorted(node_tokens, key=lambda t: (frequency[t], t))[:n_signature]
+        for token in signature:
+            buckets[(block_codes[node], token)].append(node)
+
+    # 후보 쌍: 버킷을 토큰 수로 정렬 → Jaccard ≥ t 이려면 |B| ≤ |A| / t 이므로 더 큰 상품명은 비교 생략
+    sizes = [len(node_tokens) for node_tokens in tokens]
+    edges = set()
+    for members in buckets.values():
+        if len(members) < 2 or len(members) > max_bucket:
+            continue
+        members.sort(key=sizes.__getitem__)
+        for a, i in enumerate(members):
+            tokens_i, size_i = tokens[i], sizes[i]
+            max_size = size_i / threshold
+            for j in members[a + 1:]:
+                size_j = sizes[j]
+                if size_j > max_size:
+                    break
+                inter = len(tokens_i & tokens[j])
+                union_size = size_i + size_j - inter
+                if inter >= threshold * union_size:
+                    edges.add((inter / union_size, min(i, j), max(i, j)))
+
+    # 유사도가 높은 쌍부터 합침 → 모델 번호 없는 상품명은 가장 비슷한 묶음에 들어감
+    union = sets.union
+    for _, i, j in sorted(edges, reverse=True):
+        union(i, j)
+
+    roots = np.array([sets.find(node) for node in range(n)], dtype=np.int64)
+    entity, _ = pd.factorize(roots[node_codes])
+    return pd.Series(entity, index=df.index, name="entity_id")
+
+
+def canonical_products(df, entity_ids):
+    """
+    대표 상품 표
+
+    Args:
+        df: resolve_entities에 넣은 DataFrame
+        entity_ids: resolve_entities 결과
+
+    Returns:
+        DataFrame (index=entity_id): title (가장 많이 쓰인 상품명), brand, listings, malls (쇼핑몰 수),
+        lprice_min, lprice_median, product_ids (productId 수) - listings 내림차순
+    """
+    frame = pd.DataFrame({
+        "entity_id": entity_ids,
+        "title": df["title"].astype(str).str.replace(HTML_TAG, "", regex=True),
+        "brand": df["brand"].astype(object) if "brand" in df.columns else "",
+        "mallName": df["mallName"].astype(object) if "mallName" in df.columns else "",
+        "lprice": pd.to_numeric(df["lprice"], errors="coerce") if "lprice" in df.columns else np.nan,
+        "productId": df["productId"].astype(object) if "productId" in df.columns else "",
+    }, index=df.index)
+    grouped = frame.groupby("entity_id", sort=True)
+    summary = grouped.agg(
+        listings=("title", "size"),
+        malls=("mallName", "nunique"),
+        lprice_min=("lprice", "min"),
+        lprice_median=("lprice", "median"),
+        product_ids=("productId", "nunique"),
+    )
+    # 대표 상품명 / 브랜드: 그룹에서 가장 많이 나온 값 (같으면 먼저 나온 값)
+    for column in ("title", "brand"):
+        counts = frame.groupby(["entity_id", column], sort=False).size()
+        top = counts.sort_values(ascending=False, kind="stable").reset_index()
+        summary[column] = top.drop_duplicates("entity_id").set_index("entity_id")[column]
+    ordered = ["title", "brand", "listings", "malls", "lprice_min", "lprice_median", "product_ids"]
+    return summary[ordered].sort_values("listings", ascending=False, kind="stable")
@@ -0,0 +1,245 @@
+"""
+키워드 트렌드 시계열 일괄 예측 (Holt-Winters 계절 분해)
+- 수백 개 DataLab 시계열(세그먼트 × 키워드)을 한 번에: 수준(level) + 추세(trend) + 계절(seasonal) 분해 후 12개월 예측
+- 모형: 가법 Holt-Winters + 감쇠 추세 (오차 수정형, Hyndman et al. 2008의 ETS(A,Ad,A))
+  검색 비율은 계절 진폭이 수준에 비례하므로 기본은 log1p 변환 후 적합 (= 승법 계절성, 예측값은 항상 0 이상)
+- 적합: 평활 계수 격자 전체 × 시계열 묶음을 (시계열, 격자) 배열로 한 번에 재귀 계산, 시계열마다 SSE 최소 조합 선택
+  → 시점마다 numpy 연산 한 번, 묶음은 프로세스 풀로 병렬
+- 예측 구간: 한 단계 예측 오차 분산 × 시차별 배수 (정규 근사)
+
+사용:
+    df = pd.read_csv("data/04_세그먼트별_통합_데이터.csv")
+    forecast = forecast_series(df, key=["segment", "keyword"])
+    forecast[forecast["season"] == "겨울"]
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from .seasonal_stats import long_to_wide, _series_matrix
+from .seasons import add_calendar_features
+
+
+DEFAULT_HORIZON = 12
+DEFAULT_PERIOD = 12
+DEFAULT_LEVEL = 0.95
+DEFAULT_CHUNK_SIZE = 64     # 프로세스에 한 번에 넘길 시계열 수 (메모리: 시계열 × 격자 × 주기)
+TRANSFORMS = ("log", "none")
+
+# 평활 계수 격자 (오차 수정형: beta = alpha × 비율, gamma = (1 - alpha) × 비율 → 항상 안정 영역)
+ALPHAS = (0.05, 0.1, 0.2, 0.3, 0.5, 0.7, 0.9)
+BETA_RATIOS = (0.0, 0.05, 0.2, 0.5)
+GAMMA_RATIOS = (0.0, 0.05, 0.1, 0.2, 0.4)
+PHIS = (0.9, 0.98)
+
+
+def parameter_grid(alphas=ALPHAS, beta_ratios=BETA_RATIOS, gamma_ratios=GAMMA_RATIOS, phis=PHIS):
+    """평활 계수 조합 → (alpha, beta, gamma, phi) 배열 4개 (각각 격자 크기)"""
+    a, b, g, p = np.meshgrid(alphas, beta_ratios, gamma_ratios, phis, indexing="ij")
+    a, b, g, p = (x.ravel() for x in (a, b, g, p))
+    return a, a * b, (1 - a) * g, p
+
+
+# ============================================
+# 적합 (시계열 묶음 × 격자 벡터화)
+# ============================================
+def _initial_states(values, period):
+    """
+    처음 두 주기로 초기 상태 추정 (고전적 분해)
+
+    Returns:
+        level (N,), trend (N,), seasonal (N, period) — 계절 성분 합 0
+    """
+    head = values[:, :2 * period].reshape(len(values), 2, period)
+    with np.errstate(invalid="ignore"):
+        cycle_means = np.nanmean(head, axis=2)                                # (N, 2)
+        trend = (cycle_means[:, 1] - cycle_means[:, 0]) / period
+        seasonal = np.nanmean(head - cycle_means[:, :, None], axis=1)         # (N, period)
+    trend = np.nan_to_num(trend)
+    seasonal = np.nan_to_num(seasonal)
+    seasonal -= seasonal.mean(axis=1, keepdims=True)
+    # 첫 관측 직전 시점의 수준 (첫 주기 평균은 주기 가운데 시점의 수준)
+    level = cycle_means[:, 0] - trend * (period + 1) / 2
+    return level, trend, seasonal
+
+
+def fit_holt_winters(values, period=DEFAULT_PERIOD, grid=None):
+    """
+    여러 시계열 Holt-Winters 적합 (격자 탐색, 시계열마다 SSE 최소)
+
+    Args:
+        values: (N, T) 배열 (NaN은 결측 → 그 시점은 예측값으로 상태만 진행)
+        period: 계절 주기 (월별 12)
+        grid: parameter_grid 결과 (None이면 기본 격자)
+
+    Returns:
+        dict: alpha, beta, gamma, phi, sigma (한 단계 오차 표준편차), level, trend (N,),
+              seasonal (N, period, 다음 시점부터의 순서), fitted (N, T), n_obs (N,)
+              관측이 두 주기 미만인 시계열은 모두 NaN
+    """
+    values = np.asarray(values, dtype=float)
+    n, t_len = values.shape
+    alpha, beta, gamma, phi = parameter_grid() if grid is None else grid
+    n_grid = len(alpha)
+
+    n_obs = (~np.isnan(values)).sum(axis=1)
+    enough = n_obs >= 2 * period
+    level0, trend0, seasonal0 = _initial_states(values, period) if t_len >= 2 * period else (
+        np.full(n, np.nan), np.full(n, np.nan), np.full((n, period), np.nan))
+
+    # 상태: (N, G) / (N, G, period)
+    level = np.repeat(level0[:, None], n_grid, axis=1)
+    trend = np.repeat(trend0[:, None], n_grid, axis=1)
+    seasonal = np.repeat(seasonal0[:, None, :], n_grid, axis=1)
+    sse = np.zeros((n, n_grid))
+    fitted = np.empty((n, n_grid, t_len))
+
+    for t in range(t_len):
+        s = t % period
+        damped = phi * trend
+        prediction = level + damped + seasonal[:, :, s]
+        fitted[:, :, t] = prediction
+        y = values[:, t]
+        error = np.nan_to_num(y)[:, None] - prediction
+        error[np.isnan(y)] = 0.0
+        sse += error ** 2
+        level = level + damped + alpha * error
+        trend = damped + beta * error
+        seasonal[:, :, s] += gamma * error
+
+    best = np.argmin(np.where(np.isnan(sse), np.inf, sse), axis=1)
+    rows = np.arange(n)
+    # 자유도: 관측 수 - (평활 계수 4개 + 초기 수준 / 추세 2개)
+    dof = np.maximum(n_obs - 6, 1)
+    sigma = np.sqrt(sse[rows, best] / dof)
+
+    # 마지막 시점 다음부터의 계절 순서로 정렬
+    order = (np.arange(period) + t_len) % period
+    result = {
+        "alpha": alpha[best], "beta": beta[best], "gamma": gamma[best], "phi": phi[best],
+        "sigma": sigma,
+        "level": level[rows, best], "trend": trend[rows, best],
+        "seasonal": seasonal[rows, best][:, order],
+        "fitted": fitted[rows, best],
+        "n_obs": n_obs,
+    }
+    for name, array in result.items():
+        if name != "n_obs":
+            array[~enough] = np.nan
+    return result
+
+
+def predict_holt_winters(fit, horizon=DEFAULT_HORIZON, level=DEFAULT_LEVEL):
+    """
+    적합 결과 → horizon 시점 예측 + 예측 구간
+
+    h 시점 예측 분산 = sigma² × (1 + Σ_{j<h} c_j²),  c_j = alpha + beta·(phi + … + phi^j) + gamma·[j가 주기의 배수]
+
+    Returns:
+        (forecast, lower, upper) — 각각 (N, horizon)
+    """
+    alpha, beta, gamma, phi = (fit[name][:, None] for name in ("alpha", "beta", "gamma", "phi"))
+    period = fit["seasonal"].shape[1]
+    steps = np.arange(1, horizon + 1)
+
+    damping = np.cumsum(phi ** steps, axis=1)                                 # (N, H): phi + … + phi^h
+    seasonal = fit["seasonal"][:, (steps - 1) % period]
+    forecast = fit["level"][:, None] + damping * fit["trend"][:, None] + seasonal
+
+    c = alpha + beta * damping + gamma * (steps % period == 0)               # (N, H): c_1 … c_H
+    multiplier = 1 + np.concatenate([np.zeros((len(c), 1)), np.cumsum(c ** 2, axis=1)[:, :-1]], axis=1)
+    spread = stats.norm.ppf(0.5 + level / 2) * fit["sigma"][:, None] * np.sqrt(multiplier)
+    return forecast, forecast - spread, forecast + spread
+
+
+def _forecast_chunk(values, period, horizon, level, transform):
+    """한 묶음 적합 + 예측 (프로세스 풀 작업 단위)"""
+    if transform == "log":
+        values = np.log1p(np.clip(values, 0, None))
+    fit = fit_holt_winters(values, period)
+    forecast, lower, upper = predict_holt_winters(fit, horizon, level)
+    if transform == "log":
+        forecast, upper = np.expm1(forecast), np.expm1(upper)
+        lower = np.maximum(np.expm1(lower), 0.0)
+    params = np.column_stack([fit[name] for name in ("alpha", "beta", "gamma", "phi", "sigma")])
+    return forecast, lower, upper, params
+
+
+# ============================================
+# 일괄 예측 (DataFrame 입력 / 출력)
+# ============================================
+def _future_dates(dates, horizon):
+    freq = pd.infer_freq(dates) if len(dates) >= 3 else None
+    offset = pd.tseries.frequencies.to_offset(freq or "MS")
+    return pd.date_range(dates[-1] + offset, periods=horizon, freq=offset)
+
+
+def forecast_series(frame, key="keyword", value="search_volume", date_col="date",
+                    columns=None, horizon=DEFAULT_HORIZON, period=DEFAULT_PERIOD,
+                    level=DEFAULT_LEVEL, transform="log", workers=None,
+                    chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    여러 시계열 Holt-Winters 예측 (tidy 결과)
+
+    Args:
+        frame: long format (date, key 컬럼, value) — 예: Dataset 4 (key=['segment', 'keyword'])
+               key=None이면 wide format (date + 시계열별 컬럼, 예: Dataset 1)
+        key / value / date_col: long format 컬럼
+        columns: wide format에서 예측할 컬럼 (None이면 year / month를 뺀 숫자 컬럼)
+        horizon: 예측 시점 수 (월별 12 = 1년)
+        period: 계절 주기
+        level: 예측 구간 신뢰수준
+        transform: 'log' (log1p 변환, 승법 계절성) 또는 'none'
+        workers: 프로세스 수 (None이면 CPU 수, 1이면 현재 프로세스에서)
+        chunk_size: 프로세스에 한 번에 넘길 시계열 수
+
+    Returns:
+        DataFrame (long format): key 컬럼들 (wide 입력이면 series), date, forecast, lower, upper,
+        alpha, beta, gamma, phi, sigma, year, month, season
+        (관측이 두 주기 미만인 시계열은 예측값 NaN)
+    """
+    if transform not in TRANSFORMS:
+        raise ValueError(f"지원하지 않는 transform: {transform} (사용 가능: {TRANSFORMS})")
+
+    if key is not None:
+        wide = long_to_wide(frame, key=key, value=value, date_col=date_col).sort_index()
+        dates, values, series = wide.index, wide.to_numpy(dtype=float), list(wide.columns)
+        key_names = [key] if isinstance(key, str) else list(key)
+    else:
+        dates, values, series = _series_matrix(frame, columns, date_col)
+        order = np.argsort(dates.to_numpy(), kind="stable")
+        dates, values = dates[order], values[order]
+        key_names = ["series"]
+    values = values.T                                                         # (N, T)
+
+    chunks = [values[start:start + chunk_size] for start in range(0, len(values), chunk_size)]
+    args = (period, horizon, level, transform)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(chunks) <= 1:
+        results = [_forecast_chunk(chunk, *args) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+            results = list(pool.map(_forecast_chunk, chunks, *([arg] * len(chunks) for arg in args)))
+    if results:
+        forecast, lower, upper, params = (np.concatenate(parts) for parts in zip(*results))
+    else:
+        forecast = lower = upper = np.empty((0, horizon))
+        params = np.empty((0, 5))
+
+    # tidy: 시계열 × 예측 시점
+    n = len(series)
+    keys = pd.MultiIndex.from_tuples(series) if len(key_names) > 1 else pd.Index(series)
+    result = pd.DataFrame(
+        np.repeat(keys.to_frame(index=False).to_numpy(), horizon, axis=0) if n else
+        np.empty((0, len(key_names))), columns=key_names)
+    result["date"] = np.tile(_future_dates(dates, horizon), n) if n else pd.DatetimeIndex([])
+    result["forecast"] = forecast.ravel()
+    result["lower"] = lower.ravel()
+    result["upper"] = upper.ravel()
+    for j, name in enumerate(("alpha", "beta", "gamma", "phi", "sigma")):
+        result[name] = np.repeat(params[:, j], horizon)
+    return add_calendar_features(result)
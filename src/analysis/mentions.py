@@ -0,0 +1,100 @@
+"""
+블로그 언급량 시계열 (게시일 postdate 기준)
+- 키워드별로 수집한 글을 하나의 long 테이블(keyword, postdate, link)로 모아 groupby 한 번으로 집계
+- 결과는 Dataset 1과 같은 wide 형식 (date, 키워드..., year, month, season)
+  → DataLab 검색 비율과 나란히 비교 가능
+- 검색 API는 검색어당 최신 1,000건까지만 제공 → 1,000건을 다 채운 검색어는 가장 오래된 글 날짜 이전이
+  잘린 것이므로, 그 이전 기간(coverage 이전)은 NaN으로 표시
+"""
+
+import pandas as pd
+
+from .seasons import add_calendar_features
+
+
+FREQS = {"date": "D", "week": "W-SUN", "month": "M"}   # DataLab time_unit 이름 → pandas 기간
+
+
+def _as_dates(values):
+    """postdate (YYYYMMDD 문자열 / datetime) → datetime Series (잘못된 값은 NaT)"""
+    values = pd.Series(values)
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    return pd.to_datetime(values.astype(str), format="%Y%m%d", errors="coerce")
+
+
+def posts_frame(results):
+    """
+    키워드별 블로그 검색 결과 → long 테이블
+
+    Args:
+        results: {키워드: [(검색어, items), ...]} (items는 search_blogs / get_all_blogs 결과,
+                 dict 목록 또는 columnar=True의 {필드: 값 목록})
+
+    Returns:
+        DataFrame: keyword, query, postdate (datetime), link
+    """
+    frames = []
+    for keyword, batches in results.items():
+        for query, items in batches:
+            frame = pd.DataFrame(items, columns=["postdate", "link"]) if not isinstance(items, dict) \
+                else pd.DataFrame({field: items.get(field, []) for field in ("postdate", "link")})
+            frame.insert(0, "query", query)
+            frame.insert(0, "keyword", keyword)
+            frames.append(frame)
+    if not frames:
+        return pd.DataFrame(columns=["keyword", "query", "postdate", "link"])
+    posts = pd.concat(frames, ignore_index=True)
+    posts["postdate"] = _as_dates(posts["postdate"])
+    return posts
+
+
+def mention_counts(posts, time_unit="month", start_date=None, end_date=None, coverage=None,
+                   keywords=None):
+    """
+    키워드별 기간별 언급 글 수 (groupby 한 번, 같은 글(link)은 키워드마다 한 번만)
+
+    Args:
+        posts: posts_frame 결과 (keyword, postdate, link)
+        time_unit: 'date', 'week', 'month'
+        start_date / end_date: 기간 ("YYYY-MM-DD", None이면 데이터 범위)
+        coverage: {키워드: 수집이 보장되는 가장 이른 날짜} (기간 시작일이 이 날짜 이후인 기간만 값 사용, 나머지는 NaN)
+        keywords: 컬럼 순서 (None이면 posts에 나온 순서)
+
+    Returns:
+        DataFrame: date, 키워드별 글 수..., year, month, season (Dataset 1 형식)
+    """
+    if time_unit not in FREQS:
+        raise ValueError(f"지원하지 않는 time_unit: {time_unit} (사용 가능: {', '.join(FREQS)})")
+    freq = FREQS[time_unit]
+    keywords = list(keywords) if keywords is not None else list(dict.fromkeys(posts["keyword"]))
+
+    posts = posts.dropna(subset=["postdate"])
+    dedup = posts["link"].notna() & (posts["link"] != "")
+    posts = pd.concat([posts[dedup].drop_duplicates(["keyword", "link"]), posts[~dedup]])
+    if start_date:
+        posts = posts[posts["postdate"] >= pd.Timestamp(start_date)]
+    if end_date:
+        posts = posts[posts["postdate"] <= pd.Timestamp(end_date)]
+
+    period = posts["postdate"].dt.to_period(freq)
+    counts = (posts.assign(period=period)
+              .groupby(["period", "keyword"], observed=True).size()
+              .unstack("keyword", fill_value=0))
+
+    first = pd.Period(start_date, freq) if start_date else (period.min() if len(period) else None)
+    last = pd.Period(end_date, freq) if end_date else (period.max() if len(period) else None)
+    if first is None or last is None:
+        return pd.DataFrame(columns=["date"] + keywords + ["year", "month", "season"])
+    periods = pd.period_range(first, last, freq=freq)
+    counts = counts.reindex(index=periods, columns=keywords, fill_value=0).astype(float)
+
+    # 시작일이 coverage 이전인 기간은 일부만 수집된 것 → NaN
+    for keyword, since in (coverage or {}).items():
+        if keyword in counts.columns and since is not None:
+            counts.loc[periods.start_time < pd.Timestamp(since), keyword] = float("nan")
+
+    df = counts.reset_index(drop=True)
+    df.columns.name = None
+    df.insert(0, "date", periods.start_time)
+    return add_calendar_features(df)
@@ -0,0 +1,195 @@
+"""
+블로그 글 유사 중복 탐지 (MinHash + LSH)
+- 같은 원고를 조금씩 바꾼 협찬 / 체험단 글이 언급 수 지표를 부풀리는 문제 보정
+- 본문을 공백 / 특수문자를 뺀 글자 k-gram(shingle)으로 나누고, 전체 말뭉치를 하나의 배열로 이어
+  k-gram 해시와 MinHash 서명을 numpy 벡터 연산으로 계산 (글마다 파이썬 반복 없음)
+- LSH: 서명을 bands개 구간으로 나눠 구간 해시가 같은 글만 후보 → 전체 쌍 비교 없이 말뭉치 크기에 선형
+- 후보 중 서명 일치율(추정 Jaccard)이 기준 이상인 글을 연결 요소로 묶고, 묶음마다 대표 글 하나 유지
+"""
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from scipy.sparse.csgraph import connected_components
+
+from .text import blog_documents
+
+
+DEFAULT_SHINGLE = 5         # 글자 k-gram 길이
+DEFAULT_NUM_PERM = 128      # MinHash 해시 함수 수
+DEFAULT_BANDS = 32          # LSH 구간 수 (구간당 num_perm / bands개 → 후보 기준 유사도 ≈ (1/bands)^(bands/num_perm) ≈ 0.42)
+DEFAULT_THRESHOLD = 0.5     # 추정 Jaccard 기준 (이상이면 중복, 글자 5-gram 기준이라 단어 몇 개만 바뀌어도 0.6 안팎)
+DEFAULT_BATCH = 20_000      # 서명 계산 배치 (글 수, 메모리 제한)
+
+_MAX_HASH = np.uint32(0xFFFFFFFF)
+_BASE = np.uint64(0x100000001B3)   # k-gram 다항 해시 밑 (FNV prime)
+
+
+def _normalize(text):
+    """소문자 + 글자 / 숫자만 (띄어쓰기 / 문장부호 차이 무시)"""
+    return "".join(ch for ch in text.lower() if ch.isalnum())
+
+
+def _shingle_hashes(texts, k):
+    """
+    글 목록 → (k-gram 해시 배열, 글별 시작 위치, 글별 shingle 수)
+
+    전체 글을 이어 붙인 코드포인트 배열에서 한 번에 계산
+
+    k보다 짧은 글은 글 전체를 shingle 하나로 사용, 빈 글은 shingle 없음
+    """
+    lengths = np.fromiter((len(t) for t in texts), dtype=np.int64, count=len(texts))
+    codes = np.frombuffer("".join(texts).encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+    starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+
+    # 위치 i의 k-gram 해시 = Σ codes[i + j] · BASE^(k-1-j)  (uint64 자리 넘침 = mod 2^64)
+    n_grams = np.maximum(lengths - k + 1, np.minimum(lengths, 1))   # 짧은 글은 1개, 빈 글은 0개
+    window = np.minimum(lengths, k)
+    doc = np.repeat(np.arange(len(texts)), n_grams)
+    offsets = np.arange(n_grams.sum()) - np.repeat(np.cumsum(n_grams) - n_grams, n_grams)
+    positions = starts[doc] + offsets
+    width = window[doc]
+
+    hashes = np.zeros(len(positions), dtype=np.uint64)
+    short = bool((width < k).any())
+    with np.errstate(over="ignore"):
+        for j in range(k):
+            if short:
+                inside = j < width
+                hashes[inside] = hashes[inside] * _BASE + codes[positions[inside] + j]
+            else:
+                hashes = hashes * _BASE + codes[positions + j]
+        hashes ^= hashes >> np.uint64(29)
+    shingle_starts = np.concatenate(([0], np.cumsum(n_grams)[:-1]))
+    return hashes, shingle_starts, n_grams
+
+
+def minhash_signatures(texts, num_perm=DEFAULT_NUM_PERM, shingle=DEFAULT_SHINGLE, seed=0,
+                       batch_size=DEFAULT_BATCH):
+    """
+    MinHash 서명 (벡터 연산)
+
+    해시 함수 i: h → ((a_i · h + b_i) mod 2^64) >> 32 (a_i 홀수, multiply-shift)
+    글별 최솟값은 np.minimum.reduceat으로 한 번에
+
+    Args:
+        texts: 본문 목록
+        num_perm: 해시 함수 수 (서명 길이)
+        shingle: 글자 k-gram 길이
+        seed: 해시 함수 난수 시드 (같은 시드끼리만 서명 비교 가능)
+        batch_size: 한 번에 처리할 글 수
+
+    Returns:
+        ndarray (글 수, num_perm) uint32 (shingle이 없는 빈 글은 모두 0xFFFFFFFF)
+    """
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, 2**63, num_perm, dtype=np.uint64) | np.uint64(1)
+    b = rng.integers(0, 2**63, num_perm, dtype=np.uint64)
+    texts = [_normalize(t) if isinstance(t, str) else "" for t in texts]
+
+    signatures = np.full((len(texts), num_perm), _MAX_HASH, dtype=np.uint32)
+    for start in range(0, len(texts), batch_size):
+        hashes, shingle_starts, counts = _shingle_hashes(texts[start:start + batch_size], shingle)
+        present = np.flatnonzero(counts > 0)
+        if not len(present):
+            continue
+        rows = signatures[start:start + batch_size]
+        with np.errstate(over="ignore"):
+            for i in range(num_perm):
+                permuted = ((a[i] * hashes + b[i]) >> np.uint64(32)).astype(np.uint32)
+                rows[present, i] = np.minimum.reduceat(permuted, shingle_starts[present])
+    return signatures
+
+
+def lsh_clusters(signatures, bands=DEFAULT_BANDS, threshold=DEFAULT_THRESHOLD, seed=0):
+    """
+    LSH 구간 해시로 후보를 찾아 유사 중복 묶음 번호 부여
+
+    구간마다 해시가 같은 글을 정렬로 모으고, 각 그룹의 첫 글과 서명 일치율이 threshold 이상인 글을 연결
+    → 연결 요소 = 중복 묶음 (쌍 비교는 후보 수에 비례)
+
+    Args:
+        signatures: minhash_signatures 결과
+        bands: LSH 구간 수 (num_perm의 약수)
+        threshold: 서명 일치율(추정 Jaccard) 기준
+
+    Returns:
+        ndarray: 글별 묶음 번호 (0부터, 처음 나온 순서)
+    """
+    n, num_perm = signatures.shape
+    if num_perm % bands:
+        raise ValueError(f"bands({bands})는 num_perm({num_perm})의 약수여야 합니다")
+    rows = num_perm // bands
+    # 빈 글(서명이 모두 최댓값)은 후보에서 제외
+    valid = np.flatnonzero((signatures != _MAX_HASH).any(axis=1))
+    weights = np.random.default_rng(seed).integers(1, 2**63, rows, dtype=np.uint64) | np.uint64(1)
+
+    sources, targets = [], []
+    with np.errstate(over="ignore"):
+        for band in range(bands):
+            block = signatures[valid, band * rows:(band + 1) * rows].astype(np.uint64)
+            keys = (block * weights).sum(axis=1)
+            order = np.argsort(keys, kind="stable")
+            sorted_keys = keys[order]
+            # 같은 키 그룹의 첫 글 (leader)
+            new_group = np.concatenate(([True], sorted_keys[1:] != sorted_keys[:-1]))
+            leader = order[np.flatnonzero(new_group)[np.cumsum(new_group) - 1]]
+            member = order[~new_group]
+            leader = leader[~new_group]
+            if not len(member):
+                continue
+            agreement = (signatures[valid[leader]] == signatures[valid[member]]).mean(axis=1)
+            keep = agreement >= threshold
+            sources.append(valid[leader[keep]])
+            targets.append(valid[member[keep]])
+
+    if sources:
+        sources, targets = np.concatenate(sources), np.concatenate(targets)
+    else:
+        sources = targets = np.array([], dtype=np.int64)
+    graph = sparse.coo_matrix((np.ones(len(sources), dtype=np.int8), (sources, targets)), shape=(n, n))
+    _, labels = connected_components(graph, directed=False)
+    cluster, _ = pd.factorize(labels)
+    return cluster
+
+
+def near_duplicate_clusters(df, columns=("title", "description"), num_perm=DEFAULT_NUM_PERM,
+                            bands=DEFAULT_BANDS, threshold=DEFAULT_THRESHOLD, shingle=DEFAULT_SHINGLE,
+                            seed=0):
+    """
+    블로그 글 유사 중복 표시
+
+    Args:
+        df: NaverBlog.to_dataframe 결과 (title / description 컬럼)
+        columns: 비교할 컬럼 (이어 붙여 한 본문으로)
+        num_perm, bands, threshold, shingle, seed: minhash_signatures / lsh_clusters 설정
+
+    Returns:
+        DataFrame (df와 같은 인덱스): cluster_id, cluster_size,
+        is_representative (묶음마다 첫 번째 글만 True, postdate가 있으면 가장 이른 글)
+    """
+    texts = blog_documents(df, columns)
+    signatures = minhash_signatures(texts, num_perm, shingle, seed)
+    cluster = lsh_clusters(signatures, bands, threshold, seed)
+
+    result = pd.DataFrame({"cluster_id": cluster}, index=df.index)
+    result["cluster_size"] = result.groupby("cluster_id")["cluster_id"].transform("size")
+
+    order = np.arange(len(df))
+    if "postdate" in df.columns:
+        dates = df["postdate"]
+        if not pd.api.types.is_datetime64_any_dtype(dates):
+            dates = pd.to_datetime(dates.astype(str), format="%Y%m%d", errors="coerce")
+        order = np.argsort(dates.to_numpy(), kind="stable")   # 날짜 없는 글(NaT)은 맨 뒤
+    first = pd.Series(cluster[order]).drop_duplicates().index
+    representative = np.zeros(len(df), dtype=bool)
+    representative[order[first]] = True
+    result["is_representative"] = representative
+    return result
+
+
+def drop_near_duplicates(df, **kwargs):
+    """유사 중복 묶음마다 대표 글 하나만 남긴 DataFrame (cluster_id / cluster_size 컬럼 추가)"""
+    clusters = near_duplicate_clusters(df, **kwargs)
+    kept = df.join(clusters[["cluster_id", "cluster_size"]])
+    return kept[clusters["is_representative"].to_numpy()]
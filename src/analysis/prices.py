@@ -0,0 +1,396 @@
+"""
+쇼핑 검색 결과 가격 분석 (브랜드 / 쇼핑몰 / 카테고리별)
+- NaverShopping.get_all_products 결과(여러 검색어)를 하나의 listing 테이블로 결합
+- 상품명에서 용량(ml)과 수량(2개, x3, 1+1)을 미리 컴파일한 정규식으로 한 번에 추출 → ml당 가격
+- 그룹별 가격 분위수, 최저가(lprice) / 최고가(hprice) 차이, 상품 수를 groupby 한 번으로 계산
+- 수집할 때마다 원본을 모두 보관하지 않도록, 병합 가능한 분위수 스케치(PriceSketch)로
+  분위수를 누적 갱신 (상대 오차 relative_accuracy 이내)
+"""
+
+import json
+import math
+import re
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+DEFAULT_QUANTILES = (0.1, 0.25, 0.5, 0.75, 0.9)
+LISTING_COLUMNS = ("query", "title", "lprice", "hprice", "mallName", "brand", "maker",
+                   "category1", "category2", "category3", "category4", "productId")
+
+# 용량: 50ml, 50 mL, 1.5L, 50㎖ (뒤에 영문이 이어지면 제외: 'ml' 다음 'x'는 허용)
+VOLUME_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\s*(ml|mL|ML|Ml|㎖|l|L|ℓ)(?![a-wyzA-WYZ])")
+# 수량: x2, ×3, *2, 2개, 3개입, 2입, 2팩, 2ea / 1+1, 2+1
+PACK_PATTERN = re.compile(r"(?:[xX×\*]\s*(\d+)(?!\s*(?:ml|mL|ML|㎖|g|G))|(\d+)\s*(?:개입|개|입|팩|ea|EA))")
+BONUS_PATTERN = re.compile(r"(?<![A-Za-z\d])(\d)\s*\+\s*(\d)(?!\d)")  # 'SPF50+'는 제외
+HTML_TAG = re.compile(r"<[^>]+>")
+
+LITER_UNITS = ("l", "L", "ℓ")
+MAX_PACK = 50  # 이보다 큰 수량은 오인식으로 보고 1로 처리
+
+
+# ============================================
+# listing 테이블
+# ============================================
+def _items_frame(items):
+    """get_all_products 결과 (dict 목록 또는 {필드: 값 목록}) → DataFrame"""
+    if isinstance(items, dict):
+        return pd.DataFrame({field: values for field, values in items.items()})
+    return pd.DataFrame.from_records(items)
+
+
+def listings_frame(results, brands=None):
+    """
+    검색어별 쇼핑 검색 결과 → listing 테이블
+
+    Args:
+        results: {검색어: get_all_products 결과} (columnar=True 결과 권장)
+        brands: 브랜드 목록 (지정하면 brand가 빈 상품은 상품명 / 제조사에서 브랜드 추출)
+
+    Returns:
+        DataFrame: query, title(태그 제거), lprice, hprice(없으면 NaN), mallName, brand, maker,
+                   category1~4, productId, volume_ml, pack, total_ml, price_per_ml
+    """
+    frames = []
+    for query, items in results.items():
+        frame = _items_frame(items)
+        frame.insert(0, "query", query)
+        frames.append(frame)
+    if not frames:
+        return pd.DataFrame(columns=list(LISTING_COLUMNS))
+
+    df = pd.concat(frames, ignore_index=True).reindex(columns=list(LISTING_COLUMNS))
+    text_columns = [c for c in LISTING_COLUMNS if c not in ("lprice", "hprice")]
+    df[text_columns] = df[text_columns].fillna("").astype(str)
+    df["title"] = df["title"].str.replace(HTML_TAG, "", regex=True)
+
+    df["lprice"] = pd.to_numeric(df["lprice"], errors="coerce")
+    hprice = pd.to_numeric(df["hprice"], errors="coerce")
+    df["hprice"] = hprice.where(hprice > 0)   # 0 = 최고가 정보 없음
+
+    if brands:
+        df["brand"] = assign_brands(df, brands)
+
+    volume = parse_volume(df["title"])
+    df = pd.concat([df, volume], axis=1)
+    df["price_per_ml"] = df["lprice"] / df["total_ml"]
+
+    for column in ("query", "mallName", "brand", "maker", "category1", "category2",
+                   "category3", "category4"):
+        df[column] = df[column].astype("category")
+    return df
+
+
+def brand_names(keywords):
+    """'라운드랩 선크림' 형태 키워드 목록 → 브랜드 이름 (첫 단어)"""
+    return list(dict.fromkeys(keyword.split()[0] for keyword in keywords if keyword.strip()))
+
+
+def assign_brands(df, brands):
+    """
+    brand 컬럼 보정: 빈 값이면 상품명 → 제조사 순으로 브랜드 목록과 매칭
+
+    Returns:
+        Series: 브랜드 (매칭 실패 시 기존 brand, 그것도 없으면 '')
+    """
+    alternation = "|".join(sorted((re.escape(b) for b in brands), key=len, reverse=True))
+    pattern = re.compile(f"({alternation})")
+
+    def match(column):
+        """컬럼 고유값마다 한 번만 매칭 → 행별 브랜드 (없으면 NaN)"""
+        codes, unique = pd.factorize(df[column].astype(str))
+        found = _first_groups(unique.astype(object), pattern, 1)[:, 0]
+        return pd.Series(found[codes], index=df.index, dtype=object)
+
+    brand = df["brand"].astype(str)
+    # 목록에 있는 브랜드는 표기를 통일 (예: brand='라운드랩(ROUND LAB)' → '라운드랩')
+    known = match("brand")
+    return (known.fillna(match("title")).fillna(brand.where(brand != ""))
+            .fillna(match("maker")).fillna(""))
+
+
+def _first_groups(strings, pattern, n_groups):
+    """문자열마다 정규식 첫 매치의 그룹 → (문자열 수, n_groups) object 배열 (매치 없으면 None)"""
+    search = pattern.search
+    empty = (None,) * n_groups
+    rows = [match.groups() if match else empty for match in map(search, strings)]
+    return np.array(rows, dtype=object).reshape(len(rows), n_groups)
+
+
+def _to_float(values):
+    """문자열 / None 배열 → float 배열 (None은 NaN)"""
+    return np.array([np.nan if v is None else float(v) for v in values], dtype=float)
+
+
+def parse_volume(titles):
+    """
+    상품명 → 용량 / 수량 / 총 용량 (벡터 연산)
+
+    - 용량: 상품명의 첫 번째 '숫자 + ml/L' (L은 1000배)
+    - 수량: 'x2', '2개', '3개입' 등 (없으면 1), '1+1' 형태는 합계 (둘 다 있으면 곱)
+    - 같은 상품명은 한 번만 파싱 (여러 검색어에 같은 상품이 반복되는 경우가 많음)
+
+    Returns:
+        DataFrame: volume_ml, pack, total_ml (용량을 찾지 못하면 NaN)
+    """
+    titles = pd.Series(titles, dtype=object).fillna("").astype(str)
+    codes, unique = pd.factorize(titles)
+    unique = unique.astype(object)
+
+    volume = _first_groups(unique, VOLUME_PATTERN, 2)
+    volume_ml = _to_float(volume[:, 0]) * np.where(np.isin(volume[:, 1], LITER_UNITS), 1000, 1)
+
+    pack = _first_groups(unique, PACK_PATTERN, 2)
+    count = _to_float(np.where(pack[:, 0] == None, pack[:, 1], pack[:, 0]))  # noqa: E711
+    bonus = np.ones(len(unique))
+    plus = np.flatnonzero(pd.Series(unique).str.contains("+", regex=False).to_numpy())
+    if len(plus):
+        groups = _first_groups(unique[plus], BONUS_PATTERN, 2)
+        bonus[plus] = np.nan_to_num(_to_float(groups[:, 0]) + _to_float(groups[:, 1]), nan=1)
+    count = np.nan_to_num(count, nan=1) * bonus
+    count = np.where((count >= 1) & (count <= MAX_PACK), count, 1).astype(np.int64)
+
+    volume_ml, count = volume_ml[codes], count[codes]
+    return pd.DataFrame({
+        "volume_ml": volume_ml,
+        "pack": count,
+        "total_ml": volume_ml * count,
+    }, index=titles.index)
+
+
+# ============================================
+# 그룹별 요약
+# ============================================
+def price_summary(df, by=("brand",), quantiles=DEFAULT_QUANTILES, min_listings=1):
+    """
+    그룹별 가격 요약
+
+    Args:
+        df: listings_frame 결과
+        by: 그룹 컬럼 (예: ('brand',), ('mallName',), ('category3',), ('brand', 'mallName'))
+        quantiles: 최저가(lprice) 분위수
+        min_listings: 이보다 상품 수가 적은 그룹 제외
+
+    Returns:
+        DataFrame (index=그룹): listings, lprice_mean, lprice_q10 ..., spread_median
+        (hprice - lprice, 최고가가 있는 상품만), spread_share (최고가 있는 상품 비율),
+        ppm_median (ml당 가격 중앙값), ppm_listings (용량을 찾은 상품 수)
+    """
+    by = list(by)
+    frame = df[by + ["lprice", "hprice", "price_per_ml"]].copy()
+    frame["spread"] = frame["hprice"] - frame["lprice"]
+    grouped = frame.groupby(by, observed=True, sort=True)
+
+    summary = grouped.agg(
+        listings=("lprice", "size"),
+        lprice_mean=("lprice", "mean"),
+        spread_median=("spread", "median"),
+        spread_share=("hprice", "count"),
+        ppm_median=("price_per_ml", "median"),
+        ppm_listings=("price_per_ml", "count"),
+    )
+    summary["spread_share"] = summary["spread_share"] / summary["listings"]
+
+    q = grouped["lprice"].quantile(list(quantiles)).unstack(-1)
+    q.columns = [f"lprice_q{round(level * 100):02d}" for level in q.columns]
+
+    summary = summary.join(q)
+    ordered = ["listings", "lprice_mean"] + list(q.columns) + [
+        "spread_median", "spread_share", "ppm_median", "ppm_listings"]
+    return summary.loc[summary["listings"] >= min_listings, ordered]
+
+
+# ============================================
+# 분위수 스케치 (병합 가능, 상대 오차 보장)
+# ============================================
+class PriceSketch:
+    """
+    로그 구간 히스토그램 분위수 스케치 (DDSketch 방식)
+
+    값 x를 구간 ceil(log_γ(x))에 세어 두면, 어떤 분위수든 상대 오차 relative_accuracy 이내로
+    조회 가능. 같은 설정의 스케치는 구간별 합으로 병합되므로 수집 배치마다 갱신하거나
+    여러 워커 결과를 합칠 수 있습니다. 0 이하 값(가격 없음)은 zeros로 따로 셉니다.
+    """
+
+    def __init__(self, relative_accuracy=0.01):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError(f"relative_accuracy는 0과 1 사이여야 합니다: {relative_accuracy}")
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.offset = 0                        # counts[0]의 구간 번호
+        self.counts = np.zeros(0, dtype=np.int64)
+        self.zeros = 0
+        self.min = math.inf
+        self.max = -math.inf
+
+    @property
+    def count(self):
+        return int(self.counts.sum()) + self.zeros
+
+    def _grow(self, low, high):
+        """구간 번호 [low, high]를 담도록 배열 확장"""
+        if not len(self.counts):
+            self.offset = low
+            self.counts = np.zeros(high - low + 1, dtype=np.int64)
+            return
+        new_low = min(low, self.offset)
+        new_high = max(high, self.offset + len(self.counts) - 1)
+        if new_low == self.offset and new_high == self.offset + len(self.counts) - 1:
+            return
+        counts = np.zeros(new_high - new_low + 1, dtype=np.int64)
+        start = self.offset - new_low
+        counts[start:start + len(self.counts)] = self.counts
+        self.offset, self.counts = new_low, counts
+
+    def update(self, values):
+        """값 배열 추가 (NaN 무시)"""
+        values = np.asarray(values, dtype=float).ravel()
+        values = values[~np.isnan(values)]
+        if not len(values):
+            return self
+        positive = values[values > 0]
+        self.zeros += int(len(values) - len(positive))
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        if len(positive):
+            index = np.ceil(np.log(positive) / self._log_gamma).astype(np.int64)
+            low, high = int(index.min()), int(index.max())
+            self._grow(low, high)
+            self.counts += np.bincount(index - self.offset, minlength=len(self.counts))
+        return self
+
+    def merge(self, other):
+        """같은 relative_accuracy의 스케치 병합 (self 갱신)"""
+        if not math.isclose(self.gamma, other.gamma):
+            raise ValueError("relative_accuracy가 다른 스케치는 병합할 수 없습니다")
+        if len(other.counts):
+            self._grow(other.offset, other.offset + len(other.counts) - 1)
+            start = other.offset - self.offset
+            self.counts[start:start + len(other.counts)] += other.counts
+        self.zeros += other.zeros
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def quantile(self, q):
+        """
+        분위수 (q: 0~1 스칼라 또는 배열, 값이 없으면 NaN)
+
+        반환값은 실제 분위수와 상대 오차 relative_accuracy 이내 (min / max로 범위 제한)
+        """
+        q = np.asarray(q, dtype=float)
+        total = self.count
+        if total == 0:
+            return np.full(q.shape, np.nan) if q.ndim else math.nan
+
+        rank = q * (total - 1)
+        cumulative = np.cumsum(self.counts) + self.zeros
+        position = np.searchsorted(cumulative, rank, side="right")
+        index = self.offset + position
+        values = 2 * np.power(self.gamma, index) / (self.gamma + 1)
+        values = np.where(rank < self.zeros, 0.0, np.clip(values, self.min, self.max))
+        return values if q.ndim else float(values)
+
+    def to_dict(self):
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "offset": self.offset,
+            "counts": self.counts.tolist(),
+            "zeros": self.zeros,
+            "min": None if self.count == 0 else self.min,
+            "max": None if self.count == 0 else self.max,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        sketch = cls(data["relative_accuracy"])
+        sketch.offset = data["offset"]
+        sketch.counts = np.asarray(data["counts"], dtype=np.int64)
+        sketch.zeros = data["zeros"]
+        sketch.min = math.inf if data["min"] is None else data["min"]
+        sketch.max = -math.inf if data["max"] is None else data["max"]
+        return sketch
+
+    def __repr__(self):
+        return (f"PriceSketch(count={self.count}, relative_accuracy={self.relative_accuracy}, "
+                f"buckets={len(self.counts)})")
+
+
+class PriceSketches:
+    """
+    그룹별 PriceSketch 모음 (예: 브랜드별 최저가 분위수를 수집 배치마다 누적)
+
+    Attributes:
+        by: 그룹 컬럼
+        value: 스케치할 값 컬럼 (기본 lprice, ml당 가격은 'price_per_ml')
+        sketches: {그룹 키(tuple): PriceSketch}
+    """
+
+    def __init__(self, by=("brand",), value="lprice", relative_accuracy=0.01):
+        self.by = tuple(by)
+        self.value = value
+        self.relative_accuracy = relative_accuracy
+        self.sketches = {}
+
+    def update(self, df):
+        """listing 배치 추가 (그룹별로 한 번씩 갱신)"""
+        groups = df.groupby(list(self.by), observed=True, sort=False)[self.value]
+        for key, values in groups:
+            key = key if isinstance(key, tuple) else (key,)
+            sketch = self.sketches.get(key)
+            if sketch is None:
+                sketch = self.sketches[key] = PriceSketch(self.relative_accuracy)
+            sketch.update(values.to_numpy(dtype=float))
+        return self
+
+    def merge(self, other):
+        """같은 그룹 설정의 스케치 모음 병합"""
+        if other.by != self.by or other.value != self.value:
+            raise ValueError("그룹 / 값 컬럼이 다른 스케치 모음은 병합할 수 없습니다")
+        for key, sketch in other.sketches.items():
+            if key in self.sketches:
+                self.sketches[key].merge(sketch)
+            else:
+                self.sketches[key] = PriceSketch.from_dict(sketch.to_dict())
+        return self
+
+    def summary(self, quantiles=DEFAULT_QUANTILES):
+        """그룹별 count, min, 분위수, max DataFrame"""
+        keys = sorted(self.sketches)
+        rows = []
+        for key in keys:
+            sketch = self.sketches[key]
+            rows.append([sketch.count, sketch.min] + list(sketch.quantile(quantiles)) + [sketch.max])
+        columns = (["count", "min"] + [f"q{round(q * 100):02d}" for q in quantiles] + ["max"])
+        index = pd.MultiIndex.from_tuples(keys, names=list(self.by)) if keys else None
+        summary = pd.DataFrame(rows, columns=columns, index=index)
+        if len(self.by) == 1 and keys:
+            summary.index = summary.index.get_level_values(0)
+        return summary
+
+    def save(self, path):
+        """JSON 저장"""
+        data = {
+            "by": list(self.by),
+            "value": self.value,
+            "relative_accuracy": self.relative_accuracy,
+            "sketches": [{"key": list(key), **sketch.to_dict()} for key, sketch in self.sketches.items()],
+        }
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        return path
+
+    @classmethod
+    def load(cls, path):
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        book = cls(data["by"], data["value"], data["relative_accuracy"])
+        for entry in data["sketches"]:
+            book.sketches[tuple(entry.pop("key"))] = PriceSketch.from_dict(entry)
+        return book
+
+    def __repr__(self):
+        return f"PriceSketches(by={self.by}, value={self.value!r}, groups={len(self.sketches)})"
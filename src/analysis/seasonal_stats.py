@@ -0,0 +1,214 @@
+"""
+계절 통계 엔진
+- 여러 시계열(키워드/세그먼트)을 한 번에 계산: 계절 평균, 겨울/여름 비율, 전년 대비 증감, t-검정
+- 입력: wide format (date 컬럼 또는 DatetimeIndex + 시계열별 컬럼)
+        long format은 long_to_wide로 변환 후 사용
+"""
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from .seasons import DEFAULT_SCHEME, season_lookup
+
+
+CALENDAR_COLUMNS = ("year", "month")
+
+
+# ============================================
+# 입력 정리
+# ============================================
+def long_to_wide(df, key="keyword", value="search_volume", date_col="date"):
+    """
+    long format → wide format (index=date, columns=key)
+
+    Args:
+        key: 시계열을 구분하는 컬럼 (예: 'keyword' 또는 ['segment', 'keyword'])
+    """
+    wide = df.pivot_table(index=date_col, columns=key, values=value, aggfunc="mean")
+    wide.index = pd.DatetimeIndex(wide.index)
+    return wide
+
+
+def _series_matrix(frame, columns, date_col):
+    """(DatetimeIndex, (T, N) float 배열, 컬럼 목록)"""
+    if date_col in frame.columns:
+        dates = pd.DatetimeIndex(frame[date_col])
+        data = frame.drop(columns=date_col)
+    else:
+        dates = pd.DatetimeIndex(frame.index)
+        data = frame
+
+    if columns is None:
+        columns = [
+            col for col in data.select_dtypes(include="number").columns
+            if col not in CALENDAR_COLUMNS
+        ]
+    else:
+        columns = list(columns)
+
+    values = data[columns].to_numpy(dtype=float)
+    return dates, values, columns
+
+
+def _group_moments(codes, values, n_groups):
+    """
+    그룹별 (개수, 평균, 표본분산) — 모든 시계열을 행렬 연산 한 번으로 계산
+
+    Args:
+        codes: (T,) 그룹 코드 (0 ~ n_groups-1)
+        values: (T, N) 값 (NaN은 결측)
+
+    Returns:
+        tuple: count, mean, var — 각각 (n_groups, N)
+    """
+    valid = ~np.isnan(values)
+    filled = np.where(valid, values, 0.0)
+
+    onehot = (codes[None, :] == np.arange(n_groups)[:, None]).astype(float)   # (G, T)
+
+    count = onehot @ valid
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = (onehot @ filled) / count
+        deviation = np.where(valid, values - mean[codes], 0.0)
+        var = (onehot @ deviation ** 2) / (count - 1)
+
+    var[count < 2] = np.nan
+    return count, mean, var
+
+
+# ============================================
+# 계절 통계
+# ============================================
+def season_means(frame, columns=None, scheme=DEFAULT_SCHEME, date_col="date"):
+    """
+    계절별 평균
+
+    Returns:
+        DataFrame: index=season (scheme 라벨 순서), columns=시계열
+    """
+    dates, values, columns = _series_matrix(frame, columns, date_col)
+    labels, lookup = season_lookup(scheme)
+
+    _, mean, _ = _group_moments(lookup[dates.month], values, len(labels))
+    return pd.DataFrame(mean, index=pd.Index(labels, name="season"), columns=columns)
+
+
+def season_ratio(frame, numerator="겨울", denominator="여름", columns=None,
+                 scheme=DEFAULT_SCHEME, date_col="date"):
+    """계절 평균 비율 (%) — 기본: 겨울/여름"""
+    means = season_means(frame, columns, scheme, date_col)
+    ratio = means.loc[numerator] / means.loc[denominator] * 100
+    ratio.name = f"{numerator}/{denominator}(%)"
+    return ratio
+
+
+def yearly_season_means(frame, season="겨울", columns=None, scheme=DEFAULT_SCHEME,
+                        date_col="date", season_year=False):
+    """
+    연도별 특정 계절 평균
+
+    Args:
+        season: 계절 라벨 (None이면 전체 월)
+        season_year: True면 12월을 다음 해 겨울로 묶음 (예: 2023-12 → 2024 겨울)
+                     False면 달력 연도 기준 (Q1 노트북 방식)
+
+    Returns:
+        DataFrame: index=year, columns=시계열
+    """
+    dates, values, columns = _series_matrix(frame, columns, date_col)
+    years = dates.year.to_numpy()
+
+    if season is not None:
+        labels, lookup = season_lookup(scheme)
+        mask = lookup[dates.month] == labels.index(season)
+        values, years = values[mask], years[mask]
+        if season_year:
+            years = years + (dates.month.to_numpy()[mask] == 12)
+
+    year_index, codes = np.unique(years, return_inverse=True)
+    _, mean, _ = _group_moments(codes.ravel(), values, len(year_index))
+    return pd.DataFrame(mean, index=pd.Index(year_index, name="year"), columns=columns)
+
+
+def yoy_growth(frame, season="겨울", columns=None, scheme=DEFAULT_SCHEME,
+               date_col="date", season_year=False):
+    """
+    전년 대비 증감률 (%) — 연도별 계절 평균 기준
+
+    Returns:
+        DataFrame: index=year, columns=시계열 (첫 해는 NaN)
+    """
+    yearly = yearly_season_means(frame, season, columns, scheme, date_col, season_year)
+    return (yearly / yearly.shift(1) - 1) * 100
+
+
+def season_ttest(frame, a="여름", b="겨울", columns=None, scheme=DEFAULT_SCHEME,
+                 date_col="date", equal_var=True):
+    """
+    두 계절 평균 차이 t-검정 (모든 시계열을 한 번에)
+
+    scipy.stats.ttest_ind(a, b, equal_var=...)와 같은 결과를 벡터 연산으로 계산
+
+    Returns:
+        DataFrame: index=시계열
+            mean_a, mean_b, n_a, n_b, t_stat, p_value, dof, cohens_d
+    """
+    dates, values, columns = _series_matrix(frame, columns, date_col)
+    labels, lookup = season_lookup(scheme)
+
+    count, mean, var = _group_moments(lookup[dates.month], values, len(labels))
+    ia, ib = labels.index(a), labels.index(b)
+    na, nb = count[ia], count[ib]
+    ma, mb = mean[ia], mean[ib]
+    va, vb = var[ia], var[ib]
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        pooled_var = ((na - 1) * va + (nb - 1) * vb) / (na + nb - 2)
+
+        if equal_var:
+            dof = na + nb - 2
+            se = np.sqrt(pooled_var * (1 / na + 1 / nb))
+        else:
+            qa, qb = va / na, vb / nb
+            dof = (qa + qb) ** 2 / (qa ** 2 / (na - 1) + qb ** 2 / (nb - 1))
+            se = np.sqrt(qa + qb)
+
+        t_stat = (ma - mb) / se
+        cohens_d = (ma - mb) / np.sqrt(pooled_var)
+
+    p_value = 2 * stats.t.sf(np.abs(t_stat), dof)
+
+    return pd.DataFrame({
+        "mean_a": ma,
+        "mean_b": mb,
+        "n_a": na.astype(int),
+        "n_b": nb.astype(int),
+        "t_stat": t_stat,
+        "p_value": p_value,
+        "dof": dof,
+        "cohens_d": cohens_d,
+    }, index=pd.Index(columns, name="series"))
+
+
+def seasonal_summary(frame, columns=None, low="겨울", high="여름",
+                     scheme=DEFAULT_SCHEME, date_col="date"):
+    """
+    시계열별 계절 요약 (Q1 분석을 여러 키워드에 한 번에 적용)
+
+    Returns:
+        DataFrame: index=시계열
+            {low}_평균, {high}_평균, 비율(%), t_stat, p_value, cohens_d, 평균_증감률(%)
+    """
+    test = season_ttest(frame, high, low, columns, scheme, date_col)
+    growth = yoy_growth(frame, low, columns, scheme, date_col)
+
+    return pd.DataFrame({
+        f"{low}_평균": test["mean_b"],
+        f"{high}_평균": test["mean_a"],
+        "비율(%)": test["mean_b"] / test["mean_a"] * 100,
+        "t_stat": test["t_stat"],
+        "p_value": test["p_value"],
+        "cohens_d": test["cohens_d"],
+        "평균_증감률(%)": growth.mean(axis=0).to_numpy(),
+    }, index=test.index)
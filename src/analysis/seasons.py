@@ -0,0 +1,115 @@
+"""
+계절 / 달력 피처
+- 월 → 계절 매핑을 조회 배열(lookup array)로 한 번에 변환
+- 수집 스크립트(collect_dataset_1~3)와 Q1/Q3 노트북 공용
+"""
+
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+
+# ============================================
+# 계절 구분 방식
+# ============================================
+# 라벨 순서 = 통계 결과의 행 순서
+SEASON_SCHEMES = {
+    # 겨울(12,1,2) / 여름(6,7,8) / 기타 — Dataset 1~3 수집 스크립트 기준
+    "winter_summer": {
+        "겨울": (12, 1, 2),
+        "여름": (6, 7, 8),
+        "기타": (3, 4, 5, 9, 10, 11),
+    },
+    # 봄 / 여름 / 가을 / 겨울 — Q1 노트북 기준
+    "four_seasons": {
+        "봄": (3, 4, 5),
+        "여름": (6, 7, 8),
+        "가을": (9, 10, 11),
+        "겨울": (12, 1, 2),
+    },
+}
+
+DEFAULT_SCHEME = "winter_summer"
+
+
+def _build_lookup(items):
+    labels = []
+    lookup = np.full(13, -1, dtype=np.int8)   # index 0은 사용하지 않음
+
+    for code, (label, months) in enumerate(items):
+        labels.append(label)
+        for month in months:
+            if not 1 <= month <= 12:
+                raise ValueError(f"잘못된 월: {month} ({label})")
+            if lookup[month] != -1:
+                raise ValueError(f"{month}월이 두 계절에 중복 지정되었습니다: "
+                                 f"{labels[lookup[month]]}, {label}")
+            lookup[month] = code
+
+    missing = [m for m in range(1, 13) if lookup[m] == -1]
+    if missing:
+        raise ValueError(f"계절이 지정되지 않은 월: {missing}")
+
+    lookup[0] = 0
+    return tuple(labels), lookup
+
+
+@lru_cache(maxsize=None)
+def _named_lookup(name):
+    if name not in SEASON_SCHEMES:
+        raise ValueError(f"알 수 없는 계절 구분: {name} (사용 가능: {list(SEASON_SCHEMES)})")
+    return _build_lookup(tuple(SEASON_SCHEMES[name].items()))
+
+
+def season_lookup(scheme=DEFAULT_SCHEME):
+    """
+    계절 구분의 (라벨 목록, 월 → 코드 조회 배열) 반환
+
+    Args:
+        scheme: SEASON_SCHEMES 이름 또는 {라벨: (월, ...)} 딕셔너리
+
+    Returns:
+        tuple: (labels, lookup) — lookup[month] = labels 내 위치
+    """
+    if isinstance(scheme, str):
+        return _named_lookup(scheme)
+    return _build_lookup(tuple(scheme.items()))
+
+
+# ============================================
+# 벡터 변환
+# ============================================
+def season_codes(months, scheme=DEFAULT_SCHEME):
+    """월 배열 → 계절 코드 배열 (int8)"""
+    _, lookup = season_lookup(scheme)
+    return lookup[np.asarray(months, dtype=np.intp)]
+
+
+def season_labels(months, scheme=DEFAULT_SCHEME):
+    """월 배열 → 계절 라벨 배열 (행 단위 apply 없이 조회 배열 인덱싱)"""
+    labels, lookup = season_lookup(scheme)
+    return np.asarray(labels, dtype=object)[lookup[np.asarray(months, dtype=np.intp)]]
+
+
+def add_calendar_features(df, date_col="date", scheme=DEFAULT_SCHEME, season_col="season"):
+    """
+    year, month, season 컬럼 추가 (원본 DataFrame 수정)
+
+    Args:
+        df: date_col 컬럼(datetime)이 있는 DataFrame
+        date_col: 날짜 컬럼
+        scheme: 계절 구분 방식
+        season_col: 계절 컬럼 이름
+
+    Returns:
+        DataFrame: 같은 객체 (체이닝용)
+    """
+    dates = pd.DatetimeIndex(df[date_col])
+    months = dates.month.to_numpy()
+
+    df["year"] = dates.year.to_numpy()
+    df["month"] = months
+    df[season_col] = season_labels(months, scheme)
+
+    return df
@@ -0,0 +1,233 @@
+"""
+세그먼트 × 키워드 분석 (블루오션 / 4사분면)
+- collect_dataset_4.main 과 Q4 노트북이 공통으로 사용
+- long format DataFrame (segment, keyword, search_volume) 기준
+"""
+
+import numpy as np
+import pandas as pd
+
+
+# ============================================
+# 기본 설정
+# ============================================
+BASE_KEYWORD = "선크림"
+SPORT_KEYWORDS = ["스키장", "스키", "스노우보드"]
+
+QUADRANT_LABELS = {
+    "A": "A (둘 다 높음)",
+    "B": "B (블루오션!)",
+    "C": "C (선크림만 높음)",
+    "D": "D (둘 다 낮음)",
+}
+
+
+# ============================================
+# long format 생성
+# ============================================
+def stack_segments(pieces, value_name="search_volume"):
+    """
+    세그먼트 × 키워드별 수집 결과를 하나의 long format DataFrame으로 결합
+
+    조합마다 DataFrame을 만들지 않고 배열을 모아 한 번에 생성합니다.
+
+    Args:
+        pieces: (meta, dates, values) 목록
+            - meta: {'keyword': ..., 'segment': ..., ...} 조합별 고정 컬럼
+            - dates: 날짜 배열
+            - values: 값 배열 (dates와 같은 길이)
+        value_name: 값 컬럼 이름
+
+    Returns:
+        DataFrame: date, meta 컬럼들, value_name, year, month
+    """
+    pieces = list(pieces)
+    if not pieces:
+        return pd.DataFrame(columns=["date", value_name, "year", "month"])
+
+    lengths = np.array([len(dates) for _, dates, _ in pieces])
+    dates = pd.DatetimeIndex(np.concatenate([np.asarray(d, dtype="datetime64[ns]")
+                                             for _, d, _ in pieces]))
+
+    columns = {"date": dates}
+    for key in pieces[0][0]:
+        columns[key] = np.repeat(np.array([meta[key] for meta, _, _ in pieces], dtype=object),
+                                 lengths)
+    columns[value_name] = np.concatenate([np.asarray(v, dtype=float) for _, _, v in pieces])
+    columns["year"] = dates.year
+    columns["month"] = dates.month
+
+    return pd.DataFrame(columns)
+
+
+# ============================================
+# 피벗 (세그먼트 × 키워드)
+# ============================================
+def segment_matrix(df, value="search_volume", agg="mean",
+                   segment_order=None, keyword_order=None, fill_value=0):
+    """
+    long format 데이터를 세그먼트 × 키워드 매트릭스로 변환
+
+    Args:
+        df: long format DataFrame (segment, keyword, value 컬럼)
+        value: 집계할 값 컬럼
+        agg: 집계 함수 ('mean', 'sum', 'max', ...)
+        segment_order: 행 순서 (None이면 정렬 순서)
+        keyword_order: 열 순서 (None이면 정렬 순서)
+        fill_value: 수집 실패 등으로 빠진 조합의 채움 값
+
+    Returns:
+        DataFrame: index=segment, columns=keyword
+    """
+    pivot = (
+        df.groupby(["segment", "keyword"], sort=True, observed=True)[value]
+        .agg(agg)
+        .unstack(fill_value=fill_value)
+    )
+    pivot.columns.name = "keyword"
+
+    if segment_order is not None:
+        pivot = pivot.reindex(segment_order, fill_value=fill_value)
+    if keyword_order is not None:
+        pivot = pivot.reindex(columns=keyword_order, fill_value=fill_value)
+
+    return pivot
+
+
+def composite_index(pivot, keywords=SPORT_KEYWORDS):
+    """여러 키워드의 평균 관심도 (예: 스키장+스키+스노우보드 → 겨울스포츠)"""
+    return pivot[list(keywords)].mean(axis=1)
+
+
+# ============================================
+# 4사분면 분류
+# ============================================
+def _quadrant_codes(base, sport, base_threshold, sport_threshold):
+    """사분면 정수 코드 (0=A, 1=B, 2=C, 3=D)"""
+    base_high = base >= base_threshold
+    sport_high = sport >= sport_threshold
+
+    return np.select(
+        [base_high & sport_high, ~base_high & sport_high, base_high & ~sport_high],
+        [0, 1, 2],
+        default=3,
+    ).astype(np.int8)
+
+
+def classify_quadrants(base, sport, base_threshold=None, sport_threshold=None,
+                       labels=QUADRANT_LABELS):
+    """
+    4사분면 분류 (np.select 기반 벡터 연산)
+
+    - A: 선크림 ≥ 기준 & 스포츠 ≥ 기준
+    - B: 선크림 < 기준 & 스포츠 ≥ 기준 (블루오션)
+    - C: 선크림 ≥ 기준 & 스포츠 < 기준
+    - D: 둘 다 기준 미만
+
+    Args:
+        base: 선크림 값 (array-like, 브로드캐스팅 가능)
+        sport: 스포츠 값 (array-like)
+        base_threshold: 선크림 기준선 (None이면 base 평균)
+        sport_threshold: 스포츠 기준선 (None이면 sport 평균, 열 단위)
+
+    Returns:
+        np.ndarray: 사분면 라벨 배열
+    """
+    base = np.asarray(base, dtype=float)
+    sport = np.asarray(sport, dtype=float)
+
+    if base_threshold is None:
+        base_threshold = base.mean(axis=0)
+    if sport_threshold is None:
+        sport_threshold = sport.mean(axis=0)
+
+    codes = _quadrant_codes(base, sport, base_threshold, sport_threshold)
+    return np.array([labels[key] for key in "ABCD"], dtype=object)[codes]
+
+
+def assign_quadrants(frame, base_col, sport_col, labels=QUADRANT_LABELS):
+    """DataFrame 두 컬럼의 평균을 기준선으로 4사분면 라벨 Series 반환"""
+    quadrants = classify_quadrants(frame[base_col].to_numpy(),
+                                   frame[sport_col].to_numpy(),
+                                   labels=labels)
+    return pd.Series(quadrants, index=frame.index, name="quadrant")
+
+
+def quadrant_table(pivot, base_keyword=BASE_KEYWORD, sport_keywords=SPORT_KEYWORDS,
+                   labels=QUADRANT_LABELS):
+    """
+    선크림 vs 각 스포츠 키워드의 4사분면 분류 (모든 세그먼트 × 스포츠 한 번에)
+
+    Args:
+        pivot: segment_matrix 결과
+        base_keyword: 기준 키워드 (선크림)
+        sport_keywords: 비교할 스포츠 키워드 목록
+
+    Returns:
+        DataFrame (long format, segment/sport/quadrant는 범주형):
+            segment, sport, base_value, sport_value, base_avg, sport_avg, quadrant
+    """
+    sport_keywords = list(sport_keywords)
+    base = pivot[base_keyword].to_numpy(dtype=float)            # (S,)
+    sport = pivot[sport_keywords].to_numpy(dtype=float)         # (S, K)
+
+    base_avg = base.mean()
+    sport_avg = sport.mean(axis=0)                              # (K,)
+
+    base_2d = np.broadcast_to(base[:, None], sport.shape)
+    codes = _quadrant_codes(base_2d, sport, base_avg, sport_avg)
+
+    # 세그먼트 × 스포츠 조합이 수백만 개여도 문자열 배열을 만들지 않도록 범주형으로 구성
+    n_seg, n_sport = sport.shape
+    segment_codes = np.repeat(np.arange(n_seg), n_sport)
+    sport_codes = np.tile(np.arange(n_sport), n_seg)
+
+    return pd.DataFrame({
+        "segment": pd.Categorical.from_codes(segment_codes, categories=pivot.index),
+        "sport": pd.Categorical.from_codes(sport_codes, categories=sport_keywords),
+        "base_value": base_2d.ravel(),
+        "sport_value": sport.ravel(),
+        "base_avg": base_avg,
+        "sport_avg": np.tile(sport_avg, n_seg),
+        "quadrant": pd.Categorical.from_codes(codes.ravel(),
+                                              categories=[labels[key] for key in "ABCD"]),
+    })
+
+
+# ============================================
+# 블루오션
+# ============================================
+def blue_ocean_candidates(pivot, base_keyword=BASE_KEYWORD, sport_keywords=SPORT_KEYWORDS,
+                          sport_share=0.5):
+    """
+    블루오션 후보 (스포츠 관심 상위 + 선크림 인식 평균 이하)
+
+    조건: sport > sport_max × sport_share AND base < base 평균
+
+    Returns:
+        DataFrame[bool]: index=segment, columns=sport
+    """
+    base = pivot[base_keyword]
+    sport = pivot[list(sport_keywords)]
+
+    sport_high = sport.gt(sport.max(axis=0) * sport_share, axis=1)
+    base_low = base < base.mean()
+
+    return sport_high.mul(base_low, axis=0).astype(bool)
+
+
+def blue_ocean_summary(quadrants, labels=QUADRANT_LABELS):
+    """
+    B 사분면(블루오션)에 속한 세그먼트별 스포츠 목록
+
+    Args:
+        quadrants: quadrant_table 결과
+
+    Returns:
+        dict: {segment: [sport, ...]} (quadrant_table 행 순서 유지)
+    """
+    blue = quadrants[quadrants["quadrant"] == labels["B"]]
+    return {
+        segment: group["sport"].tolist()
+        for segment, group in blue.groupby("segment", sort=False, observed=True)
+    }
@@ -0,0 +1,310 @@
+"""
+블로그 글(제목 + 요약) 한글 텍스트 처리
+- 형태소 분석은 프로세스 풀에서 (konlpy 분석기는 느리고 스레드 안전하지 않음 → 프로세스마다 분석기 하나)
+- 분석 결과는 (분석기, 본문) 해시로 SQLite에 캐시 → 다시 수집한 글 / 중복 글은 분석 생략
+- 토큰 목록 → 희소 문서-단어 행렬 (scipy.sparse CSR)
+- konlpy가 없으면 정규식 분리 + 조사 제거로 대체 (정확도는 낮음, 선택 의존성)
+
+사용:
+    docs = blog_documents(blog.to_dataframe(items))
+    tokens = tokenize_texts(docs, analyzer="okt", workers=4, cache=TokenCache(".cache/tokens.sqlite"))
+    matrix, vocabulary = document_term_matrix(tokens, min_df=2)
+"""
+
+import hashlib
+import html
+import os
+import re
+import sqlite3
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+try:
+    import konlpy
+except ImportError:
+    konlpy = None
+
+from .prices import HTML_TAG
+
+
+# 분석기: (konlpy 클래스 이름, 남길 품사) - 명사 / 동사 / 형용사 / 영문
+ANALYZERS = {
+    "okt": ("Okt", ("Noun", "Verb", "Adjective", "Alpha")),
+    "komoran": ("Komoran", ("NNG", "NNP", "VV", "VA", "SL")),
+    "mecab": ("Mecab", ("NNG", "NNP", "VV", "VA", "SL")),
+    "regex": (None, None),
+}
+DEFAULT_ANALYZER = "okt" if konlpy is not None else "regex"
+DEFAULT_CHUNK_SIZE = 500    # 프로세스에 한 번에 넘길 글 수
+CACHE_VERSION = 1           # 토큰화 규칙이 바뀌면 올려서 기존 캐시 무효화
+
+STOPWORDS = frozenset((
+    "있다", "하다", "되다", "없다", "않다", "이다", "같다", "보다", "그리고", "그래서", "하지만",
+    "정말", "진짜", "너무", "오늘", "이번", "저희", "우리", "여기", "거기", "이것", "그것", "것",
+    "수", "등", "더", "및", "제", "저", "좀", "잘", "때", "곳", "분", "중",
+))
+
+# regex 분석기: 한글 / 영문 / 숫자 덩어리 + 흔한 조사 제거 (긴 조사부터)
+WORD = re.compile(r"[가-힣]+|[a-z]+|\d+")
+JOSA = ("에서는", "으로는", "에서", "으로", "에게", "까지", "부터", "처럼", "보다", "이랑", "하고",
+        "은", "는", "이", "가", "을", "를", "에", "의", "도", "로", "와", "과", "만", "랑")
+WHITESPACE = re.compile(r"\s+")
+
+
+def clean_text(text):
+    """HTML 태그 / 엔터티 제거, 공백 정리 ('<b>스키장</b> &amp; 보드' → '스키장 & 보드')"""
+    if not isinstance(text, str):
+        return ""
+    return WHITESPACE.sub(" ", html.unescape(HTML_TAG.sub(" ", text))).strip()
+
+
+def blog_documents(df, columns=("title", "description")):
+    """
+    블로그 검색 결과 → 분석할 본문 목록
+
+    Args:
+        df: NaverBlog.to_dataframe 결과 (또는 title / description 컬럼이 있는 DataFrame)
+        columns: 이어 붙일 컬럼
+
+    Returns:
+        list: 글마다 '제목 요약' (태그 / 엔터티 제거)
+    """
+    parts = [df[column].map(clean_text) for column in columns if column in df.columns]
+    if not parts:
+        return [""] * len(df)
+    joined = parts[0]
+    for part in parts[1:]:
+        joined = joined.str.cat(part, sep=" ")
+    return joined.str.strip().tolist()
+
+
+# ============================================
+# 형태소 분석 (프로세스마다 분석기 하나)
+# ============================================
+_analyzer = None
+_analyzer_name = None
+
+
+def _regex_tokens(text):
+    tokens = []
+    for word in WORD.findall(text.lower()):
+        for josa in JOSA:
+            # 한 글자 조사는 세 글자 이상 단어에서만 제거 ('눈이' → '눈이' 유지, '선크림이' → '선크림')
+            if word.endswith(josa) and len(word) - len(josa) >= (2 if len(josa) == 1 else 1):
+                word = word[:-len(josa)]
+                break
+        tokens.append(word)
+    return tokens
+
+
+def _check_analyzer(name):
+    if name not in ANALYZERS:
+        raise ValueError(f"지원하지 않는 분석기: {name} (사용 가능: {', '.join(ANALYZERS)})")
+    if ANALYZERS[name][0] is not None and konlpy is None:
+        raise ImportError(f"'{name}' 분석기는 konlpy가 필요합니다 (pip install konlpy, 또는 analyzer='regex')")
+
+
+def _load_analyzer(name):
+    """분석기 생성 (프로세스마다 한 번, konlpy 분석기는 JVM / 사전 로딩이 느림)"""
+    global _analyzer, _analyzer_name
+    if _analyzer_name == name:
+        return _analyzer
+    _check_analyzer(name)
+    class_name, _ = ANALYZERS[name]
+    if class_name is None:
+        _analyzer = None
+    else:
+        from konlpy import tag
+        _analyzer = getattr(tag, class_name)()
+    _analyzer_name = name
+    return _analyzer
+
+
+def _tokenize(text, name):
+    """본문 하나 → 토큰 목록 (품사 필터 + 불용어 제거)"""
+    if not text:
+        return []
+    analyzer = _load_analyzer(name)
+    if analyzer is None:
+        tokens = _regex_tokens(text)
+    else:
+        _, keep = ANALYZERS[name]
+        pairs = analyzer.pos(text, stem=True) if name == "okt" else analyzer.pos(text)
+        tokens = [word.lower() for word, tag in pairs if tag in keep]
+    return [token for token in tokens if token not in STOPWORDS]
+
+
+def _tokenize_chunk(texts, name):
+    """프로세스 풀 작업 단위 (글 여러 개 → 토큰 목록 여러 개)"""
+    return [_tokenize(text, name) for text in texts]
+
+
+# ============================================
+# 토큰 캐시
+# ============================================
+def text_key(text, analyzer):
+    """(분석기, 캐시 버전, 본문) → sha1 (같은 본문은 같은 키)"""
+    return hashlib.sha1(f"{analyzer}\0{CACHE_VERSION}\0{text}".encode("utf-8")).hexdigest()
+
+
+class TokenCache:
+    """
+    본문 해시 → 토큰 목록 (SQLite, 공백으로 이어 저장)
+
+    여러 번 수집한 글 / 검색어 사이에 겹치는 글은 한 번만 분석합니다.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS tokens (key TEXT PRIMARY KEY, tokens TEXT NOT NULL)")
+
+    def close(self):
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self._conn.execute("SELECT COUNT(*) FROM tokens").fetchone()[0]
+
+    def get_many(self, keys, batch_size=500):
+        """{키: 토큰 목록} (캐시에 있는 키만)"""
+        found = {}
+        keys = list(keys)
+        for start in range(0, len(keys), batch_size):
+            batch = keys[start:start + batch_size]
+            placeholders = ",".join("?" * len(batch))
+            rows = self._conn.execute(
+                f"SELECT key, tokens FROM tokens WHERE key IN ({placeholders})", batch)
+            found.update((key, tokens.split(" ") if tokens else []) for key, tokens in rows)
+        return found
+
+    def put_many(self, items):
+        """[(키, 토큰 목록), ...] 저장"""
+        with self._conn:
+            self._conn.executemany("INSERT OR REPLACE INTO tokens (key, tokens) VALUES (?, ?)",
+                                   ((key, " ".join(tokens)) for key, tokens in items))
+
+
+# ============================================
+# 일괄 토큰화
+# ============================================
+def tokenize_texts(texts, analyzer=DEFAULT_ANALYZER, workers=None, cache=None,
+                   chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    본문 목록 형태소 분석 (중복 본문 / 캐시에 있는 본문은 분석 생략)
+
+    Args:
+        texts: 본문 목록 (blog_documents 결과)
+        analyzer: 'okt', 'komoran', 'mecab' (konlpy) 또는 'regex'
+        workers: 프로세스 수 (None이면 CPU 수, 1이면 현재 프로세스에서)
+        cache: TokenCache (None이면 캐시 사용 안 함)
+        chunk_size: 프로세스에 한 번에 넘길 글 수
+
+    Returns:
+        list: 본문마다 토큰 목록 (입력 순서)
+    """
+    _check_analyzer(analyzer)
+    texts = ["" if text is None else str(text) for text in texts]
+    keys = [text_key(text, analyzer) for text in texts]
+    unique = dict(zip(keys, texts))     # 같은 본문은 한 번만
+
+    results = cache.get_many(unique) if cache is not None else {}
+    missing = [key for key in unique if key not in results]
+
+    if missing:
+        chunks = [missing[start:start + chunk_size] for start in range(0, len(missing), chunk_size)]
+        workers = workers or os.cpu_count() or 1
+        if workers == 1 or len(chunks) == 1:
+            tokenized = [_tokenize_chunk([unique[key] for key in chunk], analyzer) for chunk in chunks]
+        else:
+            with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+                tokenized = list(pool.map(_tokenize_chunk,
+                                          [[unique[key] for key in chunk] for chunk in chunks],
+                                          [analyzer] * len(chunks)))
+        new = [(key, tokens) for chunk, chunk_tokens in zip(chunks, tokenized)
+               for key, tokens in zip(chunk, chunk_tokens)]
+        results.update(new)
+        if cache is not None:
+            cache.put_many(new)
+
+    return [results[key] for key in keys]
+
+
+# ============================================
+# 문서-단어 행렬
+# ============================================
+def document_term_matrix(token_lists, min_df=1, max_df=1.0, vocabulary=None):
+    """
+    토큰 목록 → 희소 문서-단어 행렬 (단어 빈도)
+
+    Args:
+        token_lists: tokenize_texts 결과
+        min_df: 이보다 적은 글에 나온 단어 제외 (글 수)
+        max_df: 이보다 많은 비율의 글에 나온 단어 제외 (0~1, 흔한 단어 제거)
+        vocabulary: 단어 목록 (지정하면 이 순서 그대로 사용, 없는 단어는 무시 → 수집 회차 간 비교)
+
+    Returns:
+        (scipy.sparse.csr_matrix (글 수 × 단어 수, int32), 단어 목록)
+    """
+    n_docs = len(token_lists)
+    if vocabulary is None:
+        df_counts = Counter(token for tokens in token_lists for token in set(tokens))
+        limit = max_df * n_docs
+        vocabulary = sorted(token for token, count in df_counts.items()
+                            if count >= min_df and count <= limit)
+    vocabulary = list(vocabulary)
+    index = {token: i for i, token in enumerate(vocabulary)}
+
+    indptr = [0]
+    indices, data = [], []
+    for tokens in token_lists:
+        counts = Counter(index[token] for token in tokens if token in index)
+        indices.extend(counts.keys())
+        data.extend(counts.values())
+        indptr.append(len(indices))
+
+    matrix = sparse.csr_matrix(
+        (np.asarray(data, dtype=np.int32), np.asarray(indices, dtype=np.int32),
+         np.asarray(indptr, dtype=np.int64)),
+        shape=(n_docs, len(vocabulary)))
+    matrix.sort_indices()
+    return matrix, vocabulary
+
+
+def top_terms(matrix, vocabulary, n=20, groups=None):
+    """
+    단어별 등장 글 수 / 전체 빈도 상위 n개
+
+    Args:
+        matrix, vocabulary: document_term_matrix 결과
+        groups: 글마다 그룹 라벨 (예: 검색어, 지정하면 그룹별 상위 n개)
+
+    Returns:
+        DataFrame: (group,) term, documents, count
+    """
+    if groups is None:
+        documents = np.asarray((matrix > 0).sum(axis=0)).ravel()
+        counts = np.asarray(matrix.sum(axis=0)).ravel()
+        table = pd.DataFrame({"term": vocabulary, "documents": documents, "count": counts})
+        return (table.sort_values(["documents", "count", "term"], ascending=[False, False, True])
+                .head(n).reset_index(drop=True))
+
+    groups = pd.Series(list(groups))
+    frames = []
+    for group, positions in groups.groupby(groups, sort=True).indices.items():
+        table = top_terms(matrix[positions], vocabulary, n)
+        table.insert(0, "group", group)
+        frames.append(table)
+    return pd.concat(frames, ignore_index=True)
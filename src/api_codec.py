@@ -0,0 +1,183 @@
+# src/api_codec.py
+"""
+API 응답 JSON 인코딩 / 디코딩
+
+- msgspec 또는 orjson이 설치되어 있으면 사용, 없으면 표준 json 사용 (선택 의존성)
+- DataLab 결과와 쇼핑/블로그 아이템을 to_frame / to_dataframe이 바로 쓰는
+  컬럼 구조로 디코딩 (아이템별 dict를 거치지 않음)
+"""
+
+import json
+from collections import namedtuple
+from typing import List
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if msgspec is not None:
+    BACKEND = 'msgspec'
+elif orjson is not None:
+    BACKEND = 'orjson'
+else:
+    BACKEND = 'json'
+
+
+# 키워드별 시계열 (컬럼 구조)
+TrendSeries = namedtuple('TrendSeries', ['title', 'periods', 'ratios'])
+
+SHOP_FIELDS = (
+    'title', 'link', 'image', 'lprice', 'hprice', 'mallName', 'productId',
+    'productType', 'brand', 'maker', 'category1', 'category2', 'category3', 'category4',
+)
+BLOG_FIELDS = ('title', 'link', 'description', 'bloggername', 'bloggerlink', 'postdate')
+
+
+# ============================================
+# 범용 인코딩 / 디코딩
+# ============================================
+if msgspec is not None:
+    _encoder = msgspec.json.Encoder()
+    _decoder = msgspec.json.Decoder()
+
+    def dumps(obj):
+        """객체 → JSON bytes"""
+        return _encoder.encode(obj)
+
+    def loads(data):
+        """JSON (bytes 또는 str) → 객체"""
+        return _decoder.decode(data)
+
+elif orjson is not None:
+    def dumps(obj):
+        """객체 → JSON bytes"""
+        return orjson.dumps(obj)
+
+    def loads(data):
+        """JSON (bytes 또는 str) → 객체"""
+        return orjson.loads(data)
+
+else:
+    def dumps(obj):
+        """객체 → JSON bytes"""
+        return json.dumps(obj).encode('utf-8')
+
+    def loads(data):
+        """JSON (bytes 또는 str) → 객체"""
+        return json.loads(data)
+
+
+# ============================================
+# 타입 지정 응답 구조 (msgspec)
+# ============================================
+if msgspec is not None:
+    class _TrendPoint(msgspec.Struct):
+        period: str
+        ratio: float
+
+    class _TrendResult(msgspec.Struct):
+        title: str
+        data: List[_TrendPoint] = []
+
+    class _TrendResponse(msgspec.Struct):
+        results: List[_TrendResult] = []
+
+    ShopItem = msgspec.defstruct('ShopItem', [(name, str, '') for name in SHOP_FIELDS])
+    BlogItem = msgspec.defstruct('BlogItem', [(name, str, '') for name in BLOG_FIELDS])
+
+    class _ShopResponse(msgspec.Struct):
+        total: int = 0
+        items: List[ShopItem] = []
+
+    class _BlogResponse(msgspec.Struct):
+        total: int = 0
+        items: List[BlogItem] = []
+
+    _trend_decoder = msgspec.json.Decoder(_TrendResponse)
+    _item_decoders = {
+        SHOP_FIELDS: msgspec.json.Decoder(_ShopResponse),
+        BLOG_FIELDS: msgspec.json.Decoder(_BlogResponse),
+    }
+
+
+# ============================================
+# DataLab 결과 → 컬럼 구조
+# ============================================
+def trend_series(api_response):
+    """
+    디코딩된 DataLab 응답(dict) → TrendSeries 목록
+
+    Returns:
+        list: [TrendSeries(title, periods, ratios), ...]
+    """
+    return [
+        TrendSeries(
+            result['title'],
+            [item['period'] for item in result['data']],
+            [item['ratio'] for item in result['data']],
+        )
+        for result in api_response['results']
+    ]
+
+
+def decode_trend(data):
+    """
+    DataLab 응답 JSON → TrendSeries 목록
+
+    msgspec이 있으면 응답 구조를 지정해 바로 디코딩합니다.
+    """
+    if msgspec is not None:
+        try:
+            response = _trend_decoder.decode(data)
+        except msgspec.ValidationError:
+            # 응답 형식이 예상과 다르면 범용 디코딩으로 처리
+            return trend_series(loads(data))
+        return [
+            TrendSeries(
+                result.title,
+                [point.period for point in result.data],
+                [point.ratio for point in result.data],
+            )
+            for result in response.results
+        ]
+    return trend_series(loads(data))
+
+
+# ============================================
+# 쇼핑 / 블로그 아이템 → 컬럼 구조
+# ============================================
+def item_columns(items, fields):
+    """아이템 목록(dict) → {필드: 값 목록} (없는 값은 '')"""
+    return {name: [item.get(name, '') for item in items] for name in fields}
+
+
+def decode_items(data, fields=SHOP_FIELDS):
+    """
+    쇼핑/블로그 검색 응답 JSON → (total, {필드: 값 목록})
+
+    Args:
+        data: 응답 본문 (bytes 또는 str)
+        fields: SHOP_FIELDS 또는 BLOG_FIELDS
+    """
+    fields = tuple(fields)
+
+    if msgspec is not None and fields in _item_decoders:
+        try:
+            response = _item_decoders[fields].decode(data)
+        except msgspec.ValidationError:
+            response = None
+        if response is not None:
+            rows = [msgspec.structs.astuple(item) for item in response.items]
+            values = list(zip(*rows)) if rows else [()] * len(fields)
+            return response.total, {name: list(column) for name, column in zip(fields, values)}
+
+    response = loads(data)
+    items = response.get('items', [])
+    return response.get('total', 0), item_columns(items, fields)
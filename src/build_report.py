@@ -0,0 +1,93 @@
+"""
+SODA 프로젝트 - 증분 빌드
+========================
+
+수집 스크립트 실행 후 노트북 전체를 다시 돌리는 대신, 바뀐 data/ 파일의
+하위 산출물(피벗, 요약 표, 차트)만 다시 생성
+- 해시 기록: output/.build.json (단계), output/.figures.json (차트)
+
+실행:
+    python src/build_report.py               # 바뀐 것만
+    python src/build_report.py --dry-run     # 다시 만들 대상만 확인
+    python src/build_report.py --dataset 3   # Dataset 3 산출물만
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# ============================================
+# 경로 설정
+# ============================================
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent
+src_dir = current_file.parent
+
+if str(src_dir) not in sys.path:
+    sys.path.insert(0, str(src_dir))
+
+from report import DEFAULT_DPI, FIGURES, STEPS, build
+from report.build import DATASETS
+
+PROJECT_ROOT = project_root
+
+STATUS_ICONS = {
+    "built": "✅",
+    "rendered": "✅",
+    "skipped": "⏭️ ",
+    "stale": "🔄",
+    "missing": "⚠️ ",
+}
+
+
+def add_arguments(parser):
+    """빌드 옵션 등록 (src/cli.py의 report 명령과 공용)"""
+    parser.add_argument("--dataset", nargs="+", choices=DATASETS, help="대상 데이터셋 (기본: 전체)")
+    parser.add_argument("--force", action="store_true", help="입력이 같아도 다시 생성")
+    parser.add_argument("--dry-run", action="store_true", help="다시 만들 대상만 출력")
+    parser.add_argument("--workers", type=int, default=None, help="차트 렌더링 프로세스 수")
+    parser.add_argument("--dpi", type=int, default=DEFAULT_DPI)
+    parser.add_argument("--root", type=Path, default=PROJECT_ROOT, help="프로젝트 루트")
+    return parser
+
+
+def run(args):
+    """파싱된 옵션으로 증분 빌드 실행 후 결과 출력"""
+    print("="*70)
+    print("🔨 증분 빌드" + (" (dry-run)" if args.dry_run else ""))
+    print("="*70)
+
+    start = time.perf_counter()
+    result = build(args.root, datasets=args.dataset, force=args.force, dry_run=args.dry_run,
+                   max_workers=args.workers, dpi=args.dpi)
+
+    print(f"\n📂 바뀐 데이터 파일: {len(result['changed'])}개")
+    for relpath in result["changed"]:
+        print(f"   - {relpath}")
+    for relpath in result["removed"]:
+        print(f"   - {relpath} (삭제됨)")
+
+    print("\n📊 표 / 피벗")
+    for name, status in result["steps"].items():
+        outputs = ", ".join(Path(out).name for out in STEPS[name].outputs)
+        print(f"  {STATUS_ICONS[status]} [{name}] {outputs} ({status})")
+
+    print("\n🖼️  차트")
+    for name, (status, _) in result["figures"].items():
+        print(f"  {STATUS_ICONS[status]} [{name}] {FIGURES[name].filename} ({status})")
+
+    print(f"\n✅ 완료 ({time.perf_counter() - start:.1f}s)")
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="증분 빌드 (바뀐 데이터의 하위 산출물만 다시 생성)")
+    return run(add_arguments(parser).parse_args(argv))
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n\n⚠️  사용자에 의해 중단되었습니다.")
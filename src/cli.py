@@ -0,0 +1,745 @@
+"""
+SODA 프로젝트 - 명령줄 도구 (soda)
+=================================
+
+수집 스크립트의 기간 / 키워드 / 세그먼트를 코드 수정 없이 바꿔 실행 (예약 작업용)
+- collect: 데이터셋 수집 (여러 데이터셋을 한 프로세스에서 동시에, API 클라이언트 / 속도 제한 공유)
+- refresh: 오래된(또는 없는) 데이터셋만 다시 수집 후 증분 빌드 (기본 저장 폴더: 빌드 입력인 data/)
+- report:  증분 빌드 (src/build_report.py와 동일)
+- bench:   scripts/bench_*.py 벤치마크 실행
+- sweep:   대규모 키워드 × 세그먼트 수집 (SQLite 작업 큐 + 워커 프로세스 N개, 파티션 저장 후 병합)
+- work:    기존 sweep 큐에 워커 하나 추가 (다른 터미널, --keys로 sweep과 다른 키 지정)
+- snapshot: 쇼핑 검색 결과 일별 스냅샷 저장 + 직전 스냅샷 대비 신규 / 삭제 / 가격 변경 출력
+
+collect / refresh / sweep --detect: 수집한 시계열의 새 날짜만 이상 감지 (급등 / 수준 변화, monitor.py)
+
+실행:
+    python src/cli.py collect 1 4 --start 2023-01-01 --end 2025-11-15
+    python src/cli.py collect 4 --keywords-file keywords.txt --segments "20대 여성=f:3,4"
+    python src/cli.py collect 1 4 --record tests/cassettes/collect.json.gz    # 응답 기록
+    python src/cli.py collect 1 4 --replay tests/cassettes/collect.json.gz    # 오프라인 재생
+    python src/cli.py refresh --max-age 24
+    python src/cli.py refresh --max-age 24 --detect     # 수집 직후 급등 / 수준 변화 알림
+    python src/cli.py report --dry-run
+    python src/cli.py bench cube cross --args="--segments 12"
+    python src/cli.py sweep --keywords-file keywords.txt --workers 4 --keys 0 1 2 3 --out data/sweep
+    python src/cli.py work --keys 4 5 --out data/sweep   # 같은 큐에 다른 키로 워커 추가
+    python src/cli.py snapshot --queries-file brands.txt --out data/shopping
+
+키워드 파일 (한 줄에 하나, '#' 주석):
+    선크림
+    스키: 스키, 스키장, 스노우보드     # Dataset 2는 '그룹: 키워드' 단위로 수집
+
+세그먼트 (Dataset 4, '이름=성별:연령 코드' 또는 같은 형식의 파일 경로):
+    "20대 여성=f:3,4"  "30대 남성=m:5,6"  "전체=:"
+"""
+
+import argparse
+import contextlib
+import importlib
+import multiprocessing
+import os
+import runpy
+import shlex
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from pathlib import Path
+
+# ============================================
+# 경로 설정
+# ============================================
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent
+src_dir = current_file.parent
+
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+if str(src_dir) not in sys.path:
+    sys.path.insert(0, str(src_dir))
+
+import build_report
+import transport
+from monitor import ALERT_LOG, monitor_frame
+from snapshots import SnapshotStore
+from storage import FORMATS, save_table, table_path
+from workqueue import (
+    DEFAULT_LEASE, DEFAULT_MAX_ATTEMPTS, MERGED_NAME, QUEUE_FILE,
+    WorkQueue, merge_partitions, run_worker, sweep_tasks,
+)
+
+PROJECT_ROOT = project_root
+DEFAULT_DATA_DIR = PROJECT_ROOT / 'data' / 'presentation'
+DEFAULT_CACHE_DIR = PROJECT_ROOT / '.cache' / 'api'
+DEFAULT_KEYS_STATE = PROJECT_ROOT / '.cache' / 'keys.json'                 # DataLab (키당 1,000회)
+DEFAULT_SEARCH_KEYS_STATE = PROJECT_ROOT / '.cache' / 'keys_search.json'   # 검색 API (키당 25,000회, 한도 별도)
+DEFAULT_SWEEP_DIR = PROJECT_ROOT / 'data' / 'sweep'
+DEFAULT_SHOPPING_DIR = PROJECT_ROOT / 'data' / 'shopping'
+SCRIPTS_DIR = PROJECT_ROOT / 'scripts'
+
+# 데이터셋: (모듈, 수집 함수, 저장 파일명)
+DATASETS = {
+    '1': ('collect_dataset_1', 'collect_dataset_1', '01_선크림_월별_트렌드.csv'),
+    '2': ('collect_dataset_2', 'collect_dataset_2', '02_겨울활동_월별_트렌드.csv'),
+    '3': ('collect_dataset_3', 'main', '03_기상청_UV지수_vs_검색량_비교.csv'),
+    '4': ('collect_dataset_4', 'main', '04_세그먼트별_통합_데이터.csv'),
+}
+
+# 이상 감지 대상 데이터셋: 시계열 구분 컬럼 (None = wide format, 키워드별 컬럼)
+MONITORED = {
+    '1': None,
+    '4': ['segment', 'keyword'],
+}
+MONITOR_DIR = 'monitor'   # 저장 폴더 아래 감지 상태 / 알림 기록 폴더
+
+GENDERS = ('', 'f', 'm')
+GENDER_LABELS = {'f': '여성', 'm': '남성', '': '전체'}
+AGE_CODES = {str(code) for code in range(1, 12)}
+
+
+# ============================================
+# 입력 파싱 (키워드 파일 / 세그먼트)
+# ============================================
+def _spec_lines(path):
+    """주석('#')과 빈 줄을 제외한 줄 목록"""
+    with open(path, encoding='utf-8-sig') as f:
+        lines = [line.split('#', 1)[0].strip() for line in f]
+    return [line for line in lines if line]
+
+
+def load_keywords(path):
+    """
+    키워드 파일 → {그룹 이름: 키워드 목록}
+
+    '키워드' 줄은 키워드 하나짜리 그룹, '그룹: 키워드1, 키워드2' 줄은 여러 키워드 그룹
+    """
+    groups = {}
+    for line in _spec_lines(path):
+        if ':' in line:
+            name, keywords = line.split(':', 1)
+            keywords = [kw.strip() for kw in keywords.split(',') if kw.strip()]
+        else:
+            name, keywords = line, [line]
+        if not keywords:
+            raise argparse.ArgumentTypeError(f"키워드가 없는 그룹: {line}")
+        groups[name.strip()] = keywords
+    if not groups:
+        raise argparse.ArgumentTypeError(f"키워드 파일이 비어 있습니다: {path}")
+    return groups
+
+
+def flat_keywords(groups):
+    """{그룹: 키워드 목록} → 중복 없는 키워드 목록 (등장 순서)"""
+    return list(dict.fromkeys(kw for keywords in groups.values() for kw in keywords))
+
+
+def parse_segment(spec):
+    """
+    '20대 여성=f:3,4' → ('20대 여성', 'f', ['3', '4'], '20대', '여성')
+
+    연령대 / 성별 라벨은 이름의 첫 단어 / 마지막 단어 (한 단어면 성별 코드로 결정)
+    """
+    name, sep, rest = spec.partition('=')
+    gender, _, ages = rest.partition(':')
+    name, gender = name.strip(), gender.strip()
+    ages = [age.strip() for age in ages.split(',') if age.strip()]
+
+    if not sep or not name:
+        raise argparse.ArgumentTypeError(f"세그먼트 형식 오류: {spec!r} (예: '20대 여성=f:3,4')")
+    if gender not in GENDERS:
+        raise argparse.ArgumentTypeError(f"성별은 f, m 또는 빈 값이어야 합니다: {spec!r}")
+    unknown = [age for age in ages if age not in AGE_CODES]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"연령 코드는 1~11이어야 합니다: {unknown} ({spec!r})")
+
+    words = name.split()
+    gender_label = words[-1] if len(words) > 1 else GENDER_LABELS[gender]
+    return (name, gender, ages, words[0], gender_label)
+
+
+def parse_segments(values):
+    """세그먼트 스펙 목록 (파일 경로면 파일의 각 줄)"""
+    segments = []
+    for value in values:
+        specs = _spec_lines(value) if Path(value).is_file() else [value]
+        segments.extend(parse_segment(spec) for spec in specs)
+    return segments
+
+
+# ============================================
+# 수집 실행
+# ============================================
+def make_cache(args):
+    """--cache-dir / --cache-ttl / --no-cache → ResponseCache (프로세스 간 공유 가능)"""
+    from naver_api import ResponseCache
+
+    if args.no_cache or getattr(args, 'record', None) or getattr(args, 'replay', None):
+        return None  # 카세트 기록 / 재생 중에는 모든 요청이 카세트를 거치도록
+    ttl = args.cache_ttl * 3600 if args.cache_ttl else None
+    return ResponseCache(args.cache_dir, ttl=ttl)
+
+
+def make_datalab(args):
+    """
+    데이터셋 간 공유하는 DataLab 클라이언트 (속도 제한 / 응답 캐시 공유)
+
+    키가 여러 개(NAVER_CREDENTIALS)면 KeyPool로 번갈아 사용 → 속도 제한은 키마다 적용
+    """
+    from naver_api import NAVER_CREDENTIALS, DATALAB_DAILY_LIMIT, KeyPool, NaverDataLab, RateLimiter
+
+    cache = make_cache(args)
+    if len(NAVER_CREDENTIALS) > 1:
+        key_pool = KeyPool(NAVER_CREDENTIALS, daily_limit=args.daily_limit or DATALAB_DAILY_LIMIT,
+                           rate=args.rate, state_path=args.keys_state)
+        return NaverDataLab(cache=cache, key_pool=key_pool)
+    return NaverDataLab(rate_limiter=RateLimiter(args.rate), cache=cache)
+
+
+def collector_kwargs(dataset, args, datalab):
+    """명령줄 옵션 → 수집 함수 인자 (지정하지 않은 옵션은 스크립트 기본값 사용)"""
+    kwargs = {'datalab': datalab, 'data_dir': args.data_dir, 'output_format': args.format}
+    if args.start:
+        kwargs['start_date'] = args.start
+    if args.end:
+        kwargs['end_date'] = args.end
+
+    if args.keywords_file:
+        groups = load_keywords(args.keywords_file)
+        if dataset == '2':
+            kwargs['activity_groups'] = groups
+        else:
+            kwargs['keywords'] = flat_keywords(groups)
+
+    if args.segments and dataset == '4':
+        kwargs['segments'] = parse_segments(args.segments)
+    return kwargs
+
+
+def detect_dataset(dataset, result, data_dir):
+    """
+    수집 결과로 이상 감지 (시계열별 마지막 처리 날짜 이후 값만)
+
+    Dataset 4는 (통합 데이터, 평균 매트릭스)를 반환하므로 첫 번째 값 사용
+    """
+    frame = result[0] if isinstance(result, tuple) else result
+    return monitor_frame(frame, Path(data_dir) / MONITOR_DIR / f'dataset_{dataset}.npz',
+                         f'dataset_{dataset}', key=MONITORED[dataset])
+
+
+def run_dataset(dataset, args, datalab):
+    """
+    데이터셋 하나 수집 (--detect면 수집 직후 이상 감지)
+
+    Returns:
+        (dataset, 성공 여부, 소요 시간[초], 오류 메시지, 알림 DataFrame 또는 None)
+    """
+    module_name, function_name, _ = DATASETS[dataset]
+    start = time.perf_counter()
+    alerts = None
+    try:
+        collect = getattr(importlib.import_module(module_name), function_name)
+        result = collect(**collector_kwargs(dataset, args, datalab))
+        # Dataset 3은 오류를 직접 출력하고 None 반환
+        ok, error = result is not None, None if result is not None else "수집 실패 (로그 참고)"
+        if ok and getattr(args, 'detect', False) and dataset in MONITORED:
+            alerts = detect_dataset(dataset, result, args.data_dir)
+    except Exception as e:
+        ok, error = False, str(e)
+    return dataset, ok, time.perf_counter() - start, error, alerts
+
+
+def collect(datasets, args, datalab=None):
+    """
+    여러 데이터셋을 스레드로 동시 수집 (DataLab 클라이언트 하나를 공유)
+
+    Returns:
+        list: run_dataset 결과 (데이터셋 순서)
+    """
+    datalab = datalab or make_datalab(args)
+    workers = args.workers or len(datasets)
+    quiet = open(os.devnull, 'w', encoding='utf-8') if args.quiet else None
+
+    # --quiet: 데이터셋별 진행 로그 숨김 (요약만 출력)
+    with contextlib.redirect_stdout(quiet) if quiet else contextlib.nullcontext():
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(lambda d: run_dataset(d, args, datalab), datasets))
+    if quiet:
+        quiet.close()
+    return results
+
+
+def stale_datasets(datasets, data_dir, fmt, max_age):
+    """저장 파일이 없거나 max_age 시간보다 오래된 데이터셋"""
+    stale = []
+    for dataset in datasets:
+        path = table_path(Path(data_dir) / DATASETS[dataset][2], fmt)
+        if not path.exists() or time.time() - path.stat().st_mtime > max_age * 3600:
+            stale.append(dataset)
+    return stale
+
+
+def print_results(results):
+    for dataset, ok, elapsed, error, _ in results:
+        if ok:
+            print(f"  ✅ Dataset {dataset} ({elapsed:.1f}s)")
+        else:
+            print(f"  ❌ Dataset {dataset} ({elapsed:.1f}s): {error}")
+
+
+def print_alerts(name, alerts, log_path, top=10):
+    if alerts is None:
+        return
+    if alerts.empty:
+        print(f"  🔕 {name}: 새 알림 없음")
+        return
+    counts = alerts['kind'].value_counts()
+    print(f"  🚨 {name}: 급등 / 급락 {counts.get('spike', 0):,} / 수준 변화 {counts.get('shift', 0):,} "
+          f"(기록: {log_path})")
+    strongest = alerts.reindex(alerts['z'].abs().sort_values(ascending=False).index).head(top)
+    for row in strongest.itertuples():
+        print(f"     {row.date:%Y-%m-%d} {row.series}: {row.value:.1f} (기준 {row.expected:.1f}, "
+              f"z={row.z:+.1f}, {row.kind} {row.direction})")
+
+
+def cassette_args(args):
+    """--record / --replay → (카세트 경로, 모드)"""
+    if args.record:
+        return args.record, 'record'
+    if args.replay:
+        return args.replay, 'replay'
+    return None, 'live'
+
+
+def print_cassette(cassette):
+    if cassette.mode == 'record':
+        print(f"  📼 카세트 기록: {cassette.path} (요청 {len(cassette):,}개)")
+    else:
+        print(f"  📼 카세트 재생: {cassette.path} (재생 {cassette.hits:,} / 없음 {cassette.misses:,})")
+
+
+def print_key_stats(key_pool):
+    for row in key_pool.stats():
+        remaining = '' if row['remaining'] is None else f", 남은 횟수 {row['remaining']:,}"
+        print(f"  🔑 {row['key']} {row['status']} (사용 {row['used']:,}{remaining})")
+
+
+def pool_credentials(args):
+    """--keys로 고른 키 (NAVER_CREDENTIALS 순서의 0부터 번호, 지정하지 않으면 전체)"""
+    from naver_api import NAVER_CREDENTIALS
+
+    if not getattr(args, 'keys', None):
+        return list(NAVER_CREDENTIALS)
+    unknown = [i for i in args.keys if not 0 <= i < len(NAVER_CREDENTIALS)]
+    if unknown:
+        raise ValueError(f"없는 키 번호: {unknown} (키 {len(NAVER_CREDENTIALS)}개: 0 ~ {len(NAVER_CREDENTIALS) - 1})")
+    return [NAVER_CREDENTIALS[i] for i in dict.fromkeys(args.keys)]
+
+
+def worker_datalab(args, index=0, n_workers=1):
+    """
+    sweep / work 워커 프로세스용 DataLab 클라이언트 (KeyPool 사용)
+
+    키가 워커 수 이상이면 워커마다 서로 다른 키를 나눠 쓰고 (키마다 초당 --rate회),
+    적으면 모든 워커가 전체 키를 공유 (키마다 초당 --rate / 워커 수회)
+    일일 사용량은 --keys-state 파일에 합쳐 저장 → 워커 / collect / 다른 work 프로세스가 같은 한도를 나눠 씀
+    """
+    from naver_api import DATALAB_DAILY_LIMIT, KeyPool, NaverDataLab
+
+    credentials = pool_credentials(args)
+    if len(credentials) >= n_workers:
+        credentials, rate = credentials[index::n_workers], args.rate
+    else:
+        rate = args.rate / n_workers
+    key_pool = KeyPool(credentials, daily_limit=args.daily_limit or DATALAB_DAILY_LIMIT, rate=rate,
+                       state_path=args.keys_state)
+    return NaverDataLab(cache=make_cache(args), key_pool=key_pool)
+
+
+def sweep_worker(args, index=0, n_workers=1):
+    """워커 프로세스 본체 (큐가 빌 때까지 수집)"""
+    quiet = open(os.devnull, 'w', encoding='utf-8') if args.quiet else None
+    with contextlib.redirect_stdout(quiet) if quiet else contextlib.nullcontext():
+        run_worker(args.out / QUEUE_FILE, args.out, worker=f'worker-{index}',
+                   datalab=worker_datalab(args, index, n_workers), fmt=args.format,
+                   lease_seconds=args.lease, max_attempts=args.max_attempts)
+    if quiet:
+        quiet.close()
+
+
+def make_shopping(args):
+    """
+    스냅샷용 쇼핑 검색 클라이언트 (응답 캐시 사용 안 함 → 매일 현재 가격)
+
+    키가 여러 개면 KeyPool (검색 API 일일 한도 기준)
+    """
+    from naver_api import NAVER_CREDENTIALS, SEARCH_DAILY_LIMIT, KeyPool, NaverShopping, RateLimiter
+
+    if len(NAVER_CREDENTIALS) > 1:
+        key_pool = KeyPool(NAVER_CREDENTIALS, daily_limit=SEARCH_DAILY_LIMIT, rate=args.rate,
+                           state_path=args.keys_state)
+        return NaverShopping(key_pool=key_pool)
+    return NaverShopping(rate_limiter=RateLimiter(args.rate))
+
+
+def print_snapshot_diff(diff, top=10):
+    if diff.previous_date is None:
+        print(f"  🆕 첫 스냅샷: 상품 {len(diff.new):,}개")
+        return
+    print(f"  🆕 신규 {len(diff.new):,} / 🗑️  삭제 {len(diff.removed):,} / "
+          f"💰 가격 변경 {len(diff.changed):,} ({diff.previous_date} 대비)")
+    changes = diff.price_changes()
+    if top and not changes.empty:
+        print("\n  lprice 하락 상위:")
+        print(changes.head(top).to_string(index=False))
+
+
+def print_queue(counts):
+    print(f"  📋 대기 {counts['pending']:,} / 임대 {counts['leased']:,} / "
+          f"완료 {counts['done']:,} / 실패 {counts['failed']:,}")
+
+
+# ============================================
+# 명령
+# ============================================
+def cmd_collect(args):
+    datasets = args.datasets or list(DATASETS)
+    datalab = make_datalab(args)
+    key_pool = datalab.key_pool
+    rate = f"키 {len(key_pool)}개 × 초당 {args.rate:g}회" if key_pool is not None else f"초당 {args.rate:g}회"
+    print("="*70)
+    print(f"📥 수집: Dataset {', '.join(datasets)} (동시 {args.workers or len(datasets)}개, {rate})")
+    print("="*70)
+
+    start = time.perf_counter()
+    path, mode = cassette_args(args)
+    with transport.use_cassette(path, mode, args.latency) as cassette:
+        results = collect(datasets, args, datalab)
+
+    print("\n" + "="*70)
+    print_results(results)
+    for dataset, _, _, _, alerts in results:
+        print_alerts(f"Dataset {dataset}", alerts, args.data_dir / MONITOR_DIR / ALERT_LOG)
+    if key_pool is not None:
+        print_key_stats(key_pool)
+    if cassette is not None:
+        print_cassette(cassette)
+    print(f"\n⏱️  {time.perf_counter() - start:.1f}s / 📁 {args.data_dir}")
+    return 0 if all(ok for _, ok, _, _, _ in results) else 1
+
+
+def cmd_refresh(args):
+    # 증분 빌드는 <root>/data/*.csv만 읽으므로 기본 저장 폴더도 그곳
+    build_dir = args.root / 'data'
+    args = argparse.Namespace(**{**vars(args), 'data_dir': args.data_dir or build_dir})
+    if not args.no_build and (args.data_dir.resolve() != build_dir.resolve() or args.format != 'csv'):
+        print(f"⚠️  증분 빌드는 {build_dir}의 CSV만 읽습니다 "
+              f"(--data-dir {args.data_dir}, --format {args.format}로 수집한 데이터는 반영 안 됨)")
+
+    datasets = stale_datasets(args.datasets or list(DATASETS), args.data_dir, args.format,
+                              args.max_age)
+    status = 0
+    if datasets:
+        status = cmd_collect(argparse.Namespace(**{**vars(args), 'datasets': datasets}))
+    else:
+        print(f"⏭️  {args.max_age:g}시간 이내에 수집한 데이터셋만 있어 수집 생략")
+
+    if not args.no_build:
+        print()
+        build_report.run(argparse.Namespace(dataset=None, force=False, dry_run=False,
+                                            workers=None, dpi=build_report.DEFAULT_DPI,
+                                            root=args.root))
+    return status
+
+
+def cmd_sweep(args):
+    from collect_dataset_4 import KEYWORDS, SEGMENTS, START_DATE, END_DATE
+
+    try:
+        pool_credentials(args)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+
+    keywords = flat_keywords(load_keywords(args.keywords_file)) if args.keywords_file else KEYWORDS
+    segments = parse_segments(args.segments) if args.segments else SEGMENTS
+    tasks = sweep_tasks(keywords, segments, args.start or START_DATE, args.end or END_DATE)
+    queue_path = args.out / QUEUE_FILE
+
+    with WorkQueue(queue_path, max_attempts=args.max_attempts) as queue:
+        added = queue.put(tasks)
+        if args.retry_failed:
+            queue.retry_failed()
+        counts = queue.counts()
+
+    print("="*70)
+    print(f"🧵 sweep: 키워드 {len(keywords):,}개 × 세그먼트 {len(segments)}개 = {len(tasks):,}개 작업 "
+          f"(새로 등록 {added:,}개, 워커 {args.workers}개)")
+    print(f"   큐: {queue_path}")
+    print_queue(counts)
+    print("="*70)
+
+    start = time.perf_counter()
+    processes = [multiprocessing.Process(target=sweep_worker, args=(args, i, args.workers),
+                                         name=f'worker-{i}')
+                 for i in range(args.workers)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    with WorkQueue(queue_path, max_attempts=args.max_attempts) as queue:
+        counts = queue.counts()
+        failures = queue.failures()
+
+    print("\n" + "="*70)
+    print_queue(counts)
+    for key, error in failures[:10]:
+        print(f"  ❌ {key}: {error}")
+    if len(failures) > 10:
+        print(f"  ... 외 {len(failures) - 10:,}개 (--retry-failed로 재시도)")
+
+    if not args.no_merge and counts['done']:
+        df = merge_partitions(args.out, args.format, queue_path)
+        output_file = save_table(df, args.out / MERGED_NAME, args.format)
+        print(f"  💾 병합: {output_file} ({len(df):,}행)")
+        if args.detect:
+            alerts = monitor_frame(df, args.out / MONITOR_DIR / 'sweep.npz', 'sweep',
+                                   key=MONITORED['4'])
+            print_alerts("sweep", alerts, args.out / MONITOR_DIR / ALERT_LOG)
+
+    print(f"\n⏱️  {time.perf_counter() - start:.1f}s / 📁 {args.out}")
+    return 0 if counts['pending'] == counts['leased'] == counts['failed'] == 0 else 1
+
+
+def cmd_work(args):
+    queue_path = args.out / QUEUE_FILE
+    if not queue_path.exists():
+        print(f"❌ 큐가 없습니다: {queue_path} (먼저 sweep 실행)")
+        return 1
+    try:
+        datalab = worker_datalab(args)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+
+    stats = run_worker(queue_path, args.out, datalab=datalab, fmt=args.format,
+                       lease_seconds=args.lease, max_attempts=args.max_attempts)
+    print(f"\n✅ 완료 {stats['done']:,}개 / ❌ 실패 {stats['failed']:,}개")
+    print_key_stats(datalab.key_pool)
+    return 0
+
+
+def cmd_snapshot(args):
+    from config import KEYWORDS_BRANDS
+    from naver_api import _today
+
+    queries = flat_keywords(load_keywords(args.queries_file)) if args.queries_file else KEYWORDS_BRANDS
+    day = args.date or _today()
+    shopping = make_shopping(args)
+    print("="*70)
+    print(f"🛒 쇼핑 스냅샷: {day} (검색어 {len(queries)}개, 검색어당 최대 {args.max_results}개)")
+    print("="*70)
+
+    start = time.perf_counter()
+    path, mode = cassette_args(args)
+    with transport.use_cassette(path, mode, args.latency) as cassette:
+        with ThreadPoolExecutor(max_workers=args.workers) as executor:
+            items = executor.map(
+                lambda q: shopping.get_all_products(q, max_results=args.max_results, columnar=True),
+                queries)
+            results = dict(zip(queries, items))
+
+    store = SnapshotStore(args.out)
+    try:
+        diff = store.add(day, results, replace=args.replace)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+    print_snapshot_diff(diff, args.top)
+    if cassette is not None:
+        print_cassette(cassette)
+    print(f"\n⏱️  {time.perf_counter() - start:.1f}s / 📁 {store.snapshot_path(day)}")
+    return 0
+
+
+def cmd_report(args):
+    build_report.run(args)
+    return 0
+
+
+def bench_names():
+    return sorted(path.stem[len('bench_'):] for path in SCRIPTS_DIR.glob('bench_*.py'))
+
+
+def cmd_bench(args):
+    names = args.names or bench_names()
+    extra = shlex.split(args.args)
+    for name in names:
+        path = SCRIPTS_DIR / f'bench_{name}.py'
+        argv = sys.argv
+        sys.argv = [str(path)] + extra
+        try:
+            runpy.run_path(str(path), run_name='__main__')
+        finally:
+            sys.argv = argv
+    return 0
+
+
+# ============================================
+# 명령줄 파서
+# ============================================
+def dataset_arg(value):
+    if value not in DATASETS:
+        raise argparse.ArgumentTypeError(f"알 수 없는 데이터셋: {value} (사용 가능: {', '.join(DATASETS)})")
+    return value
+
+
+def snapshot_date(value):
+    try:
+        return date.fromisoformat(value).isoformat()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"날짜 형식은 YYYY-MM-DD: {value}")
+
+
+def bench_arg(value):
+    if value not in bench_names():
+        raise argparse.ArgumentTypeError(f"알 수 없는 벤치마크: {value} (사용 가능: {', '.join(bench_names())})")
+    return value
+
+
+def add_collect_arguments(parser):
+    parser.add_argument('datasets', nargs='*', type=dataset_arg, metavar='DATASET',
+                        help="수집할 데이터셋 (1~4, 기본: 전체)")
+    parser.add_argument('--start', help="시작일 YYYY-MM-DD (기본: 스크립트 설정)")
+    parser.add_argument('--end', help="종료일 YYYY-MM-DD (기본: 스크립트 설정)")
+    parser.add_argument('--keywords-file', type=Path, help="키워드 파일 (기본: 스크립트 설정)")
+    parser.add_argument('--segments', nargs='+', metavar='SPEC',
+                        help="Dataset 4 세그먼트 ('20대 여성=f:3,4' 또는 파일 경로)")
+    parser.add_argument('--workers', type=int, default=None, help="동시 수집 데이터셋 수 (기본: 전체)")
+    parser.add_argument('--rate', type=float, default=3.0,
+                        help="DataLab 초당 요청 수 (전체 공유, 키가 여러 개면 키마다)")
+    parser.add_argument('--daily-limit', type=int, default=None,
+                        help="키당 DataLab 일일 요청 한도 (기본: 1,000)")
+    parser.add_argument('--keys-state', type=Path, default=DEFAULT_KEYS_STATE,
+                        help="키별 당일 사용량 저장 파일 (예약 작업 간 유지)")
+    parser.add_argument('--cache-dir', type=Path, default=DEFAULT_CACHE_DIR, help="API 응답 캐시 폴더")
+    parser.add_argument('--cache-ttl', type=float, default=None, help="캐시 유효 시간 (시간, 기본: 만료 없음)")
+    parser.add_argument('--no-cache', action='store_true', help="응답 캐시 사용 안 함")
+    parser.add_argument('--format', choices=FORMATS, default='csv', help="저장 형식")
+    parser.add_argument('--data-dir', type=Path, default=DEFAULT_DATA_DIR, help="저장 폴더")
+    parser.add_argument('--quiet', action='store_true', help="데이터셋별 진행 로그 숨김")
+    parser.add_argument('--detect', action='store_true',
+                        help="수집 직후 Dataset 1 / 4 이상 감지 (상태 / 알림: 저장 폴더/monitor)")
+    cassette = parser.add_mutually_exclusive_group()
+    cassette.add_argument('--record', type=Path, metavar='CASSETTE',
+                          help="API 응답을 카세트(.json.gz)에 기록 (응답 캐시 사용 안 함)")
+    cassette.add_argument('--replay', type=Path, metavar='CASSETTE',
+                          help="카세트의 응답으로 오프라인 실행 (네트워크 사용 안 함)")
+    parser.add_argument('--latency', type=transport.parse_latency, default=None,
+                        help="재생 시 요청당 지연 (초 또는 'recorded': 기록된 응답 시간)")
+
+
+def add_worker_arguments(parser):
+    parser.add_argument('--out', type=Path, default=DEFAULT_SWEEP_DIR,
+                        help="큐 / 파티션 / 병합 결과 폴더 (기본: data/sweep)")
+    parser.add_argument('--rate', type=float, default=3.0, help="키마다 DataLab 초당 요청 수")
+    parser.add_argument('--daily-limit', type=int, default=None,
+                        help="키당 DataLab 일일 요청 한도 (기본: 1,000)")
+    parser.add_argument('--keys', type=int, nargs='+', metavar='N',
+                        help="사용할 키 번호 (NAVER_CREDENTIALS 순서, 0부터, 기본: 전체) "
+                             "— 실행 중인 sweep과 다른 키로 work를 추가할 때")
+    parser.add_argument('--keys-state', type=Path, default=DEFAULT_KEYS_STATE,
+                        help="키별 당일 사용량 저장 파일 (collect / 다른 워커와 공유)")
+    parser.add_argument('--lease', type=float, default=DEFAULT_LEASE,
+                        help="작업 임대 시간 (초, 지나면 다른 워커가 재시도)")
+    parser.add_argument('--max-attempts', type=int, default=DEFAULT_MAX_ATTEMPTS,
+                        help="작업당 최대 시도 횟수")
+    parser.add_argument('--cache-dir', type=Path, default=DEFAULT_CACHE_DIR, help="API 응답 캐시 폴더")
+    parser.add_argument('--cache-ttl', type=float, default=None, help="캐시 유효 시간 (시간, 기본: 만료 없음)")
+    parser.add_argument('--no-cache', action='store_true', help="응답 캐시 사용 안 함")
+    parser.add_argument('--format', choices=FORMATS, default='csv', help="파티션 / 병합 저장 형식")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='soda', description="SODA 프로젝트 데이터 수집 / 리포트 도구")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    collect_parser = commands.add_parser('collect', help="데이터셋 수집")
+    add_collect_arguments(collect_parser)
+    collect_parser.set_defaults(handler=cmd_collect)
+
+    refresh_parser = commands.add_parser('refresh', help="오래된 데이터셋만 다시 수집 후 증분 빌드")
+    add_collect_arguments(refresh_parser)
+    refresh_parser.add_argument('--max-age', type=float, default=24.0,
+                                help="이 시간보다 오래된 데이터셋만 수집 (기본: 24시간)")
+    refresh_parser.add_argument('--no-build', action='store_true', help="수집 후 증분 빌드 생략")
+    refresh_parser.add_argument('--root', type=Path, default=PROJECT_ROOT, help="빌드 프로젝트 루트")
+    # 저장 폴더 기본값: --root의 data/ (증분 빌드 입력 폴더)
+    refresh_parser.set_defaults(handler=cmd_refresh, data_dir=None)
+
+    report_parser = commands.add_parser('report', help="증분 빌드 (피벗 / 요약 표 / 차트)")
+    build_report.add_arguments(report_parser)
+    report_parser.set_defaults(handler=cmd_report)
+
+    bench_parser = commands.add_parser('bench', help="벤치마크 실행")
+    bench_parser.add_argument('names', nargs='*', type=bench_arg, metavar='NAME',
+                              help=f"벤치마크 이름 (기본: 전체, 사용 가능: {', '.join(bench_names())})")
+    bench_parser.add_argument('--args', default='',
+                              help="벤치마크 스크립트에 전달할 인자 (예: --args='--segments 66')")
+    bench_parser.set_defaults(handler=cmd_bench)
+
+    sweep_parser = commands.add_parser('sweep', help="대규모 키워드 × 세그먼트 수집 (작업 큐 + 워커 프로세스)")
+    sweep_parser.add_argument('--keywords-file', type=Path, help="키워드 파일 (기본: Dataset 4 키워드)")
+    sweep_parser.add_argument('--segments', nargs='+', metavar='SPEC',
+                              help="세그먼트 ('20대 여성=f:3,4' 또는 파일 경로, 기본: Dataset 4 세그먼트)")
+    sweep_parser.add_argument('--start', help="시작일 YYYY-MM-DD (기본: Dataset 4 설정)")
+    sweep_parser.add_argument('--end', help="종료일 YYYY-MM-DD (기본: Dataset 4 설정)")
+    sweep_parser.add_argument('--workers', type=int, default=4, help="워커 프로세스 수")
+    sweep_parser.add_argument('--retry-failed', action='store_true', help="이전 실행에서 실패한 작업 재시도")
+    sweep_parser.add_argument('--no-merge', action='store_true', help="파티션 병합 생략")
+    sweep_parser.add_argument('--quiet', action='store_true', help="작업별 진행 로그 숨김")
+    sweep_parser.add_argument('--detect', action='store_true',
+                              help="병합 후 이상 감지 (상태 / 알림: --out 폴더/monitor)")
+    add_worker_arguments(sweep_parser)
+    sweep_parser.set_defaults(handler=cmd_sweep)
+
+    work_parser = commands.add_parser('work', help="기존 sweep 큐에 워커 하나 추가")
+    add_worker_arguments(work_parser)
+    work_parser.set_defaults(handler=cmd_work)
+
+    snapshot_parser = commands.add_parser('snapshot', help="쇼핑 검색 결과 일별 스냅샷 + 가격 변경 감지")
+    snapshot_parser.add_argument('--queries-file', type=Path,
+                                 help="검색어 파일 (기본: config.KEYWORDS_BRANDS)")
+    snapshot_parser.add_argument('--date', type=snapshot_date, help="스냅샷 날짜 YYYY-MM-DD (기본: 오늘, 한국 시간)")
+    snapshot_parser.add_argument('--max-results', type=int, default=1000,
+                                 help="검색어당 최대 상품 수 (100개 단위, 최대 1,000)")
+    snapshot_parser.add_argument('--replace', action='store_true', help="같은 날짜 스냅샷 다시 저장")
+    snapshot_parser.add_argument('--top', type=int, default=10, help="출력할 가격 하락 상품 수")
+    snapshot_parser.add_argument('--out', type=Path, default=DEFAULT_SHOPPING_DIR,
+                                 help="스냅샷 / 가격 이력 폴더 (기본: data/shopping)")
+    snapshot_parser.add_argument('--rate', type=float, default=5.0, help="키마다 검색 API 초당 요청 수")
+    snapshot_parser.add_argument('--workers', type=int, default=4, help="동시에 수집할 검색어 수")
+    snapshot_parser.add_argument('--keys-state', type=Path, default=DEFAULT_SEARCH_KEYS_STATE,
+                                 help="키별 검색 API 당일 사용량 저장 파일 (DataLab과 별도)")
+    cassette = snapshot_parser.add_mutually_exclusive_group()
+    cassette.add_argument('--record', type=Path, metavar='CASSETTE', help="API 응답을 카세트에 기록")
+    cassette.add_argument('--replay', type=Path, metavar='CASSETTE', help="카세트의 응답으로 오프라인 실행")
+    snapshot_parser.add_argument('--latency', type=transport.parse_latency, default=None,
+                                 help="재생 시 요청당 지연 (초 또는 'recorded')")
+    snapshot_parser.set_defaults(handler=cmd_snapshot)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    try:
+        sys.exit(main())
+    except KeyboardInterrupt:
+        print("\n\n⚠️  사용자에 의해 중단되었습니다.")
+        sys.exit(130)
@@ -0,0 +1,247 @@
+"""
+SODA 프로젝트 - 발표 자료 데이터 수집
+Dataset 5: 블로그 언급량 시계열 (DataLab 검색 비율의 보조 지표)
+
+- 키워드별 블로그 검색을 최신순(sort='date')으로 페이지 동시 수집 (검색어당 API 한도 1,000건)
+- 검색 결과가 1,000건을 넘는 키워드는 "키워드 + 수식어" 검색어로 나눠 더 오래된 글까지 수집
+- 게시일(postdate) 기준 월별 / 일별 글 수를 analysis.mentions로 한 번에 집계 → Dataset 1과 같은 형식으로 저장
+"""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import pandas as pd
+
+# ============================================
+# 경로 설정
+# ============================================
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent
+src_dir = current_file.parent
+
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+if str(src_dir) not in sys.path:
+    sys.path.insert(0, str(src_dir))
+
+from naver_api import NaverBlog, RateLimiter
+from analysis.mentions import posts_frame, mention_counts
+from storage import save_table
+
+PROJECT_ROOT = project_root
+
+# 기본 수집 설정
+KEYWORDS = ["선크림", "썬크림", "자외선차단제"]
+START_DATE = "2024-03-01"
+END_DATE = "2025-02-28"
+MODIFIERS = ["추천", "후기", "리뷰", "가격", "성분", "순한", "톤업", "무기자차", "유기자차", "올리브영"]
+
+MAX_START = 1000     # 검색 API start 최댓값 (검색어당 최대 1,000건)
+PAGE_SIZE = 100
+MAX_WORKERS = 8
+
+OUTPUT_FILES = {
+    'month': "05_블로그_언급량_월별.csv",
+    'week': "05_블로그_언급량_주별.csv",
+    'date': "05_블로그_언급량_일별.csv",
+}
+
+
+def _fetch_page(blog, query, start):
+    """한 페이지 (오류는 출력 후 None → 그 검색어는 끝까지 수집되지 않은 것으로 처리)"""
+    try:
+        return blog.search_blogs(query, display=PAGE_SIZE, start=start, sort='date', columnar=True)
+    except Exception as e:
+        print(f"\n   ⚠️ {query} start={start}: {e}")
+        return None
+
+
+def fetch_queries(blog, queries, max_workers=MAX_WORKERS):
+    """
+    검색어별 최신 글 최대 1,000건 (페이지 단위 동시 수집)
+
+    1단계: 모든 검색어의 첫 페이지 → total 확인
+    2단계: 나머지 페이지 (start 101 ~ 901)를 한 풀에서 동시에
+
+    Returns:
+        dict: {검색어: {'total', 'items' ({필드: 값 목록}), 'complete' (total을 모두 받았는지)}}
+    """
+    queries = list(dict.fromkeys(queries))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        first = list(executor.map(lambda q: _fetch_page(blog, q, 1), queries))
+
+        tasks = []
+        for query, page in zip(queries, first):
+            if page is None:
+                continue
+            available = min(int(page['total']), MAX_START)
+            tasks += [(query, start) for start in range(1 + PAGE_SIZE, available + 1, PAGE_SIZE)]
+        pages = list(executor.map(lambda task: _fetch_page(blog, *task), tasks))
+
+    results = {}
+    for query, page in zip(queries, first):
+        if page is None:
+            results[query] = {'total': 0, 'items': {'postdate': [], 'link': []}, 'complete': False}
+            continue
+        results[query] = {'total': int(page['total']), 'items': page['items'], 'complete': True}
+    for (query, _), page in zip(tasks, pages):
+        items = results[query]['items']
+        if page is None:
+            results[query]['complete'] = False
+            continue
+        for field, values in page['items'].items():
+            items.setdefault(field, []).extend(values)
+
+    for result in results.values():
+        fetched = len(result['items'].get('postdate', []))
+        result['complete'] = result['complete'] and fetched >= result['total']
+    return results
+
+
+def _coverage_start(result):
+    """
+    검색어 결과가 완전한 첫 날 (다 받았으면 None)
+
+    최신순으로 받다 끊겼으므로 가장 오래된 글 다음 날부터는 전부 받은 것 (그날 글은 일부만 받았을 수 있음)
+    """
+    if result['complete']:
+        return None
+    dates = pd.to_datetime(pd.Series(result['items'].get('postdate', []), dtype=str),
+                           format='%Y%m%d', errors='coerce')
+    if dates.notna().any():
+        return dates.min() + pd.Timedelta(days=1)
+    return pd.Timestamp.max.normalize()   # 첫 페이지부터 실패 → 어느 기간도 보장 안 됨
+
+
+def _latest(dates):
+    dates = [date for date in dates if date is not None]
+    return max(dates) if dates else None
+
+
+def extend_with_modifiers(df, posts, split, coverage, fetched, time_unit, start_date, end_date):
+    """
+    키워드 검색어가 닿지 않는 기간을 수식어 검색어 글 수로 추정
+
+    키워드 검색어와 수식어 검색어가 모두 완전한 기간에서 키워드 글 중 수식어 검색어에도 나온 비율(share)을 구해,
+    그 이전 기간은 (수식어 검색어 글 수 / share)로 채움 (수식어 검색어도 끊긴 기간은 그대로 NaN)
+
+    Returns:
+        (df, {키워드: share}) — df는 같은 객체
+    """
+    sub = posts[posts['query'] != posts['keyword']]
+    sub_coverage = {keyword: _latest(_coverage_start(fetched[q]) for q in queries)
+                    for keyword, queries in split.items()}
+    sub_counts = mention_counts(sub, time_unit, start_date, end_date, coverage=sub_coverage,
+                                keywords=list(split))
+
+    shares = {}
+    for keyword in split:
+        since = _latest([coverage[keyword], sub_coverage[keyword]])
+        base = posts[(posts['query'] == keyword) & (posts['postdate'] >= since)]
+        if base.empty:
+            continue
+        share = base['link'].isin(sub.loc[sub['keyword'] == keyword, 'link']).mean()
+        if share > 0:
+            missing = df[keyword].isna().to_numpy()
+            df.loc[missing, keyword] = sub_counts.loc[missing, keyword].to_numpy() / share
+            shares[keyword] = share
+    return df, shares
+
+
+def collect_blog_mentions(keywords=KEYWORDS, start_date=START_DATE, end_date=END_DATE,
+                          modifiers=MODIFIERS, time_unit='month', blog=None, data_dir=None,
+                          output_format='csv', max_workers=MAX_WORKERS):
+    """
+    Dataset 5: 키워드별 블로그 언급량 (게시일 기준 글 수)
+
+    결과: CSV 파일 (date, 키워드별 글 수..., year, month, season) — Dataset 1과 같은 형식
+    검색 API는 최신 글부터 검색어당 1,000건까지만 제공하므로, 키워드 검색어가 닿지 않는 이전 기간은
+    수식어 검색어 글 수로 추정 (extend_with_modifiers), 그것도 닿지 않는 기간은 NaN (글 수 0과 구분)
+
+    Args:
+        keywords: 키워드 목록
+        start_date / end_date: 집계 기간 ("YYYY-MM-DD")
+        modifiers: 1,000건을 넘는 키워드에 붙일 수식어 ("선크림 추천", "선크림 후기", ...)
+        time_unit: 'month', 'week', 'date'
+        blog: 공유 NaverBlog (None이면 새로 생성)
+        data_dir: 저장 폴더 (None이면 data/presentation)
+        output_format: 'csv' 또는 'parquet'
+        max_workers: 동시 요청 수
+    """
+
+    print("="*60)
+    print("📊 Dataset 5: 블로그 언급량 시계열 수집")
+    print("="*60)
+
+    # 블로그 검색 API 초기화
+    blog = blog or NaverBlog(rate_limiter=RateLimiter())
+
+    # 저장 경로
+    data_dir = Path(data_dir) if data_dir else PROJECT_ROOT / 'data' / 'presentation'
+    data_dir.mkdir(parents=True, exist_ok=True)
+
+    keywords = list(keywords)
+
+    print(f"\n📅 기간: {start_date} ~ {end_date}")
+    print(f"🔍 키워드: {', '.join(keywords)}")
+    print(f"\n수집 중 (최신순)...", end=" ")
+
+    # 1차: 키워드 검색어
+    fetched = fetch_queries(blog, keywords, max_workers)
+    searches = {keyword: [keyword] for keyword in keywords}
+
+    # 2차: 1,000건을 넘는 키워드는 수식어 검색어로 나눠 추가 수집
+    saturated = [keyword for keyword in keywords if not fetched[keyword]['complete']]
+    if saturated and modifiers:
+        split = {keyword: [f"{keyword} {modifier}" for modifier in modifiers] for keyword in saturated}
+        fetched.update(fetch_queries(blog, [q for queries in split.values() for q in queries], max_workers))
+        for keyword, queries in split.items():
+            searches[keyword] += queries
+
+    print(f"✅ 완료! (검색어 {len(fetched)}개)")
+
+    # 키워드 검색어가 완전한 기간으로 집계 (모든 키워드를 한 번에)
+    coverage = {keyword: _coverage_start(fetched[keyword]) for keyword in keywords}
+    posts = posts_frame({keyword: [(q, fetched[q]['items']) for q in queries]
+                         for keyword, queries in searches.items()})
+    df = mention_counts(posts, time_unit, start_date, end_date, coverage=coverage, keywords=keywords)
+
+    # 그 이전 기간은 수식어 검색어로 추정
+    shares = {}
+    if saturated and modifiers:
+        df, shares = extend_with_modifiers(df, posts, split, coverage, fetched,
+                                           time_unit, start_date, end_date)
+
+    # 데이터 요약
+    print(f"\n📊 수집 결과:")
+    print(f"   총 글 수 (중복 제외 전): {len(posts):,}건")
+    for keyword in keywords:
+        total = fetched[keyword]['total']
+        since = coverage[keyword]
+        note = f", {since.strftime('%Y-%m-%d')} 이전은 " if since is not None else ""
+        if note:
+            note += f"수식어 검색어로 추정 (비율 {shares[keyword]:.1%})" if keyword in shares else "NaN"
+        print(f"   {keyword}: 검색 결과 {total:,}건, 기간 내 {df[keyword].sum():,.0f}건{note}")
+
+    # 저장
+    filepath = save_table(df, data_dir / OUTPUT_FILES[time_unit], output_format)
+
+    print(f"\n💾 저장 완료: {filepath}")
+    print(f"\n✅ Dataset 5 수집 완료!")
+
+    return df
+
+
+if __name__ == "__main__":
+    try:
+        df = collect_blog_mentions()
+
+        print("\n" + "="*60)
+        print("📋 데이터 미리보기 (마지막 5행)")
+        print("="*60)
+        print(df.tail().to_string())
+
+    except Exception as e:
+        print(f"\n❌ 오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
@@ -19,18 +19,34 @@ if str(project_root) not in sys.path:
 if str(src_dir) not in sys.path:
     sys.path.insert(0, str(src_dir))
 
-from naver_api import NaverDataLab
+from naver_api import NaverDataLab, RateLimiter
+from analysis.seasons import add_calendar_features
+from analysis.seasonal_stats import season_means
+from storage import save_table
 
 PROJECT_ROOT = project_root
 
+# 기본 수집 설정
+KEYWORDS = ["선크림", "썬크림", "자외선차단제"]
+START_DATE = "2020-02-01"
+END_DATE = "2025-02-28"
 
-def collect_dataset_1():
+
+def collect_dataset_1(keywords=KEYWORDS, start_date=START_DATE, end_date=END_DATE,
+                      datalab=None, data_dir=None, output_format='csv'):
     """
     Dataset 1: 선크림 그룹 월별 검색 트렌드
     
     기간: 2020-02-01 ~ 2025-02-28 (5년)
     키워드: 선크림, 썬크림, 자외선차단제
     결과: CSV 파일 (date, 선크림, 썬크림, 자외선차단제, year, month, season)
+    
+    Args:
+        keywords: 키워드 목록 (최대 5개)
+        start_date / end_date: 수집 기간 ("YYYY-MM-DD")
+        datalab: 공유 NaverDataLab (None이면 새로 생성)
+        data_dir: 저장 폴더 (None이면 data/presentation)
+        output_format: 'csv' 또는 'parquet'
     """
     
     print("="*60)
@@ -38,16 +54,13 @@ def collect_dataset_1():
     print("="*60)
     
     # 데이터랩 API 초기화
-    datalab = NaverDataLab()
+    datalab = datalab or NaverDataLab(rate_limiter=RateLimiter())
     
     # 저장 경로
-    data_dir = PROJECT_ROOT / 'data' / 'presentation'
+    data_dir = Path(data_dir) if data_dir else PROJECT_ROOT / 'data' / 'presentation'
     data_dir.mkdir(parents=True, exist_ok=True)
     
-    # 수집 설정
-    keywords = ["선크림", "썬크림", "자외선차단제"]
-    start_date = "2020-02-01"
-    end_date = "2025-02-28"
+    keywords = list(keywords)
     
     print(f"\n📅 기간: {start_date} ~ {end_date}")
     print(f"🔍 키워드: {', '.join(keywords)}")
@@ -64,12 +77,8 @@ def collect_dataset_1():
     # DataFrame 변환
     df = datalab.to_dataframe(result)
     
-    # 추가 컬럼 생성
-    df['year'] = df['date'].dt.year
-    df['month'] = df['date'].dt.month
-    df['season'] = df['month'].apply(
-        lambda x: '겨울' if x in [12,1,2] else ('여름' if x in [6,7,8] else '기타')
-    )
+    # 추가 컬럼 생성 (year, month, season)
+    add_calendar_features(df)
     
     print(f"✅ 완료!")
     
@@ -80,14 +89,13 @@ def collect_dataset_1():
     print(f"   컬럼: {', '.join(df.columns.tolist())}")
     
     # 계절별 평균 출력
-    print(f"\n📈 계절별 평균 (선크림 기준):")
-    seasonal_avg = df.groupby('season')['선크림'].mean()
+    print(f"\n📈 계절별 평균 ({keywords[0]} 기준):")
+    seasonal_avg = season_means(df, keywords[:1])[keywords[0]]
     for season, value in seasonal_avg.items():
         print(f"   {season}: {value:.1f}")
     
     # 저장
-    filepath = data_dir / "01_선크림_월별_트렌드.csv"
-    df.to_csv(filepath, index=False, encoding='utf-8-sig')
+    filepath = save_table(df, data_dir / "01_선크림_월별_트렌드.csv", output_format)
     
     print(f"\n💾 저장 완료: {filepath}")
     print(f"\n✅ Dataset 1 수집 완료!")
@@ -6,7 +6,6 @@ Dataset 2: 겨울 실외활동 월별 시계열
 import sys
 from pathlib import Path
 import pandas as pd
-import time
 
 # ============================================
 # 경로 설정
@@ -20,12 +19,27 @@ if str(project_root) not in sys.path:
 if str(src_dir) not in sys.path:
     sys.path.insert(0, str(src_dir))
 
-from naver_api import NaverDataLab
+from naver_api import NaverDataLab, RateLimiter
+from analysis.seasons import add_calendar_features
+from analysis.seasonal_stats import season_means
+from storage import save_table
 
 PROJECT_ROOT = project_root
 
+# 기본 수집 설정
+START_DATE = "2020-02-01"
+END_DATE = "2025-02-28"
+ACTIVITY_GROUPS = {
+    "스키": ["스키", "스키장", "스노우보드"],
+    "등산": ["등산", "트레킹"],
+    "러닝": ["러닝", "조깅"],
+    "골프": ["골프"],
+    "낚시": ["낚시", "바다낚시"]
+}
 
-def collect_dataset_2():
+
+def collect_dataset_2(activity_groups=ACTIVITY_GROUPS, start_date=START_DATE, end_date=END_DATE,
+                      datalab=None, data_dir=None, output_format='csv'):
     """
     Dataset 2: 겨울 실외활동 그룹별 월별 검색 트렌드
     
@@ -38,34 +52,28 @@ def collect_dataset_2():
     - 낚시: 낚시, 바다낚시
     
     결과: CSV 파일 (date, 스키그룹, 등산그룹, 러닝그룹, 골프, 낚시그룹)
+    
+    Args:
+        activity_groups: {그룹 이름: 키워드 목록 (최대 5개)}
+        start_date / end_date: 수집 기간 ("YYYY-MM-DD")
+        datalab: 공유 NaverDataLab (None이면 새로 생성)
+        data_dir: 저장 폴더 (None이면 data/presentation)
+        output_format: 'csv' 또는 'parquet'
     """
     
     print("="*60)
     print("📊 Dataset 2: 겨울 실외활동 그룹별 월별 시계열 수집")
     print("="*60)
     
-    # 데이터랩 API 초기화
-    datalab = NaverDataLab()
+    # 데이터랩 API 초기화 (요청 간격은 RateLimiter가 조절)
+    datalab = datalab or NaverDataLab(rate_limiter=RateLimiter())
     
     # 저장 경로
-    data_dir = PROJECT_ROOT / 'data' / 'presentation'
+    data_dir = Path(data_dir) if data_dir else PROJECT_ROOT / 'data' / 'presentation'
     data_dir.mkdir(parents=True, exist_ok=True)
     
-    # 수집 설정
-    start_date = "2020-02-01"
-    end_date = "2025-02-28"
-    
     print(f"\n📅 기간: {start_date} ~ {end_date}")
     
-    # 활동 그룹 정의
-    activity_groups = {
-        "스키": ["스키", "스키장", "스노우보드"],
-        "등산": ["등산", "트레킹"],
-        "러닝": ["러닝", "조깅"],
-        "골프": ["골프"],
-        "낚시": ["낚시", "바다낚시"]
-    }
-    
     print(f"\n🏃 활동 그룹:")
     for name, keywords in activity_groups.items():
         print(f"   {name}: {', '.join(keywords)}")
@@ -92,8 +100,6 @@ def collect_dataset_2():
             
             print(f"✅ 완료 ({len(df_temp)}개월)")
             
-            time.sleep(0.3)  # API 제한 회피
-            
         except Exception as e:
             print(f"❌ 오류: {e}")
             all_data[group_name] = None
@@ -118,12 +124,8 @@ def collect_dataset_2():
         else:
             base_df[f'{group_name}_그룹'] = 0
     
-    # 추가 컬럼
-    base_df['year'] = base_df['date'].dt.year
-    base_df['month'] = base_df['date'].dt.month
-    base_df['season'] = base_df['month'].apply(
-        lambda x: '겨울' if x in [12,1,2] else ('여름' if x in [6,7,8] else '기타')
-    )
+    # 추가 컬럼 (year, month, season)
+    add_calendar_features(base_df)
     
     print(f"✅ 완료!")
     
@@ -135,14 +137,9 @@ def collect_dataset_2():
     
     # 겨울 평균 계산 및 순위
     print(f"\n📈 겨울(12,1,2월) 평균 순위:")
-    winter_df = base_df[base_df['season'] == '겨울']
-    
-    winter_avg = {}
-    for col in base_df.columns:
-        if col.endswith('_그룹'):
-            activity_name = col.replace('_그룹', '')
-            avg = winter_df[col].mean()
-            winter_avg[activity_name] = avg
+    group_cols = [col for col in base_df.columns if col.endswith('_그룹')]
+    winter_avg = season_means(base_df, group_cols).loc['겨울']
+    winter_avg.index = [col.replace('_그룹', '') for col in group_cols]
     
     # 정렬
     sorted_activities = sorted(winter_avg.items(), key=lambda x: x[1], reverse=True)
@@ -152,8 +149,7 @@ def collect_dataset_2():
         print(f"   {rank}위. {activity:8s}: {value:6.1f} {bar}")
     
     # 저장
-    filepath = data_dir / "02_겨울활동_월별_트렌드.csv"
-    base_df.to_csv(filepath, index=False, encoding='utf-8-sig')
+    filepath = save_table(base_df, data_dir / "02_겨울활동_월별_트렌드.csv", output_format)
     
     print(f"\n💾 저장 완료: {filepath}")
     print(f"\n✅ Dataset 2 수집 완료!")
@@ -24,10 +24,24 @@ if str(project_root) not in sys.path:
 if str(src_dir) not in sys.path:
     sys.path.insert(0, str(src_dir))
 
-from naver_api import NaverDataLab
+from naver_api import NaverDataLab, RateLimiter
+import transport
+from analysis.seasons import add_calendar_features
+from analysis.seasonal_stats import season_means
+from analysis.correlation import correlation_scan
+from storage import save_table
 
 PROJECT_ROOT = project_root
 
+# 기본 수집 설정
+START_DATE = "2020-02-01"
+END_DATE = "2025-02-28"
+KEYWORDS = [
+    "자외선",
+    "자외선 차단",
+    "UV 차단"
+]
+
 
 def parse_kma_uv_response(text):
     """
@@ -93,7 +107,7 @@ def get_kma_uv_daily(date, auth_key, hour=12, minute=0):
     }
     
     try:
-        response = requests.get(url, params=params, timeout=30)
+        response = transport.request('GET', url, params=params, timeout=30)
         response.raise_for_status()
         
         result = parse_kma_uv_response(response.text)
@@ -132,8 +146,9 @@ def get_kma_uv_monthly(year, month, auth_key):
         if data:
             daily_values.append(data['uvb_avg'])
         
-        # API 제한 고려 (0.3초 대기)
-        time.sleep(0.3)
+        # API 제한 고려 (0.3초 대기, 카세트 재생 시 생략)
+        if not transport.is_replay():
+            time.sleep(0.3)
     
     if len(daily_values) > 0:
         return {
@@ -243,29 +258,26 @@ def collect_kma_uv_monthly_avg(start_year=2020, start_month=2, end_year=2025, en
     return df
 
 
-def collect_naver_uv_search():
+def collect_naver_uv_search(keywords=KEYWORDS, start_date=START_DATE, end_date=END_DATE,
+                            datalab=None):
     """
     네이버 DataLab 자외선 검색량 수집
+    
+    Args:
+        keywords: 자외선 관련 키워드 목록
+        start_date / end_date: 수집 기간 ("YYYY-MM-DD")
+        datalab: 공유 NaverDataLab (None이면 새로 생성)
     """
     
     print("\n" + "="*60)
     print("🔍 [Phase 2] 네이버 자외선 검색량 수집")
     print("="*60)
     
-    datalab = NaverDataLab()
-    
-    start_date = "2020-02-01"
-    end_date = "2025-02-28"
+    # 요청 간격은 RateLimiter가 조절
+    datalab = datalab or NaverDataLab(rate_limiter=RateLimiter())
     
     print(f"\n📅 기간: {start_date} ~ {end_date}")
     
-    # 자외선 관련 키워드
-    keywords = [
-        "자외선",
-        "자외선 차단",
-        "UV 차단"
-    ]
-    
     print(f"\n🔍 검색 키워드:")
     for i, kw in enumerate(keywords, 1):
         print(f"   {i}. {kw}")
@@ -293,8 +305,6 @@ def collect_naver_uv_search():
                 print(f"⚠️ 데이터 없음")
                 all_data[keyword] = None
             
-            time.sleep(0.3)
-            
         except Exception as e:
             print(f"❌ 오류: {e}")
             all_data[keyword] = None
@@ -341,9 +351,14 @@ def collect_naver_uv_search():
     return base_df
 
 
-def merge_and_analyze(kma_df, naver_df):
+def merge_and_analyze(kma_df, naver_df, data_dir=None, output_format='csv'):
     """
     기상청 UV-B + 네이버 검색량 병합 및 분석
+    
+    Args:
+        kma_df / naver_df: Phase 1 / Phase 2 결과
+        data_dir: 저장 폴더 (None이면 data/presentation)
+        output_format: 'csv' 또는 'parquet'
     """
     
     print("\n" + "="*60)
@@ -361,12 +376,8 @@ def merge_and_analyze(kma_df, naver_df):
         how='left'
     )
     
-    # 추가 컬럼
-    merged_df['year'] = merged_df['date'].dt.year
-    merged_df['month'] = merged_df['date'].dt.month
-    merged_df['season'] = merged_df['month'].apply(
-        lambda x: '겨울' if x in [12,1,2] else ('여름' if x in [6,7,8] else '기타')
-    )
+    # 추가 컬럼 (year, month, season)
+    add_calendar_features(merged_df)
     
     print(f"\n📊 병합 결과:")
     print(f"   총 개월 수: {len(merged_df)}개월")
@@ -377,25 +388,24 @@ def merge_and_analyze(kma_df, naver_df):
     print(f"\n{'구분':<10} | {'자외선검색지수':>12} | {'UVB평균':>8}")
     print(f"{'-'*10}-+-{'-'*12}-+-{'-'*8}")
     
+    seasonal = season_means(merged_df, ['자외선검색지수', 'UVB평균'])
+    observed = set(merged_df['season'])
+    
     for season in ['겨울', '여름', '기타']:
-        season_df = merged_df[merged_df['season'] == season]
-        if len(season_df) > 0:
-            search_avg = season_df['자외선검색지수'].mean() if '자외선검색지수' in season_df.columns else 0
-            uv_avg = season_df['UVB평균'].mean() if 'UVB평균' in season_df.columns else 0
+        if season in observed:
+            search_avg = seasonal.loc[season, '자외선검색지수']
+            uv_avg = seasonal.loc[season, 'UVB평균']
             print(f"{season:<10} | {search_avg:12.2f} | {uv_avg:8.2f}")
     
     # Gap 분석
     print(f"\n💡 인식 공백(Perception Gap) 분석:")
     
-    winter_df = merged_df[merged_df['season'] == '겨울']
-    summer_df = merged_df[merged_df['season'] == '여름']
-    
-    if len(winter_df) > 0 and len(summer_df) > 0:
-        winter_search = winter_df['자외선검색지수'].mean()
-        summer_search = summer_df['자외선검색지수'].mean()
+    if '겨울' in observed and '여름' in observed:
+        winter_search = seasonal.loc['겨울', '자외선검색지수']
+        summer_search = seasonal.loc['여름', '자외선검색지수']
         
-        winter_uv = winter_df['UVB평균'].mean() if 'UVB평균' in winter_df.columns else 0
-        summer_uv = summer_df['UVB평균'].mean() if 'UVB평균' in summer_df.columns else 0
+        winter_uv = seasonal.loc['겨울', 'UVB평균']
+        summer_uv = seasonal.loc['여름', 'UVB평균']
         
         print(f"\n   [검색량 비교]")
         print(f"   - 겨울 검색:     {winter_search:6.2f}")
@@ -451,21 +461,43 @@ def merge_and_analyze(kma_df, naver_df):
         else:
             print(f"\n   ⚠️ UV 데이터 부족으로 Gap 분석 불가")
     
+    # 상관 / 시차 분석 (UV-B가 오를 때 검색량이 따라 오르는가?)
+    search_cols = [col for col in naver_df.columns if col != 'date']
+    
+    if 'UVB평균' in merged_df.columns and merged_df['UVB평균'].notna().sum() > 2:
+        scan = correlation_scan(merged_df, 'UVB평균', search_cols)
+        
+        print(f"\n🔬 UV-B 지수 ↔ 검색량 상관 분석 (시차 0~6개월):")
+        print(f"\n{'키워드':<12} | {'Pearson':>8} | {'Spearman':>8} | {'최적 시차':>8} | {'시차 상관':>8}")
+        print(f"{'-'*12}-+-{'-'*8}-+-{'-'*8}-+-{'-'*8}-+-{'-'*8}")
+        
+        for keyword, row in scan.iterrows():
+            best = f"{row['best_lag']:.0f}개월" if pd.notna(row['best_lag']) else "-"
+            print(f"{keyword:<12} | {row['pearson']:8.3f} | {row['spearman']:8.3f} | "
+                  f"{best:>8} | {row['best_lag_r']:8.3f}")
+    
     # 저장
-    data_dir = PROJECT_ROOT / 'data' / 'presentation'
+    data_dir = Path(data_dir) if data_dir else PROJECT_ROOT / 'data' / 'presentation'
     data_dir.mkdir(parents=True, exist_ok=True)
     
-    filepath = data_dir / "03_UV지수_검색량_비교.csv"
-    merged_df.to_csv(filepath, index=False, encoding='utf-8-sig')
+    filepath = save_table(merged_df, data_dir / "03_기상청_UV지수_vs_검색량_비교.csv", output_format)
     
     print(f"\n💾 저장 완료: {filepath}")
     
     return merged_df
 
 
-def main():
+def main(start_date=START_DATE, end_date=END_DATE, keywords=KEYWORDS, datalab=None,
+         data_dir=None, output_format='csv'):
     """
     Dataset 3 최종 수집 메인 함수
+    
+    Args:
+        start_date / end_date: 수집 기간 ("YYYY-MM-DD", 기상청 데이터는 해당 월 단위)
+        keywords: 자외선 관련 검색 키워드 목록
+        datalab: 공유 NaverDataLab (None이면 새로 생성)
+        data_dir: 저장 폴더 (None이면 data/presentation)
+        output_format: 'csv' 또는 'parquet'
     """
     
     print("="*60)
@@ -484,20 +516,21 @@ def main():
     try:
         # Phase 1: 기상청 UV 데이터
         print(f"\n⏳ Phase 1 시작...")
+        start, end = pd.Timestamp(start_date), pd.Timestamp(end_date)
         kma_df = collect_kma_uv_monthly_avg(
-            start_year=2020,
-            start_month=2,
-            end_year=2025,
-            end_month=2
+            start_year=start.year,
+            start_month=start.month,
+            end_year=end.year,
+            end_month=end.month
         )
         
         # Phase 2: 네이버 검색량
         print(f"\n⏳ Phase 2 시작...")
-        naver_df = collect_naver_uv_search()
+        naver_df = collect_naver_uv_search(keywords, start_date, end_date, datalab)
         
         # Phase 3: 병합 및 분석
         print(f"\n⏳ Phase 3 시작...")
-        final_df = merge_and_analyze(kma_df, naver_df)
+        final_df = merge_and_analyze(kma_df, naver_df, data_dir, output_format)
         
         # 결과 출력
         print("\n" + "="*60)
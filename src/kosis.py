@@ -0,0 +1,224 @@
+# src/kosis.py
+"""
+KOSIS(통계청) 내보내기 CSV 로더
+
+- 여러 줄 헤더(시점 / 항목 / 데이터 종류)를 MultiIndex 컬럼으로 파싱
+- 문자열 숫자('-', 'X', 천 단위 쉼표 포함)를 한 번의 벡터 연산으로 변환
+- 정규화 결과(long format)를 Parquet로 캐시 (pyarrow / fastparquet 선택 의존성,
+  없으면 pickle) → 같은 파일은 한 번만 파싱
+"""
+
+import hashlib
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+try:
+    import fastparquet
+except ImportError:
+    fastparquet = None
+
+
+CACHE_FORMAT = 'parquet' if (pyarrow is not None or fastparquet is not None) else 'pickle'
+CACHE_VERSION = 1
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent.parent / '.cache' / 'kosis'
+
+# 헤더 행 이름 (위에서부터: 시점, 항목, 데이터 종류)
+HEADER_LEVELS = ('period', 'item', 'metric')
+
+# 자주 쓰는 분류 컬럼 이름 → 영문 이름
+DIMENSION_NAMES = {
+    '행정구역별(1)': 'region',
+    '특성별(1)': 'characteristic',
+    '특성별(2)': 'detail',
+}
+
+
+# ============================================
+# 파싱
+# ============================================
+def _count_header_rows(values):
+    """첫 번째 분류 컬럼 이름이 반복되는 윗부분 = 헤더 행"""
+    first = values[0, 0]
+    count = 1
+    while count < len(values) and values[count, 0] == first:
+        count += 1
+    return count
+
+
+def _count_id_columns(header):
+    """모든 헤더 행의 값이 같은 앞쪽 컬럼 = 분류 컬럼 (나머지는 값 컬럼)"""
+    same = (header == header[0]).all(axis=0)
+    n_id = int(np.argmin(same)) if not same.all() else header.shape[1]
+    if n_id == 0 or n_id == header.shape[1]:
+        raise ValueError("KOSIS 헤더에서 분류 컬럼과 값 컬럼을 구분할 수 없습니다")
+    return n_id
+
+
+def _coerce_numbers(block):
+    """문자열 2차원 배열 → float 배열 (한 번에 변환, 숫자가 아니면 NaN)"""
+    flat = pd.Series(block.ravel()).str.replace(',', '', regex=False).str.strip()
+    return pd.to_numeric(flat, errors='coerce').to_numpy(dtype=float).reshape(block.shape)
+
+
+def _period_level(labels):
+    """시점 라벨이 모두 연도(4자리)면 int, 아니면 문자열 그대로"""
+    labels = pd.Index(labels)
+    if labels.str.fullmatch(r'\d{4}').all():
+        return labels.astype(int), 'year'
+    return labels, 'period'
+
+
+def read_kosis(path, header_rows=None, encoding='utf-8-sig', rename=DIMENSION_NAMES):
+    """
+    KOSIS CSV → wide DataFrame
+
+    Args:
+        path: CSV 경로
+        header_rows: 헤더 행 수 (None이면 자동 감지)
+        encoding: 파일 인코딩
+        rename: 분류 컬럼 이름 변경 {KOSIS 이름: 새 이름}
+
+    Returns:
+        DataFrame:
+            index: 분류 컬럼 MultiIndex (예: region, characteristic, detail)
+            columns: 헤더 MultiIndex (year 또는 period, item, metric)
+    """
+    raw = pd.read_csv(path, header=None, dtype=str, keep_default_na=False, encoding=encoding)
+    values = raw.to_numpy(dtype=object)
+
+    if header_rows is None:
+        header_rows = _count_header_rows(values)
+    header, body = values[:header_rows], values[header_rows:]
+    n_id = _count_id_columns(header)
+
+    id_names = [(rename or {}).get(name, name) for name in header[0, :n_id]]
+    index = pd.MultiIndex.from_arrays(
+        [pd.Index(body[:, i]).str.strip() for i in range(n_id)], names=id_names
+    )
+
+    level_names = list(HEADER_LEVELS[:header_rows]) + [
+        f'level_{i}' for i in range(len(HEADER_LEVELS), header_rows)
+    ]
+    levels = [pd.Index(header[i, n_id:]).str.strip() for i in range(header_rows)]
+    levels[0], level_names[0] = _period_level(levels[0])
+    columns = pd.MultiIndex.from_arrays(levels, names=level_names)
+
+    return pd.DataFrame(_coerce_numbers(body[:, n_id:]), index=index, columns=columns)
+
+
+# ============================================
+# wide ↔ long
+# ============================================
+def to_long(wide, value_name='value'):
+    """
+    wide → tidy long format (분류 컬럼, 헤더 레벨, value)
+
+    문자열 컬럼은 원래 순서를 유지하는 범주형으로 만듭니다.
+    """
+    n_rows, n_cols = wide.shape
+    columns = {}
+    for name in wide.index.names:
+        labels = wide.index.get_level_values(name)
+        columns[name] = np.repeat(labels, n_cols)
+    for name in wide.columns.names:
+        labels = wide.columns.get_level_values(name)
+        columns[name] = np.tile(labels, n_rows)
+    columns[value_name] = wide.to_numpy().ravel()
+
+    long = pd.DataFrame(columns)
+    for name in list(wide.index.names) + list(wide.columns.names):
+        if not pd.api.types.is_numeric_dtype(long[name]):
+            long[name] = pd.Categorical(long[name], categories=pd.unique(long[name]))
+    return long
+
+
+def _long_levels(long, value_name='value'):
+    """long format 컬럼 → (분류 컬럼, 헤더 레벨 컬럼)"""
+    header = {'year', 'period'} | set(HEADER_LEVELS)
+    levels = [c for c in long.columns
+              if c != value_name and (c in header or str(c).startswith('level_'))]
+    index = [c for c in long.columns if c != value_name and c not in levels]
+    return index, levels
+
+
+def _plain_levels(index):
+    """범주형 레벨 → 원래 값 타입 (read_kosis 결과와 같은 형태)"""
+    arrays = [index.get_level_values(i) for i in range(index.nlevels)]
+    arrays = [level.astype(level.categories.dtype) if isinstance(level, pd.CategoricalIndex)
+              else level for level in arrays]
+    return pd.MultiIndex.from_arrays(arrays, names=index.names)
+
+
+def to_wide(long, index, columns, value_name='value'):
+    """tidy long → wide (범주형 순서 유지)"""
+    wide = long.set_index(list(index) + list(columns))[value_name].unstack(list(columns))
+    wide.index = _plain_levels(wide.index)
+    wide.columns = _plain_levels(wide.columns)
+    return wide
+
+
+def flatten_columns(wide, sep='_', drop_levels=()):
+    """MultiIndex 컬럼 → '2019_원데이터' 형태 단일 컬럼 (drop_levels 레벨 제외)"""
+    columns = wide.columns.droplevel(list(drop_levels)) if drop_levels else wide.columns
+    flat = wide.copy()
+    flat.columns = [sep.join(str(part) for part in col) if isinstance(col, tuple) else str(col)
+                    for col in columns]
+    return flat
+
+
+# ============================================
+# 캐시
+# ============================================
+def _cache_path(path, cache_dir, header_rows, encoding):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        digest.update(f.read())
+    digest.update(f'{header_rows}|{encoding}|{CACHE_VERSION}'.encode())
+    suffix = 'parquet' if CACHE_FORMAT == 'parquet' else 'pkl'
+    return Path(cache_dir) / f'{Path(path).stem}.{digest.hexdigest()[:16]}.{suffix}'
+
+
+def load_kosis(path, layout='long', cache_dir=DEFAULT_CACHE_DIR, header_rows=None,
+               encoding='utf-8-sig'):
+    """
+    KOSIS CSV 로드 (파일 내용이 같으면 캐시 사용)
+
+    Args:
+        path: CSV 경로
+        layout: 'long' (tidy) 또는 'wide' (MultiIndex 컬럼)
+        cache_dir: 캐시 폴더 (None이면 캐시 사용 안 함)
+        header_rows: 헤더 행 수 (None이면 자동 감지)
+
+    Returns:
+        DataFrame
+    """
+    if layout not in ('long', 'wide'):
+        raise ValueError(f"layout은 'long' 또는 'wide'여야 합니다: {layout}")
+
+    cache_file = _cache_path(path, cache_dir, header_rows, encoding) if cache_dir else None
+    if cache_file is not None and cache_file.exists():
+        long = pd.read_parquet(cache_file) if CACHE_FORMAT == 'parquet' else pd.read_pickle(cache_file)
+        wide = None
+    else:
+        wide = read_kosis(path, header_rows, encoding)
+        long = to_long(wide)
+        if cache_file is not None:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            if CACHE_FORMAT == 'parquet':
+                long.to_parquet(cache_file, index=False)
+            else:
+                long.to_pickle(cache_file)
+
+    if layout == 'long':
+        return long
+    if wide is None:
+        index, columns = _long_levels(long)
+        wide = to_wide(long, index, columns)
+    return wide
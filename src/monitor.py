@@ -0,0 +1,385 @@
+# src/monitor.py
+"""
+트렌드 시계열 이상 감지 (스트리밍, 수집할 때마다 새 날짜만 처리)
+
+- 급등 / 급락(spike): 시계열별 robust 지수 가중 평균 / 분산 대비 z-점수가 기준 이상
+  (Huber 방식으로 잔차를 잘라 갱신 → 이상값 하나가 기준선을 끌어올리지 않음)
+- 수준 변화(shift): 잘라낸 z-점수의 양방향 CUSUM이 기준 이상 → 알림 후 기준선을 새 값으로 재설정
+- 상태: 시계열마다 숫자 몇 개 (평균, 분산, 관측 수, CUSUM 2개, 마지막 날짜와 그날 값)
+  → 새 날짜의 값마다 O(1), 모든 시계열을 numpy 연산 한 번으로 갱신, 실행 사이에는 .npz로 저장
+- 이미 처리한 날짜(마지막 날짜 이하)는 건너뜀 → 전체 이력이 든 수집 결과를 매번 넘겨도 새 날짜만 처리
+- DataLab 비율은 요청 기간의 최댓값을 100으로 맞춘 값 → 새 최댓값이 들어오면 이력 전체의 척도가 바뀜
+  → 수집 결과의 마지막 처리 날짜 값이 저장한 값과 다르면 그 비율로 기준선을 다시 맞춘 뒤 새 날짜 처리
+
+구조:
+    data/presentation/monitor/
+    ├── dataset_4.npz      # 시계열별 상태
+    └── alerts.csv         # 알림 기록 (추가만)
+
+사용:
+    monitor = TrendMonitor.load('data/presentation/monitor/dataset_4.npz')
+    alerts = monitor.process(df, key=['segment', 'keyword'])
+    monitor.save('data/presentation/monitor/dataset_4.npz')
+"""
+
+from pathlib import Path
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+
+from analysis.seasonal_stats import CALENDAR_COLUMNS
+
+STATE_VERSION = 2         # 2: 마지막 날짜의 값(anchor) 추가 (1은 anchor 없이 불러옴)
+ALERT_LOG = 'alerts.csv'
+ALERT_COLUMNS = ('source', 'date', 'series', 'value', 'expected', 'z', 'kind', 'direction')
+KEY_SEPARATOR = ' | '     # 여러 key 컬럼 → 시계열 이름 ('20대 여성 | 선크림')
+RESCALE_TOLERANCE = 1e-3  # 마지막 날짜 값의 상대 차이가 이보다 크면 척도가 바뀐 것으로 판단 (DataLab 소수 5자리)
+
+DEFAULT_PARAMS = {
+    'log': 1.0,           # 1이면 log1p 값으로 감지 (검색 비율의 변동은 수준에 비례), 0이면 원래 값
+    'halflife': 14.0,     # 기준선 지수 가중 반감기 (관측 수)
+    'trend': 0.2,         # 기울기 갱신 비율 (기준선 가중치 대비, 0이면 기울기 없음 → 계절 추세도 수준 변화로 잡힘)
+    'warmup': 14,         # 이 관측 수 전에는 기준선만 학습 (알림 없음)
+    'z_threshold': 4.0,   # 급등 / 급락 z-점수 기준
+    'clip': 2.0,          # 기준선 갱신 / CUSUM에 쓰는 잔차 z-점수 상한 (Huber)
+    'cusum_k': 0.5,       # CUSUM 허용 편차 (z 단위, 이보다 작은 변화는 누적 안 함)
+    'cusum_h': 8.0,       # CUSUM 기준 (z 단위 누적)
+    'min_scale': 0.02,    # 분산이 0에 가까운 시계열의 최소 표준편차 (log1p 단위 ≈ 2%, log=0이면 값 단위)
+}
+
+
+def _clipped_variance(c):
+    """표준정규 잔차를 ±c로 잘랐을 때의 분산 (잘라낸 잔차로 추정한 분산 보정)"""
+    normal = NormalDist()
+    tail = 1 - normal.cdf(c)
+    return (1 - 2 * tail) - 2 * c * normal.pdf(c) + 2 * c * c * tail
+
+
+def _days(dates):
+    """날짜 → 1970-01-01 기준 일 수 (int64)"""
+    return pd.DatetimeIndex(dates).to_numpy().astype('datetime64[D]').astype(np.int64)
+
+
+def _join_keys(frame, keys):
+    """key 컬럼들 → 행별 시계열 이름 (문자열 연결은 고유 조합마다 한 번만)"""
+    codes, uniques = zip(*(pd.factorize(frame[column], use_na_sentinel=False) for column in keys))
+    shape = [len(unique) for unique in uniques]
+    combos, inverse = np.unique(np.ravel_multi_index(codes, shape), return_inverse=True)
+    parts = [np.asarray(unique).astype(str)[code]
+             for unique, code in zip(uniques, np.unravel_index(combos, shape))]
+    labels = np.array([KEY_SEPARATOR.join(names) for names in zip(*parts)], dtype=object)
+    return pd.Series(labels[inverse], index=frame.index)
+
+
+def frame_series(frame, key='keyword', value='search_volume', date_col='date', columns=None):
+    """
+    수집 결과 → (날짜, 시계열 이름, 값) 배열 (long format)
+
+    Parameters:
+    - frame: long format (date, key 컬럼, value) 또는 key=None이면 wide format (date + 시계열별 컬럼)
+    - key: 시계열을 구분하는 컬럼 (여러 개면 KEY_SEPARATOR로 연결)
+    - columns: wide format에서 감시할 컬럼 (None이면 year / month를 뺀 숫자 컬럼)
+    """
+    if key is None:
+        if columns is None:
+            columns = [col for col in frame.select_dtypes(include='number').columns
+                       if col not in CALENDAR_COLUMNS and col != date_col]
+        frame = frame.melt(id_vars=[date_col], value_vars=list(columns), var_name='series',
+                           value_name='value')
+        names, values = frame['series'].astype(str), frame['value']
+    else:
+        keys = [key] if isinstance(key, str) else list(key)
+        names = _join_keys(frame, keys)
+        values = frame[value]
+    dates = pd.to_datetime(frame[date_col])
+    return dates.to_numpy(), names.to_numpy(dtype=object), pd.to_numeric(values, errors='coerce').to_numpy(float)
+
+
+class TrendMonitor:
+    """
+    시계열별 이상 감지 상태 (robust EWMA z-점수 + CUSUM)
+
+    Parameters:
+    - keys: 시계열 이름 목록
+    - params: DEFAULT_PARAMS 중 바꿀 값
+    """
+
+    def __init__(self, keys=(), **params):
+        unknown = set(params) - set(DEFAULT_PARAMS)
+        if unknown:
+            raise ValueError(f"알 수 없는 설정: {', '.join(sorted(unknown))} (사용 가능: {', '.join(DEFAULT_PARAMS)})")
+        self.params = {**DEFAULT_PARAMS, **params}
+        self.keys = []
+        self._index = {}
+        self.mean = np.zeros(0)
+        self.slope = np.zeros(0)
+        self.var = np.zeros(0)
+        self.count = np.zeros(0, dtype=np.int64)
+        self.pos = np.zeros(0)
+        self.neg = np.zeros(0)
+        self.last = np.zeros(0, dtype=np.int64)
+        self.anchor = np.zeros(0)
+        self.rescaled = np.zeros(0, dtype=np.int64)
+        self._add_keys(keys)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __repr__(self):
+        return f'TrendMonitor(시계열 {len(self):,}개)'
+
+    def _add_keys(self, keys):
+        new = [key for key in dict.fromkeys(keys) if key not in self._index]
+        if not new:
+            return
+        for key in new:
+            self._index[key] = len(self.keys)
+            self.keys.append(key)
+        pad = len(new)
+        self.mean = np.concatenate([self.mean, np.zeros(pad)])
+        self.slope = np.concatenate([self.slope, np.zeros(pad)])
+        self.var = np.concatenate([self.var, np.zeros(pad)])
+        self.count = np.concatenate([self.count, np.zeros(pad, dtype=np.int64)])
+        self.pos = np.concatenate([self.pos, np.zeros(pad)])
+        self.neg = np.concatenate([self.neg, np.zeros(pad)])
+        self.last = np.concatenate([self.last, np.full(pad, np.iinfo(np.int64).min)])
+        self.anchor = np.concatenate([self.anchor, np.full(pad, np.nan)])
+
+    def indices(self, keys):
+        """시계열 이름 → 상태 배열 위치 (처음 보는 시계열은 추가)"""
+        codes, unique = pd.factorize(np.asarray(keys, dtype=object))
+        self._add_keys(unique)
+        positions = np.fromiter((self._index[key] for key in unique), dtype=np.int64, count=len(unique))
+        return positions[codes]
+
+    # ------------------------------------------
+    # 갱신
+    # ------------------------------------------
+    def update(self, day, idx, values):
+        """
+        하루치 값으로 상태 갱신 (시계열 수만큼의 numpy 연산, 시계열마다 O(1))
+
+        Parameters:
+        - day: 날짜 (1970-01-01 기준 일 수)
+        - idx: 시계열 위치 (indices 결과, 중복 없음)
+        - values: 값 (NaN은 건너뜀)
+
+        Returns:
+            dict: idx, value, expected (원래 값 단위), z, spike, shift (알림 판정 배열, 관측 순서)
+        """
+        p = self.params
+        valid = ~np.isnan(values)
+        idx, raw = idx[valid], values[valid]
+        values = np.log1p(np.clip(raw, 0, None)) if p['log'] else raw
+
+        level, slope, var, count = self.mean[idx], self.slope[idx], self.var[idx], self.count[idx]
+        expected = level + slope
+        scale = np.maximum(np.sqrt(var), p['min_scale'])
+        residual = values - expected
+        z = residual / scale
+        ready = count >= p['warmup']
+
+        # 급등 / 급락
+        spike = ready & (np.abs(z) >= p['z_threshold'])
+
+        # 수준 변화 (CUSUM, 준비 전에는 누적 안 함)
+        zc = np.where(ready, np.clip(z, -p['clip'], p['clip']), 0.0)
+        pos = np.maximum(0.0, self.pos[idx] + zc - p['cusum_k'])
+        neg = np.maximum(0.0, self.neg[idx] - zc - p['cusum_k'])
+        shift = np.where(pos > p['cusum_h'], 1, np.where(neg > p['cusum_h'], -1, 0))
+
+        # 기준선: 준비 중에는 누적 평균 / 분산, 이후에는 잔차를 잘라 지수 가중 갱신 (수준 + 기울기)
+        # (잘린 잔차의 제곱 평균은 분산보다 작으므로 정규분포 기준으로 보정)
+        weight = np.where(ready, 1 - 0.5 ** (1 / p['halflife']), 1 / (count + 1))
+        bounded = np.where(ready, np.clip(residual, -p['clip'] * scale, p['clip'] * scale), residual)
+        new_mean = expected + weight * bounded
+        new_slope = np.where(ready, slope + p['trend'] * weight * bounded, 0.0)
+        new_var = np.where(ready,
+                           (1 - weight) * var + weight * bounded ** 2 / _clipped_variance(p['clip']),
+                           var + (residual * (values - new_mean) - var) / (count + 1))
+
+        # 수준 변화가 확인되면 기준선을 새 값으로 옮기고 누적 초기화
+        moved = shift != 0
+        new_mean[moved] = values[moved]
+        new_slope[moved] = 0.0
+        pos[moved] = 0.0
+        neg[moved] = 0.0
+
+        self.mean[idx] = new_mean
+        self.slope[idx] = new_slope
+        self.var[idx] = new_var
+        self.count[idx] = count + 1
+        self.pos[idx] = pos
+        self.neg[idx] = neg
+        self.last[idx] = day
+        self.anchor[idx] = raw
+        if p['log']:
+            expected = np.expm1(expected)
+        return {'idx': idx, 'value': raw, 'expected': expected, 'z': z, 'spike': spike, 'shift': shift}
+
+    def rescale(self, idx, factor):
+        """
+        값의 척도가 factor배로 바뀐 시계열의 기준선 / 분산 변환 (CUSUM은 z 단위라 그대로)
+
+        log 모드는 기준선을 log1p(factor · 값)으로 옮기고, 기울기 / 분산은 그 점의 기울기(미분)로 변환
+        """
+        if self.params['log']:
+            level = np.expm1(self.mean[idx])
+            gain = factor * (1 + level) / (1 + factor * level)
+            self.mean[idx] = np.log1p(factor * level)
+        else:
+            gain = factor
+            self.mean[idx] *= factor
+        self.slope[idx] *= gain
+        self.var[idx] *= gain ** 2
+        self.anchor[idx] *= factor
+
+    def _align_scale(self, days, idx, values):
+        """
+        마지막 처리 날짜의 새 값 / 저장한 값이 1이 아닌 시계열을 그 비율로 rescale
+
+        Returns:
+            ndarray: rescale한 시계열 위치
+        """
+        at = (days == self.last[idx]) & (values > 0) & (self.anchor[idx] > 0)
+        factor = np.ones(len(self))
+        factor[idx[at]] = values[at] / self.anchor[idx[at]]
+        moved = np.flatnonzero(np.abs(factor - 1) > RESCALE_TOLERANCE)
+        if len(moved):
+            self.rescale(moved, factor[moved])
+        return moved
+
+    def process(self, frame, key='keyword', value='search_volume', date_col='date', columns=None):
+        """
+        수집 결과에서 시계열별 마지막 처리 날짜 이후 값만 날짜순으로 갱신
+
+        Parameters:
+        - frame, key, value, date_col, columns: frame_series 인자
+
+        Returns:
+            DataFrame: date, series, value, expected (갱신 전 기준선), z,
+            kind ('spike' / 'shift'), direction ('up' / 'down')
+            (척도가 바뀌어 rescale한 시계열 위치는 self.rescaled)
+        """
+        dates, names, values = frame_series(frame, key, value, date_col, columns)
+        days = _days(dates)
+        idx = self.indices(names)
+        self.rescaled = self._align_scale(days, idx, values)
+
+        # 이미 처리한 날짜는 시계열별로 제외 (새 시계열은 last가 최솟값이라 전체 이력 처리)
+        fresh = days > self.last[idx]
+        days, idx, values = days[fresh], idx[fresh], values[fresh]
+        order = np.lexsort((idx, days))
+        days, idx, values = days[order], idx[order], values[order]
+        # 같은 날짜 · 시계열이 여러 번 있으면 마지막 값
+        keep = np.ones(len(days), dtype=bool)
+        keep[:-1] = (days[1:] != days[:-1]) | (idx[1:] != idx[:-1])
+        days, idx, values = days[keep], idx[keep], values[keep]
+
+        alerts = []
+        bounds = np.flatnonzero(np.diff(days)) + 1
+        starts = np.concatenate(([0], bounds)) if len(days) else []
+        for start, stop in zip(starts, np.concatenate((bounds, [len(days)]))):
+            result = self.update(days[start], idx[start:stop], values[start:stop])
+            for kind, flags in (('spike', result['spike']), ('shift', result['shift'] != 0)):
+                hits = np.flatnonzero(flags)
+                if len(hits):
+                    alerts.append(pd.DataFrame({
+                        'day': days[start],
+                        'idx': result['idx'][hits],
+                        'value': result['value'][hits],
+                        'expected': result['expected'][hits],
+                        'z': result['z'][hits],
+                        'kind': kind,
+                    }))
+
+        # 알림이 없어도 같은 dtype의 빈 프레임 (이어 붙이기 / 날짜 연산이 그대로 동작)
+        alerts = pd.concat(alerts, ignore_index=True) if alerts else pd.DataFrame({
+            'day': np.zeros(0, dtype=np.int64), 'idx': np.zeros(0, dtype=np.int64),
+            'value': np.zeros(0), 'expected': np.zeros(0), 'z': np.zeros(0), 'kind': np.zeros(0, dtype=str),
+        })
+        return pd.DataFrame({
+            'date': pd.to_datetime(alerts['day'].to_numpy().astype('datetime64[D]')),
+            'series': np.asarray(self.keys, dtype=object)[alerts['idx'].to_numpy()],
+            'value': alerts['value'],
+            'expected': alerts['expected'],
+            'z': alerts['z'],
+            'kind': alerts['kind'],
+            'direction': np.where(alerts['z'] >= 0, 'up', 'down'),
+        }).astype({'series': str, 'kind': str, 'direction': str})
+
+    # ------------------------------------------
+    # 저장 / 불러오기
+    # ------------------------------------------
+    def save(self, path):
+        """상태 .npz 저장 (임시 파일에 쓴 뒤 교체)"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f'.{path.stem}.tmp.npz')
+        np.savez_compressed(
+            tmp, version=STATE_VERSION, keys=np.array(self.keys, dtype=str),
+            mean=self.mean, slope=self.slope, var=self.var, count=self.count, pos=self.pos, neg=self.neg, last=self.last,
+            anchor=self.anchor,
+            params=np.array([self.params[name] for name in DEFAULT_PARAMS], dtype=float))
+        tmp.replace(path)
+        return path
+
+    @classmethod
+    def load(cls, path, **params):
+        """
+        저장한 상태 읽기 (파일이 없으면 빈 상태)
+
+        Parameters:
+        - params: 바꿀 설정 (없으면 저장할 때의 설정)
+        """
+        path = Path(path)
+        if not path.exists():
+            return cls(**params)
+        with np.load(path) as data:
+            if int(data['version']) not in (1, STATE_VERSION):
+                raise ValueError(f"지원하지 않는 감지 상태 버전: {int(data['version'])} ({path})")
+            saved = {name: float(v) for name, v in zip(DEFAULT_PARAMS, data['params'])}
+            saved['warmup'] = int(saved['warmup'])
+            monitor = cls(data['keys'].tolist(), **{**saved, **params})
+            for name in ('mean', 'slope', 'var', 'count', 'pos', 'neg', 'last', 'anchor'):
+                if name in data:
+                    setattr(monitor, name, data[name].copy())
+        return monitor
+
+
+# ============================================
+# 수집 결과 연동
+# ============================================
+def append_alerts(alerts, path, source):
+    """알림을 CSV 기록에 추가 (source: 데이터셋 이름)"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    rows = alerts.assign(source=source)[list(ALERT_COLUMNS)]
+    new_file = not path.exists()
+    rows.to_csv(path, mode='a', header=new_file, index=False,
+                encoding='utf-8-sig' if new_file else 'utf-8')   # 엑셀 호환 BOM은 처음 한 번만
+    return path
+
+
+def monitor_frame(frame, state_path, source, key='keyword', value='search_volume', date_col='date',
+                  columns=None, log_path=None, **params):
+    """
+    수집 결과 하나로 감지 실행: 상태 불러오기 → 새 날짜 처리 → 상태 저장 → 알림 기록
+
+    Parameters:
+    - frame, key, value, date_col, columns: frame_series 인자
+    - state_path: 상태 파일 (.npz)
+    - source: 알림 기록에 남길 이름 (예: 'dataset_4')
+    - log_path: 알림 기록 CSV (None이면 상태 파일과 같은 폴더의 alerts.csv)
+
+    Returns:
+        DataFrame: 새 알림 (TrendMonitor.process 결과)
+    """
+    state_path = Path(state_path)
+    monitor = TrendMonitor.load(state_path, **params)
+    alerts = monitor.process(frame, key, value, date_col, columns)
+    monitor.save(state_path)
+    if len(alerts):
+        append_alerts(alerts, log_path or state_path.parent / ALERT_LOG, source)
+    return alerts
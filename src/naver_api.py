@@ -1,17 +1,32 @@
 # src/naver_api.py
-import requests
-import json
+import numpy as np
 import pandas as pd
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
+import contextlib
+import hashlib
+import json
+import os
 import sys
+import threading
+import time
 from pathlib import Path
 
+try:
+    import fcntl      # 사용량 파일 잠금 (POSIX, 없으면 잠금 없이 합치기만)
+except ImportError:
+    fcntl = None
+
 # ============================================
 # 임포트 처리 (직접 실행 vs 패키지 임포트)
 # ============================================
 try:
     # 패키지로 임포트될 때
-    from . import NAVER_CLIENT_ID, NAVER_CLIENT_SECRET
+    from . import NAVER_CLIENT_ID, NAVER_CLIENT_SECRET, NAVER_CREDENTIALS
+    from .api_codec import (
+        dumps, loads, trend_series, decode_trend, decode_items, SHOP_FIELDS, BLOG_FIELDS
+    )
+    from . import transport
 except ImportError:
     # 직접 실행될 때
     current_dir = Path(__file__).resolve().parent
@@ -20,19 +35,587 @@ except ImportError:
     if str(project_root) not in sys.path:
         sys.path.insert(0, str(project_root))
     
-    from config import NAVER_CLIENT_ID, NAVER_CLIENT_SECRET
+    from config import NAVER_CLIENT_ID, NAVER_CLIENT_SECRET, NAVER_CREDENTIALS
+    from api_codec import (
+        dumps, loads, trend_series, decode_trend, decode_items, SHOP_FIELDS, BLOG_FIELDS
+    )
+    import transport
+
+
+# ============================================
+# 요청 (속도 제한 / 응답 캐시)
+# ============================================
+class RateLimiter:
+    """
+    초당 요청 수 제한 (토큰 버킷, 스레드 안전)
+
+    여러 클라이언트 / 스레드가 같은 인스턴스를 공유하면 전체 요청 속도가 rate 이하로 유지됩니다.
+    기본 초당 3회 (수집 스크립트의 요청 간 0.3초 대기와 같은 수준)
+    """
+
+    def __init__(self, rate=3.0, burst=1):
+        if rate <= 0 or burst < 1:
+            raise ValueError(f"잘못된 속도 제한: rate={rate}, burst={burst}")
+        self.rate = float(rate)
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wait(self):
+        """토큰이 생길 때까지 대기 후 하나 사용"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+
+
+def request_key(method, url, params=None, data=None):
+    """요청 식별 키 (메서드 + URL + 정렬한 파라미터 + 바디의 sha256)"""
+    digest = hashlib.sha256(f'{method} {url}'.encode())
+    if params:
+        digest.update(dumps(sorted(params.items())))
+    if data:
+        digest.update(data if isinstance(data, bytes) else data.encode())
+    return digest.hexdigest()
+
+
+class SingleFlight:
+    """
+    동시에 들어온 같은 요청을 네트워크 호출 한 번으로 합침 (스레드 안전)
+
+    같은 키의 호출이 진행 중이면 새로 요청하지 않고 그 결과(또는 예외)를 함께 받습니다.
+    호출이 끝나면 키를 지우므로, 이후의 같은 요청은 다시 호출됩니다 (재사용은 ResponseCache 담당).
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+        self.calls = 0    # 실제 호출 수
+        self.shared = 0   # 진행 중인 호출 결과를 공유받은 수
+
+    def do(self, key, func):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = {'done': threading.Event(), 'result': None, 'error': None}
+                self.calls += 1
+            else:
+                self.shared += 1
+
+        if not leader:
+            call['done'].wait()
+            if call['error'] is not None:
+                raise call['error']
+            return call['result']
+
+        try:
+            call['result'] = func()
+            return call['result']
+        except Exception as e:
+            call['error'] = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call['done'].set()
+
+
+# 기본값: 프로세스 전체에서 공유 (클라이언트 인스턴스가 달라도 같은 요청은 합쳐짐)
+SINGLE_FLIGHT = SingleFlight()
+
+
+class ResponseCache:
+    """
+    API 응답 디스크 캐시 (요청 URL + 파라미터/바디의 sha256 → 응답 bytes)
+
+    ttl 초가 지난 응답은 다시 요청합니다 (None이면 만료 없음).
+    """
+
+    def __init__(self, directory, ttl=None):
+        self.directory = Path(directory)
+        self.ttl = ttl
+
+    def key(self, method, url, params=None, data=None):
+        return request_key(method, url, params, data)
+
+    def _path(self, key):
+        return self.directory / key[:2] / f'{key}.json'
+
+    def get(self, key):
+        path = self._path(key)
+        if not path.exists():
+            return None
+        if self.ttl is not None and time.time() - path.stat().st_mtime > self.ttl:
+            return None
+        return path.read_bytes()
+
+    def set(self, key, content):
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f'.{threading.get_ident()}.tmp')
+        tmp.write_bytes(content)
+        tmp.replace(path)
+
+
+# ============================================
+# API 키 풀 (키별 일일 한도 분산)
+# ============================================
+DATALAB_DAILY_LIMIT = 1000    # DataLab 검색어 트렌드: 키당 하루 1,000회
+SEARCH_DAILY_LIMIT = 25000    # 검색 API (쇼핑 / 블로그): 키당 하루 25,000회
+QUOTA_ERROR_CODES = ('010',)  # 429 응답 중 일일 한도 초과 (그 외 429는 일시적 속도 제한)
+KST = timezone(timedelta(hours=9))  # 한도 초기화 기준 (자정, 한국 시간)
+
+
+class KeyPoolExhausted(Exception):
+    """모든 API 키가 일일 한도를 소진함 (초기화 시각까지 요청 불가)"""
+
+
+class _PoolKey:
+    """키 하나의 사용량 / 상태"""
+
+    def __init__(self, client_id, client_secret, rate=None):
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.rate_limiter = RateLimiter(rate) if rate else None
+        self.used = 0
+        self.saved = 0            # 마지막으로 상태 파일과 합친 시점의 used (이후 증가분만 더함)
+        self.throttled_until = 0.0
+        self.exhausted_until = 0.0
+
+    @property
+    def label(self):
+        """로그용 마스킹 ID"""
+        return f'{self.client_id[:4]}…' if len(self.client_id) > 4 else self.client_id
+
+    def headers(self, headers):
+        return {**headers, 'X-Naver-Client-Id': self.client_id,
+                'X-Naver-Client-Secret': self.client_secret}
+
+
+@contextlib.contextmanager
+def _locked(path):
+    """프로세스 간 배타 잠금 (잠금 파일 flock, fcntl이 없으면 잠금 없음)"""
+    with open(path, 'a') as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def _today():
+    return datetime.now(KST).date().isoformat()
+
+
+def _next_reset():
+    """다음 한도 초기화 시각 (한국 시간 자정, epoch 초)"""
+    tomorrow = datetime.now(KST).date() + timedelta(days=1)
+    return datetime(tomorrow.year, tomorrow.month, tomorrow.day, tzinfo=KST).timestamp()
+
+
+class KeyPool:
+    """
+    여러 애플리케이션 키를 번갈아 사용하는 키 풀 (스레드 안전)
+
+    - 요청마다 사용 가능한 다음 키 선택 (라운드 로빈)
+    - 키별 사용량 기록, daily_limit에 도달하거나 한도 초과(429, 010) 응답을 받으면
+      다음 초기화 시각(한국 시간 자정)까지 제외
+    - 일시적 속도 제한(그 외 429)은 cooldown 초 동안 제외
+    - 여러 클라이언트 / 스레드가 하나의 풀을 공유 → 전체 처리량 ≈ 키 수 × 키당 한도
+    - state_path를 지정하면 사용량을 JSON으로 저장 (예약 작업 간 당일 사용량 유지)
+    """
+
+    def __init__(self, credentials, daily_limit=DATALAB_DAILY_LIMIT, rate=None, cooldown=60.0,
+                 state_path=None):
+        """
+        Parameters:
+        - credentials: [(client_id, client_secret), ...]
+        - daily_limit: 키당 하루 요청 수 (None이면 429 응답으로만 판단)
+        - rate: 키당 초당 요청 수 (None이면 제한 없음)
+        - cooldown: 일시적 속도 제한(429) 후 제외 시간 (초)
+        - state_path: 사용량 저장 파일 (None이면 저장 안 함)
+        """
+        credentials = list(dict.fromkeys(tuple(c) for c in credentials))
+        if not credentials:
+            raise ValueError("API 키가 하나 이상 필요합니다")
+
+        self.daily_limit = daily_limit
+        self.cooldown = cooldown
+        self.state_path = Path(state_path) if state_path else None
+        self.max_attempts = 3 * len(credentials)
+        self._keys = [_PoolKey(client_id, secret, rate) for client_id, secret in credentials]
+        self._next = 0
+        self._day = _today()
+        self._lock = threading.Lock()
+        self._load_state()
+
+    def __len__(self):
+        return len(self._keys)
+
+    # 상태 저장 / 복원 ----------------------------------------------
+    def _read_state(self):
+        """저장된 오늘 사용량 {client_id: {'used', 'exhausted_until'}} (없거나 다른 날이면 빈 dict)"""
+        if self.state_path is None or not self.state_path.exists():
+            return {}
+        with open(self.state_path, encoding='utf-8') as f:
+            state = json.load(f)
+        return state['keys'] if state.get('day') == self._day else {}
+
+    def _load_state(self):
+        saved = self._read_state()
+        for key in self._keys:
+            entry = saved.get(key.client_id)
+            if entry:
+                key.used = key.saved = entry['used']
+                key.exhausted_until = entry['exhausted_until']
+
+    def _save_state(self):
+        """
+        사용량 저장 (같은 파일을 쓰는 다른 프로세스와 합침)
+
+        파일 잠금 안에서 다시 읽어, 키마다 저장된 사용량에 이 프로세스의 미저장 증가분을 더하고
+        exhausted_until은 큰 값 → 다른 프로세스의 사용량 / 한도 소진도 이 풀에 반영
+        """
+        if self.state_path is None:
+            return
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        with _locked(self.state_path.with_name(f'{self.state_path.name}.lock')):
+            saved = self._read_state()
+            for key in self._keys:
+                entry = saved.get(key.client_id)
+                if entry:
+                    key.used = max(key.used, entry['used'] + key.used - key.saved)
+                    key.exhausted_until = max(key.exhausted_until, entry['exhausted_until'])
+                    if self.daily_limit is not None and key.used >= self.daily_limit:
+                        key.exhausted_until = max(key.exhausted_until, _next_reset())
+                key.saved = key.used
+                saved[key.client_id] = {'used': key.used, 'exhausted_until': key.exhausted_until}
+
+            tmp = self.state_path.with_name(f'.{self.state_path.name}.{os.getpid()}.tmp')
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump({'day': self._day, 'keys': saved}, f)
+            tmp.replace(self.state_path)
+
+    def _roll_day(self):
+        """날짜가 바뀌면 사용량 초기화"""
+        today = _today()
+        if today != self._day:
+            self._day = today
+            for key in self._keys:
+                key.used = key.saved = 0
+                key.exhausted_until = 0.0
+
+    # 키 선택 / 결과 보고 --------------------------------------------
+    def acquire(self):
+        """
+        요청에 사용할 키 선택 (사용량 1 증가)
+
+        모든 키가 일시적 속도 제한이면 가장 먼저 풀리는 키까지 대기,
+        모든 키가 일일 한도 소진이면 KeyPoolExhausted
+        """
+        while True:
+            with self._lock:
+                self._roll_day()
+                now = time.time()
+                n = len(self._keys)
+                for offset in range(n):
+                    key = self._keys[(self._next + offset) % n]
+                    if key.exhausted_until <= now and key.throttled_until <= now:
+                        self._next = (self._next + offset + 1) % n
+                        key.used += 1
+                        if self.daily_limit is not None and key.used >= self.daily_limit:
+                            key.exhausted_until = _next_reset()
+                        self._save_state()
+                        break
+                else:
+                    waiting = [key.throttled_until for key in self._keys if key.exhausted_until <= now]
+                    if not waiting:
+                        reset = datetime.fromtimestamp(min(k.exhausted_until for k in self._keys), KST)
+                        raise KeyPoolExhausted(
+                            f"모든 API 키({n}개)의 일일 한도 소진 (초기화: {reset:%Y-%m-%d %H:%M} KST)"
+                        )
+                    key = None
+                    delay = min(waiting) - now
+            if key is not None:
+                break
+            time.sleep(max(delay, 0.01))
+
+        if key.rate_limiter is not None:
+            key.rate_limiter.wait()
+        return key
+
+    def report(self, key, status_code, content=b''):
+        """응답 상태 보고 (429면 키를 한도 소진 또는 일시 제한으로 표시)"""
+        if status_code != 429:
+            return
+        try:
+            code = str(loads(content).get('errorCode', ''))
+        except Exception:
+            code = ''
+        with self._lock:
+            if code in QUOTA_ERROR_CODES:
+                key.exhausted_until = _next_reset()
+            else:
+                key.throttled_until = time.time() + self.cooldown
+            self._save_state()
+
+    def stats(self):
+        """
+        키별 사용 현황
+
+        Returns:
+            list: [{'key': 마스킹 ID, 'used': 사용량, 'remaining': 남은 횟수, 'status': 상태}, ...]
+        """
+        with self._lock:
+            self._roll_day()
+            now = time.time()
+            rows = []
+            for key in self._keys:
+                if key.exhausted_until > now:
+                    status = 'exhausted'
+                elif key.throttled_until > now:
+                    status = 'throttled'
+                else:
+                    status = 'active'
+                remaining = None if self.daily_limit is None else max(self.daily_limit - key.used, 0)
+                rows.append({'key': key.label, 'used': key.used, 'remaining': remaining,
+                             'status': status})
+            return rows
+
+
+def _request(method, url, headers, rate_limiter=None, params=None, data=None, key_pool=None):
+    """API 요청 1회 (key_pool이 있으면 429 시 다른 키로 재시도) → 응답 bytes"""
+    if transport.is_replay():
+        # 카세트 재생: 키 사용량 / 속도 제한 적용 안 함
+        rate_limiter = key_pool = None
+    attempts = key_pool.max_attempts if key_pool is not None else 1
+    for _ in range(attempts):
+        credential = key_pool.acquire() if key_pool is not None else None
+        if rate_limiter is not None:
+            rate_limiter.wait()
+        response = transport.request(
+            method, url, headers=credential.headers(headers) if credential else headers,
+            params=params, data=data
+        )
+        if credential is not None:
+            key_pool.report(credential, response.status_code, response.content)
+            if response.status_code == 429:
+                continue
+        break
+
+    if response.status_code != 200:
+        raise Exception(f"API 오류 {response.status_code}: {response.text}")
+    return response.content
+
+
+def _fetch(method, url, headers, rate_limiter=None, cache=None, params=None, data=None,
+           key_pool=None, single_flight=SINGLE_FLIGHT):
+    """
+    API 요청 → 응답 bytes (캐시에 있으면 요청하지 않음)
+
+    key_pool이 있으면 요청마다 풀에서 키를 골라 인증 헤더를 바꾸고,
+    429(한도 초과 / 속도 제한)면 다른 키로 다시 요청합니다.
+    single_flight가 있으면 동시에 진행 중인 같은 요청과 결과를 공유합니다.
+    200이 아니면 Exception (기존 메시지 형식 유지)
+    """
+    key = request_key(method, url, params, data)
+
+    def load():
+        if cache is not None:
+            content = cache.get(key)
+            if content is not None:
+                return content
+        content = _request(method, url, headers, rate_limiter, params, data, key_pool)
+        if cache is not None:
+            cache.set(key, content)
+        return content
+
+    if single_flight is None:
+        return load()
+    return single_flight.do(key, load)
+
+
+# ============================================
+# 일별 수집 (기간 분할 + 척도 연결)
+# ============================================
+MAX_KEYWORD_GROUPS = 5   # DataLab 요청당 최대 키워드 그룹 수
+
+
+def _date_windows(start_date, end_date, window_days, overlap_days):
+    """
+    [start_date, end_date] 기간을 overlap_days만큼 겹치는 구간으로 분할
+
+    Returns:
+        list: [(구간 시작, 구간 끝), ...] (numpy datetime64[D])
+    """
+    if window_days < 1 or not 0 < overlap_days < window_days:
+        raise ValueError(f"잘못된 구간 설정: window_days={window_days}, overlap_days={overlap_days} "
+                         f"(0 < overlap_days < window_days)")
+
+    start = np.datetime64(start_date, 'D')
+    end = np.datetime64(end_date, 'D')
+    if end < start:
+        raise ValueError(f"종료일이 시작일보다 빠릅니다: {start_date} ~ {end_date}")
+
+    windows = []
+    window_start = start
+    while True:
+        window_end = min(window_start + window_days - 1, end)
+        windows.append((window_start, window_end))
+        if window_end >= end:
+            return windows
+        window_start = window_start + (window_days - overlap_days)
+
+
+def _trend_matrix(series, dates=None, dtype=np.float64, fill_value=np.nan):
+    """
+    DataLab 결과 → 날짜 × 키워드 배열
+
+    키워드별 dict나 날짜 문자열 집합을 만들지 않고, period 문자열을 datetime64로 한 번에 변환해
+    날짜 인덱스 위치(searchsorted)에 바로 배치합니다.
+
+    Args:
+        series: TrendSeries 목록 (api_codec.trend_series / decode_trend 결과)
+        dates: 정렬된 datetime64[D] 날짜 인덱스 (None이면 응답 날짜의 합집합)
+               지정 시 응답의 모든 period를 포함해야 함
+        dtype: 값 배열 dtype
+        fill_value: 응답에 없는 날짜의 값 (기본 NaN — 검색량 0과 구분)
+
+    Returns:
+        tuple: (dates, keywords, values) — values는 (날짜 수, 키워드 수)
+    """
+    keywords = [item.title for item in series]
+    periods = [np.array(item.periods, dtype='datetime64[D]') for item in series]
+
+    if dates is None:
+        dates = np.unique(np.concatenate(periods)) if periods else np.array([], dtype='datetime64[D]')
+
+    values = np.full((len(dates), len(keywords)), fill_value, dtype=dtype)
+    for j, (item, period) in enumerate(zip(series, periods)):
+        if len(period):
+            values[np.searchsorted(dates, period), j] = item.ratios
+
+    return dates, keywords, values
+
+
+def _as_series(api_response):
+    """get_search_trend 결과 (dict 또는 TrendSeries 목록) → TrendSeries 목록"""
+    if isinstance(api_response, dict):
+        return trend_series(api_response)
+    return api_response
+
+
+def _overlap_factor(reference, values):
+    """겹치는 날짜의 합 비율 (reference / values) — 계산 불가 시 None"""
+    both = ~np.isnan(reference) & ~np.isnan(values)
+    denominator = values[both].sum()
+    if denominator <= 0:
+        return None
+    return reference[both].sum() / denominator
+
+
+def _stitch_windows(windows, matrices, start, n_days):
+    """
+    구간별 결과를 겹치는 날짜 기준으로 하나의 척도로 연결
+
+    DataLab은 요청마다 구간 내 최댓값을 100으로 정규화하므로,
+    각 구간에 (앞 구간까지 연결된 값 / 이번 구간 값)의 겹침 구간 합 비율을 곱해 이어 붙입니다.
+    """
+    stitched = np.full((n_days, matrices[0].shape[1]), np.nan)
+    filled = 0   # 이미 채운 날짜 수
+
+    for (window_start, _), values in zip(windows, matrices):
+        offset = int((window_start - start).astype(np.int64))
+        overlap = max(filled - offset, 0)
+
+        factor = 1.0
+        if overlap:
+            factor = _overlap_factor(stitched[offset:filled], values[:overlap])
+            if factor is None:
+                print(f"   ⚠️ {window_start} 구간: 겹치는 기간 검색량이 0이라 척도 보정 생략")
+                factor = 1.0
+
+        stitched[filled:offset + len(values)] = values[overlap:] * factor
+        filled = max(filled, offset + len(values))
+
+    return stitched
+
+
+# ============================================
+# 요청 정규화 (같은 의미의 요청 → 같은 바디 / 캐시 키)
+# ============================================
+def _normalize_ages(ages):
+    """연령 코드 중복 제거 + 숫자 순 정렬 (['4', '3', 3] → ['3', '4'])"""
+    return sorted({str(age).strip() for age in ages}, key=int)
+
+
+def _trend_body(keywords, start_date, end_date, time_unit, device, gender, ages):
+    """
+    DataLab 요청 바디 (정규화)
+
+    키워드 그룹은 중복 제거 후 이름순 — DataLab 비율은 요청 내 전체 그룹 기준이라
+    그룹 순서와 무관하므로, 순서만 다른 요청도 같은 바디가 됩니다 (결과는 _reorder_trend로 복원).
+    """
+    body = {
+        "startDate": start_date,
+        "endDate": end_date,
+        "timeUnit": time_unit,
+        "keywordGroups": [
+            {"groupName": keyword, "keywords": [keyword]} for keyword in sorted(set(keywords))
+        ]
+    }
+    
+    # 선택 파라미터
+    if device:
+        body["device"] = device.lower()
+    if gender:
+        body["gender"] = gender.lower()
+    if ages:
+        body["ages"] = _normalize_ages(ages)
+    return body
+
+
+def _reorder_trend(result, keywords):
+    """정규화한 요청 결과 → 요청한 키워드 순서 (dict 또는 TrendSeries 목록)"""
+    if isinstance(result, dict):
+        by_title = {item['title']: item for item in result.get('results', [])}
+        ordered = [by_title[keyword] for keyword in keywords if keyword in by_title]
+        return {**result, 'results': ordered}
+    by_title = {item.title: item for item in result}
+    return [by_title[keyword] for keyword in keywords if keyword in by_title]
 
 
 class NaverDataLab:
     """네이버 데이터랩 API"""
     
-    def __init__(self):
+    def __init__(self, rate_limiter=None, cache=None, key_pool=None, single_flight=SINGLE_FLIGHT):
+        """
+        Parameters:
+        - rate_limiter: RateLimiter (여러 클라이언트가 공유하면 전체 속도 제한)
+        - cache: ResponseCache (같은 요청은 디스크 응답 재사용)
+        - key_pool: KeyPool (여러 키를 번갈아 사용, 없으면 config의 단일 키)
+        - single_flight: SingleFlight (동시에 진행 중인 같은 요청 합치기, None이면 사용 안 함)
+        """
         self.client_id = NAVER_CLIENT_ID
         self.client_secret = NAVER_CLIENT_SECRET
         self.url = "https://openapi.naver.com/v1/datalab/search"
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.key_pool = key_pool
+        self.single_flight = single_flight
     
     def get_search_trend(self, keywords, start_date, end_date, 
-                         time_unit='month', device='', gender='', ages=[]):
+                         time_unit='month', device='', gender='', ages=[], columnar=False):
         """
         검색 트렌드 조회
         
@@ -44,31 +627,11 @@ class NaverDataLab:
         - device: '', 'pc', 'mo'
         - gender: '', 'm', 'f'
         - ages: [] or ['1','2'] ~ ['11']
+        - columnar: True면 dict 대신 TrendSeries 목록 반환 (to_frame / to_dataframe 입력으로 사용)
         """
         
-        # 키워드 그룹 생성
-        keyword_groups = []
-        for keyword in keywords:
-            keyword_groups.append({
-                "groupName": keyword,
-                "keywords": [keyword]
-            })
-        
-        # 요청 바디
-        body = {
-            "startDate": start_date,
-            "endDate": end_date,
-            "timeUnit": time_unit,
-            "keywordGroups": keyword_groups
-        }
-        
-        # 선택 파라미터
-        if device:
-            body["device"] = device
-        if gender:
-            body["gender"] = gender
-        if ages:
-            body["ages"] = ages
+        # 요청 바디 (정규화: 키워드 / 연령 순서가 달라도 같은 요청)
+        body = _trend_body(keywords, start_date, end_date, time_unit, device, gender, ages)
         
         # API 요청
         headers = {
@@ -77,60 +640,180 @@ class NaverDataLab:
             "Content-Type": "application/json"
         }
         
-        response = requests.post(self.url, headers=headers, 
-                                data=json.dumps(body))
+        content = _fetch("POST", self.url, headers, self.rate_limiter, self.cache,
+                         data=dumps(body), key_pool=self.key_pool, single_flight=self.single_flight)
         
-        if response.status_code == 200:
-            return response.json()
-        else:
-            raise Exception(f"API 오류 {response.status_code}: {response.text}")
+        result = decode_trend(content) if columnar else loads(content)
+        return _reorder_trend(result, keywords)
     
-    def to_dataframe(self, api_response):
-        """API 응답을 DataFrame으로 변환 (개선 버전)"""
-        results = api_response['results']
+    def get_daily_trend(self, keywords, start_date, end_date, window_days=180,
+                        overlap_days=14, max_workers=4, anchor=None,
+                        device='', gender='', ages=[]):
+        """
+        일별 검색 트렌드 조회 (긴 기간을 구간으로 나눠 동시 수집 후 하나의 척도로 연결)
         
-        if not results:
-            return pd.DataFrame()
+        Parameters:
+        - keywords: list of str (5개 초과 시 5개씩 나눠 요청)
+        - start_date: "YYYY-MM-DD"
+        - end_date: "YYYY-MM-DD"
+        - window_days: 요청 1회당 기간 (일)
+        - overlap_days: 인접 구간이 겹치는 일수 (척도 연결 기준)
+        - max_workers: 동시 요청 수
+        - anchor: 키워드가 5개를 넘을 때 모든 요청에 함께 넣는 기준 키워드
+                  (지정하면 전체 키워드가 같은 척도, 없으면 5개 묶음별 척도)
+        - device, gender, ages: get_search_trend와 동일
+        
+        Returns:
+        - DataFrame: date + 키워드별 float32 컬럼 (최댓값 100, 값이 없는 날은 NaN)
+        """
+        keywords = list(dict.fromkeys(keywords))
         
-        # 모든 키워드의 데이터를 먼저 수집
-        all_data = {}
+        # 키워드 묶음 (요청당 최대 5개)
+        if anchor is not None and len(keywords) > MAX_KEYWORD_GROUPS:
+            others = [keyword for keyword in keywords if keyword != anchor]
+            size = MAX_KEYWORD_GROUPS - 1
+            batches = [[anchor] + others[i:i + size] for i in range(0, len(others), size)]
+        else:
+            size = MAX_KEYWORD_GROUPS
+            batches = [keywords[i:i + size] for i in range(0, len(keywords), size)]
+        
+        windows = _date_windows(start_date, end_date, window_days, overlap_days)
+        start = windows[0][0]
+        n_days = int((windows[-1][1] - start).astype(np.int64)) + 1
+        
+        def fetch(task):
+            batch, (window_start, window_end) = task
+            result = self.get_search_trend(
+                batch, str(window_start), str(window_end), time_unit='date',
+                device=device, gender=gender, ages=ages, columnar=True
+            )
+            window_dates = np.arange(window_start, window_end + 1)
+            _, titles, values = _trend_matrix(result, dates=window_dates)
+            return values[:, [titles.index(keyword) for keyword in batch]]
+        
+        tasks = [(batch, window) for batch in batches for window in windows]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            matrices = list(executor.map(fetch, tasks))
+        
+        # 묶음별로 구간 연결
+        columns = {}
+        reference = None
+        for b, batch in enumerate(batches):
+            batch_matrices = matrices[b * len(windows):(b + 1) * len(windows)]
+            stitched = _stitch_windows(windows, batch_matrices, start, n_days)
+            
+            if anchor is not None and anchor in batch:
+                anchor_values = stitched[:, batch.index(anchor)]
+                if reference is None:
+                    reference = anchor_values
+                else:
+                    factor = _overlap_factor(reference[:, None], anchor_values[:, None])
+                    stitched = stitched * (1.0 if factor is None else factor)
+            else:
+                # 묶음별 척도: 각 묶음의 최댓값을 100으로
+                peak = np.nanmax(stitched) if not np.isnan(stitched).all() else 0
+                if peak > 0:
+                    stitched = stitched * (100.0 / peak)
+            
+            for j, keyword in enumerate(batch):
+                columns.setdefault(keyword, stitched[:, j])
+        
+        values = np.column_stack([columns[keyword] for keyword in keywords])
+        
+        # anchor 기준 전체 척도: 전체 최댓값을 100으로
+        if anchor is not None and reference is not None:
+            peak = np.nanmax(values) if not np.isnan(values).all() else 0
+            if peak > 0:
+                values = values * (100.0 / peak)
+        
+        df = pd.DataFrame(values.astype(np.float32), columns=keywords)
+        df.insert(0, 'date', pd.date_range(str(start), periods=n_days, freq='D'))
         
-        for result in results:
-            keyword = result['title']
-            data_dict = {item['period']: item['ratio'] for item in result['data']}
-            all_data[keyword] = data_dict
+        return df
+    
+    def to_frame(self, api_response, layout='wide', dtype=np.float32):
+        """
+        API 응답을 메모리 효율적인 DataFrame으로 변환
         
-        # 모든 날짜 수집 (합집합)
-        all_dates = set()
-        for data_dict in all_data.values():
-            all_dates.update(data_dict.keys())
+        Parameters:
+        - api_response: get_search_trend 결과 (dict 또는 columnar=True 결과)
+        - layout: 'wide' (index=date, columns=키워드) 또는
+                  'long' (date, keyword, ratio — 응답에 있는 행만)
+        - dtype: 값 dtype (기본 float32)
         
-        all_dates = sorted(all_dates)
+        Returns:
+        - DataFrame: 응답에 없는 날짜는 NaN (wide), keyword는 범주형 (long)
+        """
+        series = _as_series(api_response)
+        
+        if layout == 'wide':
+            dates, keywords, values = _trend_matrix(series, dtype=dtype)
+            return pd.DataFrame(values, columns=keywords,
+                                index=pd.DatetimeIndex(dates.astype('datetime64[ns]'), name='date'))
+        
+        if layout == 'long':
+            keywords = [item.title for item in series]
+            lengths = [len(item.periods) for item in series]
+            periods = [period for item in series for period in item.periods]
+            ratios = [ratio for item in series for ratio in item.ratios]
+            
+            return pd.DataFrame({
+                'date': pd.DatetimeIndex(np.array(periods, dtype='datetime64[D]').astype('datetime64[ns]')),
+                'keyword': pd.Categorical.from_codes(
+                    np.repeat(np.arange(len(keywords)), lengths), categories=keywords
+                ),
+                'ratio': np.array(ratios, dtype=dtype),
+            })
         
-        # DataFrame 생성
-        df_dict = {'date': all_dates}
+        raise ValueError(f"지원하지 않는 layout: {layout} ('wide' 또는 'long')")
+    
+    def to_dataframe(self, api_response):
+        """API 응답을 DataFrame으로 변환 (date 컬럼, 없는 날짜는 0 — 기존 수집 스크립트 호환)"""
+        series = _as_series(api_response)
         
-        for keyword, data_dict in all_data.items():
-            # 각 날짜에 대해 값이 있으면 사용, 없으면 0
-            df_dict[keyword] = [data_dict.get(date, 0) for date in all_dates]
+        if not series:
+            return pd.DataFrame()
         
-        df = pd.DataFrame(df_dict)
+        dates, keywords, values = _trend_matrix(series, fill_value=0)
         
-        # 날짜 변환
-        df['date'] = pd.to_datetime(df['date'])
+        df = pd.DataFrame(values, columns=keywords)
+        df.insert(0, 'date', pd.DatetimeIndex(dates.astype('datetime64[ns]')))
         
         return df
 
 
+# ============================================
+# 검색 결과 누적 (쇼핑 / 블로그)
+# ============================================
+def _count_items(items):
+    """검색 결과 아이템 수 (list 또는 {필드: 값 목록})"""
+    if isinstance(items, dict):
+        return len(next(iter(items.values()), []))
+    return len(items)
+
+
+def _extend_items(all_items, items):
+    """페이지 결과를 누적 (list 또는 {필드: 값 목록})"""
+    if isinstance(all_items, dict):
+        for field, values in all_items.items():
+            values.extend(items.get(field, []))
+    else:
+        all_items.extend(items)
+
+
 class NaverShopping:
     """네이버 쇼핑 검색 API"""
     
-    def __init__(self):
+    def __init__(self, rate_limiter=None, cache=None, key_pool=None, single_flight=SINGLE_FLIGHT):
         self.client_id = NAVER_CLIENT_ID
         self.client_secret = NAVER_CLIENT_SECRET
         self.url = "https://openapi.naver.com/v1/search/shop.json"
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.key_pool = key_pool
+        self.single_flight = single_flight
     
-    def search_products(self, query, display=100, start=1, sort='sim'):
+    def search_products(self, query, display=100, start=1, sort='sim', columnar=False):
         """
         쇼핑 검색
         
@@ -139,6 +822,7 @@ class NaverShopping:
         - display: 결과 수 (최대 100)
         - start: 시작 위치 (1~1000)
         - sort: 'sim'(정확도), 'date', 'asc'(가격↑), 'dsc'(가격↓)
+        - columnar: True면 items를 {필드: 값 목록}으로 반환
         """
         headers = {
             "X-Naver-Client-Id": self.client_id,
@@ -152,24 +836,25 @@ class NaverShopping:
             "sort": sort
         }
         
-        response = requests.get(self.url, headers=headers, params=params)
+        content = _fetch("GET", self.url, headers, self.rate_limiter, self.cache, params=params,
+                         key_pool=self.key_pool, single_flight=self.single_flight)
         
-        if response.status_code == 200:
-            return response.json()
-        else:
-            raise Exception(f"API 오류 {response.status_code}: {response.text}")
+        if columnar:
+            total, items = decode_items(content, SHOP_FIELDS)
+            return {'total': total, 'items': items}
+        return loads(content)
     
-    def get_all_products(self, query, max_results=500):
-        """여러 페이지 수집"""
-        all_items = []
+    def get_all_products(self, query, max_results=500, columnar=False):
+        """여러 페이지 수집 (columnar=True면 {필드: 값 목록})"""
+        all_items = {field: [] for field in SHOP_FIELDS} if columnar else []
         
         for start in range(1, max_results, 100):
             try:
-                result = self.search_products(query, display=100, start=start)
+                result = self.search_products(query, display=100, start=start, columnar=columnar)
                 items = result['items']
-                all_items.extend(items)
+                _extend_items(all_items, items)
                 
-                if len(items) < 100:
+                if _count_items(items) < 100:
                     break
                     
             except Exception as e:
@@ -179,9 +864,7 @@ class NaverShopping:
         return all_items
     
     def to_dataframe(self, items):
-        """제품 리스트를 DataFrame으로"""
-        import re
-        
+        """제품 리스트(또는 columnar=True 결과)를 DataFrame으로"""
         df = pd.DataFrame(items)
         
         # 가격 정수 변환
@@ -190,7 +873,7 @@ class NaverShopping:
             df['hprice'] = pd.to_numeric(df['hprice'], errors='coerce').fillna(0).astype(int)
         
         # HTML 태그 제거
-        df['title'] = df['title'].apply(lambda x: re.sub('<.*?>', '', x))
+        df['title'] = df['title'].str.replace('<.*?>', '', regex=True)
         
         return df
 
@@ -198,13 +881,17 @@ class NaverShopping:
 class NaverBlog:
     """네이버 블로그 검색 API"""
     
-    def __init__(self):
+    def __init__(self, rate_limiter=None, cache=None, key_pool=None, single_flight=SINGLE_FLIGHT):
         self.client_id = NAVER_CLIENT_ID
         self.client_secret = NAVER_CLIENT_SECRET
         self.url = "https://openapi.naver.com/v1/search/blog.json"
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.key_pool = key_pool
+        self.single_flight = single_flight
     
-    def search_blogs(self, query, display=100, start=1, sort='sim'):
-        """블로그 검색"""
+    def search_blogs(self, query, display=100, start=1, sort='sim', columnar=False):
+        """블로그 검색 (columnar=True면 items를 {필드: 값 목록}으로 반환)"""
         headers = {
             "X-Naver-Client-Id": self.client_id,
             "X-Naver-Client-Secret": self.client_secret
@@ -217,24 +904,25 @@ class NaverBlog:
             "sort": sort  # 'sim' or 'date'
         }
         
-        response = requests.get(self.url, headers=headers, params=params)
+        content = _fetch("GET", self.url, headers, self.rate_limiter, self.cache, params=params,
+                         key_pool=self.key_pool, single_flight=self.single_flight)
         
-        if response.status_code == 200:
-            return response.json()
-        else:
-            raise Exception(f"API 오류 {response.status_code}")
+        if columnar:
+            total, items = decode_items(content, BLOG_FIELDS)
+            return {'total': total, 'items': items}
+        return loads(content)
     
-    def get_all_blogs(self, query, max_results=1000):
-        """여러 페이지 수집"""
-        all_items = []
+    def get_all_blogs(self, query, max_results=1000, columnar=False):
+        """여러 페이지 수집 (columnar=True면 {필드: 값 목록})"""
+        all_items = {field: [] for field in BLOG_FIELDS} if columnar else []
         
         for start in range(1, max_results, 100):
             try:
-                result = self.search_blogs(query, display=100, start=start)
+                result = self.search_blogs(query, display=100, start=start, columnar=columnar)
                 items = result['items']
-                all_items.extend(items)
+                _extend_items(all_items, items)
                 
-                if len(items) < 100:
+                if _count_items(items) < 100:
                     break
                     
             except Exception as e:
@@ -244,14 +932,12 @@ class NaverBlog:
         return all_items
     
     def to_dataframe(self, items):
-        """블로그 리스트를 DataFrame으로"""
-        import re
-        
+        """블로그 리스트(또는 columnar=True 결과)를 DataFrame으로"""
         df = pd.DataFrame(items)
         
         # HTML 태그 제거
-        df['title'] = df['title'].apply(lambda x: re.sub('<.*?>', '', x))
-        df['description'] = df['description'].apply(lambda x: re.sub('<.*?>', '', x))
+        df['title'] = df['title'].str.replace('<.*?>', '', regex=True)
+        df['description'] = df['description'].str.replace('<.*?>', '', regex=True)
         
         # 날짜 변환
         df['postdate'] = pd.to_datetime(df['postdate'], format='%Y%m%d')
@@ -283,8 +969,24 @@ if __name__ == "__main__":
     except Exception as e:
         print(f"❌ 실패: {e}")
     
-    # 2. Shopping 테스트
-    print("\n2️⃣ 쇼핑 검색 API 테스트")
+    # 2. DataLab 일별 테스트 (구간 분할)
+    print("\n2️⃣ 데이터랩 일별 수집 테스트")
+    try:
+        datalab = NaverDataLab()
+        df = datalab.get_daily_trend(
+            keywords=["선크림", "스키장"],
+            start_date="2024-01-01",
+            end_date="2024-03-31",
+            window_days=30,
+            overlap_days=7
+        )
+        print(f"✅ 성공: {len(df)}일 수집")
+        print(df.head())
+    except Exception as e:
+        print(f"❌ 실패: {e}")
+    
+    # 3. Shopping 테스트
+    print("\n3️⃣ 쇼핑 검색 API 테스트")
     try:
         shopping = NaverShopping()
         items = shopping.search_products("선크림", display=10)
@@ -294,8 +996,8 @@ if __name__ == "__main__":
     except Exception as e:
         print(f"❌ 실패: {e}")
     
-    # 3. Blog 테스트
-    print("\n3️⃣ 블로그 검색 API 테스트")
+    # 4. Blog 테스트
+    print("\n4️⃣ 블로그 검색 API 테스트")
     try:
         blog = NaverBlog()
         items = blog.search_blogs("선크림", display=10)
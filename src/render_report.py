@@ -0,0 +1,73 @@
+"""
+SODA 프로젝트 - 발표 자료 차트 일괄 생성
+======================================
+
+data/ 의 저장된 데이터셋으로 output/ 차트(2-1 ~ 4-1)를 다시 그림
+- 입력 데이터가 바뀐 차트만 렌더링 (--force: 전체)
+- 차트별 프로세스 병렬 렌더링 (Agg 백엔드)
+
+실행:
+    python src/render_report.py
+    python src/render_report.py --only 3-1 3-2 --force
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# ============================================
+# 경로 설정
+# ============================================
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent
+src_dir = current_file.parent
+
+if str(src_dir) not in sys.path:
+    sys.path.insert(0, str(src_dir))
+
+from report import DEFAULT_DPI, FIGURES, render_figures
+
+PROJECT_ROOT = project_root
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="발표 자료 차트 일괄 생성")
+    parser.add_argument("--only", nargs="+", metavar="NAME", choices=list(FIGURES),
+                        help="렌더링할 차트 (기본: 전체)")
+    parser.add_argument("--force", action="store_true", help="입력이 같아도 다시 렌더링")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수")
+    parser.add_argument("--dpi", type=int, default=DEFAULT_DPI)
+    parser.add_argument("--data-dir", type=Path, default=PROJECT_ROOT / "data")
+    parser.add_argument("--output-dir", type=Path, default=PROJECT_ROOT / "output")
+    args = parser.parse_args(argv)
+
+    print("="*70)
+    print("📊 발표 자료 차트 생성")
+    print("="*70)
+
+    start = time.perf_counter()
+    results = render_figures(args.data_dir, args.output_dir, names=args.only,
+                             force=args.force, max_workers=args.workers, dpi=args.dpi)
+
+    for name, (status, detail) in results.items():
+        filename = FIGURES[name].filename
+        if status == "rendered":
+            print(f"  ✅ {filename} ({detail:.1f}s)")
+        elif status == "skipped":
+            print(f"  ⏭️  {filename} (입력 변경 없음)")
+        else:
+            print(f"  ⚠️  {filename} (입력 파일 없음: {', '.join(detail)})")
+
+    rendered = sum(status == "rendered" for status, _ in results.values())
+    print(f"\n✅ 완료: {rendered}개 렌더링 / {len(results) - rendered}개 건너뜀 "
+          f"({time.perf_counter() - start:.1f}s)")
+    print(f"📁 {args.output_dir}")
+    return results
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n\n⚠️  사용자에 의해 중단되었습니다.")
@@ -0,0 +1,29 @@
+# src/report/__init__.py
+"""
+발표 자료 차트 (output/*.png) 생성
+
+- figures: 저장된 데이터셋만으로 그리는 차트 정의 (노트북 시각화 셀과 같은 차트)
+- render: 입력 해시가 바뀐 차트만 프로세스 풀에서 다시 렌더링
+- build: 데이터 해시 기반 증분 빌드 (피벗 / 요약 표 / 차트 중 입력이 바뀐 것만)
+"""
+
+from .figures import FIGURES, FigureSpec, figure, load_input
+from .render import DEFAULT_DPI, figure_hash, check_figures, render_figure, render_figures
+from .build import STEPS, Step, step, step_order, build
+
+__all__ = [
+    'FIGURES',
+    'FigureSpec',
+    'figure',
+    'load_input',
+    'DEFAULT_DPI',
+    'figure_hash',
+    'render_figure',
+    'check_figures',
+    'render_figures',
+    'STEPS',
+    'Step',
+    'step',
+    'step_order',
+    'build',
+]
@@ -0,0 +1,308 @@
+"""
+증분 빌드 (데이터 해시 기반)
+- data/ 파일과 단계별 입력(데이터 + 분석 코드)의 sha256을 output/.build.json에 기록
+- 입력이 바뀐 단계와 그 하위 산출물(피벗, 요약 표, 차트)만 다시 생성
+  (예: Dataset 3만 갱신하면 Q1/Q2/Q4 산출물은 건드리지 않음)
+"""
+
+import hashlib
+import importlib
+import inspect
+import json
+from collections import namedtuple
+from pathlib import Path
+
+import pandas as pd
+
+from analysis.correlation import correlation_scan
+from analysis.cube import AggregateCube
+from analysis.seasonal_stats import seasonal_summary
+from analysis.segmentation import quadrant_table, segment_matrix
+
+from .figures import FIGURES, cross_estimate, cross_usage, load_input, uv_season_summary
+from .render import DEFAULT_DPI, check_figures, file_hash, render_figures
+
+
+BUILD_MANIFEST = ".build.json"
+DATASETS = ("1", "2", "3", "4")
+
+
+# ============================================
+# 빌드 단계 등록
+# ============================================
+Step = namedtuple("Step", ["name", "dataset", "inputs", "outputs", "modules", "run"])
+
+STEPS = {}
+
+
+def step(name, dataset, inputs, outputs, modules=()):
+    """
+    빌드 단계 등록 데코레이터
+
+    Args:
+        name: 단계 이름
+        dataset: 소속 데이터셋 ('1' ~ '4')
+        inputs / outputs: 프로젝트 루트 기준 상대 경로 목록
+            (다른 단계의 출력을 입력으로 쓰면 그 단계 뒤에 실행)
+        modules: 결과에 영향을 주는 분석 모듈 (소스가 바뀌면 다시 생성)
+
+    단계 함수는 run(inputs, outputs)로 호출됩니다 (절대 경로 목록).
+    """
+    def register(run):
+        STEPS[name] = Step(name, dataset, tuple(inputs), tuple(outputs), tuple(modules), run)
+        return run
+    return register
+
+
+def _read_dated(path):
+    return pd.read_csv(path, encoding="utf-8-sig", parse_dates=["date"])
+
+
+def _write_csv(frame, path, index=True):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    frame.to_csv(path, index=index, encoding="utf-8-sig")
+
+
+# ============================================
+# Dataset 1 ~ 4 산출물
+# ============================================
+@step("1-seasonal", "1",
+      ["data/01_선크림_월별_트렌드.csv"],
+      ["output/tables/01_선크림_계절별_요약.csv"],
+      modules=["analysis.seasons", "analysis.seasonal_stats"])
+def seasonal_table(inputs, outputs):
+    df = _read_dated(inputs[0])
+    _write_csv(seasonal_summary(df, ["선크림", "썬크림", "자외선차단제"]), outputs[0])
+
+
+@step("2-usage", "2",
+      ["data/02_통계청_지난1년간_스키장_이용_횟수.csv"],
+      ["output/tables/02_스키장_이용률_정리.csv", "output/tables/02_연령_소득_교차_이용률.csv",
+       "output/tables/02_연령_소득_교차_이용률_전체.csv"],
+      modules=["kosis", "analysis.cross_estimate", "report.figures"])
+def ski_usage_tables(inputs, outputs):
+    df = load_input(inputs[0].parent, inputs[0].name)
+    _write_csv(df, outputs[0], index=False)
+    _write_csv(cross_usage(df), outputs[1])
+
+    # 전 지역 × 전 연도 (곱셈 모형 / IPF)
+    independence = cross_estimate(df).to_frame("independence")
+    independence["ipf"] = cross_estimate(df, method="ipf").to_frame()["rate"]
+    _write_csv(independence, outputs[2], index=False)
+
+
+@step("3-seasonal", "3",
+      ["data/03_기상청_UV지수_vs_검색량_비교.csv"],
+      ["output/tables/03_계절별_UV_검색량_Gap.csv"],
+      modules=["analysis.seasons", "analysis.seasonal_stats", "report.figures"])
+def uv_gap_table(inputs, outputs):
+    summary = uv_season_summary(_read_dated(inputs[0]))
+    table = pd.DataFrame({"겨울": summary["winter"], "여름": summary["summer"]}).T
+    for key in ("search_ratio", "uv_flatland_ratio", "uv_ski_ratio", "gap_flatland", "gap_ski"):
+        table[key] = summary[key]
+    _write_csv(table, outputs[0])
+
+
+@step("3-correlation", "3",
+      ["data/03_기상청_UV지수_vs_검색량_비교.csv"],
+      ["output/tables/03_UVB_검색량_상관.csv"],
+      modules=["analysis.correlation"])
+def uv_correlation_table(inputs, outputs):
+    df = _read_dated(inputs[0])
+    columns = [col for col in ["자외선", "자외선차단", "UV차단", "자외선검색지수"] if col in df.columns]
+    _write_csv(correlation_scan(df, "UVB평균", columns), outputs[0])
+
+
+@step("4-pivot", "4",
+      ["data/04_세그먼트별_통합_데이터.csv"],
+      ["data/04_세그먼트_키워드_평균_매트릭스.csv"],
+      modules=["analysis.segmentation"])
+def segment_pivot(inputs, outputs):
+    # collect_dataset_4와 같은 순서 (세그먼트: 수집 순서, 키워드: 정렬)
+    df = _read_dated(inputs[0])
+    pivot = segment_matrix(df, segment_order=list(pd.unique(df["segment"])),
+                           keyword_order=sorted(pd.unique(df["keyword"])))
+    _write_csv(pivot, outputs[0])
+
+
+@step("4-cube", "4",
+      ["data/04_세그먼트별_통합_데이터.csv"],
+      ["data/04_세그먼트_키워드_집계큐브.npz"],
+      modules=["analysis.cube", "analysis.seasons"])
+def segment_cube(inputs, outputs):
+    AggregateCube.from_frame(_read_dated(inputs[0])).save(outputs[0])
+
+
+@step("4-quadrant", "4",
+      ["data/04_세그먼트_키워드_평균_매트릭스.csv"],
+      ["output/tables/04_세그먼트_4사분면.csv"],
+      modules=["analysis.segmentation"])
+def segment_quadrant_table(inputs, outputs):
+    pivot = pd.read_csv(inputs[0], encoding="utf-8-sig", index_col=0)
+    _write_csv(quadrant_table(pivot), outputs[0], index=False)
+
+
+# ============================================
+# 해시
+# ============================================
+class HashCache:
+    """파일 해시 캐시 (크기와 수정 시각이 같으면 이전 해시 재사용)"""
+
+    def __init__(self, root, entries=None):
+        self.root = Path(root)
+        self.entries = dict(entries or {})
+
+    def __call__(self, relpath):
+        path = self.root / relpath
+        stat = path.stat()
+        entry = self.entries.get(relpath)
+        if entry and entry[0] == stat.st_size and entry[1] == stat.st_mtime_ns:
+            return entry[2]
+        digest = file_hash(path)
+        self.entries[relpath] = [stat.st_size, stat.st_mtime_ns, digest]
+        return digest
+
+
+def step_hash(spec, root, hasher):
+    """
+    단계 입력 해시 (입력 파일 + 단계 함수 소스 + 분석 모듈 소스)
+
+    Returns:
+        str 또는 None (입력 파일이 없을 때)
+    """
+    digest = hashlib.sha256()
+    digest.update(spec.name.encode())
+    digest.update(inspect.getsource(spec.run).encode())
+    for module in spec.modules:
+        digest.update(file_hash(importlib.import_module(module).__file__).encode())
+    for relpath in spec.inputs:
+        if not (Path(root) / relpath).exists():
+            return None
+        digest.update(relpath.encode())
+        digest.update(hasher(relpath).encode())
+    return digest.hexdigest()
+
+
+def _load_build_manifest(output_dir):
+    path = output_dir / BUILD_MANIFEST
+    if not path.exists():
+        return {"files": {}, "steps": {}}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _save_build_manifest(output_dir, manifest):
+    output_dir.mkdir(parents=True, exist_ok=True)
+    with open(output_dir / BUILD_MANIFEST, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+
+
+def step_order(steps=None):
+    """입력/출력 관계로 정렬한 단계 이름 목록 (등록 순서 유지)"""
+    steps = list(STEPS) if steps is None else list(steps)
+    producer = {out: name for name in steps for out in STEPS[name].outputs}
+    upstream = {name: {producer[i] for i in STEPS[name].inputs if i in producer} - {name}
+                for name in steps}
+
+    order, done = [], set()
+    while len(order) < len(steps):
+        ready = [name for name in steps if name not in done and upstream[name] <= done]
+        if not ready:
+            raise ValueError(f"빌드 단계에 순환 의존이 있습니다: {sorted(set(steps) - done)}")
+        order.extend(ready)
+        done.update(ready)
+    return order
+
+
+def _data_files(root):
+    root = Path(root)
+    return sorted(path.relative_to(root).as_posix()
+                  for path in (root / "data").rglob("*") if path.is_file())
+
+
+def data_changes(root, manifest, hasher):
+    """지난 빌드 이후 바뀐 data/ 파일 (추가/변경/삭제)"""
+    current = _data_files(root)
+    previous = {relpath: entry[2] for relpath, entry in manifest["files"].items()}
+
+    changed = [relpath for relpath in current if previous.get(relpath) != hasher(relpath)]
+    removed = sorted(set(previous) - set(current))
+    return changed, removed
+
+
+# ============================================
+# 빌드
+# ============================================
+def build(root, datasets=None, force=False, dry_run=False, max_workers=None, dpi=DEFAULT_DPI):
+    """
+    입력이 바뀐 산출물만 다시 생성 (표/피벗 → 차트 순서)
+
+    Args:
+        root: 프로젝트 루트 (data/, output/ 상위 폴더)
+        datasets: 대상 데이터셋 (예: ['3'], None이면 전체)
+        force: 해시가 같아도 다시 생성
+        dry_run: 생성하지 않고 다시 만들 대상만 확인
+        max_workers: 차트 렌더링 프로세스 수
+        dpi: 차트 해상도
+
+    Returns:
+        dict:
+            changed / removed: 지난 빌드 이후 바뀐 / 삭제된 data/ 파일
+            steps: {단계 이름: 'built' | 'skipped' | 'stale' | 'missing'}
+            figures: {차트 이름: render_figures 결과 ('stale': dry_run에서 다시 그릴 차트)}
+    """
+    root = Path(root)
+    data_dir, output_dir = root / "data", root / "output"
+    datasets = set(DATASETS if datasets is None else map(str, datasets))
+
+    manifest = _load_build_manifest(output_dir)
+    hasher = HashCache(root, manifest["files"])
+    changed, removed = data_changes(root, manifest, hasher)
+
+    results = {}
+    producer = {out: name for name, spec in STEPS.items() for out in spec.outputs}
+    selected = [name for name in step_order() if STEPS[name].dataset in datasets]
+
+    for name in selected:
+        spec = STEPS[name]
+        upstream_stale = any(results.get(producer.get(i)) == "stale" for i in spec.inputs)
+        digest = step_hash(spec, root, hasher)
+
+        if digest is None:
+            results[name] = "missing"
+            continue
+        outputs_exist = all((root / out).exists() for out in spec.outputs)
+        if not force and not upstream_stale and outputs_exist and manifest["steps"].get(name) == digest:
+            results[name] = "skipped"
+            continue
+        if dry_run:
+            results[name] = "stale"
+            continue
+
+        spec.run([root / i for i in spec.inputs], [root / out for out in spec.outputs])
+        # 출력이 다른 단계의 입력이면 해시 캐시 갱신을 위해 다시 계산되도록 제거
+        for out in spec.outputs:
+            hasher.entries.pop(out, None)
+        manifest["steps"][name] = digest
+        results[name] = "built"
+
+    figure_names = [name for name in FIGURES if name.split("-")[0] in datasets]
+    if dry_run:
+        figures, stale = check_figures(data_dir, output_dir, figure_names, force, dpi)
+        upstream = {name for name, status in results.items() if status == "stale"}
+        for name in figure_names:
+            inputs = {f"data/{filename}" for filename in FIGURES[name].inputs}
+            if name in stale or any(producer.get(i) in upstream for i in inputs):
+                figures[name] = ("stale", None)
+        figures = {name: figures[name] for name in figure_names}
+    else:
+        figures = render_figures(data_dir, output_dir, figure_names, force, max_workers, dpi)
+
+        # 이번 빌드에서 생성한 data/ 산출물(피벗, 큐브)까지 포함해 현재 상태 기록
+        current = _data_files(root)
+        for relpath in current:
+            hasher(relpath)
+        manifest["files"] = {relpath: hasher.entries[relpath] for relpath in current}
+        _save_build_manifest(output_dir, manifest)
+
+    return {"changed": changed, "removed": removed, "steps": results, "figures": figures}
@@ -0,0 +1,435 @@
+"""
+발표 자료 차트 정의 (output/*.png)
+- 차트마다 저장된 데이터셋(data/*.csv)만으로 그리는 함수 하나 (노트북 셀과 같은 차트)
+- @figure로 등록: 차트 이름, 출력 파일명, 입력 데이터 파일, 스타일
+- 각 함수는 {입력 파일명: DataFrame}을 받아 Figure를 반환 (pyplot 전역 상태 사용 안 함,
+  tight_layout / 저장은 render에서 처리)
+"""
+
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+import seaborn as sns
+from matplotlib.figure import Figure
+from matplotlib.patches import Patch
+
+from analysis.cross_estimate import estimate_cross
+from analysis.seasonal_stats import season_means
+from analysis.segmentation import QUADRANT_LABELS, SPORT_KEYWORDS, assign_quadrants, composite_index
+from kosis import flatten_columns, load_kosis
+
+
+# ============================================
+# 입력 데이터
+# ============================================
+SKI_USAGE_FILE = "02_통계청_지난1년간_스키장_이용_횟수.csv"
+UV_SEARCH_FILE = "03_기상청_UV지수_vs_검색량_비교.csv"
+SEGMENT_MATRIX_FILE = "04_세그먼트_키워드_평균_매트릭스.csv"
+
+SKI_METRICS = {"원데이터": "이용률", "전기간 대비 증감": "증감", "증감률": "증감률"}
+
+
+def _load_ski_usage(path):
+    """통계청 스키장 이용률 (KOSIS) → 지역, 특성_대분류, 특성_세부, {연도}_{이용률/증감/증감률}"""
+    wide = load_kosis(path, layout="wide").rename(columns=SKI_METRICS, level="metric")
+    df = flatten_columns(wide, drop_levels=["item"]).reset_index()
+    return df.rename(columns={"region": "지역", "characteristic": "특성_대분류", "detail": "특성_세부"})
+
+
+def _usage_years(df):
+    """이용률 컬럼이 있는 연도 목록"""
+    return [int(col.split("_")[0]) for col in df.columns if col.endswith("_이용률")]
+
+
+def _load_dated(path):
+    return pd.read_csv(path, encoding="utf-8-sig", parse_dates=["date"])
+
+
+LOADERS = {
+    SKI_USAGE_FILE: _load_ski_usage,
+    UV_SEARCH_FILE: _load_dated,
+}
+
+
+def load_input(data_dir, filename):
+    """입력 데이터 파일 로드 (파일별 전처리 포함)"""
+    loader = LOADERS.get(filename)
+    path = data_dir / filename
+    if loader is None:
+        return pd.read_csv(path, encoding="utf-8-sig")
+    return loader(path)
+
+
+# ============================================
+# 차트 등록
+# ============================================
+FigureSpec = namedtuple("FigureSpec", ["name", "filename", "inputs", "draw", "style"])
+
+FIGURES = {}
+
+
+def figure(name, filename, inputs, style=None):
+    """
+    차트 함수 등록 데코레이터
+
+    Args:
+        name: 차트 이름 (예: '2-1')
+        filename: output/ 아래 파일명
+        inputs: data/ 아래 입력 파일명 목록 (해시 비교 대상)
+        style: seaborn 스타일 (예: 'whitegrid', 없으면 matplotlib 기본)
+    """
+    def register(draw):
+        FIGURES[name] = FigureSpec(name, filename, tuple(inputs), draw, style)
+        return draw
+    return register
+
+
+# ============================================
+# Dataset 2: 통계청 스키장 이용률
+# ============================================
+POPULATION_13PLUS = 5000  # 13세 이상 인구 (만 명)
+
+INCOME_LABELS = {
+    "100만원 미만": "<1M",
+    "100∼200만원 미만": "1-2M",
+    "200∼300만원 미만": "2-3M",
+    "300∼400만원 미만": "3-4M",
+    "400∼500만원 미만": "4-5M",
+    "500∼600만원 미만": "5-6M",
+    "600만원 이상": "6M+",
+}
+PREMIUM_INCOME_COLORS = {
+    "300∼400만원 미만": "#FDDA24",
+    "400∼500만원 미만": "#FDB913",
+    "500∼600만원 미만": "#F7931E",
+    "600만원 이상": "#FF6B35",
+}
+AGE_LABELS = {"20∼29세": "20-29", "30∼39세": "30-39", "40∼49세": "40-49"}
+
+
+def _national(df, category):
+    """전국 기준 특성 대분류 행"""
+    return df[(df["지역"] == "전국") & (df["특성_대분류"] == category)]
+
+
+def _total_row(df):
+    """전국 전체 계 행"""
+    return _national(df, "전체").iloc[0]
+
+
+def _income_rates(df, year=2025):
+    """가구소득 구간별 이용률 (소득 순서 정렬)"""
+    income = _national(df, "가구소득").set_index("특성_세부")[f"{year}_이용률"]
+    return income.reindex(list(INCOME_LABELS)).dropna()
+
+
+def usage_long(df):
+    """정리된 이용률 표 → tidy long (region, characteristic, detail, year, value)"""
+    years = _usage_years(df)
+    long = df.melt(id_vars=["지역", "특성_대분류", "특성_세부"],
+                   value_vars=[f"{year}_이용률" for year in years], var_name="year")
+    long["year"] = long["year"].str.split("_").str[0].astype(int)
+    return long.rename(columns={"지역": "region", "특성_대분류": "characteristic", "특성_세부": "detail"})
+
+
+def cross_estimate(df, method="independence"):
+    """연령(20~40대) × 가구소득(300만원 이상) 추정 이용률 (전 지역 × 전 연도)"""
+    return estimate_cross(usage_long(df), "연령", "가구소득", row_labels=list(AGE_LABELS),
+                          col_labels=list(PREMIUM_INCOME_COLORS), method=method)
+
+
+def cross_usage(df, year=2025, method="independence"):
+    """
+    연령 × 가구소득 추정 이용률 (교차 데이터가 없어 곱셈 모형으로 추정)
+
+    교차 이용률 = 전체 평균 × (연령 이용률 / 평균) × (소득 이용률 / 평균)
+    """
+    return cross_estimate(df, method).frame("전국", year, AGE_LABELS, INCOME_LABELS)
+
+
+@figure("2-1", "2-1.통계청_스키장_이용객.png", [SKI_USAGE_FILE])
+def yearly_ski_usage(data):
+    """연도별 스키장 이용률 + 추정 이용자 수 (듀얼 축)"""
+    df = data[SKI_USAGE_FILE]
+    total = _total_row(df)
+    years = _usage_years(df)
+    usage_rates = [total[f"{year}_이용률"] for year in years]
+    user_counts = [rate * POPULATION_13PLUS / 100 for rate in usage_rates]
+
+    fig = Figure(figsize=(12, 6))
+    ax1 = fig.subplots()
+
+    color1 = "#2E86AB"
+    ax1.set_xlabel("Year", fontsize=12, fontweight="bold")
+    ax1.set_ylabel("Ski Resort Usage Rate (%)", color=color1, fontsize=12, fontweight="bold")
+    ax1.plot(years, usage_rates, color=color1, marker="o", markersize=10,
+             linewidth=3, label="Usage Rate (%)")
+    ax1.tick_params(axis="y", labelcolor=color1)
+    ax1.set_ylim(0, 20)
+    ax1.grid(True, alpha=0.3)
+    ax1.axvspan(2020.5, 2021.5, alpha=0.2, color="red", label="COVID-19 Impact")
+
+    ax2 = ax1.twinx()
+    color2 = "#A23B72"
+    ax2.set_ylabel("Estimated Users (10K people)", color=color2, fontsize=12, fontweight="bold")
+    ax2.plot(years, user_counts, color=color2, marker="s", markersize=10,
+             linewidth=3, linestyle="--", label="Estimated Users")
+    ax2.tick_params(axis="y", labelcolor=color2)
+    ax2.set_ylim(0, 1000)
+
+    ax2.set_title("Annual Ski Resort Usage Trend (2019-2025)\n~5.5 Million Annual Market",
+                  fontsize=14, fontweight="bold", pad=20)
+
+    for year, rate, count in zip(years, usage_rates, user_counts):
+        ax1.text(year, rate + 1, f"{rate:.1f}%", ha="center", fontsize=10, color=color1, fontweight="bold")
+        ax2.text(year, count + 30, f"{count:.0f}M", ha="center", fontsize=9, color=color2)
+
+    lines1, labels1 = ax1.get_legend_handles_labels()
+    lines2, labels2 = ax2.get_legend_handles_labels()
+    ax1.legend(lines1 + lines2, labels1 + labels2, loc="upper right", fontsize=10)
+    return fig
+
+
+@figure("2-2", "2-2.통계청_스키장_이용고객_순수입.png", [SKI_USAGE_FILE])
+def income_ski_usage(data):
+    """가구소득별 스키장 이용률 (파이 차트, 300만원 이상 강조)"""
+    income = _income_rates(data[SKI_USAGE_FILE])
+    premium = income.index.isin(list(PREMIUM_INCOME_COLORS))
+
+    fig = Figure(figsize=(12, 8))
+    ax = fig.subplots()
+
+    _, _, autotexts = ax.pie(
+        income.to_numpy(),
+        labels=[INCOME_LABELS[i] for i in income.index],
+        colors=[PREMIUM_INCOME_COLORS.get(i, "#D3D3D3") for i in income.index],
+        explode=np.where(premium, 0.05, 0),
+        autopct="%1.1f%%",
+        startangle=90,
+        textprops={"fontsize": 12, "fontweight": "bold"},
+        wedgeprops={"edgecolor": "black", "linewidth": 2},
+    )
+    for autotext in autotexts:
+        autotext.set_color("white")
+        autotext.set_fontsize(11)
+
+    ax.set_title("Ski Resort Usage by Household Income (2025)\nPremium Target: 3M+ KRW",
+                 fontsize=14, fontweight="bold", pad=20)
+
+    legend_elements = [
+        Patch(facecolor="#FF6B35", edgecolor="black", label="6M+ KRW"),
+        Patch(facecolor="#F7931E", edgecolor="black", label="5-6M KRW"),
+        Patch(facecolor="#FDB913", edgecolor="black", label="4-5M KRW"),
+        Patch(facecolor="#FDDA24", edgecolor="black", label="3-4M KRW"),
+        Patch(facecolor="#D3D3D3", edgecolor="black", label="<3M KRW"),
+    ]
+    ax.legend(handles=legend_elements, title="Monthly Household Income",
+              loc="upper left", bbox_to_anchor=(1, 1), fontsize=10)
+    return fig
+
+
+@figure("2-3", "2-3.통계청_스키장_연령_수입별_히트맵.png", [SKI_USAGE_FILE])
+def age_income_heatmap(data):
+    """연령 × 가구소득 추정 이용률 히트맵"""
+    cross = cross_usage(data[SKI_USAGE_FILE])
+
+    fig = Figure(figsize=(10, 6))
+    ax = fig.subplots()
+    sns.heatmap(cross, annot=True, fmt=".1f", cmap="YlOrRd",
+                cbar_kws={"label": "Usage Rate (%)"},
+                linewidths=2, linecolor="white", vmin=8, vmax=28, ax=ax)
+
+    ax.set_title("Ski Usage by Age x Income (2025)\nPremium Target: Young & Wealthy",
+                 fontsize=14, fontweight="bold", pad=20)
+    ax.set_xlabel("Monthly Household Income (Million KRW)", fontsize=12, fontweight="bold")
+    ax.set_ylabel("Age Group", fontsize=12, fontweight="bold")
+    return fig
+
+
+# ============================================
+# Dataset 3: 기상청 UV-B vs 자외선 검색량
+# ============================================
+ALTITUDE_CORRECTION = 1.12   # 고도 1000m: +12% (WHO 가이드라인)
+SNOW_REFLECTION = 1.85       # 눈 반사: +85% (UV-B 알베도)
+TOTAL_CORRECTION = ALTITUDE_CORRECTION * SNOW_REFLECTION
+
+
+def uv_season_summary(df):
+    """
+    겨울/여름 UV-B(평지, 스키장 보정)와 검색량 평균 및 인식 공백(Gap)
+
+    Returns:
+        dict: winter, summer (계절 평균 Series), search_ratio,
+              uv_flatland_ratio, uv_ski_ratio, gap_flatland, gap_ski
+    """
+    df = df.assign(UVB_SkiResort=(df["UVB평균"] * TOTAL_CORRECTION).round(2))
+    means = season_means(df, ["자외선검색지수", "UVB평균", "UVB_SkiResort"])
+    winter, summer = means.loc["겨울"], means.loc["여름"]
+
+    search_ratio = winter["자외선검색지수"] / summer["자외선검색지수"] * 100
+    uv_flatland_ratio = winter["UVB평균"] / summer["UVB평균"] * 100
+    uv_ski_ratio = winter["UVB_SkiResort"] / summer["UVB평균"] * 100
+    return {
+        "winter": winter,
+        "summer": summer,
+        "search_ratio": search_ratio,
+        "uv_flatland_ratio": uv_flatland_ratio,
+        "uv_ski_ratio": uv_ski_ratio,
+        "gap_flatland": uv_flatland_ratio - search_ratio,
+        "gap_ski": uv_ski_ratio - search_ratio,
+    }
+
+
+def _bar_labels(ax, bars, fmt, fontsize):
+    for bar in bars:
+        height = bar.get_height()
+        ax.text(bar.get_x() + bar.get_width() / 2., height, fmt.format(height),
+                ha="center", va="bottom", fontsize=fontsize, fontweight="bold")
+
+
+@figure("3-1", "3-1.기상청-네이버_실제UVB_자외선검색량_비교.png", [UV_SEARCH_FILE], style="whitegrid")
+def uv_winter_summer(data):
+    """겨울/여름 UV-B 지수 및 검색량 비교 막대 차트"""
+    summary = uv_season_summary(data[UV_SEARCH_FILE])
+    winter, summer = summary["winter"], summary["summer"]
+
+    fig = Figure(figsize=(16, 7))
+    ax1, ax2 = fig.subplots(1, 2)
+
+    values = [winter["UVB평균"], winter["UVB_SkiResort"], summer["UVB평균"]]
+    bars = ax1.bar(["Flatland\nWinter", "Ski Resort\nWinter", "Flatland\nSummer"], values,
+                   color=["#3498db", "#e74c3c", "#f39c12"], alpha=0.8, edgecolor="black", linewidth=2)
+    _bar_labels(ax1, bars, "{:.2f}", 14)
+    ax1.set_title("UV-B Index Comparison", fontsize=16, fontweight="bold")
+    ax1.set_ylabel("UV-B Index", fontsize=12)
+    ax1.set_ylim(0, max(values) * 1.2)
+    ax1.grid(axis="y", alpha=0.3)
+    ax1.text(1, winter["UVB_SkiResort"] * 0.5, f"×{TOTAL_CORRECTION:.2f}",
+             ha="center", fontsize=12, fontweight="bold",
+             bbox=dict(boxstyle="round", facecolor="yellow", alpha=0.7))
+
+    values = [winter["자외선검색지수"], summer["자외선검색지수"]]
+    bars = ax2.bar(["Winter", "Summer"], values,
+                   color=["#3498db", "#f39c12"], alpha=0.8, edgecolor="black", linewidth=2)
+    _bar_labels(ax2, bars, "{:.1f}", 14)
+    ax2.set_title("UV Search Volume Comparison", fontsize=16, fontweight="bold")
+    ax2.set_ylabel("Search Index", fontsize=12)
+    ax2.set_ylim(0, max(values) * 1.2)
+    ax2.grid(axis="y", alpha=0.3)
+    ax2.text(0.5, max(values) * 0.5, f"{summary['search_ratio']:.1f}%",
+             ha="center", fontsize=12, fontweight="bold",
+             bbox=dict(boxstyle="round", facecolor="lightgreen", alpha=0.7))
+
+    return fig
+
+
+def _gap_label(gap, high="Under-awareness"):
+    if gap < -10:
+        return "Over-awareness"
+    return "Appropriate" if abs(gap) < 10 else high
+
+
+@figure("3-2", "3-2.기상청-네이버_자외선_고객인식.png", [UV_SEARCH_FILE], style="whitegrid")
+def perception_gap(data):
+    """UV 위험도(겨울/여름) vs 검색 인식(겨울/여름) 인식 공백 차트"""
+    summary = uv_season_summary(data[UV_SEARCH_FILE])
+    scenarios = ["Flatland", "Ski Resort"]
+    uv_ratios = [summary["uv_flatland_ratio"], summary["uv_ski_ratio"]]
+    search_ratios = [summary["search_ratio"]] * 2
+    gaps = [summary["gap_flatland"], summary["gap_ski"]]
+
+    fig = Figure(figsize=(12, 8))
+    ax = fig.subplots()
+
+    x = np.arange(len(scenarios))
+    width = 0.35
+    bars1 = ax.bar(x - width / 2, uv_ratios, width, label="UV Risk (Winter/Summer %)",
+                   color="#e74c3c", alpha=0.8, edgecolor="black", linewidth=2)
+    bars2 = ax.bar(x + width / 2, search_ratios, width, label="Search Awareness (Winter/Summer %)",
+                   color="#2ecc71", alpha=0.8, edgecolor="black", linewidth=2)
+    _bar_labels(ax, bars1, "{:.1f}%", 12)
+    _bar_labels(ax, bars2, "{:.1f}%", 12)
+
+    for i, gap in enumerate(gaps):
+        if abs(gap) > 5:
+            ax.annotate(f"Gap: {gap:+.1f}%p {'↑' if gap > 0 else '↓'}",
+                        xy=(i, max(uv_ratios[i], search_ratios[i]) + 5), fontsize=13,
+                        fontweight="bold", ha="center", color="red" if gap > 0 else "blue",
+                        bbox=dict(boxstyle="round", facecolor="yellow", alpha=0.7))
+
+    ax.set_title("Perception Gap Analysis\nUV Risk vs Search Awareness", fontsize=16, fontweight="bold")
+    ax.set_ylabel("Ratio (%)", fontsize=12)
+    ax.set_xticks(x)
+    ax.set_xticklabels(scenarios, fontsize=13)
+    ax.legend(fontsize=11)
+    ax.grid(axis="y", alpha=0.3)
+    ax.set_ylim(0, max(uv_ratios + search_ratios) * 1.3)
+
+    interpretation = (
+        f"\nFlatland: Gap {gaps[0]:+.1f}%p\n→ {_gap_label(gaps[0])}\n\n"
+        f"Ski Resort: Gap {gaps[1]:+.1f}%p ⭐\n→ {_gap_label(gaps[1], 'Clear Gap!')}\n"
+    )
+    ax.text(0.02, 0.98, interpretation, transform=ax.transAxes, fontsize=11,
+            verticalalignment="top", bbox=dict(boxstyle="round", facecolor="wheat", alpha=0.8))
+
+    return fig
+
+
+# ============================================
+# Dataset 4: 세그먼트 4사분면
+# ============================================
+QUADRANT_COLORS = {
+    QUADRANT_LABELS["A"]: "#3498db",
+    QUADRANT_LABELS["B"]: "#27ae60",
+    QUADRANT_LABELS["C"]: "#95a5a6",
+    QUADRANT_LABELS["D"]: "#ecf0f1",
+}
+
+
+@figure("4-1", "4-1.네이버-스키장_선크림_세그먼트_분석.png", [SEGMENT_MATRIX_FILE])
+def segment_quadrants(data):
+    """선크림 vs 겨울스포츠 통합 관심도 4사분면 산점도"""
+    stats = data[SEGMENT_MATRIX_FILE].rename(columns={"segment": "세그먼트"})
+    stats["겨울스포츠"] = composite_index(stats, SPORT_KEYWORDS)
+    stats["사분면"] = assign_quadrants(stats, "선크림", "겨울스포츠")
+    suncream_avg = stats["선크림"].mean()
+    sport_avg = stats["겨울스포츠"].mean()
+
+    fig = Figure(figsize=(12, 8))
+    ax = fig.subplots()
+
+    ax.scatter(stats["선크림"], stats["겨울스포츠"], c=stats["사분면"].map(QUADRANT_COLORS),
+               s=500, alpha=0.8, edgecolors="black", linewidth=2)
+    for segment, x, y, quadrant in stats[["세그먼트", "선크림", "겨울스포츠", "사분면"]].itertuples(index=False):
+        ax.annotate(segment, (x, y), fontsize=11, ha="center", va="center",
+                    fontweight="bold" if quadrant == QUADRANT_LABELS["B"] else "normal")
+
+    ax.axhline(y=sport_avg, color="red", linestyle="--", alpha=0.6, linewidth=2)
+    ax.axvline(x=suncream_avg, color="red", linestyle="--", alpha=0.6, linewidth=2)
+
+    offset_x = (stats["선크림"].max() - stats["선크림"].min()) * 0.05
+    offset_y = (stats["겨울스포츠"].max() - stats["겨울스포츠"].min()) * 0.05
+    ax.text(suncream_avg + offset_x, sport_avg + offset_y,
+            "A\n(둘 다 높음)\n리마인더", fontsize=11, alpha=0.6, ha="left", va="bottom")
+    ax.text(suncream_avg - offset_x, sport_avg + offset_y,
+            "B\n(블루오션!)\n교육 캠페인", fontsize=12, alpha=0.8, ha="right", va="bottom",
+            color="green", fontweight="bold")
+    ax.text(suncream_avg + offset_x, sport_avg - offset_y,
+            "C\n(선크림만)\n온라인", fontsize=11, alpha=0.6, ha="left", va="top")
+    ax.text(suncream_avg - offset_x, sport_avg - offset_y,
+            "D\n(둘 다 낮음)\n우선순위↓", fontsize=11, alpha=0.6, ha="right", va="top")
+
+    ax.set_xlabel("Sunscreen Average Search Volume", fontsize=13, fontweight="bold")
+    ax.set_ylabel("Winter Sports Average Search Volume (Ski Resort+Ski+Snowboard)",
+                  fontsize=13, fontweight="bold")
+    ax.set_title("Target Segment 4-Quadrant Analysis\n(Green = Education Campaign Priority)",
+                 fontsize=15, fontweight="bold", pad=20)
+    ax.grid(alpha=0.3)
+    ax.legend(handles=[
+        Patch(facecolor="#27ae60", label="B: Blue Ocean (Top Priority)"),
+        Patch(facecolor="#3498db", label="A: Secondary Target"),
+        Patch(facecolor="#95a5a6", label="C: Online Target"),
+        Patch(facecolor="#ecf0f1", label="D: Low Priority"),
+    ], loc="upper left", fontsize=11)
+    return fig
@@ -0,0 +1,189 @@
+"""
+차트 렌더링 (프로세스 풀, Agg 백엔드)
+- 입력 데이터 해시가 바뀐 차트만 다시 그림 (output/.figures.json에 해시 기록)
+- 차트마다 별도 프로세스에서 렌더링 → 전체 소요 시간 ≈ 가장 오래 걸리는 차트 하나
+"""
+
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from . import figures
+from .figures import FIGURES, load_input
+
+
+DEFAULT_DPI = 300
+MANIFEST_NAME = ".figures.json"
+
+# 한글 라벨용 폰트 후보 (설치된 첫 번째 폰트 사용)
+KOREAN_FONTS = ["Malgun Gothic", "AppleGothic", "NanumGothic", "Noto Sans CJK KR", "Noto Sans KR"]
+
+
+# ============================================
+# 해시 / 매니페스트
+# ============================================
+def file_hash(path, chunk_size=1 << 20):
+    """파일 내용 sha256"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def figure_hash(spec, data_dir, dpi=DEFAULT_DPI, code_hash=None):
+    """
+    차트 입력 해시 (입력 데이터 파일 + 차트 코드 + dpi)
+
+    Returns:
+        str 또는 None (입력 파일이 없을 때)
+    """
+    digest = hashlib.sha256()
+    digest.update((code_hash or file_hash(figures.__file__)).encode())
+    digest.update(f"{spec.name}|{spec.filename}|{dpi}".encode())
+    for name in spec.inputs:
+        path = data_dir / name
+        if not path.exists():
+            return None
+        digest.update(name.encode())
+        digest.update(file_hash(path).encode())
+    return digest.hexdigest()
+
+
+def load_manifest(output_dir):
+    path = output_dir / MANIFEST_NAME
+    if not path.exists():
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_manifest(output_dir, manifest):
+    with open(output_dir / MANIFEST_NAME, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+
+
+# ============================================
+# 워커 (프로세스별 1회 설정 후 차트 렌더링)
+# ============================================
+def _init_worker():
+    """Agg 백엔드 + 한글 폰트 설정"""
+    import matplotlib
+    matplotlib.use("Agg")
+    from matplotlib import font_manager
+
+    installed = {font.name for font in font_manager.fontManager.ttflist}
+    korean = [name for name in KOREAN_FONTS if name in installed]
+    if korean:
+        matplotlib.rcParams["font.family"] = korean[0]
+    matplotlib.rcParams["axes.unicode_minus"] = False
+
+
+def _font_rc():
+    """현재 폰트 설정 (seaborn 스타일 적용 후 다시 덮어쓸 값)"""
+    import matplotlib
+    return {key: matplotlib.rcParams[key] for key in ("font.family", "axes.unicode_minus")}
+
+
+def render_figure(name, data_dir, output_dir, dpi=DEFAULT_DPI):
+    """
+    차트 하나 렌더링 후 저장
+
+    Returns:
+        (name, 소요 시간[초])
+    """
+    import matplotlib
+    import seaborn as sns
+
+    start = time.perf_counter()
+    spec = FIGURES[name]
+    data = {filename: load_input(Path(data_dir), filename) for filename in spec.inputs}
+
+    rc = dict(sns.axes_style(spec.style)) if spec.style else {}
+    rc.update(_font_rc())
+    with matplotlib.rc_context(rc):
+        fig = spec.draw(data)
+        fig.tight_layout()
+        fig.savefig(Path(output_dir) / spec.filename, dpi=dpi, bbox_inches="tight")
+
+    return name, time.perf_counter() - start
+
+
+# ============================================
+# 전체 렌더링
+# ============================================
+def _figure_names(names):
+    names = list(FIGURES) if names is None else list(names)
+    unknown = [name for name in names if name not in FIGURES]
+    if unknown:
+        raise KeyError(f"등록되지 않은 차트: {unknown} (사용 가능: {list(FIGURES)})")
+    return names
+
+
+def check_figures(data_dir, output_dir, names=None, force=False, dpi=DEFAULT_DPI, manifest=None):
+    """
+    렌더링이 필요한 차트 확인 (렌더링하지 않음)
+
+    Returns:
+        (results, stale)
+        - results: {차트 이름: ('skipped', None) | ('missing', 없는 입력 파일)}
+        - stale: {다시 그릴 차트 이름: 입력 해시}
+    """
+    data_dir, output_dir = Path(data_dir), Path(output_dir)
+    if manifest is None:
+        manifest = load_manifest(output_dir)
+    code_hash = file_hash(figures.__file__)
+    results, stale = {}, {}
+
+    for name in _figure_names(names):
+        spec = FIGURES[name]
+        digest = figure_hash(spec, data_dir, dpi, code_hash)
+        if digest is None:
+            results[name] = ("missing", [f for f in spec.inputs if not (data_dir / f).exists()])
+        elif not force and manifest.get(name) == digest and (output_dir / spec.filename).exists():
+            results[name] = ("skipped", None)
+        else:
+            stale[name] = digest
+    return results, stale
+
+
+def render_figures(data_dir, output_dir, names=None, force=False, max_workers=None,
+                   dpi=DEFAULT_DPI):
+    """
+    차트 일괄 렌더링 (입력이 바뀐 차트만, 프로세스 풀)
+
+    Args:
+        data_dir: 입력 데이터 폴더 (data/)
+        output_dir: 출력 폴더 (output/)
+        names: 렌더링할 차트 이름 목록 (None이면 전체, 예: ['2-1', '3-2'])
+        force: 해시가 같아도 다시 렌더링
+        max_workers: 프로세스 수 (None이면 렌더링할 차트 수와 CPU 수 중 작은 값)
+        dpi: 저장 해상도
+
+    Returns:
+        dict: {차트 이름: ('rendered', 소요 시간) | ('skipped', None) | ('missing', 없는 입력 파일)}
+    """
+    data_dir, output_dir = Path(data_dir), Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    names = _figure_names(names)
+    manifest = load_manifest(output_dir)
+    results, stale = check_figures(data_dir, output_dir, names, force, dpi, manifest)
+
+    if stale:
+        workers = max_workers or min(len(stale), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers,
+                                 initializer=_init_worker) as pool:
+            futures = [pool.submit(render_figure, name, str(data_dir), str(output_dir), dpi)
+                       for name in stale]
+            for future in as_completed(futures):
+                name, elapsed = future.result()
+                results[name] = ("rendered", elapsed)
+                manifest[name] = stale[name]
+                # 중간에 실패해도 끝난 차트는 다음 실행에서 건너뛰도록 바로 기록
+                save_manifest(output_dir, manifest)
+
+    return {name: results[name] for name in names}
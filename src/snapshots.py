@@ -0,0 +1,367 @@
+# src/snapshots.py
+"""
+네이버 쇼핑 검색 결과 일별 스냅샷 저장소 (변경 감지 / 상품별 가격 이력)
+
+- 스냅샷: 하루치 검색 결과(여러 검색어)를 productId 기준으로 합쳐 gzip 압축 JSON(컬럼 형식)으로 저장
+- 변경: 직전 스냅샷과 productId → (lprice, hprice) dict로 비교 (DataFrame merge 없이 해시 조회)
+  → 신규 / 삭제 / 가격 변경 상품
+- 가격 이력: 변경 이벤트만 history.csv.gz에 추가 (매일 전체 이력을 다시 처리하지 않음)
+  → 상품별 가격 시계열은 이벤트를 날짜순으로 이어 붙여 복원
+
+구조:
+    data/shopping/
+    ├── snapshots/2025-11-15.json.gz
+    ├── snapshots/2025-11-16.json.gz
+    └── history.csv.gz     # date, productId, event(new / price / removed), lprice, hprice
+
+사용:
+    store = SnapshotStore('data/shopping')
+    diff = store.add('2025-11-16', {'라운드랩 선크림': shopping.get_all_products('라운드랩 선크림')})
+    store.price_history(['12345678'])
+"""
+
+import gzip
+import json
+import re
+from datetime import date as Date
+from pathlib import Path
+
+import pandas as pd
+
+SNAPSHOT_DIR = 'snapshots'
+HISTORY_FILE = 'history.csv.gz'
+SNAPSHOT_VERSION = 1
+
+# 스냅샷에 저장할 필드 (image는 용량만 크고 분석에 쓰지 않아 제외)
+SNAPSHOT_FIELDS = (
+    'title', 'link', 'lprice', 'hprice', 'mallName', 'productType', 'brand', 'maker',
+    'category1', 'category2', 'category3', 'category4',
+)
+PRICE_FIELDS = ('lprice', 'hprice')
+HISTORY_COLUMNS = ('date', 'productId', 'event', 'lprice', 'hprice')
+EVENTS = ('new', 'price', 'removed')
+
+_HTML_TAG = re.compile(r'<[^>]+>')
+
+
+def _price(value):
+    """'12300' → 12300, 빈 값 / 0 → None (hprice 0 = 최고가 정보 없음)"""
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        return None
+    return value or None
+
+
+def _rows(items):
+    """get_all_products 결과 (dict 목록 또는 {필드: 값 목록}) → dict 반복"""
+    if isinstance(items, dict):
+        fields = list(items)
+        return (dict(zip(fields, values)) for values in zip(*items.values()))
+    return iter(items)
+
+
+def _check_date(value):
+    """'YYYY-MM-DD' 검증 (datetime.date도 허용)"""
+    return Date.fromisoformat(str(value)).isoformat()
+
+
+# ============================================
+# 스냅샷
+# ============================================
+class Snapshot:
+    """
+    하루치 상품 목록 (productId → 필드 값)
+
+    Parameters:
+    - date: 'YYYY-MM-DD'
+    - products: {productId: {필드: 값}} (가격은 int 또는 None)
+    - queries: {productId: [검색어, ...]} (상품이 나온 검색어)
+    """
+
+    def __init__(self, date, products, queries):
+        self.date = date
+        self.products = products
+        self.queries = queries
+
+    def __len__(self):
+        return len(self.products)
+
+    @classmethod
+    def from_results(cls, date, results):
+        """{검색어: get_all_products 결과} → Snapshot (여러 검색어에 나온 상품은 하나로)"""
+        products, queries = {}, {}
+        for query, items in results.items():
+            for item in _rows(items):
+                product_id = str(item.get('productId') or '')
+                if not product_id:
+                    continue
+                queries.setdefault(product_id, []).append(query)
+                if product_id in products:
+                    continue
+                record = {field: item.get(field, '') for field in SNAPSHOT_FIELDS}
+                record['title'] = _HTML_TAG.sub('', record['title'] or '')
+                for field in PRICE_FIELDS:
+                    record[field] = _price(record[field])
+                products[product_id] = record
+        return cls(_check_date(date), products, queries)
+
+    def prices(self):
+        """productId → (lprice, hprice) (변경 감지용 해시 인덱스)"""
+        return {product_id: (record['lprice'], record['hprice'])
+                for product_id, record in self.products.items()}
+
+    def to_frame(self):
+        """productId 인덱스 DataFrame (queries는 '|'로 연결)"""
+        ids = sorted(self.products)
+        df = pd.DataFrame([self.products[i] for i in ids], index=pd.Index(ids, name='productId'),
+                          columns=list(SNAPSHOT_FIELDS))
+        df['queries'] = ['|'.join(self.queries.get(i, [])) for i in ids]
+        for field in PRICE_FIELDS:
+            df[field] = pd.to_numeric(df[field], errors='coerce').astype('Int64')
+        return df
+
+    def save(self, path):
+        """컬럼 형식 gzip JSON 저장 (productId 정렬, mtime=0 → 같은 내용이면 같은 파일)"""
+        ids = sorted(self.products)
+        query_names = sorted({q for qs in self.queries.values() for q in qs})
+        query_index = {q: i for i, q in enumerate(query_names)}
+        data = {
+            'version': SNAPSHOT_VERSION,
+            'date': self.date,
+            'productId': ids,
+            'columns': {field: [self.products[i][field] for i in ids] for field in SNAPSHOT_FIELDS},
+            'query_names': query_names,
+            'queries': [[query_index[q] for q in self.queries.get(i, [])] for i in ids],
+        }
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f'.{path.name}.tmp')
+        with open(tmp, 'wb') as raw, gzip.GzipFile(fileobj=raw, mode='wb', mtime=0) as f:
+            f.write(json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+        tmp.replace(path)
+        return path
+
+    @classmethod
+    def load(cls, path, fields=SNAPSHOT_FIELDS):
+        """
+        저장한 스냅샷 읽기
+
+        Parameters:
+        - fields: 읽을 필드 (변경 감지만 할 때는 PRICE_FIELDS)
+        """
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') != SNAPSHOT_VERSION:
+            raise ValueError(f"지원하지 않는 스냅샷 버전: {data.get('version')} ({path})")
+        ids = data['productId']
+        columns = [(field, data['columns'][field]) for field in fields]
+        products = {i: {field: values[n] for field, values in columns} for n, i in enumerate(ids)}
+        names = data['query_names']
+        queries = {i: [names[q] for q in qs] for i, qs in zip(ids, data['queries'])}
+        return cls(data['date'], products, queries)
+
+
+# ============================================
+# 변경 감지
+# ============================================
+class SnapshotDiff:
+    """
+    두 스냅샷 사이의 변경
+
+    - new: 새로 나온 productId
+    - removed: 사라진 productId
+    - changed: {productId: ((이전 lprice, hprice), (현재 lprice, hprice))}
+    """
+
+    def __init__(self, previous_date, date, new, removed, changed, current_prices):
+        self.previous_date = previous_date
+        self.date = date
+        self.new = new
+        self.removed = removed
+        self.changed = changed
+        self._current_prices = current_prices
+
+    def __repr__(self):
+        return (f'SnapshotDiff({self.previous_date} → {self.date}: 신규 {len(self.new):,}, '
+                f'삭제 {len(self.removed):,}, 가격 변경 {len(self.changed):,})')
+
+    def events(self):
+        """가격 이력 이벤트 [(date, productId, event, lprice, hprice), ...]"""
+        rows = [(self.date, i, 'new', *self._current_prices[i]) for i in self.new]
+        rows += [(self.date, i, 'price', *now) for i, (_, now) in self.changed.items()]
+        rows += [(self.date, i, 'removed', None, None) for i in self.removed]
+        return rows
+
+    def price_changes(self):
+        """
+        가격 변경 표
+
+        Returns:
+            DataFrame: productId, lprice_before, lprice, lprice_change, lprice_change_pct,
+                       hprice_before, hprice (lprice 변화율 순)
+        """
+        columns = ['productId', 'lprice_before', 'lprice', 'hprice_before', 'hprice']
+        rows = [(i, before[0], now[0], before[1], now[1]) for i, (before, now) in self.changed.items()]
+        df = pd.DataFrame(rows, columns=columns)
+        for column in columns[1:]:
+            df[column] = pd.to_numeric(df[column]).astype('Int64')
+        df['lprice_change'] = df['lprice'] - df['lprice_before']
+        df['lprice_change_pct'] = (df['lprice_change'] / df['lprice_before'] * 100).astype('Float64').round(1)
+        df = df[['productId', 'lprice_before', 'lprice', 'lprice_change', 'lprice_change_pct',
+                 'hprice_before', 'hprice']]
+        return df.sort_values('lprice_change_pct', kind='stable').reset_index(drop=True)
+
+
+def diff_prices(previous, current, previous_date=None, date=None):
+    """
+    productId → (lprice, hprice) dict 두 개 비교 (해시 조회, 정렬 / merge 없음)
+
+    Returns:
+        SnapshotDiff (productId 목록은 정렬)
+    """
+    new = sorted(i for i in current if i not in previous)
+    removed = sorted(i for i in previous if i not in current)
+    changed = {}
+    for i in sorted(current):
+        before = previous.get(i)
+        if before is not None and tuple(before) != current[i]:
+            changed[i] = (tuple(before), current[i])
+    return SnapshotDiff(previous_date, date, new, removed, changed, current)
+
+
+# ============================================
+# 저장소
+# ============================================
+class SnapshotStore:
+    """
+    일별 스냅샷 + 가격 변경 이력
+
+    스냅샷은 날짜순으로만 추가합니다 (마지막 날짜 재저장은 replace=True).
+    """
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self.snapshot_dir = self.root / SNAPSHOT_DIR
+        self.history_path = self.root / HISTORY_FILE
+
+    def snapshot_path(self, date):
+        return self.snapshot_dir / f'{_check_date(date)}.json.gz'
+
+    def dates(self):
+        """저장된 스냅샷 날짜 (오름차순)"""
+        if not self.snapshot_dir.exists():
+            return []
+        return sorted(p.name[:-len('.json.gz')] for p in self.snapshot_dir.glob('*.json.gz'))
+
+    def latest_date(self):
+        dates = self.dates()
+        return dates[-1] if dates else None
+
+    def load(self, date=None, fields=SNAPSHOT_FIELDS):
+        """스냅샷 읽기 (date 생략 시 최신)"""
+        date = date or self.latest_date()
+        if date is None:
+            raise FileNotFoundError(f"저장된 스냅샷이 없습니다: {self.snapshot_dir}")
+        return Snapshot.load(self.snapshot_path(date), fields)
+
+    def frame(self, date=None):
+        """스냅샷 → productId 인덱스 DataFrame"""
+        return self.load(date).to_frame()
+
+    def add(self, date, results, replace=False):
+        """
+        하루치 검색 결과 저장 + 직전 스냅샷과 비교 + 가격 이력에 변경 추가
+
+        Parameters:
+        - date: 'YYYY-MM-DD' (마지막 스냅샷보다 뒤, replace=True면 같은 날짜도 가능)
+        - results: {검색어: get_all_products 결과}
+        - replace: 마지막 날짜 스냅샷을 다시 저장 (그 날짜의 이력은 새로 계산)
+
+        Returns:
+            SnapshotDiff (첫 스냅샷이면 모든 상품이 신규)
+        """
+        snapshot = Snapshot.from_results(date, results)
+        dates = self.dates()
+        if dates and snapshot.date <= dates[-1]:
+            if not (replace and snapshot.date == dates[-1]):
+                raise ValueError(f"스냅샷은 날짜순으로만 추가합니다: {snapshot.date} "
+                                 f"(마지막: {dates[-1]}, 같은 날짜 재저장은 replace=True)")
+            dates = dates[:-1]
+            self._drop_history(snapshot.date)
+
+        previous_date = dates[-1] if dates else None
+        previous = self.load(previous_date, PRICE_FIELDS).prices() if previous_date else {}
+        diff = diff_prices(previous, snapshot.prices(), previous_date, snapshot.date)
+
+        snapshot.save(self.snapshot_path(snapshot.date))
+        self._append_history(diff.events())
+        return diff
+
+    def diff(self, previous_date, date):
+        """저장된 두 스냅샷 비교"""
+        previous = self.load(previous_date, PRICE_FIELDS).prices()
+        current = self.load(date, PRICE_FIELDS).prices()
+        return diff_prices(previous, current, previous_date, date)
+
+    # ------------------------------------------
+    # 가격 이력
+    # ------------------------------------------
+    def _append_history(self, rows):
+        """이벤트 추가 (gzip 멤버를 이어 붙임 → 기존 내용은 다시 쓰지 않음)"""
+        if not rows:
+            return
+        df = pd.DataFrame(rows, columns=list(HISTORY_COLUMNS))
+        header = not self.history_path.exists()
+        self.root.mkdir(parents=True, exist_ok=True)
+        with gzip.open(self.history_path, 'at', encoding='utf-8', newline='') as f:
+            df.to_csv(f, index=False, header=header, float_format='%.0f')
+
+    def _drop_history(self, date):
+        """date 이후 이벤트 삭제 (replace용, 파일 전체를 다시 씀)"""
+        if not self.history_path.exists():
+            return
+        history = self.read_history()
+        history = history[history['date'] < date]
+        tmp = self.history_path.with_name(f'.{self.history_path.name}.tmp')
+        with gzip.open(tmp, 'wt', encoding='utf-8', newline='') as f:
+            history.to_csv(f, index=False, float_format='%.0f')
+        tmp.replace(self.history_path)
+
+    def read_history(self, product_ids=None):
+        """
+        가격 변경 이벤트
+
+        Parameters:
+        - product_ids: 특정 상품만 (None이면 전체)
+
+        Returns:
+            DataFrame: date, productId, event, lprice, hprice (날짜순)
+        """
+        if not self.history_path.exists():
+            return pd.DataFrame(columns=list(HISTORY_COLUMNS))
+        history = pd.read_csv(self.history_path, dtype={'date': str, 'productId': str, 'event': str})
+        for field in PRICE_FIELDS:
+            history[field] = history[field].astype('Int64')
+        if product_ids is not None:
+            history = history[history['productId'].isin([str(i) for i in product_ids])]
+        return history.reset_index(drop=True)
+
+    def price_history(self, product_ids=None, field='lprice'):
+        """
+        상품별 가격 시계열 (스냅샷 날짜 × productId, 이벤트 사이는 직전 가격 유지)
+
+        Returns:
+            DataFrame: 인덱스 date, 컬럼 productId (목록에 없던 날은 NaN)
+        """
+        history = self.read_history(product_ids)
+        dates = self.dates()
+        if history.empty:
+            return pd.DataFrame(index=pd.Index(dates, name='date'))
+
+        wide = history.pivot(index='date', columns='productId', values=field).astype('Float64')
+        wide = wide.reindex(dates).ffill()
+        # 첫 등장 전 / 삭제 이후 (다시 나오기 전까지)는 NaN
+        events = history.pivot(index='date', columns='productId', values='event')
+        events = events.reindex(dates).ffill()
+        return wide.where(events.notna() & (events != 'removed'))
@@ -0,0 +1,40 @@
+# src/storage.py
+"""
+수집 결과 저장 (CSV / Parquet)
+
+- CSV: 기존 수집 스크립트와 동일 (utf-8-sig, 인덱스 없음)
+- Parquet: pyarrow 또는 fastparquet 필요 (선택 의존성)
+"""
+
+from pathlib import Path
+
+FORMATS = ('csv', 'parquet')
+
+
+def table_path(path, fmt='csv'):
+    """저장 형식에 맞게 확장자 변경 (예: 01_선크림_월별_트렌드.parquet)"""
+    if fmt not in FORMATS:
+        raise ValueError(f"지원하지 않는 저장 형식: {fmt} (사용 가능: {FORMATS})")
+    return Path(path).with_suffix(f'.{fmt}')
+
+
+def save_table(df, path, fmt='csv', index=False):
+    """
+    DataFrame 저장
+
+    Args:
+        df: 저장할 DataFrame
+        path: 저장 경로 (확장자는 fmt에 맞게 변경)
+        fmt: 'csv' 또는 'parquet'
+        index: 인덱스 저장 여부
+
+    Returns:
+        Path: 실제 저장 경로
+    """
+    path = table_path(path, fmt)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if fmt == 'parquet':
+        df.to_parquet(path, index=index)
+    else:
+        df.to_csv(path, index=index, encoding='utf-8-sig')
+    return path
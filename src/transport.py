@@ -0,0 +1,275 @@
+# src/transport.py
+"""
+HTTP 전송 계층 (실제 요청 / 카세트 기록 / 카세트 재생)
+
+- live:   requests로 실제 요청 (기본)
+- record: 실제 요청 + 응답을 카세트에 기록 (gzip 압축 JSON)
+- replay: 카세트의 응답을 메모리에서 반환 (네트워크 사용 안 함, 선택적으로 지연 시간 재현)
+
+카세트 키는 정규화한 요청 (메서드, URL, 인증 파라미터를 뺀 정렬된 쿼리, 키 정렬 JSON 바디)
+→ 인증 헤더 / 키가 달라도 같은 요청이면 같은 응답. 카세트에는 인증 정보를 저장하지 않습니다.
+
+사용:
+    with use_cassette('tests/cassettes/dataset_1.json.gz', mode='record'):
+        collect_dataset_1()
+
+    환경 변수: SODA_CASSETTE=경로  SODA_CASSETTE_MODE=record|replay  SODA_CASSETTE_LATENCY=초|recorded
+"""
+
+import atexit
+import base64
+import contextlib
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+import requests
+
+MODES = ('live', 'record', 'replay')
+CASSETTE_VERSION = 1
+
+# 카세트 키 / 저장에서 제외할 인증 파라미터
+SECRET_PARAMS = ('authKey', 'serviceKey', 'client_secret')
+
+
+class CassetteMiss(Exception):
+    """replay 모드에서 카세트에 없는 요청"""
+
+
+class CassetteResponse:
+    """카세트에서 재생한 응답 (requests.Response에서 쓰는 속성만)"""
+
+    def __init__(self, status_code, content, url=''):
+        self.status_code = status_code
+        self.content = content
+        self.url = url
+        self.encoding = 'utf-8'
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding, errors='replace')
+
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status_code} Error: {self.url}", response=self)
+
+
+# ============================================
+# 요청 정규화
+# ============================================
+def _normalize_body(data):
+    """JSON 바디는 키 정렬로 직렬화, 그 외는 bytes 그대로"""
+    if data is None:
+        return b''
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    try:
+        return json.dumps(json.loads(data), sort_keys=True, ensure_ascii=False,
+                          separators=(',', ':')).encode('utf-8')
+    except ValueError:
+        return data
+
+
+def _public_params(params):
+    """인증 파라미터를 뺀 정렬된 쿼리 [(이름, 값 문자열), ...]"""
+    return sorted((str(k), str(v)) for k, v in (params or {}).items() if k not in SECRET_PARAMS)
+
+
+def cassette_key(method, url, params=None, data=None):
+    """정규화한 요청 → 카세트 키 (sha256)"""
+    digest = hashlib.sha256(f'{method.upper()} {url}'.encode('utf-8'))
+    digest.update(json.dumps(_public_params(params), ensure_ascii=False).encode('utf-8'))
+    digest.update(_normalize_body(data))
+    return digest.hexdigest()
+
+
+# ============================================
+# 카세트
+# ============================================
+def _encode_body(content):
+    try:
+        return {'text': content.decode('utf-8')}
+    except UnicodeDecodeError:
+        return {'base64': base64.b64encode(content).decode('ascii')}
+
+
+def _decode_body(body):
+    if 'text' in body:
+        return body['text'].encode('utf-8')
+    return base64.b64decode(body['base64'])
+
+
+class Cassette:
+    """
+    요청 → 응답 기록 (메모리 dict, 파일은 gzip JSON)
+
+    Parameters:
+    - path: 카세트 파일 (.json.gz)
+    - mode: 'record' (기존 내용에 추가) 또는 'replay'
+    - latency: replay 시 요청마다 대기 (None: 없음, 초, 'recorded': 기록된 응답 시간)
+    """
+
+    def __init__(self, path, mode='replay', latency=None):
+        if mode not in ('record', 'replay'):
+            raise ValueError(f"카세트 모드는 'record' 또는 'replay'여야 합니다: {mode}")
+        self.path = Path(path)
+        self.mode = mode
+        self.latency = latency
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._dirty = False
+
+        if self.path.exists():
+            self.load()
+        elif mode == 'replay':
+            raise FileNotFoundError(f"카세트가 없습니다: {self.path} (먼저 record 모드로 기록)")
+
+    def __len__(self):
+        return len(self.entries)
+
+    def load(self):
+        with gzip.open(self.path, 'rt', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') != CASSETTE_VERSION:
+            raise ValueError(f"지원하지 않는 카세트 버전: {data.get('version')} ({self.path})")
+        self.entries = {entry['key']: entry for entry in data['entries']}
+
+    def save(self):
+        """기록 내용 저장 (변경이 없으면 생략, 키 순서로 정렬 → 같은 기록은 같은 파일)"""
+        with self._lock:
+            if not self._dirty:
+                return
+            entries = [self.entries[key] for key in sorted(self.entries)]
+            self._dirty = False
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f'.{self.path.name}.tmp')
+        # mtime=0: 내용이 같으면 파일도 바이트 단위로 같음
+        with open(tmp, 'wb') as raw, gzip.GzipFile(fileobj=raw, mode='wb', mtime=0) as f:
+            f.write(json.dumps({'version': CASSETTE_VERSION, 'entries': entries},
+                               ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+        tmp.replace(self.path)
+
+    def play(self, method, url, params=None, data=None):
+        """기록된 응답 반환 (없으면 CassetteMiss)"""
+        key = cassette_key(method, url, params, data)
+        entry = self.entries.get(key)
+        if entry is None:
+            with self._lock:
+                self.misses += 1
+            raise CassetteMiss(f"카세트에 없는 요청: {method.upper()} {url} {_public_params(params)}")
+        with self._lock:
+            self.hits += 1
+
+        delay = entry['elapsed'] if self.latency == 'recorded' else self.latency
+        if delay:
+            time.sleep(delay)
+        return CassetteResponse(entry['status'], _decode_body(entry['body']), url)
+
+    def record(self, method, url, params, data, response, elapsed):
+        entry = {
+            'key': cassette_key(method, url, params, data),
+            'method': method.upper(),
+            'url': url,
+            'params': _public_params(params),
+            'status': response.status_code,
+            'elapsed': round(elapsed, 4),
+            'body': _encode_body(response.content),
+        }
+        with self._lock:
+            self.entries[entry['key']] = entry
+            self._dirty = True
+
+
+# ============================================
+# 요청
+# ============================================
+_cassette = None
+
+
+def request(method, url, headers=None, params=None, data=None, timeout=None):
+    """
+    HTTP 요청 (현재 카세트 모드에 따라 실제 요청 / 기록 / 재생)
+
+    Returns:
+        requests.Response 또는 CassetteResponse (status_code, content, text, raise_for_status)
+    """
+    cassette = _cassette
+    if cassette is not None and cassette.mode == 'replay':
+        return cassette.play(method, url, params, data)
+
+    start = time.perf_counter()
+    response = requests.request(method, url, headers=headers, params=params, data=data,
+                                timeout=timeout)
+    if cassette is not None:
+        cassette.record(method, url, params, data, response, time.perf_counter() - start)
+    return response
+
+
+def current_cassette():
+    """사용 중인 카세트 (live 모드면 None)"""
+    return _cassette
+
+
+def is_replay():
+    """replay 모드 여부 (요청 간 대기 등 실제 API용 처리 생략에 사용)"""
+    return _cassette is not None and _cassette.mode == 'replay'
+
+
+@contextlib.contextmanager
+def use_cassette(path, mode='replay', latency=None):
+    """
+    블록 안의 요청을 카세트로 기록 / 재생 (끝나면 record 내용 저장)
+
+    Args:
+        path: 카세트 파일 (.json.gz)
+        mode: 'record', 'replay' 또는 'live' (카세트 사용 안 함)
+        latency: replay 지연 (None, 초, 'recorded')
+    """
+    global _cassette
+    if mode not in MODES:
+        raise ValueError(f"지원하지 않는 모드: {mode} (사용 가능: {MODES})")
+    if mode == 'live':
+        yield None
+        return
+
+    previous = _cassette
+    _cassette = Cassette(path, mode, latency)
+    try:
+        yield _cassette
+    finally:
+        if _cassette.mode == 'record':
+            _cassette.save()
+        _cassette = previous
+
+
+def parse_latency(value):
+    """'0.05' → 0.05, 'recorded' → 'recorded', '' / None → None"""
+    if value in (None, '', '0'):
+        return None
+    return value if value == 'recorded' else float(value)
+
+
+def _install_from_env():
+    """SODA_CASSETTE 환경 변수가 있으면 프로세스 전체에 카세트 적용 (종료 시 저장)"""
+    global _cassette
+    path = os.getenv('SODA_CASSETTE')
+    if not path:
+        return
+    mode = os.getenv('SODA_CASSETTE_MODE', 'replay')
+    if mode == 'live':
+        return
+    _cassette = Cassette(path, mode, parse_latency(os.getenv('SODA_CASSETTE_LATENCY')))
+    if mode == 'record':
+        atexit.register(_cassette.save)
+
+
+_install_from_env()
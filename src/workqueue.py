@@ -0,0 +1,351 @@
+# src/workqueue.py
+"""
+대규모 키워드 × 세그먼트 수집용 작업 큐 (SQLite, 한 호스트의 여러 워커 프로세스)
+
+- 코디네이터: 수집 조합(키워드 × 세그먼트)을 작업으로 나눠 큐에 등록
+- 워커: 작업을 임대(lease) → 수집 → 조합별 파티션 파일 저장 → 완료 표시
+- 임대 시간이 지나도록 완료되지 않은 작업(워커 중단 등)은 다른 워커가 다시 가져감
+- 실패한 작업은 max_attempts회까지 재시도, 이후 'failed'
+- 파티션을 합치면 Dataset 4와 같은 형식의 long format 테이블
+"""
+
+import contextlib
+import json
+import os
+import sqlite3
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from storage import FORMATS, save_table
+
+STATUSES = ('pending', 'leased', 'done', 'failed')
+DEFAULT_LEASE = 300.0      # 작업 임대 시간 (초)
+DEFAULT_MAX_ATTEMPTS = 3   # 작업당 최대 시도 횟수
+PARTS_DIR = 'parts'
+QUEUE_FILE = 'queue.sqlite'
+MERGED_NAME = '04_세그먼트별_통합_데이터.csv'
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY,
+    key TEXT UNIQUE NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    lease_until REAL,
+    worker TEXT,
+    error TEXT,
+    updated REAL
+);
+CREATE INDEX IF NOT EXISTS tasks_status ON tasks (status, id);
+'''
+
+
+class Task:
+    """임대한 작업 (id, key, payload dict, 시도 횟수)"""
+
+    def __init__(self, id, key, payload, attempts):
+        self.id = id
+        self.key = key
+        self.payload = payload
+        self.attempts = attempts
+
+    def __repr__(self):
+        return f'Task(id={self.id}, key={self.key!r}, attempts={self.attempts})'
+
+
+class WorkQueue:
+    """
+    SQLite 작업 큐 (여러 프로세스가 같은 파일을 공유)
+
+    임대는 BEGIN IMMEDIATE 트랜잭션으로 처리해 같은 작업을 두 워커가 동시에 가져가지 않습니다.
+    연결은 프로세스마다 따로 만드세요 (fork 후 부모 연결 재사용 금지).
+    """
+
+    def __init__(self, path, max_attempts=DEFAULT_MAX_ATTEMPTS, timeout=30.0):
+        self.path = Path(path)
+        self.max_attempts = max_attempts
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), timeout=timeout, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(_SCHEMA)
+
+    def close(self):
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @contextlib.contextmanager
+    def _transaction(self):
+        """쓰기 잠금을 먼저 잡는 트랜잭션 (임대 경쟁 방지)"""
+        self._conn.execute('BEGIN IMMEDIATE')
+        try:
+            yield self._conn
+        except BaseException:
+            self._conn.execute('ROLLBACK')
+            raise
+        self._conn.execute('COMMIT')
+
+    # 등록 -----------------------------------------------------------
+    def put(self, tasks):
+        """
+        작업 등록 (key가 이미 있으면 무시 → 코디네이터를 다시 실행해도 중복 없음)
+
+        Args:
+            tasks: [(key, payload dict), ...]
+
+        Returns:
+            int: 새로 등록한 작업 수
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            before = conn.total_changes
+            conn.executemany(
+                'INSERT OR IGNORE INTO tasks (key, payload, updated) VALUES (?, ?, ?)',
+                [(key, json.dumps(payload, ensure_ascii=False), now) for key, payload in tasks]
+            )
+            return conn.total_changes - before
+
+    # 임대 / 결과 -----------------------------------------------------
+    def lease(self, worker, lease_seconds=DEFAULT_LEASE):
+        """
+        대기 중이거나 임대 시간이 지난 작업 하나 임대 (없으면 None)
+
+        Returns:
+            Task 또는 None
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            row = conn.execute(
+                '''SELECT id, key, payload, attempts FROM tasks
+                   WHERE (status = 'pending' OR (status = 'leased' AND lease_until < ?))
+                     AND attempts < ?
+                   ORDER BY id LIMIT 1''',
+                (now, self.max_attempts)
+            ).fetchone()
+            if row is None:
+                # 임대 시간이 지났는데 시도 횟수를 다 쓴 작업은 실패 처리
+                conn.execute(
+                    '''UPDATE tasks SET status = 'failed', error = COALESCE(error, '임대 시간 초과'),
+                              updated = ? WHERE status = 'leased' AND lease_until < ?''',
+                    (now, now)
+                )
+                return None
+            task_id, key, payload, attempts = row
+            conn.execute(
+                '''UPDATE tasks SET status = 'leased', attempts = ?, lease_until = ?, worker = ?,
+                          updated = ? WHERE id = ?''',
+                (attempts + 1, now + lease_seconds, worker, now, task_id)
+            )
+        return Task(task_id, key, json.loads(payload), attempts + 1)
+
+    def complete(self, task, worker):
+        """
+        작업 완료 표시
+
+        Returns:
+            bool: 아직 이 워커의 임대였는지 (임대 시간이 지나 다른 워커가 가져갔으면 False)
+        """
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                '''UPDATE tasks SET status = 'done', error = NULL, lease_until = NULL, updated = ?
+                   WHERE id = ? AND worker = ? AND status = 'leased' ''',
+                (time.time(), task.id, worker)
+            )
+            return cursor.rowcount == 1
+
+    def fail(self, task, worker, error):
+        """작업 실패 (시도 횟수가 남았으면 대기 상태로 되돌려 재시도)"""
+        with self._transaction() as conn:
+            conn.execute(
+                '''UPDATE tasks SET status = CASE WHEN attempts < ? THEN 'pending' ELSE 'failed' END,
+                          error = ?, lease_until = NULL, updated = ?
+                   WHERE id = ? AND worker = ? AND status = 'leased' ''',
+                (self.max_attempts, str(error), time.time(), task.id, worker)
+            )
+
+    def release(self, task, worker):
+        """시도 횟수를 세지 않고 작업 반환 (예: API 한도 소진으로 워커 종료)"""
+        with self._transaction() as conn:
+            conn.execute(
+                '''UPDATE tasks SET status = 'pending', attempts = attempts - 1, lease_until = NULL,
+                          updated = ? WHERE id = ? AND worker = ? AND status = 'leased' ''',
+                (time.time(), task.id, worker)
+            )
+
+    def retry_failed(self):
+        """실패한 작업을 다시 대기 상태로 (시도 횟수 초기화)"""
+        with self._transaction() as conn:
+            return conn.execute(
+                '''UPDATE tasks SET status = 'pending', attempts = 0, updated = ?
+                   WHERE status = 'failed' ''',
+                (time.time(),)
+            ).rowcount
+
+    # 상태 -----------------------------------------------------------
+    def counts(self):
+        """상태별 작업 수 {'pending': .., 'leased': .., 'done': .., 'failed': ..}"""
+        counts = dict.fromkeys(STATUSES, 0)
+        for status, count in self._conn.execute(
+                'SELECT status, COUNT(*) FROM tasks GROUP BY status'):
+            counts[status] = count
+        return counts
+
+    def is_finished(self):
+        """모든 작업이 완료 또는 실패"""
+        counts = self.counts()
+        return counts['pending'] == 0 and counts['leased'] == 0
+
+    def done_ids(self):
+        """완료된 작업 id 집합"""
+        return {row[0] for row in self._conn.execute("SELECT id FROM tasks WHERE status = 'done'")}
+
+    def failures(self):
+        """실패한 작업 [(key, 오류 메시지), ...]"""
+        return self._conn.execute(
+            "SELECT key, error FROM tasks WHERE status = 'failed' ORDER BY id"
+        ).fetchall()
+
+
+# ============================================
+# 키워드 × 세그먼트 수집 작업
+# ============================================
+def sweep_tasks(keywords, segments, start_date, end_date):
+    """
+    키워드 × 세그먼트 조합 → 작업 목록 (Dataset 4와 같은 키워드 우선 순서)
+
+    Args:
+        segments: [(이름, 성별, 연령 코드, 연령대, 성별 한글), ...]
+
+    Returns:
+        list: [(key, payload), ...]
+    """
+    tasks = []
+    for keyword in dict.fromkeys(keywords):
+        for seg_name, gender, ages, age_group, gender_kr in segments:
+            key = f'{keyword}|{seg_name}|{start_date}|{end_date}'
+            tasks.append((key, {
+                'keyword': keyword, 'segment': seg_name, 'gender': gender, 'ages': list(ages),
+                'age_group': age_group, 'gender_kr': gender_kr,
+                'start_date': start_date, 'end_date': end_date,
+            }))
+    return tasks
+
+
+def _partition_path(out_dir, task, fmt):
+    """파티션 파일 경로: parts/keyword=<키워드>/part-<작업 id>.<형식>"""
+    keyword = task.payload['keyword'].replace(os.sep, '_')
+    return Path(out_dir) / PARTS_DIR / f'keyword={keyword}' / f'part-{task.id:06d}.{fmt}'
+
+
+def fetch_task(datalab, task):
+    """작업 하나 수집 → long format DataFrame (Dataset 4 통합 데이터와 같은 컬럼)"""
+    from analysis.segmentation import stack_segments
+
+    p = task.payload
+    result = datalab.get_search_trend(
+        keywords=[p['keyword']], start_date=p['start_date'], end_date=p['end_date'],
+        time_unit='month', gender=p['gender'], ages=p['ages']
+    )
+    df = datalab.to_dataframe(result)
+    meta = {'keyword': p['keyword'], 'segment': p['segment'],
+            'gender': p['gender_kr'], 'age_group': p['age_group']}
+    if df.empty:
+        return stack_segments([(meta, [], [])])
+    return stack_segments([(meta, df['date'].to_numpy(), df[p['keyword']].to_numpy())])
+
+
+def write_partition(df, out_dir, task, fmt='csv'):
+    """파티션 저장 (임시 파일 → 이름 변경, 같은 작업을 다시 수행하면 덮어씀)"""
+    path = _partition_path(out_dir, task, fmt)
+    tmp = save_table(df, path.with_name(f'.{path.stem}.{os.getpid()}.tmp.{fmt}'), fmt)
+    tmp.replace(path)
+    return path
+
+
+# ============================================
+# 워커
+# ============================================
+def run_worker(queue_path, out_dir, worker=None, datalab=None, fmt='csv',
+               lease_seconds=DEFAULT_LEASE, max_attempts=DEFAULT_MAX_ATTEMPTS, poll=1.0):
+    """
+    워커 루프: 큐가 빌 때까지 임대 → 수집 → 파티션 저장 → 완료
+
+    다른 워커가 임대 중인 작업이 남아 있으면 임대 시간 초과(재시도 대상)를 기다리며 대기합니다.
+
+    Args:
+        queue_path: 큐 파일
+        out_dir: 파티션 저장 폴더
+        worker: 워커 이름 (None이면 'pid-<프로세스 id>')
+        datalab: NaverDataLab (None이면 새로 생성)
+        fmt: 'csv' 또는 'parquet'
+
+    Returns:
+        dict: {'done': 완료 수, 'failed': 실패 수}
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"지원하지 않는 저장 형식: {fmt} (사용 가능: {FORMATS})")
+    if datalab is None:
+        from naver_api import NaverDataLab, RateLimiter
+        datalab = NaverDataLab(rate_limiter=RateLimiter())
+    from naver_api import KeyPoolExhausted
+
+    worker = worker or f'pid-{os.getpid()}'
+    stats = {'done': 0, 'failed': 0}
+    with WorkQueue(queue_path, max_attempts=max_attempts) as queue:
+        while True:
+            task = queue.lease(worker, lease_seconds)
+            if task is None:
+                if queue.is_finished():
+                    return stats
+                time.sleep(poll)
+                continue
+
+            try:
+                df = fetch_task(datalab, task)
+                write_partition(df, out_dir, task, fmt)
+            except KeyPoolExhausted as e:
+                queue.release(task, worker)
+                print(f"  ⚠️ [{worker}] {e} → 워커 종료")
+                return stats
+            except Exception as e:
+                queue.fail(task, worker, e)
+                stats['failed'] += 1
+                print(f"  ❌ [{worker}] {task.key} (시도 {task.attempts}): {e}")
+                continue
+
+            if queue.complete(task, worker):
+                stats['done'] += 1
+                print(f"  ✅ [{worker}] {task.key}")
+
+
+# ============================================
+# 결과 병합
+# ============================================
+def merge_partitions(out_dir, fmt='csv', queue_path=None):
+    """
+    파티션 파일 → 하나의 long format DataFrame (작업 id = 등록 순서)
+
+    queue_path를 지정하면 완료된 작업의 파티션만 사용 (임대 시간 초과 후 늦게 쓴 파일 제외)
+    """
+    paths = sorted(Path(out_dir, PARTS_DIR).glob(f'keyword=*/part-*.{fmt}'),
+                   key=lambda p: int(p.stem.split('-')[1]))
+    if queue_path is not None:
+        with WorkQueue(queue_path) as queue:
+            done = queue.done_ids()
+        paths = [p for p in paths if int(p.stem.split('-')[1]) in done]
+    if not paths:
+        return pd.DataFrame()
+
+    if fmt == 'parquet':
+        frames = [pd.read_parquet(p) for p in paths]
+    else:
+        frames = [pd.read_csv(p, parse_dates=['date'], encoding='utf-8-sig') for p in paths]
+    return pd.concat(frames, ignore_index=True)
@@ -0,0 +1,16 @@
+"""
+pytest 공통 설정 — src / 프로젝트 루트를 import 경로에 추가
+
+실행:
+    python -m pytest -q tests
+"""
+
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+src_dir = project_root / 'src'
+
+for path in (project_root, src_dir):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
@@ -1,6 +1,10 @@
 # tests/test_api.py
 """
 네이버 API 연결 테스트 스크립트
+
+오프라인 실행 (카세트 기록 / 재생, src/transport.py):
+    SODA_CASSETTE=tests/cassettes/naver_api.json.gz SODA_CASSETTE_MODE=record python tests/naver-api-test.py
+    SODA_CASSETTE=tests/cassettes/naver_api.json.gz python tests/naver-api-test.py
 """
 
 import sys
@@ -26,6 +30,11 @@ if project_root not in sys.path:
     sys.path.insert(0, project_root)
     print(f"✅ sys.path에 추가됨: {project_root}")
 
+# src 폴더 (HTTP 전송 계층)
+src_dir = os.path.join(project_root, 'src')
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
 print(f"\n현재 sys.path:")
 for p in sys.path[:3]:
     print(f"  - {p}")
@@ -53,10 +62,11 @@ except AttributeError as e:
     print(f"  .env 파일을 생성하고 API 키를 입력하세요")
     sys.exit(1)
 
-import requests
 import json
 from datetime import datetime
 
+import transport
+
 # ============================================
 # 색상 출력
 # ============================================
@@ -137,7 +147,7 @@ def test_datalab_api():
         }
         
         print_info("API 요청 중...")
-        response = requests.post(url, headers=headers, data=json.dumps(body))
+        response = transport.request("POST", url, headers=headers, data=json.dumps(body))
         
         if response.status_code == 200:
             data = response.json()
@@ -182,7 +192,7 @@ def test_shopping_api():
         params = {"query": "테스트", "display": 5}
         
         print_info("API 요청 중...")
-        response = requests.get(url, headers=headers, params=params)
+        response = transport.request("GET", url, headers=headers, params=params)
         
         if response.status_code == 200:
             data = response.json()
@@ -215,7 +225,7 @@ def test_blog_api():
         params = {"query": "테스트", "display": 5}
         
         print_info("API 요청 중...")
-        response = requests.get(url, headers=headers, params=params)
+        response = transport.request("GET", url, headers=headers, params=params)
         
         if response.status_code == 200:
             data = response.json()
@@ -0,0 +1,35 @@
+"""analysis.cooccurrence 블로그 역색인 / 동시 언급률 테스트"""
+
+import pandas as pd
+
+from analysis.cooccurrence import CooccurrenceIndex
+
+TOKENS = [
+    ["스키", "톤업선크림", "추천"],        # 스키 + 선크림 (복합어)
+    ["스키장", "후기"],                    # 스키장만
+    ["스키니", "선크림", "코디"],          # 스키니진 코디 → 스포츠 글 아님
+    ["스키마", "설계"],
+    ["스노우보드", "자외선차단제"],
+]
+DATES = ["20240105", "20240110", "20240115", "20240201", "20240203"]
+
+
+def test_cooccurrence_sport_exact_match():
+    index = CooccurrenceIndex.from_tokens(TOKENS, DATES)
+    table = index.cooccurrence().set_index(["keyword", "month"])
+
+    assert table.loc[("스키", "2024-01"), "posts"] == 1
+    assert table.loc[("스키", "2024-01"), "both"] == 1
+    assert table.loc[("스키", "2024-02"), "posts"] == 0
+    assert pd.isna(table.loc[("스키", "2024-02"), "rate"])
+    assert table.loc[("전체", "2024-01"), ["posts", "both"]].tolist() == [2, 1]
+    assert table.loc[("전체", "2024-02"), ["posts", "both"]].tolist() == [1, 1]
+
+
+def test_cooccurrence_sunscreen_substring_match():
+    index = CooccurrenceIndex.from_tokens(TOKENS, DATES)
+    assert set(index.terms("선크림")) == {"선크림", "톤업선크림"}
+    assert set(index.terms("스키", "prefix")) == {"스키", "스키장", "스키니", "스키마"}
+
+    table = index.cooccurrence(sport_match="prefix").set_index(["keyword", "month"])
+    assert table.loc[("스키", "2024-01"), "posts"] == 3
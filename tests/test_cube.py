@@ -0,0 +1,57 @@
+"""analysis.cube 집계 큐브 조회 테스트"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from analysis.cube import STATS, AggregateCube
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(0)
+    dates = pd.date_range("2023-01-01", "2024-12-31", freq="D")
+    rows = [(date, segment, keyword) for segment in ("20대 여성", "30대 남성")
+            for keyword in ("선크림", "스키") for date in dates]
+    df = pd.DataFrame(rows, columns=["date", "segment", "keyword"])
+    df["search_volume"] = rng.uniform(0, 100, len(df))
+    df["year"] = df["date"].dt.year
+    df["month"] = df["date"].dt.month
+    return df
+
+
+@pytest.fixture
+def cube(frame):
+    return AggregateCube.from_frame(frame)
+
+
+@pytest.mark.parametrize("stat", STATS)
+def test_query_matches_groupby(cube, frame, stat):
+    expected = frame[frame["year"] == 2024].groupby(["segment", "month"])["search_volume"].agg(stat)
+    result = cube.query(stat, by=("segment", "month"), where={"year": 2024})
+    np.testing.assert_allclose(result.to_numpy(), expected.to_numpy(), rtol=1e-9)
+
+
+@pytest.mark.parametrize("stat", STATS)
+def test_query_empty_where(cube, stat):
+    assert cube.query(stat, where={"year": 1999}).empty
+    assert cube.query(stat, by=("keyword", "season"), where={"year": 1999}).empty
+
+    total = cube.query(stat, by=(), where={"year": 1999})
+    if stat in ("sum", "count"):
+        assert total == 0
+    else:
+        assert np.isnan(total)
+
+
+def test_query_empty_where_keeps_labels(cube):
+    result = cube.query("min", by="keyword", where={"year": 1999}, dropna=False)
+    assert list(result.index) == ["선크림", "스키"]
+    assert result.isna().all()
+
+
+def test_save_load_roundtrip(cube, tmp_path):
+    path = tmp_path / "cube.npz"
+    cube.save(path)
+    loaded = AggregateCube.load(path)
+    pd.testing.assert_series_equal(loaded.query("std"), cube.query("std"))
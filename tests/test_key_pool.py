@@ -0,0 +1,95 @@
+"""naver_api.KeyPool 사용량 저장 (여러 프로세스가 같은 상태 파일 공유)"""
+
+import json
+import multiprocessing
+import os
+
+import pytest
+
+os.environ.setdefault('NAVER_CLIENT_ID', 'replay')
+os.environ.setdefault('NAVER_CLIENT_SECRET', 'replay')
+
+from naver_api import KeyPool, KeyPoolExhausted  # noqa: E402
+
+CREDENTIALS = [('key-a', 'secret-a'), ('key-b', 'secret-b')]
+
+
+def saved_usage(path):
+    with open(path, encoding='utf-8') as f:
+        return {client_id: entry['used'] for client_id, entry in json.load(f)['keys'].items()}
+
+
+def acquire_many(credentials, state_path, n):
+    pool = KeyPool(credentials, daily_limit=None, state_path=state_path)
+    for _ in range(n):
+        pool.acquire()
+
+
+def test_pools_sharing_state_add_usage(tmp_path):
+    path = tmp_path / 'keys.json'
+    first = KeyPool(CREDENTIALS, daily_limit=None, state_path=path)
+    second = KeyPool(CREDENTIALS, daily_limit=None, state_path=path)
+    for _ in range(3):
+        first.acquire()
+        second.acquire()
+    assert sum(saved_usage(path).values()) == 6
+    assert not list(tmp_path.glob('*.tmp'))
+
+
+def test_processes_sharing_state_add_usage(tmp_path):
+    path = tmp_path / 'keys.json'
+    processes = [multiprocessing.Process(target=acquire_many, args=(CREDENTIALS, path, 100))
+                 for _ in range(2)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    assert [process.exitcode for process in processes] == [0, 0]
+    assert saved_usage(path) == {'key-a': 100, 'key-b': 100}
+
+
+def test_subset_pool_keeps_other_keys(tmp_path):
+    path = tmp_path / 'keys.json'
+    acquire_many(CREDENTIALS, path, 4)
+    acquire_many(CREDENTIALS[1:], path, 3)
+    assert saved_usage(path) == {'key-a': 2, 'key-b': 5}
+
+
+def test_limit_reached_by_other_process(tmp_path):
+    path = tmp_path / 'keys.json'
+    pool = KeyPool(CREDENTIALS[:1], daily_limit=5, state_path=path)
+    pool.acquire()
+    acquire_many(CREDENTIALS[:1], path, 4)
+
+    pool.acquire()      # 저장 시 다른 프로세스 사용량 4를 합쳐 1 + 4 + 1 = 6 ≥ 5 → 소진
+    with pytest.raises(KeyPoolExhausted):
+        pool.acquire()
+
+
+@pytest.fixture
+def four_keys(monkeypatch):
+    import naver_api
+    monkeypatch.setattr(naver_api, 'NAVER_CREDENTIALS', [(f'key-{i}', f'secret-{i}') for i in range(4)])
+
+
+def worker_args(tmp_path, *extra):
+    import cli
+    return cli.build_parser().parse_args(['work', '--no-cache', '--out', str(tmp_path),
+                                          '--keys-state', str(tmp_path / 'keys.json'), *extra])
+
+
+def test_worker_keys_split_and_saved(tmp_path, four_keys):
+    import cli
+    args = worker_args(tmp_path, '--keys', '0', '1', '2')
+    pools = [cli.worker_datalab(args, i, 2).key_pool for i in range(2)]
+    assert [[key.client_id for key in pool._keys] for pool in pools] == [['key-0', 'key-2'], ['key-1']]
+
+    for pool in pools:
+        pool.acquire()
+    assert saved_usage(tmp_path / 'keys.json') == {'key-0': 1, 'key-1': 1, 'key-2': 0}
+
+
+def test_worker_unknown_key(tmp_path, four_keys):
+    import cli
+    with pytest.raises(ValueError):
+        cli.worker_datalab(worker_args(tmp_path, '--keys', '4'))
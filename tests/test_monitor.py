@@ -0,0 +1,115 @@
+"""monitor.TrendMonitor 스트리밍 이상 감지 테스트"""
+
+import numpy as np
+import pandas as pd
+
+from monitor import TrendMonitor, frame_series
+
+
+def make_feed(keywords, start="2024-01-01", days=60, seed=0):
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range(start, periods=days, freq="D")
+    return pd.DataFrame({
+        "date": np.tile(dates, len(keywords)),
+        "keyword": np.repeat(keywords, days),
+        "search_volume": rng.uniform(40, 60, days * len(keywords)),
+    })
+
+
+def test_frame_series_joins_keys():
+    frame = pd.DataFrame({
+        "date": pd.date_range("2024-01-01", periods=3),
+        "segment": ["20대 여성", "30대 남성", "20대 여성"],
+        "keyword": ["선크림", "선크림", "스키"],
+        "search_volume": [1, 2, 3],
+    })
+    _, names, values = frame_series(frame, key=["segment", "keyword"])
+    assert list(names) == ["20대 여성 | 선크림", "30대 남성 | 선크림", "20대 여성 | 스키"]
+    assert list(values) == [1.0, 2.0, 3.0]
+
+
+def test_new_series_keeps_history():
+    monitor = TrendMonitor()
+    monitor.process(make_feed(["a"]))
+
+    # 이미 처리한 날짜까지 포함한 수집 결과에 새 시계열 b가 추가됨
+    feed = make_feed(["a", "b"], days=61, seed=1)
+    monitor.process(feed)
+
+    a, b = monitor.indices(["a", "b"])
+    assert monitor.count[b] == 61
+    assert monitor.count[a] == 61
+    assert monitor.last[a] == monitor.last[b]
+
+
+def test_rerun_skips_processed_dates(tmp_path):
+    feed = make_feed(["a", "b"])
+    monitor = TrendMonitor()
+    monitor.process(feed)
+    path = monitor.save(tmp_path / "state.npz")
+
+    loaded = TrendMonitor.load(path)
+    loaded.process(feed)
+    np.testing.assert_array_equal(loaded.count, monitor.count)
+    np.testing.assert_allclose(loaded.mean, monitor.mean)
+
+
+def test_no_alerts_keeps_dtypes():
+    feed = make_feed(["a", "b"])
+    monitor = TrendMonitor()
+    first = monitor.process(feed)
+    empty = monitor.process(feed)              # 새 날짜 없음 → 알림 없음
+
+    assert empty.empty
+    assert list(empty.columns) == list(first.columns)
+    assert (empty.dtypes == first.dtypes).all()
+    assert pd.api.types.is_datetime64_any_dtype(empty["date"])
+    assert pd.api.types.is_float_dtype(empty["z"])
+    assert pd.api.types.is_string_dtype(empty["series"])
+
+    alerts = pd.concat([first, empty], ignore_index=True)
+    assert (alerts["date"] - pd.Timestamp("2024-01-01")).dt.days.ge(0).all()
+
+
+def test_spike_alert():
+    feed = make_feed(["a", "b"])
+    feed.loc[(feed["keyword"] == "a") & (feed["date"] == "2024-02-15"), "search_volume"] = 300
+    alerts = TrendMonitor().process(feed)
+
+    spikes = alerts[alerts["kind"] == "spike"]
+    assert list(spikes["series"]) == ["a"]
+    assert spikes["date"].iloc[0] == pd.Timestamp("2024-02-15")
+    assert spikes["direction"].iloc[0] == "up"
+
+
+def rescaled_runs(factor, **params):
+    """60일 처리 후, 이력 전체가 factor배로 다시 정규화된 70일 수집 결과 처리"""
+    feed = make_feed(["a", "b"], days=70)
+    monitor = TrendMonitor(**params)
+    monitor.process(feed[feed["date"] < "2024-03-01"])
+    rescaled = feed.assign(search_volume=feed["search_volume"] * factor)
+    return monitor, rescaled
+
+
+def test_rescaled_history_no_false_alerts():
+    for params in ({}, {"log": 0.0}):
+        monitor, feed = rescaled_runs(0.5, **params)
+        alerts = monitor.process(feed)
+        assert alerts.empty
+        assert list(monitor.rescaled) == [0, 1]
+
+
+def test_rescaled_history_keeps_real_spike(tmp_path):
+    monitor, feed = rescaled_runs(0.4)
+    path = monitor.save(tmp_path / "state.npz")
+    feed.loc[(feed["keyword"] == "b") & (feed["date"] == "2024-03-05"), "search_volume"] *= 4
+
+    alerts = TrendMonitor.load(path).process(feed)
+    assert list(alerts["series"]) == ["b"]
+    assert alerts["date"].iloc[0] == pd.Timestamp("2024-03-05")
+
+
+def test_same_scale_not_rescaled():
+    monitor, feed = rescaled_runs(1.0)
+    monitor.process(feed)
+    assert len(monitor.rescaled) == 0
@@ -0,0 +1,58 @@
+"""
+soda refresh: 수집 → 증분 빌드 연결 (카세트 재생, 임시 프로젝트 루트)
+"""
+
+import json
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+import requests
+
+os.environ.setdefault('NAVER_CLIENT_ID', 'replay')
+os.environ.setdefault('NAVER_CLIENT_SECRET', 'replay')
+
+import cli  # noqa: E402
+from report import STEPS, build  # noqa: E402
+from report.build import BUILD_MANIFEST  # noqa: E402
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+CASSETTE = PROJECT_ROOT / 'tests' / 'cassettes' / 'collect.json.gz'
+
+
+@pytest.fixture
+def root(tmp_path, monkeypatch):
+    """저장소 data/를 복사해 한 번 빌드한 프로젝트 루트 (네트워크 요청은 실패)"""
+    def refuse(*args, **kwargs):
+        raise AssertionError(f"재생 중 네트워크 요청: {args}")
+    monkeypatch.setattr(requests, 'request', refuse)
+
+    shutil.copytree(PROJECT_ROOT / 'data', tmp_path / 'data',
+                    ignore=shutil.ignore_patterns('presentation', 'sweep', 'shopping', 'monitor'))
+    build(tmp_path, max_workers=1)
+    return tmp_path
+
+
+def step_digests(root):
+    with open(root / 'output' / BUILD_MANIFEST, encoding='utf-8') as f:
+        return json.load(f)['steps']
+
+
+def test_collected_files_are_build_inputs():
+    inputs = {Path(relpath).name for spec in STEPS.values() for relpath in spec.inputs}
+    for dataset in ('1', '3', '4'):
+        assert cli.DATASETS[dataset][2] in inputs
+
+
+def test_refresh_rebuilds_collected_datasets(root):
+    before = step_digests(root)
+    status = cli.main(['refresh', '1', '4', '--root', str(root), '--max-age', '0',
+                       '--start', '2024-01-01', '--end', '2024-12-31', '--no-cache', '--quiet',
+                       '--replay', str(CASSETTE), '--keys-state', str(root / 'keys.json')])
+    assert status == 0
+    after = step_digests(root)
+
+    rebuilt = {name for name in after if after[name] != before.get(name)}
+    assert rebuilt == {name for name, spec in STEPS.items() if spec.dataset in ('1', '4')}
+    assert not (root / 'data' / 'presentation').exists()
@@ -0,0 +1,72 @@
+"""
+카세트 재생으로 수집 스크립트 오프라인 실행 (Dataset 1, 4)
+
+tests/cassettes/collect.json.gz의 응답은 실제 API 응답이 아니라 DataLab 형식의 합성 비율
+(API 키 없이 기록, 요청 25개) → 수집 / 저장 경로 회귀 확인용이며 값 자체는 의미 없음
+
+실제 응답으로 다시 기록 (API 키 필요, 같은 옵션):
+    python src/cli.py collect 1 4 --start 2024-01-01 --end 2024-12-31 --no-cache \\
+        --record tests/cassettes/collect.json.gz
+"""
+
+import os
+from pathlib import Path
+
+import pandas as pd
+import pytest
+import requests
+
+# config는 키가 없으면 import 시 오류 → 재생에는 쓰이지 않는 더미 키
+os.environ.setdefault('NAVER_CLIENT_ID', 'replay')
+os.environ.setdefault('NAVER_CLIENT_SECRET', 'replay')
+
+import cli  # noqa: E402
+
+CASSETTE = Path(__file__).resolve().parent / 'cassettes' / 'collect.json.gz'
+MONTHS = pd.date_range('2024-01-01', '2024-12-01', freq='MS')
+
+
+def replay(data_dir, *extra):
+    return cli.main(['collect', '1', '4', '--start', '2024-01-01', '--end', '2024-12-31',
+                     '--no-cache', '--quiet', '--replay', str(CASSETTE),
+                     '--keys-state', str(data_dir / 'keys.json'),
+                     '--data-dir', str(data_dir), *extra])
+
+
+@pytest.fixture
+def offline(monkeypatch):
+    """실제 요청이 나가면 실패"""
+    def refuse(*args, **kwargs):
+        raise AssertionError(f"재생 중 네트워크 요청: {args}")
+    monkeypatch.setattr(requests, 'request', refuse)
+
+
+def test_replay_collect(tmp_path, offline):
+    assert replay(tmp_path) == 0
+
+    df1 = pd.read_csv(tmp_path / cli.DATASETS['1'][2], parse_dates=['date'])
+    assert list(df1['date']) == list(MONTHS)
+    assert {'선크림', '썬크림', '자외선차단제', 'year', 'month', 'season'} <= set(df1.columns)
+    assert df1[['선크림', '썬크림', '자외선차단제']].notna().all().all()
+
+    df4 = pd.read_csv(tmp_path / cli.DATASETS['4'][2], parse_dates=['date'])
+    assert {'date', 'segment', 'keyword', 'search_volume'} <= set(df4.columns)
+    assert set(df4['keyword']) == {'선크림', '스키장', '스키', '스노우보드'}
+    assert set(df4['date']) == set(MONTHS)
+    assert not df4.duplicated(['date', 'segment', 'keyword']).any()
+    assert len(df4) == df4['segment'].nunique() * 4 * len(MONTHS)
+
+
+def test_replay_is_deterministic(tmp_path, offline):
+    first, second = tmp_path / 'first', tmp_path / 'second'
+    assert replay(first) == 0
+    assert replay(second) == 0
+    for dataset in ('1', '4'):
+        name = cli.DATASETS[dataset][2]
+        pd.testing.assert_frame_equal(pd.read_csv(first / name), pd.read_csv(second / name))
+
+
+def test_replay_detect(tmp_path, offline):
+    assert replay(tmp_path, '--detect') == 0
+    for dataset in ('1', '4'):
+        assert (tmp_path / cli.MONITOR_DIR / f'dataset_{dataset}.npz').exists()